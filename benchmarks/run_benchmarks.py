@@ -0,0 +1,324 @@
+"""
+Benchmarks of the processing and aggregation hot paths.
+
+Every case runs on synthetic data sets (modules/synthetic_data.py) of several sizes;
+Jira calls of JiraEstimationAnalyzer go to an in-process mock Jira server.
+Results are saved as JSON and compared with a baseline, a case that got slower
+than the threshold is reported as a regression and the run exits with code 1.
+
+Usage (from the repository root):
+    python -m benchmarks.run_benchmarks                          # default sizes, compare with baseline
+    python -m benchmarks.run_benchmarks --sizes 1000 100000 --only process_issues_data
+    python -m benchmarks.run_benchmarks --save-baseline          # store this run as the new baseline
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import warnings
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SIZES = [1000, 10000, 50000]
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_MIN_DELTA = 0.01
+DEFAULT_RESULTS_DIR = os.path.join(BENCHMARKS_DIR, 'results')
+DEFAULT_BASELINE = os.path.join(BENCHMARKS_DIR, 'baseline.json')
+
+# Fixed end date, so that data sets of the same size and seed are identical between runs
+DATASET_END_DATE = datetime(2025, 6, 30)
+DATASET_SEED = 42
+
+# Upper data set size of cases that are too slow for the largest sizes
+ESTIMATION_MAX_SIZE = 5000
+VISUALIZATION_MAX_SIZE = 100000
+
+
+def configure_environment():
+    """Keep benchmarks independent of local caches and Jira rate limits (before the app modules are imported)"""
+    config.JIRA_CACHE_ENABLED = False
+    config.ISSUE_STORE_ENABLED = False
+    config.JIRA_RECORD_MODE = None
+    config.JIRA_RATE_LIMIT = 0
+    config.jira_url = None
+
+
+class Dataset:
+    """Synthetic data set of one size and the DataFrame built from it"""
+
+    def __init__(self, size):
+        from modules.synthetic_data import SyntheticIssueGenerator
+        from modules.data_processor import process_issues_data
+
+        self.size = size
+        self.generator = SyntheticIssueGenerator(size, DATASET_SEED, end_date=DATASET_END_DATE)
+        raw = self.generator.generate()
+        additional = raw['additional_data']
+        self.clm_issues = additional['clm_issues']
+        self.est_issues = additional['est_issues']
+        self.improvement_issues = additional['improvement_issues']
+        self.implementation_issues = raw['all_implementation_issues']
+        self.filtered_issues = raw['filtered_issues']
+        self.df = process_issues_data(self.implementation_issues)
+
+    def all_issues(self):
+        return self.clm_issues + self.est_issues + self.improvement_issues + self.implementation_issues
+
+
+def bench_process_issues_data(dataset, context):
+    from modules.data_processor import process_issues_data
+    return lambda: process_issues_data(dataset.implementation_issues)
+
+
+def bench_get_status_categories(dataset, context):
+    from modules.data_processor import get_status_categories
+    return lambda: get_status_categories(dataset.df)
+
+
+def bench_get_improved_open_statuses(dataset, context):
+    from modules.data_processor import get_improved_open_statuses
+    return lambda: get_improved_open_statuses(dataset.df)
+
+
+def bench_has_merge_request_mentions(dataset, context):
+    from modules.dashboard import has_merge_request_mentions
+    return lambda: sum(1 for issue in dataset.implementation_issues if has_merge_request_mentions(issue))
+
+
+def bench_get_merge_request_mask(dataset, context):
+    from modules.dashboard import get_merge_request_mask
+    return lambda: get_merge_request_mask(dataset.df, dataset.implementation_issues)
+
+
+def bench_prepare_chart_data(dataset, context):
+    import routes  # noqa: F401 - routes must be imported before modules.analysis (circular import)
+    from modules.analysis import prepare_chart_data
+    return lambda: prepare_chart_data(
+        dataset.df, data_source='clm', use_filter=True, filter_id=config.DEFAULT_JIRA_FILTER_ID,
+        clm_filter_id=config.DEFAULT_CLM_FILTER_ID, clm_issues=dataset.clm_issues, est_issues=dataset.est_issues,
+        improvement_issues=dataset.improvement_issues, implementation_issues=dataset.implementation_issues,
+        filtered_issues=dataset.filtered_issues)
+
+
+def bench_map_components_to_projects(dataset, context):
+    import routes  # noqa: F401 - routes must be imported before modules.analysis (circular import)
+    from modules.analysis import map_components_to_projects
+    return lambda: map_components_to_projects(dataset.est_issues, dataset.implementation_issues,
+                                              dataset.all_issues())
+
+
+def bench_process_clm_data(dataset, context):
+    from modules.clm_processing import process_clm_data
+    return lambda: process_clm_data(dataset.clm_issues, dataset.est_issues, dataset.implementation_issues)
+
+
+def bench_create_visualizations(dataset, context):
+    from modules.visualization import create_visualizations
+    output_dir = os.path.join(context['temp_dir'], f'charts_{dataset.size}')
+    return lambda: create_visualizations(dataset.df, output_dir,
+                                         implementation_issues=dataset.implementation_issues)
+
+
+def bench_estimation_process_issues(dataset, context):
+    from modules.jira_estimation import JiraEstimationAnalyzer
+    from modules.mock_jira import MockJiraServer, MockJiraData
+
+    server = MockJiraServer(MockJiraData(dataset.all_issues())).start()
+    context['cleanup'].append(server.stop)
+    analyzer = JiraEstimationAnalyzer(jira_url=server.url, api_token='benchmark')
+    issues = [issue for issue in dataset.implementation_issues if not issue['fields'].get('parent')]
+    return lambda: analyzer.process_issues(issues, '2025-04-01T00:00:00.000+0300', sprint_filter=True,
+                                           all_tasks=True)
+
+
+# Case name -> (function building the timed callable, largest data set size or None)
+CASES = {
+    'process_issues_data': (bench_process_issues_data, None),
+    'get_status_categories': (bench_get_status_categories, None),
+    'get_improved_open_statuses': (bench_get_improved_open_statuses, None),
+    'has_merge_request_mentions': (bench_has_merge_request_mentions, None),
+    'get_merge_request_mask': (bench_get_merge_request_mask, None),
+    'prepare_chart_data': (bench_prepare_chart_data, None),
+    'map_components_to_projects': (bench_map_components_to_projects, None),
+    'process_clm_data': (bench_process_clm_data, None),
+    'create_visualizations': (bench_create_visualizations, VISUALIZATION_MAX_SIZE),
+    'estimation_process_issues': (bench_estimation_process_issues, ESTIMATION_MAX_SIZE)
+}
+
+
+def time_call(func, repeat):
+    """
+    Run a callable once untimed (imports, lazy caches) and then several times
+
+    Returns:
+        dict: min, median and mean time in seconds and all runs
+    """
+    func()
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+    return {
+        'min': min(runs),
+        'median': statistics.median(runs),
+        'mean': statistics.mean(runs),
+        'runs': runs
+    }
+
+
+def run_benchmarks(sizes, names, repeat):
+    """
+    Run benchmark cases
+
+    Args:
+        sizes (list): Data set sizes (total number of issues)
+        names (list): Case names
+        repeat (int): Number of timed runs per case and size
+
+    Returns:
+        dict: Case name -> size (str) -> timings
+    """
+    results = {name: {} for name in names}
+    context = {'temp_dir': tempfile.mkdtemp(prefix='jira_benchmarks_'), 'cleanup': []}
+    try:
+        for size in sizes:
+            logger.warning(f"Generating data set of {size} issues...")
+            dataset = Dataset(size)
+            for name in names:
+                build, max_size = CASES[name]
+                if max_size is not None and size > max_size:
+                    logger.warning(f"  {name}: skipped for {size} issues (limit {max_size})")
+                    continue
+                try:
+                    func = build(dataset, context)
+                    timing = time_call(func, repeat)
+                except ImportError as e:
+                    logger.warning(f"  {name}: skipped, missing dependency: {e}")
+                    continue
+                results[name][str(size)] = timing
+                logger.warning(f"  {name} [{size}]: median {timing['median']:.3f}s, min {timing['min']:.3f}s")
+            while context['cleanup']:
+                context['cleanup'].pop()()
+    finally:
+        for cleanup in context['cleanup']:
+            cleanup()
+        shutil.rmtree(context['temp_dir'], ignore_errors=True)
+    return results
+
+
+def get_git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=BENCHMARKS_DIR).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare_results(results, baseline, threshold, min_delta=DEFAULT_MIN_DELTA):
+    """
+    Compare medians with a baseline
+
+    Args:
+        results (dict): Current results
+        baseline (dict): Baseline results
+        threshold (float): Allowed relative slowdown (0.2 - 20%)
+        min_delta (float): Slowdowns below this many seconds are timer noise, not regressions
+
+    Returns:
+        list: Comparison rows (name, size, baseline median, current median, ratio, regression flag)
+    """
+    rows = []
+    for name, sizes in results.items():
+        for size, timing in sizes.items():
+            base = baseline.get(name, {}).get(size)
+            if not base:
+                continue
+            ratio = timing['median'] / base['median'] if base['median'] else 0
+            regression = ratio > 1 + threshold and timing['median'] - base['median'] > min_delta
+            rows.append((name, size, base['median'], timing['median'], ratio, regression))
+    return rows
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark processing and aggregation hot paths")
+    parser.add_argument("--sizes", type=int, nargs='+', default=DEFAULT_SIZES, help="Data set sizes in issues")
+    parser.add_argument("--only", nargs='+', choices=sorted(CASES), help="Run only these cases")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per case and size")
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline results file")
+    parser.add_argument("--save-baseline", action="store_true", help="Save this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown against the baseline (0.2 = 20%%)")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA,
+                        help="Ignore slowdowns smaller than this many seconds")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    # Deprecation noise of plotting libraries would hide the report
+    warnings.filterwarnings('ignore', category=FutureWarning)
+    configure_environment()
+
+    names = args.only or list(CASES)
+    results = run_benchmarks(args.sizes, names, args.repeat)
+
+    report = {
+        'created': datetime.now().isoformat(),
+        'commit': get_git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': args.sizes,
+        'repeat': args.repeat,
+        'results': results
+    }
+
+    output = args.output or os.path.join(DEFAULT_RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results saved to {output}")
+
+    if args.save_baseline:
+        shutil.copyfile(output, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create one")
+        return 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f).get('results', {})
+
+    rows = compare_results(results, baseline, args.threshold, args.min_delta)
+    print(f"\n{'case':<30} {'size':>8} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, size, base, current, ratio, regression in rows:
+        print(f"{name:<30} {size:>8} {base:>9.3f}s {current:>9.3f}s {ratio:>6.2f}x{'  REGRESSION' if regression else ''}")
+
+    regressions = [row for row in rows if row[5]]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,4 +11,62 @@ DEFAULT_JIRA_FILTER_ID = 114476  # ID фильтра Jira по умолчани
 
 # Другие настройки приложения
 DEBUG_MODE = True  # Режим отладки
-LOGGING_LEVEL = 'INFO'  # Уровень логирования (DEBUG, INFO, WARNING, ERROR, CRITICAL)
\ No newline at end of file
+LOGGING_LEVEL = 'INFO'  # Уровень логирования (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+
+# Параметры HTTP-клиента Jira
+JIRA_HTTP_POOL_SIZE = 20  # Maximum number of kept-alive connections per host
+JIRA_HTTP_MAX_RETRIES = 4  # Retries for 429/5xx responses and connection errors
+JIRA_HTTP_BACKOFF_FACTOR = 1.0  # Base delay in seconds for exponential backoff
+JIRA_HTTP_TIMEOUT = 30  # Default request timeout in seconds
+JIRA_PARALLEL_PAGING = True  # Fetch search result pages concurrently after the first one
+JIRA_SEARCH_WORKERS = 4  # Number of concurrent page requests per search
+JIRA_GRAPH_WORKERS = 4  # Number of concurrent queries per CLM graph level
+JIRA_MAX_JQL_LENGTH = 6000  # Maximum length of one packed JQL query in characters
+
+# Локальное хранилище задач для инкрементальной синхронизации
+ISSUE_STORE_ENABLED = True  # Read issues through the local SQLite store and fetch only changes
+ISSUE_STORE_PATH = 'data/issue_store.db'  # Path to the SQLite issue store
+ISSUE_STORE_SYNC_OVERLAP_MINUTES = 60  # Overlap for 'updated >=' delta queries (clock / time zone skew)
+
+# Кэш ответов Jira
+JIRA_CACHE_ENABLED = True  # Serve repeated read-only Jira requests from an on-disk cache
+JIRA_CACHE_PATH = 'data/jira_cache.db'  # Path to the SQLite response cache
+JIRA_CACHE_MAX_BYTES = 200 * 1024 * 1024  # Size bound, least recently used responses are evicted above it
+# JIRA_CACHE_TTLS = [(r'/rest/api/2/search$', 600), ...]  # Per-endpoint TTLs in seconds, see modules/jira_cache.py
+JIRA_FETCH_CONCURRENCY = 8  # Default number of requests in flight per fetch engine run
+
+# Ограничение нагрузки на Jira (общий клиент)
+JIRA_RATE_LIMIT = 10.0  # Maximum requests per second for all analyzers together (0 - no limit)
+JIRA_RATE_BURST = 20  # Requests that may be sent at once after an idle period
+JIRA_ADAPTIVE_CONCURRENCY = True  # Grow parallelism while Jira is healthy, back off on 429/Retry-After/slow responses
+JIRA_INITIAL_CONCURRENCY = 4  # Starting number of requests in flight
+JIRA_MIN_CONCURRENCY = 1  # Lowest number of requests in flight
+JIRA_MAX_CONCURRENCY = 20  # Highest number of requests in flight (also limited by JIRA_HTTP_POOL_SIZE)
+JIRA_LATENCY_TOLERANCE = 2.0  # Back off when smoothed latency exceeds the baseline by this factor
+
+# Локальный стенд Jira (python mock_jira_server.py) и запись/воспроизведение ответов
+JIRA_RECORD_MODE = None  # None, 'record' (save every Jira response) or 'replay' (answer from recordings, no server)
+JIRA_RECORDINGS_DIR = 'data/jira_recordings'  # Directory with recorded responses
+
+# Метрика "закрытые задачи без активности" (комментарии, вложения, связи, упоминания MR)
+CLOSED_TASKS_MODE = 'local'  # 'local' (filter downloaded issues), 'pushdown' (JQL predicates in Jira) or 'verify' (both, log differences)
+# CLOSED_TASKS_PUSHDOWN_CLAUSES = ['comment is EMPTY', 'attachments is EMPTY', 'issueLinkType is EMPTY']  # JQL predicates evaluated by Jira
+
+# Формат файлов анализа (обработанные данные и исходные задачи)
+SNAPSHOT_FRAME_FORMAT = 'auto'  # 'auto' (Parquet if pyarrow is installed), 'parquet' or 'columns' (compressed column lines)
+SNAPSHOT_COMPRESSION = 'auto'  # 'auto' (zstd if zstandard is installed, else gzip), 'zstd', 'gzip' or 'none'
+SNAPSHOT_GZIP_LEVEL = 3  # gzip level 1-9, higher is smaller but slower to write
+
+# Каталог анализов и ежедневных снимков дашборда (python rebuild_catalog.py - пересоздать по папкам)
+CATALOG_ENABLED = True  # List analyses and dashboard days from SQLite instead of reading every index.json/summary.json
+CATALOG_PATH = 'data/catalog.db'  # Path to the SQLite catalog
+
+# Журнал результатов создания CLM Error (data/clm_results/creation_results.jsonl)
+CLM_RESULTS_COMPACT_EVERY = 1000  # Rewrite the journal without duplicates and superseded failures after this many appended lines
+
+# Кэш разобранных файлов анализов и снимков дашборда в памяти процесса
+SNAPSHOT_CACHE_MAX_BYTES = 256 * 1024 * 1024  # Estimated memory of cached parsed files, least recently used are dropped above it (0 - no cache)
+
+# Фоновые задачи: анализ, расчет оценок и сбор данных дашборда (/api/jobs)
+JOB_WORKERS = 2  # Worker threads; jobs of one kind run one at a time, identical queued jobs run once
+JOB_HISTORY_LIMIT = 100  # Finished jobs kept in memory for /api/jobs
@@ -131,6 +131,7 @@ def generate_real_data(days=7, clm_filter_id=114473):
     try:
         # Import necessary modules
         from modules.jira_analyzer import JiraAnalyzer
+        from modules.jql_builder import JqlTemplate
         from modules.data_processor import process_issues_data, get_improved_open_statuses
     except ImportError:
         logger.error(
@@ -165,7 +166,7 @@ def generate_real_data(days=7, clm_filter_id=114473):
         logger.info(f"Fetching CLM issues with query: {clm_query}")
 
         # Get CLM issues
-        clm_issues = analyzer.get_issues_by_filter(jql_query=clm_query)
+        clm_issues = analyzer.get_issues_by_filter(jql_query=clm_query, profile='counts_only')
         logger.info(f"Found {len(clm_issues)} CLM issues")
 
         if not clm_issues:
@@ -174,7 +175,7 @@ def generate_real_data(days=7, clm_filter_id=114473):
 
         # Get related issues
         logger.info(f"Fetching related issues...")
-        est_issues, improvement_issues, implementation_issues = analyzer.get_clm_related_issues(clm_issues)
+        est_issues, improvement_issues, implementation_issues = analyzer.get_clm_related_issues(clm_issues, profile='counts_only')
 
         logger.info(
             f"Found {len(est_issues)} EST issues, {len(improvement_issues)} improvement issues, and {len(implementation_issues)} implementation issues")
@@ -216,23 +217,19 @@ def generate_real_data(days=7, clm_filter_id=114473):
             logger.info(f"Processing data for date {date_str} (Day {actual_days_generated}/{days})")
 
             # For each day, we need to fetch worklogs that existed up to and including that day
-            chunk_size = 100  # Adjust as needed based on JQL length limits
+            # Pack as many keys per query as fit into the JQL length limit
+            worklog_template = JqlTemplate(f'issue in ({{items}}) AND worklogDate <= "{date_str}"', separator=', ')
+            worklog_batches = worklog_template.pack(implementation_keys)
             worklog_issues = []
 
-            # Process implementation issues in chunks to avoid JQL query length limits
-            for i in range(0, len(implementation_keys), chunk_size):
-                chunk = implementation_keys[i:i + chunk_size]
-                # Create a JQL query using "issue in (key1, key2, ...)" format and add date filter
-                worklog_query = f'issue in ({", ".join(chunk)}) AND worklogDate <= "{date_str}"'
-
-                logger.info(
-                    f"Fetching worklog data chunk {i // chunk_size + 1}/{(len(implementation_keys) + chunk_size - 1) // chunk_size} with query: {worklog_query}")
+            for batch_number, batch in enumerate(worklog_batches, 1):
+                logger.info(f"Fetching worklog data chunk {batch_number}/{len(worklog_batches)} with {len(batch)} keys")
                 try:
-                    chunk_issues = analyzer.get_issues_by_filter(jql_query=worklog_query)
+                    chunk_issues = analyzer.search_pack(worklog_template, batch, profile='counts_only')
                     worklog_issues.extend(chunk_issues)
                     logger.info(f"Retrieved {len(chunk_issues)} issues with worklogs from chunk")
                 except Exception as e:
-                    logger.error(f"Error fetching chunk {i // chunk_size + 1}: {e}")
+                    logger.error(f"Error fetching chunk {batch_number}: {e}")
 
             logger.info(f"Retrieved {len(worklog_issues)} total issues with worklogs for date {date_str}")
 
@@ -252,7 +249,7 @@ def generate_real_data(days=7, clm_filter_id=114473):
                 open_tasks = df_worklog[df_worklog['status'].isin(open_statuses) & (df_worklog['time_spent_hours'] > 0)]
 
                 if not open_tasks.empty:
-                    open_tasks_by_project = open_tasks.groupby('project').size().to_dict()
+                    open_tasks_by_project = open_tasks.groupby('project', observed=True).size().to_dict()
                     open_tasks_data = open_tasks_by_project
 
                 # Create data for this date
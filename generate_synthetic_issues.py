@@ -0,0 +1,10 @@
+#!/usr/bin/env python
+"""
+Generate synthetic Jira issues in raw_issues.json format for benchmarks and the mock Jira server:
+
+    python generate_synthetic_issues.py --issues 100000 --output data/synthetic/raw_issues.json
+"""
+from modules.synthetic_data import main
+
+if __name__ == "__main__":
+    main()
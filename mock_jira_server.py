@@ -0,0 +1,16 @@
+#!/usr/bin/env python
+"""
+Local Jira stand-in server.
+
+Serves issues from raw_issues.json-like files over the Jira REST API with optional
+latency and error injection, for development and benchmarks without a real Jira:
+
+    python mock_jira_server.py --data jira_charts/<timestamp>/raw_issues.json --latency 0.2 --error-rate 0.05
+    python mock_jira_server.py --synthetic 50000
+
+Then set jira_url = "http://127.0.0.1:8089" in config.py (any token is accepted).
+"""
+from modules.mock_jira import main
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,13 @@ import json
 import logging
 from datetime import datetime
 from routes.main_routes import analysis_state
+from modules.job_queue import JobCancelled
 from modules.jira_analyzer import JiraAnalyzer
+from modules.jql_builder import JqlTemplate
+from modules.issue_store import get_issue_store
+from modules.raw_issue_storage import RawIssueWriter
+from modules.snapshot_storage import save_frame, SNAPSHOT_FORMAT_VERSION
+from modules.catalog import record_analysis
 from modules.data_processor import get_improved_open_statuses, get_status_categories
 
 # Get logger
@@ -12,6 +18,10 @@ logger = logging.getLogger(__name__)
 # Directory for saving charts
 CHARTS_DIR = 'jira_charts'
 
+# Issue lists of raw_issues.json in CLM mode
+RAW_ISSUES_LISTS = ['filtered_issues', 'all_implementation_issues', 'additional_data.clm_issues',
+                    'additional_data.est_issues', 'additional_data.improvement_issues']
+
 
 def prepare_chart_data(df, data_source='jira', use_filter=True, filter_id=None, jql_query=None,
                        date_from=None, date_to=None, clm_filter_id=None, clm_jql_query=None,
@@ -42,7 +52,7 @@ def prepare_chart_data(df, data_source='jira', use_filter=True, filter_id=None,
         dict: Chart data for interactive charts
     """
     import logging
-    from modules.data_processor import get_status_categories, get_improved_open_statuses
+    from modules.data_processor import get_status_categories, get_improved_open_statuses, count_values
     import json
 
     logger = logging.getLogger(__name__)
@@ -63,9 +73,9 @@ def prepare_chart_data(df, data_source='jira', use_filter=True, filter_id=None,
                 df = filtered_df
 
         # Project data from the (potentially filtered) DataFrame
-        project_counts = df['project'].value_counts().to_dict()
-        project_estimates = df.groupby('project')['original_estimate_hours'].sum().to_dict()
-        project_time_spent = df.groupby('project')['time_spent_hours'].sum().to_dict()
+        project_counts = count_values(df['project']).to_dict()
+        project_estimates = df.groupby('project', observed=True)['original_estimate_hours'].sum().to_dict()
+        project_time_spent = df.groupby('project', observed=True)['time_spent_hours'].sum().to_dict()
 
         # Generate the list of all projects
         all_projects = list(set(list(project_counts.keys()) +
@@ -181,7 +191,7 @@ def prepare_chart_data(df, data_source='jira', use_filter=True, filter_id=None,
         no_transitions_by_project = {}
         if not no_transitions_tasks.empty:
             try:
-                no_transitions_by_project = no_transitions_tasks.groupby('project').size().to_dict()
+                no_transitions_by_project = no_transitions_tasks.groupby('project', observed=True).size().to_dict()
                 logger.info(f"Prepared open tasks with worklogs data with {len(no_transitions_by_project)} projects")
 
                 # Store the open task issue keys by project
@@ -267,10 +277,102 @@ def prepare_chart_data(df, data_source='jira', use_filter=True, filter_id=None,
         }
 
 
+def issue_stub(issue):
+    """
+    Get the light copy of an issue kept after its body was streamed: key, update time and project
+
+    Args:
+        issue (dict): Issue dictionary
+
+    Returns:
+        dict: Issue dictionary with only these fields
+    """
+    fields = issue.get('fields', {})
+    return {
+        'key': issue.get('key'),
+        'fields': {
+            'updated': fields.get('updated'),
+            'project': {'key': (fields.get('project') or {}).get('key', '')}
+        }
+    }
+
+
+def collect_issues(issues, raw_writer, list_names, stubs):
+    """
+    Pass streamed issues on, writing every body into raw_issues.json and keeping only its stub
+
+    Args:
+        issues (iterable): Issue dictionaries
+        raw_writer (RawIssueWriter): Snapshot receiving the bodies
+        list_names (tuple): Lists of the snapshot the issues belong to
+        stubs (list): List receiving the issue stubs
+
+    Yields:
+        dict: The same issue dictionaries
+    """
+    for issue in issues:
+        raw_writer.add(issue, *list_names)
+        stubs.append(issue_stub(issue))
+        yield issue
+
+
+def iter_worklog_filtered_issues(analyzer, implementation_keys, implementation_projects, date_query, store, state):
+    """
+    Get implementation issues with worklogs matching a date condition, batch by batch
+
+    Args:
+        analyzer (JiraAnalyzer): Jira analyzer
+        implementation_keys (list): Keys of all implementation issues
+        implementation_projects (set): Projects of the implementation issues (used if there are no keys)
+        date_query (str): JQL worklog date condition
+        store (IssueStore): Optional local issue store
+        state (dict): Progress record
+
+    Yields:
+        dict: Issue dictionary
+    """
+    total_issues_count = 0
+
+    if implementation_keys:
+        # Делаем фильтрацию на основе ключей задач, а не только по проектам
+        # Это обеспечит, что мы получим только тикеты связанные с нашими CLM и их сабтаски
+        # Используем key IN для точного соответствия только нужным задачам
+        batch_template = JqlTemplate(f'(key in ({{items}})) AND ({date_query})', separator=', ')
+        batches = batch_template.pack(implementation_keys)
+        processed_count = 0
+
+        for batch_number, batch in enumerate(batches, 1):
+            logger.info(f"Fetching filtered batch {batch_number}/{len(batches)} with {len(batch)} keys")
+            if store is not None:
+                # Only keys are needed here, bodies come from the issue store
+                batch_issues = analyzer.hydrate_issues(
+                    analyzer.search_pack(batch_template, batch, profile='keys'), 'dashboard', store)
+            else:
+                batch_issues = analyzer.search_pack(batch_template, batch, profile='dashboard')
+            yield from batch_issues
+
+            total_issues_count += len(batch_issues)
+            processed_count += len(batch)
+            state['progress'] = 30 + int(processed_count / len(implementation_keys) * 10)
+            state[
+                'status_message'] = f'Filtered {processed_count}/{len(implementation_keys)} implementation issues, found {total_issues_count} issues with worklogs'
+    else:
+        # Если по какой-то причине implementation_keys пустой, используем поиск по проектам
+        logger.warning("No implementation issue keys found, falling back to project-based filtering")
+        for project in implementation_projects:
+            project_query = f'project = "{project}" AND ({date_query})'
+            for issue in analyzer.iter_issues(jql_query=project_query, profile='dashboard'):
+                total_issues_count += 1
+                yield issue
+
+            state[
+                'status_message'] = f'Processed {len(implementation_projects)} projects, found {total_issues_count} issues with worklogs'
+
+
 def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_query=None, date_from=None, date_to=None,
-                 clm_filter_id=114473, clm_jql_query=None):
+                 clm_filter_id=114473, clm_jql_query=None, progress=None):
     """
-    Run Jira data analysis in a separate thread
+    Run Jira data analysis (in a background job, see run_analysis_job)
 
     FIXED: Proper handling of filter_id and JQL parameters
 
@@ -283,22 +385,26 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
         date_to (str): End date for worklog filtering (YYYY-MM-DD)
         clm_filter_id (str/int): ID of CLM filter to use
         clm_jql_query (str): CLM JQL query to use instead of filter ID
+        progress (dict): Progress record to update (the global analysis_state if None)
+
+    Returns:
+        str: Timestamp folder of the analysis or None if it failed
     """
-    global analysis_state
+    state = analysis_state if progress is None else progress
 
     # Инициализируем components_to_projects в начале функции, чтобы избежать ошибки
     # "referenced before assignment"
     components_to_projects = {}
 
     try:
-        analysis_state['is_running'] = True
-        analysis_state['progress'] = 0
-        analysis_state['status_message'] = 'Initialization...'
+        state['is_running'] = True
+        state['progress'] = 0
+        state['status_message'] = 'Initialization...'
 
         # Create timestamp folder
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_dir = os.path.join(CHARTS_DIR, timestamp)
-        analysis_state['current_folder'] = timestamp
+        state['current_folder'] = timestamp
 
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
@@ -313,8 +419,9 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
         if not os.path.exists(metrics_dir):
             os.makedirs(metrics_dir)
 
-        # Initialize Jira analyzer
+        # Initialize Jira analyzer and local issue store (None if disabled)
         analyzer = JiraAnalyzer()
+        store = get_issue_store()
 
         # Get the right query based on data source
         clm_metrics = None
@@ -339,7 +446,7 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
                 logger.info(f"JIRA mode: Using JQL query: {final_jql}")
         else:
             # CLM analysis
-            analysis_state['status_message'] = 'Processing CLM data...'
+            state['status_message'] = 'Processing CLM data...'
 
             # Get CLM issues first
             if use_filter:
@@ -351,162 +458,111 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
                 clm_query = clm_jql_query or "project = CLM"
                 logger.info(f"CLM mode: Using JQL query: {clm_query}")
 
-            analysis_state['status_message'] = f'Fetching CLM issues with query: {clm_query}'
-            analysis_state['progress'] = 5
-
-            # Get CLM issues
-            clm_issues = analyzer.get_issues_by_filter(jql_query=clm_query)
-            clm_count = len(clm_issues)
-            analysis_state['status_message'] = f'Found {clm_count} CLM issues'
+            state['status_message'] = f'Fetching CLM issues with query: {clm_query}'
+            state['progress'] = 5
 
             # Get CLM issues
-            clm_issues = analyzer.get_issues_by_filter(jql_query=clm_query)
+            clm_issues = analyzer.sync_query(clm_query, profile='counts_only', store=store)
             clm_count = len(clm_issues)
-            analysis_state['status_message'] = f'Found {clm_count} CLM issues'
+            state['status_message'] = f'Found {clm_count} CLM issues'
 
             if not clm_issues:
-                analysis_state['status_message'] = "No CLM issues found. Check query or credentials."
-                analysis_state['is_running'] = False
+                state['status_message'] = "No CLM issues found. Check query or credentials."
+                state['is_running'] = False
                 return
 
             # Get related issues using the improved method
-            analysis_state['status_message'] = 'Fetching related EST, Improvement and implementation issues...'
-            analysis_state['progress'] = 25
+            state['status_message'] = 'Fetching related EST, Improvement and implementation issues...'
+            state['progress'] = 25
 
-            est_issues, improvement_issues, implementation_issues = analyzer.get_clm_related_issues(clm_issues)
+            # Implementation issues come as stubs (key and updated): their bodies are streamed chunk by chunk
+            # into raw_issues.json and the DataFrame below, and only light stubs are kept afterwards
+            est_issues, improvement_issues, implementation_stubs = analyzer.get_clm_related_issues(
+                clm_issues, profile='dashboard', store=store, keys_only=True)
 
             est_count = len(est_issues)
             improvement_count = len(improvement_issues)
-            implementation_count = len(implementation_issues)
+            implementation_count = len(implementation_stubs)
 
-            analysis_state[
+            state[
                 'status_message'] = f'Found {est_count} EST issues, {improvement_count} Improvement issues, and {implementation_count} implementation issues'
-            analysis_state['progress'] = 40
-
-            # Extract all unique projects from implementation issues
-            implementation_projects = set()
-            for issue in implementation_issues:
-                project_key = issue.get('fields', {}).get('project', {}).get('key', '')
-                if project_key:
-                    implementation_projects.add(project_key)
-
-            analysis_state[
-                'status_message'] = f'Found {len(implementation_projects)} unique projects in implementation issues'
-
-            # Обновление проектов и их задач для более точного фильтрования
-            project_issue_mapping = {}
-            project_implementation_mapping = {}
-
-            # Extract issue keys by project
-            project_issue_mapping = {}
-            for issue in implementation_issues:
-                issue_key = issue.get('key')
-                project_key = issue.get('fields', {}).get('project', {}).get('key', '')
-                if issue_key and project_key:
-                    if project_key not in project_issue_mapping:
-                        project_issue_mapping[project_key] = []
-                    project_issue_mapping[project_key].append(issue_key)
-
-            # Store ALL implementation issues in raw_issues_all.json for later use
-            raw_issues_all_path = os.path.join(output_dir, 'raw_issues_all.json')
-            with open(raw_issues_all_path, 'w', encoding='utf-8') as f:
-                json.dump(implementation_issues, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved all {len(implementation_issues)} implementation issues to {raw_issues_all_path}")
+            state['progress'] = 40
 
             # Get implementation issue keys
-            implementation_keys = [issue.get('key') for issue in implementation_issues if issue.get('key')]
-
-            # Filter by dates if specified
-            if date_from or date_to:
-                date_conditions = []
-                if date_from:
-                    date_conditions.append(f'worklogDate >= "{date_from}"')
-                if date_to:
-                    date_conditions.append(f'worklogDate <= "{date_to}"')
-
-                date_query = ' AND '.join(date_conditions)
-
-                # Get issues with worklog for the specified period across ALL implementation projects
-                analysis_state['status_message'] = f'Filtering issues by worklog date: {date_query}'
-
-                # For each project, get tasks with worklog in the specified period
-                filtered_issues = []
-                total_issues_count = 0
-                batch_size = 50
-
-                if implementation_keys:
-                    # Делаем фильтрацию на основе ключей задач, а не только по проектам
-                    # Это обеспечит, что мы получим только тикеты связанные с нашими CLM и их сабтаски
-                    for i in range(0, len(implementation_keys), batch_size):
-                        batch = implementation_keys[i:i + batch_size]
-
-                        # Используем key IN для точного соответствия только нужным задачам
-                        keys_condition = f'key in ({", ".join(batch)})'
-                        batch_query = f'({keys_condition}) AND ({date_query})'
-
-                        logger.info(f"Fetching filtered batch {i // batch_size + 1} with query: {batch_query}")
-                        batch_issues = analyzer.get_issues_by_filter(jql_query=batch_query)
-                        filtered_issues.extend(batch_issues)
-
-                        total_issues_count += len(batch_issues)
-                        analysis_state['progress'] = 30 + int((i + batch_size) / len(implementation_keys) * 10)
-                        analysis_state[
-                            'status_message'] = f'Filtered {i + min(batch_size, len(implementation_keys) - i)}/{len(implementation_keys)} implementation issues, found {total_issues_count} issues with worklogs'
+            implementation_keys = [issue.get('key') for issue in implementation_stubs if issue.get('key')]
+
+            # MODIFIED: Save both filtered and all implementation issues in raw_issues.json
+            # Both lists and the CLM, EST and Improvement issues go into a single structure
+            raw_issues_path = os.path.join(output_dir, 'raw_issues.json')
+            with RawIssueWriter(raw_issues_path, RAW_ISSUES_LISTS) as raw_writer:
+                raw_writer.extend(clm_issues, 'additional_data.clm_issues')
+                raw_writer.extend(est_issues, 'additional_data.est_issues')
+                raw_writer.extend(improvement_issues, 'additional_data.improvement_issues')
+
+                implementation_bodies = analyzer.iter_issue_bodies(implementation_stubs, 'dashboard', store)
+                implementation_issues = []
+
+                if date_from or date_to:
+                    # With a date filter the CLM chart also needs all implementation issues
+                    implementation_df = analyzer.process_issues_data(collect_issues(
+                        implementation_bodies, raw_writer, ('all_implementation_issues',), implementation_issues))
+                    save_frame(os.path.join(data_dir, 'implementation_data'), implementation_df)
+                    del implementation_df
                 else:
-                    # Если по какой-то причине implementation_keys пустой, используем поиск по проектам
-                    logger.warning(
-                        "No implementation issue keys found, falling back to project-based filtering")
-                    for project in implementation_projects:
-                        project_query = f'project = "{project}" AND ({date_query})'
-                        project_issues = analyzer.get_issues_by_filter(jql_query=project_query)
-                        filtered_issues.extend(project_issues)
-
-                        total_issues_count += len(project_issues)
-                        analysis_state[
-                            'status_message'] = f'Processed {len(implementation_projects)} projects, found {total_issues_count} issues with worklogs'
-
-                # MODIFIED: Save both filtered and all implementation issues in raw_issues.json
-                # Combine both filtered issues and implementation issues into a single structure
-                combined_issues = {
-                    "filtered_issues": filtered_issues,
-                    "all_implementation_issues": implementation_issues,
-                    "additional_data": {
-                        "clm_issues": clm_issues,
-                        "est_issues": est_issues,
-                        "improvement_issues": improvement_issues
-                    }
-                }
+                    # Use all issues without date filtering: filtered_issues and implementation_issues are identical
+                    df = analyzer.process_issues_data(collect_issues(
+                        implementation_bodies, raw_writer, ('filtered_issues', 'all_implementation_issues'),
+                        implementation_issues))
+
+                # Extract all unique projects from implementation issues
+                implementation_projects = set()
+                for issue in implementation_issues:
+                    project_key = issue.get('fields', {}).get('project', {}).get('key', '')
+                    if project_key:
+                        implementation_projects.add(project_key)
 
-                raw_issues_path = os.path.join(output_dir, 'raw_issues.json')
-                with open(raw_issues_path, 'w', encoding='utf-8') as f:
-                    json.dump(combined_issues, f, indent=2, ensure_ascii=False)
-                logger.info(
-                    f"Saved combined issues data with {len(filtered_issues)} filtered issues and {len(implementation_issues)} total implementation issues to {raw_issues_path}")
+                state[
+                    'status_message'] = f'Found {len(implementation_projects)} unique projects in implementation issues'
 
-                # Use the filtered issues for the current analysis
-                issues = filtered_issues
-            else:
-                # Use all issues without date filtering
-                issues = implementation_issues
-
-                # In this case, filtered_issues and implementation_issues are identical
-                # Still use the combined structure for consistency
-                combined_issues = {
-                    "filtered_issues": implementation_issues,
-                    "all_implementation_issues": implementation_issues,
-                    "additional_data": {
-                        "clm_issues": clm_issues,
-                        "est_issues": est_issues,
-                        "improvement_issues": improvement_issues
-                    }
-                }
+                # Extract issue keys by project
+                project_issue_mapping = {}
+                for issue in implementation_issues:
+                    issue_key = issue.get('key')
+                    project_key = issue.get('fields', {}).get('project', {}).get('key', '')
+                    if issue_key and project_key:
+                        if project_key not in project_issue_mapping:
+                            project_issue_mapping[project_key] = []
+                        project_issue_mapping[project_key].append(issue_key)
+
+                # Filter by dates if specified
+                if date_from or date_to:
+                    date_conditions = []
+                    if date_from:
+                        date_conditions.append(f'worklogDate >= "{date_from}"')
+                    if date_to:
+                        date_conditions.append(f'worklogDate <= "{date_to}"')
+
+                    date_query = ' AND '.join(date_conditions)
+
+                    # Get issues with worklog for the specified period across ALL implementation projects
+                    state['status_message'] = f'Filtering issues by worklog date: {date_query}'
+
+                    filtered_issues = []
+                    df = analyzer.process_issues_data(collect_issues(
+                        iter_worklog_filtered_issues(analyzer, implementation_keys, implementation_projects,
+                                                     date_query, store, state),
+                        raw_writer, ('filtered_issues',), filtered_issues))
+                else:
+                    filtered_issues = implementation_issues
 
-                raw_issues_path = os.path.join(output_dir, 'raw_issues.json')
-                with open(raw_issues_path, 'w', encoding='utf-8') as f:
-                    json.dump(combined_issues, f, indent=2, ensure_ascii=False)
-                logger.info(f"Saved combined issues data with {len(implementation_issues)} issues to {raw_issues_path}")
+            # Use the filtered issues for the current analysis
+            issues = filtered_issues
+            logger.info(
+                f"Saved combined issues data with {len(filtered_issues)} filtered issues and {len(implementation_issues)} total implementation issues to {raw_writer.stats['path']}")
 
-                filtered_issues = implementation_issues
+            # ALL implementation issues for later use, as references into raw_issues.json
+            raw_issues_all_path = os.path.join(output_dir, 'raw_issues_all.json')
+            raw_writer.save_refs(raw_issues_all_path, 'all_implementation_issues')
 
             # Also save issue keys for later JQL generation
             clm_issue_keys = [issue.get('key') for issue in clm_issues if issue.get('key')]
@@ -552,8 +608,8 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
                 json.dump(clm_metrics, f, indent=4, ensure_ascii=False)
 
             # Create array of issue dictionaries for processing
-            analysis_state['status_message'] = f'Processing {len(issues)} issues...'
-            analysis_state['progress'] = 45
+            state['status_message'] = f'Processing {len(issues)} issues...'
+            state['progress'] = 45
 
             # Set issues for further processing
             if not issues:
@@ -586,17 +642,19 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
                     'jql_query': None,
                     'clm_filter_id': clm_filter_id if use_filter else None,
                     'clm_jql_query': clm_jql_query if not use_filter else None,
-                    'data_source': data_source
+                    'data_source': data_source,
+                    'format_version': SNAPSHOT_FORMAT_VERSION
                 }
 
                 index_path = os.path.join(output_dir, 'index.json')
                 with open(index_path, 'w', encoding='utf-8') as f:
                     json.dump(index_data, f, indent=4, ensure_ascii=False)
+                record_analysis(output_dir)
 
-                analysis_state[
+                state[
                     'status_message'] = "No implementation issues found with time logged in the specified period."
-                analysis_state['is_running'] = False
-                return
+                state['is_running'] = False
+                return timestamp
 
         # Add date filtering if specified (for Jira mode or as additional condition for CLM)
         if data_source == 'jira' and (date_from or date_to):
@@ -617,25 +675,32 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
                 logger.info(f"Added date conditions: {date_condition_str}")
 
         if data_source == 'jira':
-            analysis_state['status_message'] = f'Using query: {final_jql}'
-            analysis_state['progress'] = 10
+            state['status_message'] = f'Using query: {final_jql}'
+            state['progress'] = 10
 
             # Fetch issues
-            analysis_state['status_message'] = 'Fetching issues from Jira...'
+            state['status_message'] = 'Fetching issues from Jira...'
 
             # Important: Pass jql_query and filter_id correctly based on use_filter
             if use_filter:
-                issues = analyzer.get_issues_by_filter(filter_id=filter_id)
                 logger.info(f"Fetching issues using filter ID: {filter_id}")
+                issue_stream = analyzer.iter_sync_query(f'filter={filter_id}', profile='dashboard', store=store)
             else:
-                issues = analyzer.get_issues_by_filter(jql_query=final_jql)
                 logger.info(f"Fetching issues using JQL query: {final_jql}")
+                issue_stream = analyzer.iter_sync_query(final_jql, profile='dashboard', store=store)
+
+            # Raw issues are turned into rows page by page and are not kept in memory
+            df = analyzer.process_issues_data(issue_stream)
+            issues_count = len(df)
+        else:
+            # CLM issues were turned into rows while they were streamed into raw_issues.json
+            issues_count = len(issues)
 
-        analysis_state['total_issues'] = len(issues)
-        analysis_state['status_message'] = f'Found {len(issues)} issues.'
-        analysis_state['progress'] = 50
+        state['total_issues'] = issues_count
+        state['status_message'] = f'Found {issues_count} issues.'
+        state['progress'] = 50
 
-        if not issues:
+        if not issues_count:
             # Create empty summary file with required fields
             summary_path = os.path.join(output_dir, 'summary.json')
             summary_data = {
@@ -668,25 +733,25 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
                 'jql_query': jql_query if not use_filter and data_source == 'jira' else None,
                 'clm_filter_id': clm_filter_id if use_filter and data_source == 'clm' else None,
                 'clm_jql_query': clm_jql_query if not use_filter and data_source == 'clm' else None,
-                'data_source': data_source
+                'data_source': data_source,
+                'format_version': SNAPSHOT_FORMAT_VERSION
             }
 
             index_path = os.path.join(output_dir, 'index.json')
             with open(index_path, 'w', encoding='utf-8') as f:
                 json.dump(index_data, f, indent=4, ensure_ascii=False)
+            record_analysis(output_dir)
 
-            analysis_state['status_message'] = "No issues found. Check query or credentials."
-            analysis_state['is_running'] = False
-            return
+            state['status_message'] = "No issues found. Check query or credentials."
+            state['is_running'] = False
+            return timestamp
 
         # Process data
-        analysis_state['status_message'] = 'Processing issue data...'
-        analysis_state['progress'] = 60
-        df = analyzer.process_issues_data(issues)
+        state['status_message'] = 'Processing issue data...'
+        state['progress'] = 60
 
-        # Save raw data for interactive charts
-        raw_data_path = os.path.join(data_dir, 'raw_data.json')
-        df.to_json(raw_data_path, orient='records')
+        # Save processed data as a columnar snapshot for interactive charts
+        save_frame(os.path.join(data_dir, 'raw_data'), df)
 
         # If this is CLM mode, let's also identify and store open task issue keys for better JQL generation
         if data_source == 'clm':
@@ -724,15 +789,15 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
                             project_implementation_mapping[project_key].append(issue_key)
 
         # Create visualizations
-        analysis_state['status_message'] = 'Creating visualizations...'
-        analysis_state['progress'] = 70
+        state['status_message'] = 'Creating visualizations...'
+        state['progress'] = 70
 
         # Передаем implementation_issues в функцию create_visualizations
         chart_paths = analyzer.create_visualizations(df, output_dir)
 
         # For CLM analysis, create additional CLM summary visualization
         if data_source == 'clm' and clm_metrics:
-            analysis_state['status_message'] = 'Creating CLM summary visualization...'
+            state['status_message'] = 'Creating CLM summary visualization...'
             import matplotlib.pyplot as plt
             import seaborn as sns
 
@@ -764,8 +829,8 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
             chart_paths['clm_summary'] = clm_summary_path
 
         # Generate data for interactive charts
-        analysis_state['status_message'] = 'Creating interactive charts...'
-        analysis_state['progress'] = 80
+        state['status_message'] = 'Creating interactive charts...'
+        state['progress'] = 80
 
         # Prepare chart data
         chart_data = prepare_chart_data(
@@ -794,7 +859,7 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
         # Create index file with chart information
         index_data = {
             'timestamp': timestamp,
-            'total_issues': len(issues),
+            'total_issues': issues_count,
             'charts': chart_paths,
             'summary': {},
             'date_from': date_from,
@@ -803,7 +868,8 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
             'jql_query': jql_query if not use_filter and data_source == 'jira' else None,
             'clm_filter_id': clm_filter_id if use_filter and data_source == 'clm' else None,
             'clm_jql_query': clm_jql_query if not use_filter and data_source == 'clm' else None,
-            'data_source': data_source
+            'data_source': data_source,
+            'format_version': SNAPSHOT_FORMAT_VERSION
         }
 
         # Load summary data if available
@@ -843,7 +909,7 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
 
                 # Create default summary
                 index_data['summary'] = {
-                    'total_issues': len(issues),
+                    'total_issues': issues_count,
                     'total_original_estimate_hours': 0,
                     'total_time_spent_hours': 0,
                     'projects_count': len(df['project'].unique()) if not df.empty else 0,
@@ -860,16 +926,38 @@ def run_analysis(data_source='jira', use_filter=True, filter_id=114476, jql_quer
         index_path = os.path.join(output_dir, 'index.json')
         with open(index_path, 'w', encoding='utf-8') as f:
             json.dump(index_data, f, indent=4, ensure_ascii=False)
+        record_analysis(output_dir)
 
-        analysis_state['status_message'] = f'Analysis complete. Charts saved to {output_dir}.'
-        analysis_state['progress'] = 100
-        analysis_state['last_run'] = timestamp
+        state['status_message'] = f'Analysis complete. Charts saved to {output_dir}.'
+        state['progress'] = 100
+        state['last_run'] = timestamp
+        return timestamp
 
+    except JobCancelled:
+        logger.info("Analysis cancelled")
+        raise
     except Exception as e:
         logger.error(f"Error during analysis: {e}", exc_info=True)
-        analysis_state['status_message'] = f"An error occurred: {str(e)}"
+        state['status_message'] = f"An error occurred: {str(e)}"
     finally:
-        analysis_state['is_running'] = False
+        state['is_running'] = False
+
+
+def run_analysis_job(job, **params):
+    """
+    Job target of an analysis (see modules.job_queue)
+
+    Args:
+        job (Job): Running job, its progress record is updated by the analysis
+        **params: Keyword arguments of run_analysis
+
+    Returns:
+        dict: Timestamp folder of the analysis
+    """
+    timestamp = run_analysis(progress=job.progress, **params)
+    if timestamp is None:
+        raise RuntimeError(job.progress.get('status_message') or 'Analysis failed')
+    return {'timestamp': timestamp}
 
 
 def map_components_to_projects(est_issues, implementation_issues, all_related_issues=None):
@@ -0,0 +1,492 @@
+"""
+Catalog of analyses (jira_charts/<timestamp>) and daily dashboard snapshots (nbss_data/<YYYYMMDD>).
+
+Listing pages read the metadata of every folder (index.json, summary.json). The
+catalog keeps this metadata in SQLite, so a listing is one query plus one
+directory scan that picks up folders created or removed outside the app:
+
+    analyses         - timestamp, data source, filters, date range, totals, chart list
+    daily_snapshots  - date and the summary.json content of a collection
+
+Rows are written when run_analysis, collect_daily_data and save_daily_data
+finish. Existing folders can be loaded (together with the dashboard time-series
+index, see modules/dashboard_series.py) with:
+
+    python rebuild_catalog.py
+"""
+import os
+import json
+import sqlite3
+import logging
+import argparse
+import threading
+from datetime import datetime
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Default settings (can be overridden in config.py)
+DEFAULT_CATALOG_PATH = os.path.join('data', 'catalog.db')
+DEFAULT_CHARTS_DIR = 'jira_charts'
+DEFAULT_DASHBOARD_DIR = 'nbss_data'
+
+try:
+    import config
+
+    CATALOG_ENABLED = getattr(config, 'CATALOG_ENABLED', True)
+    CATALOG_PATH = getattr(config, 'CATALOG_PATH', DEFAULT_CATALOG_PATH)
+except ImportError:
+    CATALOG_ENABLED = True
+    CATALOG_PATH = DEFAULT_CATALOG_PATH
+
+RECORDED_AT_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def read_analysis_info(folder_path):
+    """
+    Read the listing metadata of an analysis folder from its index.json
+
+    Args:
+        folder_path (str): Path to jira_charts/<timestamp>
+
+    Returns:
+        dict: Listing metadata (defaults if index.json is missing or broken)
+    """
+    info = {
+        'timestamp': os.path.basename(os.path.normpath(folder_path)),
+        'data_source': 'jira',  # Default to 'jira' if not specified
+        'filter_id': None,
+        'jql_query': None,
+        'clm_filter_id': None,
+        'clm_jql_query': None,
+        'date_from': None,
+        'date_to': None,
+        'total_issues': 0,
+        'charts': {},
+        'format_version': None
+    }
+
+    index_file = os.path.join(folder_path, 'index.json')
+    if os.path.exists(index_file):
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for key in info:
+                if key != 'timestamp' and data.get(key) is not None:
+                    info[key] = data[key]
+        except Exception as e:
+            logger.error(f"Error reading index file {index_file}: {e}")
+    return info
+
+
+def read_daily_summary(folder_path):
+    """
+    Read summary.json of a daily dashboard snapshot
+
+    Args:
+        folder_path (str): Path to nbss_data/<YYYYMMDD>
+
+    Returns:
+        dict: Summary data or None if the file is missing or broken
+    """
+    summary_path = os.path.join(folder_path, 'summary.json')
+    if not os.path.exists(summary_path):
+        return None
+    try:
+        with open(summary_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.error(f"Error reading summary file {summary_path}: {e}")
+        return None
+
+
+def is_analysis_folder(name):
+    """Whether a jira_charts entry name is an analysis folder"""
+    return name != 'data'
+
+
+def is_daily_folder(name):
+    """Whether an nbss_data entry name is a daily snapshot folder (YYYYMMDD)"""
+    return name.isdigit() and len(name) == 8
+
+
+def scan_folders(root, predicate):
+    """
+    List subfolder names of a directory
+
+    Args:
+        root (str): Directory to scan
+        predicate (callable): Filter of folder names
+
+    Returns:
+        set: Folder names
+    """
+    if not os.path.exists(root):
+        return set()
+    with os.scandir(root) as entries:
+        return {entry.name for entry in entries if entry.is_dir() and predicate(entry.name)}
+
+
+class Catalog:
+    """
+    SQLite catalog of analysis folders and daily dashboard snapshots.
+
+    Folders are keyed by their parent directory (absolute path) and name, so
+    several chart or dashboard directories can share one catalog. Filter IDs are
+    stored without a column type, so numbers and strings come back as written.
+    """
+
+    def __init__(self, path=None):
+        """
+        Initialize the catalog and create tables if needed
+
+        Args:
+            path (str): Path to SQLite database file
+        """
+        self.path = path or CATALOG_PATH
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS analyses (
+                    root TEXT,
+                    timestamp TEXT,
+                    data_source TEXT,
+                    filter_id,
+                    jql_query TEXT,
+                    clm_filter_id,
+                    clm_jql_query TEXT,
+                    date_from TEXT,
+                    date_to TEXT,
+                    total_issues INTEGER,
+                    charts TEXT,
+                    format_version INTEGER,
+                    recorded_at TEXT,
+                    PRIMARY KEY (root, timestamp)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS daily_snapshots (
+                    root TEXT,
+                    folder TEXT,
+                    date TEXT,
+                    summary TEXT,
+                    recorded_at TEXT,
+                    PRIMARY KEY (root, folder)
+                )
+            """)
+
+    def _connect(self):
+        """Open a new connection (one per call, so the catalog can be used from worker threads)"""
+        return sqlite3.connect(self.path, timeout=30)
+
+    def record_analysis(self, folder_path, conn=None):
+        """
+        Insert or update an analysis from its folder
+
+        Args:
+            folder_path (str): Path to jira_charts/<timestamp>
+            conn (sqlite3.Connection): Connection of an open transaction (a new one if None)
+        """
+        root, timestamp = _split_folder(folder_path)
+        info = read_analysis_info(folder_path)
+        row = (
+            root, timestamp, info['data_source'],
+            info['filter_id'], info['jql_query'], info['clm_filter_id'], info['clm_jql_query'],
+            info['date_from'], info['date_to'], int(info['total_issues'] or 0),
+            json.dumps(info['charts'], ensure_ascii=False), info['format_version'],
+            datetime.now().strftime(RECORDED_AT_FORMAT)
+        )
+        sql = """
+            INSERT OR REPLACE INTO analyses (root, timestamp, data_source, filter_id, jql_query, clm_filter_id,
+                                             clm_jql_query, date_from, date_to, total_issues, charts,
+                                             format_version, recorded_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        if conn is not None:
+            conn.execute(sql, row)
+            return
+        with self._connect() as conn:
+            conn.execute(sql, row)
+
+    def record_daily_snapshot(self, folder_path, summary=None, conn=None):
+        """
+        Insert or update a daily dashboard snapshot
+
+        Args:
+            folder_path (str): Path to nbss_data/<YYYYMMDD>
+            summary (dict): Summary just written (read from summary.json if None)
+            conn (sqlite3.Connection): Connection of an open transaction (a new one if None)
+        """
+        root, folder = _split_folder(folder_path)
+        if summary is None:
+            summary = read_daily_summary(folder_path)
+        row = (
+            root, folder,
+            (summary or {}).get('date') or _folder_date(folder),
+            json.dumps(summary, ensure_ascii=False) if summary is not None else None,
+            datetime.now().strftime(RECORDED_AT_FORMAT)
+        )
+        sql = """
+            INSERT OR REPLACE INTO daily_snapshots (root, folder, date, summary, recorded_at)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        if conn is not None:
+            conn.execute(sql, row)
+            return
+        with self._connect() as conn:
+            conn.execute(sql, row)
+
+    def remove_analysis(self, folder_path):
+        """
+        Remove a deleted analysis
+
+        Args:
+            folder_path (str): Path to jira_charts/<timestamp>
+        """
+        root, timestamp = _split_folder(folder_path)
+        with self._connect() as conn:
+            conn.execute('DELETE FROM analyses WHERE root = ? AND timestamp = ?', (root, timestamp))
+
+    def list_analyses(self, charts_dir):
+        """
+        List analyses of a charts directory, newest first
+
+        Args:
+            charts_dir (str): Directory with analysis folders
+
+        Returns:
+            list: Listing metadata dictionaries (see read_analysis_info)
+        """
+        root = os.path.abspath(charts_dir)
+        self._sync(charts_dir, 'analyses', 'timestamp', is_analysis_folder, self.record_analysis)
+
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute("""
+                SELECT timestamp, data_source, filter_id, jql_query, clm_filter_id, clm_jql_query,
+                       date_from, date_to, total_issues, charts, format_version
+                FROM analyses WHERE root = ? ORDER BY timestamp DESC
+            """, (root,)).fetchall()
+
+        analyses = []
+        for row in rows:
+            info = dict(row)
+            info['charts'] = json.loads(info['charts']) if info['charts'] else {}
+            analyses.append(info)
+        return analyses
+
+    def list_daily_snapshots(self, dashboard_dir):
+        """
+        List daily snapshots of a dashboard directory, oldest first
+
+        Args:
+            dashboard_dir (str): Directory with YYYYMMDD folders
+
+        Returns:
+            list: (folder name, summary dictionary or None) tuples
+        """
+        root = os.path.abspath(dashboard_dir)
+        self._sync(dashboard_dir, 'daily_snapshots', 'folder', is_daily_folder, self.record_daily_snapshot)
+
+        with self._connect() as conn:
+            rows = conn.execute('SELECT folder, summary FROM daily_snapshots WHERE root = ? ORDER BY folder',
+                                (root,)).fetchall()
+        return [(folder, json.loads(summary) if summary else None) for folder, summary in rows]
+
+    def rebuild(self, charts_dir=DEFAULT_CHARTS_DIR, dashboard_dir=DEFAULT_DASHBOARD_DIR):
+        """
+        Rebuild the catalog entries of both directories from their folders in one transaction
+
+        Args:
+            charts_dir (str): Directory with analysis folders
+            dashboard_dir (str): Directory with daily snapshot folders
+
+        Returns:
+            dict: Number of analyses and daily snapshots
+        """
+        analyses = sorted(scan_folders(charts_dir, is_analysis_folder))
+        snapshots = sorted(scan_folders(dashboard_dir, is_daily_folder))
+        with self._connect() as conn:
+            conn.execute('DELETE FROM analyses WHERE root = ?', (os.path.abspath(charts_dir),))
+            conn.execute('DELETE FROM daily_snapshots WHERE root = ?', (os.path.abspath(dashboard_dir),))
+            for folder in analyses:
+                self.record_analysis(os.path.join(charts_dir, folder), conn=conn)
+            for folder in snapshots:
+                self.record_daily_snapshot(os.path.join(dashboard_dir, folder), conn=conn)
+
+        logger.info(f"Rebuilt catalog {self.path}: {len(analyses)} analyses, {len(snapshots)} daily snapshots")
+        return {'analyses': len(analyses), 'daily_snapshots': len(snapshots)}
+
+    def _sync(self, directory, table, name_column, predicate, record):
+        """Add folders missing from the catalog and drop entries of removed folders (one directory scan)"""
+        root = os.path.abspath(directory)
+        folders = scan_folders(directory, predicate)
+        with self._connect() as conn:
+            known = {row[0] for row in conn.execute(f'SELECT {name_column} FROM {table} WHERE root = ?', (root,))}
+            added = sorted(folders - known)
+            removed = sorted(known - folders)
+            for folder in added:
+                record(os.path.join(directory, folder), conn=conn)
+            if removed:
+                conn.executemany(f'DELETE FROM {table} WHERE root = ? AND {name_column} = ?',
+                                 [(root, folder) for folder in removed])
+
+        if added or removed:
+            logger.info(f"Catalog synced with {directory}: {len(added)} folders added, {len(removed)} removed")
+
+
+def _split_folder(folder_path):
+    folder_path = os.path.abspath(folder_path)
+    return os.path.dirname(folder_path), os.path.basename(folder_path)
+
+
+def _folder_date(folder):
+    try:
+        return datetime.strptime(folder, '%Y%m%d').strftime('%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog():
+    """
+    Get the shared catalog if it is enabled in config
+
+    Returns:
+        Catalog: Shared catalog instance or None if disabled or unavailable
+    """
+    global _catalog
+    if not CATALOG_ENABLED:
+        return None
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                try:
+                    _catalog = Catalog()
+                    logger.info(f"Opened catalog: {_catalog.path}")
+                except Exception as e:
+                    logger.error(f"Error opening catalog: {e}", exc_info=True)
+                    return None
+    return _catalog
+
+
+def list_analyses(charts_dir=DEFAULT_CHARTS_DIR):
+    """
+    List analyses newest first, from the catalog or by reading every index.json if it is disabled
+
+    Args:
+        charts_dir (str): Directory with analysis folders
+
+    Returns:
+        list: Listing metadata dictionaries (see read_analysis_info)
+    """
+    catalog = get_catalog()
+    if catalog is not None:
+        try:
+            return catalog.list_analyses(charts_dir)
+        except Exception as e:
+            logger.error(f"Error listing analyses from catalog: {e}", exc_info=True)
+
+    return [read_analysis_info(os.path.join(charts_dir, folder))
+            for folder in sorted(scan_folders(charts_dir, is_analysis_folder), reverse=True)]
+
+
+def list_daily_snapshots(dashboard_dir=DEFAULT_DASHBOARD_DIR):
+    """
+    List daily snapshots oldest first, from the catalog or by reading every summary.json if it is disabled
+
+    Args:
+        dashboard_dir (str): Directory with YYYYMMDD folders
+
+    Returns:
+        list: (folder name, summary dictionary or None) tuples
+    """
+    catalog = get_catalog()
+    if catalog is not None:
+        try:
+            return catalog.list_daily_snapshots(dashboard_dir)
+        except Exception as e:
+            logger.error(f"Error listing daily snapshots from catalog: {e}", exc_info=True)
+
+    return [(folder, read_daily_summary(os.path.join(dashboard_dir, folder)))
+            for folder in sorted(scan_folders(dashboard_dir, is_daily_folder))]
+
+
+def record_analysis(folder_path):
+    """
+    Update the catalog entry of an analysis after its index.json was written
+
+    Args:
+        folder_path (str): Path to jira_charts/<timestamp>
+    """
+    catalog = get_catalog()
+    if catalog is None:
+        return
+    try:
+        catalog.record_analysis(folder_path)
+    except Exception as e:
+        logger.error(f"Error recording analysis {folder_path} in catalog: {e}")
+
+
+def record_daily_snapshot(folder_path, summary=None):
+    """
+    Update the catalog entry of a daily snapshot after its summary.json was written
+
+    Args:
+        folder_path (str): Path to nbss_data/<YYYYMMDD>
+        summary (dict): Summary just written (read from summary.json if None)
+    """
+    catalog = get_catalog()
+    if catalog is None:
+        return
+    try:
+        catalog.record_daily_snapshot(folder_path, summary)
+    except Exception as e:
+        logger.error(f"Error recording daily snapshot {folder_path} in catalog: {e}")
+
+
+def remove_analysis(folder_path):
+    """
+    Remove the catalog entry of a deleted analysis
+
+    Args:
+        folder_path (str): Path to jira_charts/<timestamp>
+    """
+    catalog = get_catalog()
+    if catalog is None:
+        return
+    try:
+        catalog.remove_analysis(folder_path)
+    except Exception as e:
+        logger.error(f"Error removing analysis {folder_path} from catalog: {e}")
+
+
+def main(argv=None):
+    """
+    Command line entry point: rebuild the catalog from existing folders
+
+    Args:
+        argv (list): Command line arguments (sys.argv if None)
+    """
+    parser = argparse.ArgumentParser(description="Rebuild the catalog of analyses and daily dashboard snapshots")
+    parser.add_argument("--charts-dir", default=DEFAULT_CHARTS_DIR, help="Directory with analysis folders")
+    parser.add_argument("--dashboard-dir", default=DEFAULT_DASHBOARD_DIR, help="Directory with daily snapshot folders")
+    parser.add_argument("--catalog", default=None, help=f"Catalog database path (default: {CATALOG_PATH})")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    catalog = Catalog(args.catalog)
+    counts = catalog.rebuild(args.charts_dir, args.dashboard_dir)
+    print(f"Catalog rebuilt: {counts['analyses']} analyses, {counts['daily_snapshots']} daily snapshots")
+
+    # The dashboard time-series index is derived from the same summaries
+    from modules.dashboard_series import rebuild_time_series
+    series = rebuild_time_series(args.dashboard_dir, catalog.list_daily_snapshots(args.dashboard_dir))
+    print(f"Time-series index rebuilt: {len(series['days'])} days")
@@ -4,14 +4,20 @@ import logging
 from datetime import datetime
 
 import pandas as pd
-import requests
 from io import BytesIO
+from .jira_client import get_jira_client
 from .status_transitioner import ClmStatusTransitioner
+from .clm_results_journal import get_results_journal
 
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# Creation results: append-only journal, the JSON file is the previous format
+RESULTS_DIR = os.path.join('data', 'clm_results')
+RESULTS_FILE = os.path.join(RESULTS_DIR, 'creation_results.jsonl')
+LEGACY_RESULTS_FILE = os.path.join(RESULTS_DIR, 'creation_results.json')
+
 
 class ClmErrorCreator:
     def __init__(self, jira_url=None):
@@ -19,8 +25,14 @@ class ClmErrorCreator:
         Initialize CLM Error creator
 
         Args:
-            jira_url (str): Base URL for your Jira instance
+            jira_url (str): Base URL for your Jira instance (config.jira_url if None)
         """
+        if jira_url is None:
+            try:
+                import config
+                jira_url = getattr(config, 'jira_url', None)
+            except ImportError:
+                pass
         self.jira_url = jira_url or 'https://jira.nexign.com'
         logger.info(f"Initializing ClmErrorCreator with Jira URL: {self.jira_url}")
 
@@ -45,6 +57,21 @@ class ClmErrorCreator:
             self.api_token = None
             self.headers = {}
 
+        # Shared pooled HTTP client (keep-alive, retries with backoff)
+        self.client = get_jira_client()
+
+        # Path for storing creation results (set up before the transition monitor starts reading it)
+        self.results_dir = RESULTS_DIR
+        self.results_file = RESULTS_FILE
+        self.legacy_results_file = LEGACY_RESULTS_FILE
+
+        # Ensure the results directory exists
+        if not os.path.exists(self.results_dir):
+            os.makedirs(self.results_dir)
+
+        # Shared journal with in-memory indexes by source and CLM Error key
+        self.results_journal = get_results_journal(self.results_file, self.legacy_results_file)
+
         # Initialize the status transitioner
         self.status_transitioner = ClmStatusTransitioner(self)
 
@@ -82,14 +109,6 @@ class ClmErrorCreator:
         self.create_meta = self.get_create_meta()
         self.field_ids = self._get_field_ids()
 
-        # Path for storing creation results
-        self.results_dir = os.path.join('data', 'clm_results')
-        self.results_file = os.path.join(self.results_dir, 'creation_results.json')
-
-        # Ensure the results directory exists
-        if not os.path.exists(self.results_dir):
-            os.makedirs(self.results_dir)
-
     def _get_component_mapping_data(self, component):
         """
         Get Product Group and Subsystem mapping data for a given component.
@@ -230,7 +249,7 @@ class ClmErrorCreator:
                     return field_mappings
 
                 url = f"{self.jira_url}/rest/api/2/field"
-                response = requests.get(
+                response = self.client.get(
                     url,
                     headers=self.headers,
                     timeout=30
@@ -367,7 +386,7 @@ class ClmErrorCreator:
                 url = f"{self.jira_url}/rest/api/2/field/{field_id}/option"
                 logger.info(f"Fetching options for field {field_id} from {url}")
 
-                response = requests.get(
+                response = self.client.get(
                     url,
                     headers=self.headers,
                     timeout=30
@@ -445,7 +464,7 @@ class ClmErrorCreator:
             url = f"{self.jira_url}/rest/api/2/issue/{issue_key}"
             logger.info(f"Fetching issue details for {issue_key} from {url}")
 
-            response = requests.get(
+            response = self.client.get(
                 url,
                 headers=self.headers,
                 timeout=30
@@ -478,10 +497,13 @@ class ClmErrorCreator:
             logger.error(f"Error getting issue details for {issue_key}: {e}", exc_info=True)
             return None
 
-    def get_available_link_types(self):
+    def get_available_link_types(self, use_cache=True):
         """
         Get all available issue link types from Jira
 
+        Args:
+            use_cache (bool): Allow the response from the Jira response cache
+
         Returns:
             list: List of link type dictionaries with inward, outward, and name properties
         """
@@ -494,10 +516,11 @@ class ClmErrorCreator:
             url = f"{self.jira_url}/rest/api/2/issueLinkType"
             logger.info(f"Fetching available link types from {url}")
 
-            response = requests.get(
+            response = self.client.get(
                 url,
                 headers=self.headers,
-                timeout=30
+                timeout=30,
+                cache=use_cache
             )
 
             if response.status_code != 200:
@@ -569,7 +592,7 @@ class ClmErrorCreator:
             }
 
             # Make the API request
-            response = requests.post(
+            response = self.client.post(
                 url,
                 headers=self.headers,
                 data=json.dumps(link_data),
@@ -588,7 +611,7 @@ class ClmErrorCreator:
                     logger.info(f"Trying again with default link type '{self.default_link_type}'")
                     link_data["type"]["name"] = self.default_link_type
 
-                    retry_response = requests.post(
+                    retry_response = self.client.post(
                         url,
                         headers=self.headers,
                         data=json.dumps(link_data),
@@ -605,7 +628,7 @@ class ClmErrorCreator:
                 # If there are no cached link types or both attempts failed, try to get the link types again
                 if not self.link_types:
                     logger.info("No cached link types available, fetching them now")
-                    self.link_types = self.get_available_link_types()
+                    self.link_types = self.get_available_link_types(use_cache=False)
 
                     if self.link_types:
                         # Try one more time with the first available link type
@@ -613,7 +636,7 @@ class ClmErrorCreator:
                         logger.info(f"Trying third attempt with first available link type: '{first_link_type}'")
 
                         link_data["type"]["name"] = first_link_type
-                        third_response = requests.post(
+                        third_response = self.client.post(
                             url,
                             headers=self.headers,
                             data=json.dumps(link_data),
@@ -809,7 +832,7 @@ class ClmErrorCreator:
                 logger.warning(f"Could not log request payload: {e}")
 
             # Make the API request to create the issue
-            response = requests.post(
+            response = self.client.post(
                 url,
                 headers=self.headers,
                 data=json.dumps(issue_data),
@@ -861,7 +884,7 @@ class ClmErrorCreator:
             url = f"{self.jira_url}/rest/api/2/issue/createmeta?projectKeys=CLM&issuetypeNames=Error&expand=projects.issuetypes.fields"
             logger.info(f"Fetching create metadata from {url}")
 
-            response = requests.get(
+            response = self.client.get(
                 url,
                 headers=self.headers,
                 timeout=30
@@ -924,30 +947,39 @@ class ClmErrorCreator:
 
     def get_creation_results(self):
         """
-        Get all CLM Error creation results from the results file
+        Get all CLM Error creation results from the results journal
 
         Returns:
             list: List of creation result dictionaries
         """
         try:
-            # Check if results file exists
-            if not os.path.exists(self.results_file):
-                logger.info(f"Results file not found: {self.results_file}")
-                return []
-
-            # Read results from file
-            with open(self.results_file, 'r', encoding='utf-8') as f:
-                results = json.load(f)
-
-            logger.info(f"Retrieved {len(results)} creation results from file")
+            results = self.results_journal.get_results()
+            logger.info(f"Retrieved {len(results)} creation results from journal")
             return results
         except Exception as e:
             logger.error(f"Error getting creation results: {e}", exc_info=True)
             return []
 
+    def find_source_key(self, clm_error_key):
+        """
+        Find the source issue a CLM Error was created for
+
+        Args:
+            clm_error_key (str): CLM Error issue key
+
+        Returns:
+            str: Source issue key or None if the CLM Error is not in the results
+        """
+        try:
+            result = self.results_journal.get_by_clm_error_key(clm_error_key)
+            return result.get('source_key') if result else None
+        except Exception as e:
+            logger.error(f"Error finding source issue of {clm_error_key}: {e}", exc_info=True)
+            return None
+
     def save_creation_result(self, source_key, clm_error_key):
         """
-        Save a CLM Error creation result to the results file
+        Append a CLM Error creation result to the results journal
 
         Args:
             source_key (str): Source issue key
@@ -965,15 +997,7 @@ class ClmErrorCreator:
                 'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             }
 
-            # Get existing results
-            results = self.get_creation_results()
-
-            # Add new result
-            results.append(result)
-
-            # Save results to file
-            with open(self.results_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
+            self.results_journal.append(result)
 
             logger.info(f"Saved creation result for {source_key} -> {clm_error_key}")
             return True
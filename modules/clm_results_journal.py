@@ -0,0 +1,273 @@
+"""
+Append-only journal of CLM Error creation results (data/clm_results/creation_results.jsonl).
+
+Every result is one JSON line appended with flush and fsync, so saving a result
+does not re-read or rewrite the history, and a crash can at most leave a torn
+last line, which is skipped on load and terminated before the next append.
+
+Results are kept in memory with an index by clm_error_key. The
+journal object is shared per file, and lines appended by other processes are
+read incrementally from the last known offset.
+
+Compaction rewrites the file (temp file + os.replace) without torn lines,
+exact duplicates and failed attempts that a later successful result for the
+same source issue superseded; failures recorded after the last success of a
+source issue are kept. It runs after CLM_RESULTS_COMPACT_EVERY appended lines.
+
+The previous creation_results.json (one JSON array) is imported once when the
+journal does not exist yet; the old file is left in place.
+"""
+import os
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Default settings (can be overridden in config.py)
+DEFAULT_COMPACT_EVERY = 1000
+
+try:
+    import config
+
+    CLM_RESULTS_COMPACT_EVERY = getattr(config, 'CLM_RESULTS_COMPACT_EVERY', DEFAULT_COMPACT_EVERY)
+except ImportError:
+    CLM_RESULTS_COMPACT_EVERY = DEFAULT_COMPACT_EVERY
+
+RESULT_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class CreationResultsJournal:
+    """Append-only JSON Lines journal of creation results with in-memory indexes"""
+
+    def __init__(self, path, legacy_path=None):
+        """
+        Initialize the journal, importing the legacy JSON file if the journal does not exist
+
+        Args:
+            path (str): Journal file path (.jsonl)
+            legacy_path (str): Previous creation_results.json to import once
+        """
+        self.path = path
+        self.legacy_path = legacy_path
+        self._lock = threading.RLock()
+
+        self._results = []
+        self._by_clm_error_key = {}
+        # Keys of stored results, exact duplicates are not indexed twice
+        self._seen = set()
+        # File identity and bytes of complete lines read so far, line counts for compaction
+        self._inode = None
+        self._offset = 0
+        self._lines = 0
+        self._lines_at_compaction = 0
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        if not os.path.exists(self.path) and legacy_path and os.path.exists(legacy_path):
+            self._import_legacy(legacy_path)
+
+        self._refresh()
+        self._lines_at_compaction = self._lines
+
+    def append(self, result):
+        """
+        Append a result to the journal
+
+        Args:
+            result (dict): Creation result (source_key, clm_error_key, status, timestamp)
+        """
+        line = (json.dumps(result, ensure_ascii=False) + '\n').encode('utf-8')
+        with self._lock:
+            # Lines of other writers first, so the offset stays at the end of the file
+            self._refresh()
+            with open(self.path, 'ab+') as f:
+                size = f.seek(0, os.SEEK_END)
+                if size > self._offset:
+                    # A torn last line left by a crash: terminate it, it is skipped on load
+                    f.write(b'\n')
+                    size += 1
+                    self._lines += 1
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._offset = size + len(line)
+            self._lines += 1
+            self._add(result)
+
+            if self._lines - self._lines_at_compaction >= CLM_RESULTS_COMPACT_EVERY:
+                self.compact()
+
+    def get_results(self):
+        """
+        Get all results in journal order
+
+        Returns:
+            list: Copies of the result dictionaries
+        """
+        with self._lock:
+            self._refresh()
+            return [dict(result) for result in self._results]
+
+    def get_by_clm_error_key(self, clm_error_key):
+        """
+        Get the result that created a CLM Error
+
+        Args:
+            clm_error_key (str): CLM Error issue key
+
+        Returns:
+            dict: Latest result with this key or None
+        """
+        with self._lock:
+            self._refresh()
+            result = self._by_clm_error_key.get(clm_error_key)
+            return dict(result) if result else None
+
+    def get_recent_successes(self, max_hours):
+        """
+        Get successful results created within the last hours
+
+        Args:
+            max_hours (float): Maximum age of a result in hours
+
+        Returns:
+            list: Results in journal order
+        """
+        since = (datetime.now() - timedelta(hours=max_hours)).strftime(RESULT_TIME_FORMAT)
+        with self._lock:
+            self._refresh()
+            return [dict(result) for result in self._results
+                    if result.get('status') == 'success' and result.get('clm_error_key')
+                    and (result.get('timestamp') or '') >= since]
+
+    def compact(self):
+        """
+        Rewrite the journal without torn lines, duplicates and superseded failures
+
+        Returns:
+            int: Number of results kept
+        """
+        with self._lock:
+            self._refresh()
+            # Position of the last success of every source issue, only failures before it are superseded
+            last_success = {result.get('source_key'): position for position, result in enumerate(self._results)
+                            if result.get('status') == 'success'}
+            kept = []
+            for position, result in enumerate(self._results):
+                superseded = (result.get('status') != 'success'
+                              and position < last_success.get(result.get('source_key'), -1))
+                if not superseded:
+                    kept.append(result)
+
+            temp_path = f'{self.path}.tmp'
+            with open(temp_path, 'wb') as f:
+                for result in kept:
+                    f.write((json.dumps(result, ensure_ascii=False) + '\n').encode('utf-8'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+
+            dropped = len(self._results) - len(kept)
+            lines_before = self._lines
+            self._reset()
+            self._refresh()
+            self._lines_at_compaction = self._lines
+            logger.info(f"Compacted CLM Error results journal: {lines_before} lines -> {len(kept)} results "
+                        f"({dropped} superseded failures dropped)")
+            return len(kept)
+
+    def _add(self, result):
+        identity = (result.get('source_key'), result.get('clm_error_key'), result.get('status'), result.get('timestamp'))
+        if identity in self._seen:
+            return
+        self._seen.add(identity)
+        self._results.append(result)
+        if result.get('clm_error_key'):
+            self._by_clm_error_key[result['clm_error_key']] = result
+
+    def _reset(self):
+        self._results = []
+        self._by_clm_error_key = {}
+        self._seen = set()
+        self._inode = None
+        self._offset = 0
+        self._lines = 0
+
+    def _refresh(self):
+        """Read lines appended since the last read (everything again if the file was replaced)"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            self._reset()
+            return
+        size = stat.st_size
+        if stat.st_ino != self._inode or size < self._offset:
+            # Compacted or replaced by another process
+            self._reset()
+            self._inode = stat.st_ino
+        if size == self._offset:
+            return
+
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read(size - self._offset)
+
+        # Only complete lines are consumed, a torn last line is left for the next read
+        end = data.rfind(b'\n') + 1
+        for raw_line in data[:end].splitlines():
+            self._lines += 1
+            if not raw_line.strip():
+                continue
+            try:
+                self._add(json.loads(raw_line))
+            except ValueError:
+                logger.warning(f"Skipping unreadable line in {self.path}")
+        self._offset += end
+
+    def _import_legacy(self, legacy_path):
+        try:
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                results = json.load(f)
+        except Exception as e:
+            logger.error(f"Error importing CLM Error results from {legacy_path}: {e}", exc_info=True)
+            return
+
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'wb') as f:
+            for result in results:
+                f.write((json.dumps(result, ensure_ascii=False) + '\n').encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        logger.info(f"Imported {len(results)} CLM Error results from {legacy_path} into {self.path}")
+
+
+_journals = {}
+_journals_lock = threading.Lock()
+
+
+def get_results_journal(path, legacy_path=None):
+    """
+    Get the shared journal of a results file
+
+    Args:
+        path (str): Journal file path (.jsonl)
+        legacy_path (str): Previous creation_results.json to import once
+
+    Returns:
+        CreationResultsJournal: Journal shared by all creators of the process
+    """
+    key = os.path.abspath(path)
+    journal = _journals.get(key)
+    if journal is None:
+        with _journals_lock:
+            journal = _journals.get(key)
+            if journal is None:
+                journal = CreationResultsJournal(path, legacy_path)
+                _journals[key] = journal
+    return journal
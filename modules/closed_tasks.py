@@ -0,0 +1,239 @@
+"""
+Closed tasks without activity: closed implementation tasks without comments,
+attachments and links, optionally without merge request or remote mentions.
+
+The metric can be computed in three modes (config.CLOSED_TASKS_MODE):
+    local    - filter processed data (requires comments, attachments and links
+               to be downloaded for every implementation issue)
+    pushdown - ask Jira for the keys matching the predicates with JQL and
+               download only these candidates for the final check
+    verify   - run both, log the differences and return the local result
+"""
+import logging
+
+from modules.jql_builder import JqlTemplate
+from modules.data_processor import get_status_categories, get_closed_tasks_without_links, get_issue_mask
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Default mode (can be overridden in config.py)
+DEFAULT_CLOSED_TASKS_MODE = 'local'
+
+CLOSED_TASKS_MODES = ('local', 'pushdown', 'verify')
+
+# Predicates evaluated by Jira; the closed statuses of the data set are added to them
+DEFAULT_PUSHDOWN_CLAUSES = ['comment is EMPTY', 'attachments is EMPTY', 'issueLinkType is EMPTY']
+
+# Field profile of the candidates downloaded for the final check
+PUSHDOWN_PROFILE = 'closed_check'
+
+try:
+    import config
+
+    CLOSED_TASKS_MODE = getattr(config, 'CLOSED_TASKS_MODE', DEFAULT_CLOSED_TASKS_MODE)
+    PUSHDOWN_CLAUSES = getattr(config, 'CLOSED_TASKS_PUSHDOWN_CLAUSES', DEFAULT_PUSHDOWN_CLAUSES)
+except ImportError:
+    CLOSED_TASKS_MODE = DEFAULT_CLOSED_TASKS_MODE
+    PUSHDOWN_CLAUSES = DEFAULT_PUSHDOWN_CLAUSES
+
+
+def quote_jql_value(value):
+    """Quote a value for a JQL clause"""
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def build_pushdown_template(closed_statuses):
+    """
+    Build the JQL template of the pushed down predicates over a key list
+
+    Args:
+        closed_statuses (list): Status names counted as closed
+
+    Returns:
+        JqlTemplate: Template with an {items} placeholder for issue keys
+    """
+    clauses = [f"status in ({', '.join(quote_jql_value(status) for status in closed_statuses)})"]
+    clauses.extend(PUSHDOWN_CLAUSES)
+    # The key list goes last, so the predicates are not repeated per packed key
+    return JqlTemplate(' AND '.join(clauses) + ' AND key in ({items})')
+
+
+def has_activity_fields(issues):
+    """
+    Check that raw issues were downloaded with comments and attachments
+
+    Issues of the 'counts_only' profile have neither, so every closed task of
+    them would look like a task without activity.
+
+    Args:
+        issues (list): Raw issues
+
+    Returns:
+        bool: True if every issue has the comment and attachment fields
+    """
+    for issue in issues:
+        fields = issue.get('fields') or {}
+        if 'comment' not in fields or 'attachment' not in fields:
+            return False
+    return True
+
+
+def get_closed_tasks_locally(df, issues=None, predicate=None):
+    """
+    Filter closed tasks without activity from processed data
+
+    Args:
+        df (pandas.DataFrame): Processed data
+        issues (list): Raw issues for the predicate
+        predicate (callable): Check of one raw issue; matching tasks are excluded
+
+    Returns:
+        tuple: (filtered DataFrame, number of tasks excluded by the predicate)
+    """
+    closed_tasks = get_closed_tasks_without_links(df)
+    if predicate is None or not issues:
+        return closed_tasks, 0
+
+    mask = get_issue_mask(closed_tasks, issues, predicate, getattr(predicate, '__name__', 'check'))
+    return closed_tasks[~mask], int(mask.sum())
+
+
+def get_closed_tasks_with_pushdown(df, analyzer, predicate=None):
+    """
+    Filter closed tasks without activity with JQL predicates evaluated by Jira
+
+    Only the keys of df are queried, packed into as few queries as fit the JQL
+    length limit. Candidates are downloaded with a small field profile and the
+    predicate is applied to them locally.
+
+    Args:
+        df (pandas.DataFrame): Processed data (comments and attachments are not needed)
+        analyzer (JiraAnalyzer): Analyzer used for the searches
+        predicate (callable): Check of one raw issue; matching tasks are excluded
+
+    Returns:
+        tuple: (filtered DataFrame, number of tasks excluded by the predicate)
+    """
+    closed_statuses = get_status_categories(df)['closed_statuses']
+    if df.empty or not closed_statuses:
+        return df.iloc[0:0], 0
+
+    keys = df['issue_key'].dropna().unique().tolist()
+    candidates, excluded = fetch_closed_task_candidates(analyzer, keys, closed_statuses, predicate)
+    candidate_keys = {issue.get('key') for issue in candidates}
+    return df[df['issue_key'].isin(candidate_keys)], excluded
+
+
+def fetch_closed_task_candidates(analyzer, keys, closed_statuses, predicate=None):
+    """
+    Download the issues among keys that match the pushed down predicates
+
+    Args:
+        analyzer (JiraAnalyzer): Analyzer used for the searches
+        keys (list): Issue keys to check
+        closed_statuses (list): Status names counted as closed
+        predicate (callable): Check of one raw issue; matching tasks are excluded
+
+    Returns:
+        tuple: (list of raw candidate issues, number of issues excluded by the predicate)
+    """
+    if not keys or not closed_statuses:
+        return [], 0
+
+    template = build_pushdown_template(closed_statuses)
+    candidates = analyzer.search_keys(keys, template, profile=PUSHDOWN_PROFILE, use_cache=False)
+    logger.info(f"Jira returned {len(candidates)} closed tasks without comments, attachments and links "
+                f"out of {len(keys)} issues")
+
+    excluded = 0
+    if predicate is not None:
+        before = len(candidates)
+        candidates = [issue for issue in candidates if not predicate(issue)]
+        excluded = before - len(candidates)
+    return candidates, excluded
+
+
+def compare_closed_tasks(local_tasks, pushdown_tasks):
+    """
+    Compare results of the local and pushdown modes
+
+    Args:
+        local_tasks (pandas.DataFrame): Result of get_closed_tasks_locally
+        pushdown_tasks (pandas.DataFrame): Result of get_closed_tasks_with_pushdown
+
+    Returns:
+        dict: consistent flag and sorted keys found by only one of the modes
+    """
+    local_keys = set(local_tasks['issue_key'])
+    pushdown_keys = set(pushdown_tasks['issue_key'])
+    return {
+        'consistent': local_keys == pushdown_keys,
+        'local_count': len(local_keys),
+        'pushdown_count': len(pushdown_keys),
+        'local_only': sorted(local_keys - pushdown_keys),
+        'pushdown_only': sorted(pushdown_keys - local_keys)
+    }
+
+
+def get_closed_tasks_without_activity(df, issues=None, predicate=None, analyzer=None, mode=None):
+    """
+    Get closed tasks without comments, attachments, links and predicate matches
+
+    Falls back to the local filter if no analyzer is given or the pushdown
+    searches fail. The local filter needs comments and attachments: if the
+    raw issues were downloaded without them ('counts_only' profile), an error
+    is logged and no closed tasks are returned.
+
+    Args:
+        df (pandas.DataFrame): Processed data
+        issues (list): Raw issues for the predicate in local mode
+        predicate (callable): Check of one raw issue, e.g. has_merge_request_mentions
+        analyzer (JiraAnalyzer): Analyzer for the pushdown searches
+        mode (str): 'local', 'pushdown' or 'verify' (default from config.CLOSED_TASKS_MODE)
+
+    Returns:
+        tuple: (filtered DataFrame, number of tasks excluded by the predicate)
+    """
+    mode = mode or CLOSED_TASKS_MODE
+    if mode not in CLOSED_TASKS_MODES:
+        logger.warning(f"Unknown closed tasks mode '{mode}', using 'local'")
+        mode = 'local'
+    if mode != 'local' and analyzer is None:
+        logger.warning(f"Closed tasks mode '{mode}' needs a Jira analyzer, using 'local'")
+        mode = 'local'
+
+    local_available = issues is None or has_activity_fields(issues)
+
+    if mode == 'local':
+        if not local_available:
+            return _no_local_result(df)
+        return get_closed_tasks_locally(df, issues, predicate)
+
+    try:
+        pushdown_result = get_closed_tasks_with_pushdown(df, analyzer, predicate)
+    except Exception as e:
+        if not local_available:
+            logger.error(f"Closed tasks pushdown failed: {e}")
+            return _no_local_result(df)
+        logger.error(f"Closed tasks pushdown failed, using local filter: {e}")
+        return get_closed_tasks_locally(df, issues, predicate)
+
+    if mode == 'pushdown' or not local_available:
+        return pushdown_result
+
+    local_result = get_closed_tasks_locally(df, issues, predicate)
+    comparison = compare_closed_tasks(local_result[0], pushdown_result[0])
+    if comparison['consistent']:
+        logger.info(f"Closed tasks pushdown is consistent with the local filter ({comparison['local_count']} tasks)")
+    else:
+        logger.warning(f"Closed tasks pushdown differs from the local filter: "
+                       f"local {comparison['local_count']}, pushdown {comparison['pushdown_count']}, "
+                       f"local only {comparison['local_only'][:20]}, pushdown only {comparison['pushdown_only'][:20]}")
+    return local_result
+
+
+def _no_local_result(df):
+    logger.error("Raw issues have no comments and attachments (downloaded with the 'counts_only' profile), "
+                 "closed tasks without activity cannot be filtered locally")
+    return df.iloc[0:0], 0
@@ -3,11 +3,19 @@ import json
 import logging
 import re
 
-import logger
-import pandas as pd
 from datetime import datetime, timedelta, date
 from modules.jira_analyzer import JiraAnalyzer
-from modules.data_processor import process_issues_data, get_improved_open_statuses, get_status_categories
+from modules.issue_store import get_issue_store
+from modules.jql_builder import JqlTemplate
+from modules.raw_issue_storage import save_raw_issues, find_raw_issues
+from modules.catalog import record_daily_snapshot
+from modules.dashboard_series import load_time_series, update_time_series, get_series_path
+from modules.closed_tasks import (CLOSED_TASKS_MODE, get_closed_tasks_without_activity, fetch_closed_task_candidates,
+                                  quote_jql_value)
+from modules.data_processor import process_issues_data, get_improved_open_statuses, get_issue_mask, categorize_statuses
+
+# Get logger
+logger = logging.getLogger(__name__)
 
 try:
     from config import PROJECT_BUDGET, DASHBOARD_UPDATE_HOUR, DASHBOARD_UPDATE_MINUTE, DASHBOARD_REFRESH_INTERVAL
@@ -19,17 +27,26 @@ except ImportError:
     DASHBOARD_UPDATE_MINUTE = 0
     DASHBOARD_REFRESH_INTERVAL = 3600
 
-# Get logger
-logger = logging.getLogger(__name__)
-
 # Directory for dashboard data
 DASHBOARD_DIR = 'nbss_data'
 
+# Result of the last quick refresh of the KPI tiles (overlaid on the latest full collection)
+KPI_REFRESH_PATH = os.path.join(DASHBOARD_DIR, 'kpi_refresh.json')
+
+# CLM issues of the dashboard and EST issues linked to them
+CLM_FILTER_ID = 114473
+CLM_QUERY = f'project = CLM AND filter={CLM_FILTER_ID}'
+EST_COUNT_QUERY = f'project = "Оценки CLM" AND issueFunction in linkedIssuesOf("{CLM_QUERY}", "relates to")'
+
 # Ensure the directory exists
 if not os.path.exists(DASHBOARD_DIR):
     os.makedirs(DASHBOARD_DIR)
 
 
+# Упоминания merge requests: "merge request" в любом регистре или ключ задачи SSO-
+MERGE_REQUEST_PATTERN = re.compile(r'(?i:merge\s+request)|SSO-')
+
+
 def has_merge_request_mentions(issue):
     """
     Проверяет, содержит ли задача упоминания merge requests
@@ -40,50 +57,59 @@ def has_merge_request_mentions(issue):
     Returns:
         bool: True если есть упоминания merge requests, иначе False
     """
-    # Проверяем комментарии
-    comments = issue.get('fields', {}).get('comment', {}).get('comments', [])
-    for comment in comments:
-        comment_text = comment.get('body', '')
-        # Ищем упоминания merge requests по паттерну
-        if re.search(r'merge\s+request', comment_text, re.IGNORECASE) or 'SSO-' in comment_text:
-            return True
-
-    # Проверяем описание задачи
-    description = issue.get('fields', {}).get('description', '') or ''
-    if re.search(r'merge\s+request', description, re.IGNORECASE) or 'SSO-' in description:
-        return True
-
-    # Проверяем summary
-    summary = issue.get('fields', {}).get('summary', '') or ''
-    if re.search(r'merge\s+request', summary, re.IGNORECASE) or 'SSO-' in summary:
+    fields = issue.get('fields', {})
+
+    # Комментарии, описание и summary проверяются одним поиском по склеенному тексту.
+    # Разделитель \0 не совпадает с \s, поэтому совпадение не может пройти через границу полей
+    texts = [comment.get('body') or '' for comment in fields.get('comment', {}).get('comments', [])]
+    texts.append(fields.get('description') or '')
+    texts.append(fields.get('summary') or '')
+    if MERGE_REQUEST_PATTERN.search('\0'.join(texts)):
         return True
 
     # Проверяем наличие issue links типа "mentioned on" с MR
-    issue_links = issue.get('fields', {}).get('issuelinks', [])
-    for link in issue_links:
-        # Проверяем тип связи
-        link_type_name = link.get('type', {}).get('name', '').lower()
-
+    for link in fields.get('issuelinks', []):
         # Ищем связь "mentioned on"
-        if link_type_name == 'mentioned on' or 'mention' in link_type_name:
-            # Проверяем ключ связанной задачи - часто MR имеют формат "SSO-XXXXX"
-            related_key = None
-            if 'inwardIssue' in link:
-                related_key = link.get('inwardIssue', {}).get('key', '')
-            elif 'outwardIssue' in link:
-                related_key = link.get('outwardIssue', {}).get('key', '')
-
-            if related_key and 'SSO-' in related_key:
-                return True
+        link_type_name = link.get('type', {}).get('name', '').lower()
+        if 'mention' not in link_type_name:
+            continue
+
+        # Проверяем ключ связанной задачи - часто MR имеют формат "SSO-XXXXX"
+        if 'inwardIssue' in link:
+            related_key = link.get('inwardIssue', {}).get('key', '')
+        else:
+            related_key = link.get('outwardIssue', {}).get('key', '')
+        if related_key and 'SSO-' in related_key:
+            return True
 
     return False
 
 
-def collect_daily_data():
+def get_merge_request_mask(df, issues):
+    """
+    Mark rows of processed data whose raw issues mention merge requests
+
+    Args:
+        df (pandas.DataFrame): Processed data with issue_key column
+        issues (list): Raw issues from Jira API
+
+    Returns:
+        pandas.Series: Boolean mask aligned to df.index
+    """
+    return get_issue_mask(df, issues, has_merge_request_mentions, 'merge request check')
+
+
+def collect_daily_data(quick=False):
     """
     Collect and process daily data for the NBSS Dashboard.
     This should be run daily at the configured time (default: 9:00 AM).
+
+    Args:
+        quick (bool): Only refresh the KPI tiles with count-only queries (see refresh_kpi_tiles)
     """
+    if quick:
+        return refresh_kpi_tiles()
+
     logger.info(f"Collecting daily data for NBSS Dashboard at {DASHBOARD_UPDATE_HOUR}:{DASHBOARD_UPDATE_MINUTE}")
 
     try:
@@ -97,15 +123,12 @@ def collect_daily_data():
         collect_estimation_data(filter_id=estimation_filter_id, sprint_filter=False, all_tasks=False)
         logger.info("Completed collection of Jira estimation data")
 
-        # Initialize Jira analyzer
+        # Initialize Jira analyzer and local issue store (None if disabled)
         analyzer = JiraAnalyzer()
-
-        # Use the CLM filter to get issues
-        clm_filter_id = 114473
-        clm_query = f'project = CLM AND filter={clm_filter_id}'
+        store = get_issue_store()
 
         # Get CLM issues
-        clm_issues = analyzer.get_issues_by_filter(jql_query=clm_query)
+        clm_issues = analyzer.sync_query(CLM_QUERY, profile='counts_only', store=store)
         logger.info(f"Found {len(clm_issues)} CLM issues")
 
         if not clm_issues:
@@ -121,8 +144,10 @@ def collect_daily_data():
 
         logger.info(f"Time spent directly on CLM issues: {clm_time_spent_hours} hours")
 
-        # Get related issues
-        est_issues, improvement_issues, implementation_issues = analyzer.get_clm_related_issues(clm_issues)
+        # Get related issues. With the JQL pushdown of the closed tasks metric comments,
+        # attachments and changelogs of implementation issues are not needed
+        related_profile = 'counts_only' if CLOSED_TASKS_MODE == 'pushdown' else 'dashboard'
+        est_issues, improvement_issues, implementation_issues = analyzer.get_clm_related_issues(clm_issues, profile=related_profile, store=store)
 
         # Process implementation issues to get time spent
         df = None
@@ -185,58 +210,22 @@ def collect_daily_data():
 
             if not open_tasks.empty:
                 # Group by project
-                open_tasks_by_project = open_tasks.groupby('project').size().to_dict()
+                open_tasks_by_project = open_tasks.groupby('project', observed=True).size().to_dict()
                 open_tasks_data = open_tasks_by_project
 
                 # Store issue keys for open tasks
                 open_tasks_issue_keys = open_tasks['issue_key'].tolist()
 
-            # Calculate closed tasks without comments, attachments, and links
-            # Get status categories
-            status_categories = get_status_categories(df)
-            closed_statuses = status_categories['closed_statuses']
-
-            # Предварительная фильтрация
-            pre_filtered_tasks = df[df['status'].isin(closed_statuses) &
-                                    (~df['has_comments']) &
-                                    (~df['has_attachments']) &
-                                    (~df['has_links'])]
-
-            logger.info(f"Pre-filtered {len(pre_filtered_tasks)} closed tasks without comments, attachments, and links")
-
-            # Дополнительная фильтрация на упоминания merge requests
-            closed_tasks_final = []
-            merge_request_mentions_count = 0
-
-            # Получаем raw issues для проверки упоминаний merge requests
-            # Создаем mapping из ключей задач в raw issues
-            issue_mapping = {issue.get('key'): issue for issue in implementation_issues if issue.get('key')}
-
-            for _, row in pre_filtered_tasks.iterrows():
-                issue_key = row['issue_key']
-                raw_issue = issue_mapping.get(issue_key)
-
-                if raw_issue:
-                    if not has_merge_request_mentions(raw_issue):
-                        closed_tasks_final.append(row)
-                    else:
-                        merge_request_mentions_count += 1
-                else:
-                    # Если не нашли raw issue, считаем что она всё равно подходит
-                    closed_tasks_final.append(row)
-                    logger.warning(f"Could not find raw issue for {issue_key} for merge request check")
+            # Calculate closed tasks without comments, attachments, links and merge request mentions
+            # (locally or with JQL pushdown, see CLOSED_TASKS_MODE in config.py)
+            closed_tasks, merge_request_mentions_count = get_closed_tasks_without_activity(
+                df, implementation_issues, has_merge_request_mentions, analyzer)
 
             logger.info(f"Filtered out {merge_request_mentions_count} issues with merge request mentions")
 
-            # Конвертируем список обратно в DataFrame
-            if closed_tasks_final:
-                closed_tasks = pd.DataFrame(closed_tasks_final)
-            else:
-                closed_tasks = pd.DataFrame(columns=pre_filtered_tasks.columns)
-
             if not closed_tasks.empty:
                 # Group by project
-                closed_tasks_by_project = closed_tasks.groupby('project').size().to_dict()
+                closed_tasks_by_project = closed_tasks.groupby('project', observed=True).size().to_dict()
                 closed_tasks_data = closed_tasks_by_project
 
                 logger.info(
@@ -289,8 +278,7 @@ def collect_daily_data():
 
         # Save raw issues
         raw_issues_path = os.path.join(daily_dir, 'raw_issues.json')
-        with open(raw_issues_path, 'w', encoding='utf-8') as f:
-            json.dump(raw_data, f, indent=2, ensure_ascii=False)
+        save_raw_issues(raw_issues_path, raw_data)
         logger.info(f"Saved raw issues data to {raw_issues_path}")
 
         # Save keys data
@@ -371,6 +359,10 @@ def collect_daily_data():
         # Save the data
         save_daily_data(dashboard_data)
 
+        # The full collection supersedes an earlier quick refresh
+        if os.path.exists(KPI_REFRESH_PATH):
+            os.remove(KPI_REFRESH_PATH)
+
         logger.info("Daily data collection complete")
         return dashboard_data
 
@@ -379,6 +371,121 @@ def collect_daily_data():
         return None
 
 
+def load_latest_issue_keys():
+    """
+    Load issue keys saved by the latest full data collection
+
+    Returns:
+        tuple: (timestamp of the collection, keys data) or (None, None) if there is none
+    """
+    folders = sorted((item for item in os.listdir(DASHBOARD_DIR) if item.isdigit() and len(item) == 8),
+                     reverse=True)
+    for folder in folders:
+        keys_path = os.path.join(DASHBOARD_DIR, folder, 'data', 'clm_issue_keys.json')
+        if os.path.exists(keys_path):
+            with open(keys_path, 'r', encoding='utf-8') as f:
+                return folder, json.load(f)
+    return None, None
+
+
+def refresh_kpi_tiles():
+    """
+    Quick refresh of the dashboard KPI tiles without downloading issues.
+
+    CLM and EST counts and open tasks per project are count-only searches
+    (maxResults=0, only the total is read), run concurrently. Open and closed
+    statuses are taken from the status list of Jira with the same terms as the
+    full collection. Closed tasks without activity are found with the JQL
+    pushdown of modules/closed_tasks.py, which downloads only the few candidates.
+
+    The implementation issues are the ones of the latest full collection, so
+    issues created since then are not counted and time spent is not refreshed.
+    The result is saved to KPI_REFRESH_PATH and shown by get_dashboard_data()
+    until the next full collection.
+
+    Returns:
+        dict: Refreshed KPI values or None if the refresh failed
+    """
+    logger.info("Quick refresh of the dashboard KPI tiles")
+    try:
+        timestamp, keys_data = load_latest_issue_keys()
+        if not keys_data:
+            logger.error("No full data collection found, quick refresh needs its issue keys")
+            return None
+
+        project_issue_mapping = keys_data.get('project_issue_mapping', {})
+        analyzer = JiraAnalyzer()
+
+        statuses = categorize_statuses(analyzer.get_statuses())
+        open_statuses = statuses['open_statuses']
+        closed_statuses = statuses['closed_statuses']
+        if not open_statuses or not closed_statuses:
+            logger.error("Could not get open and closed statuses from Jira")
+            return None
+
+        queries = {'clm_issues_count': CLM_QUERY, 'est_issues_count': EST_COUNT_QUERY}
+        open_template = JqlTemplate(f"status in ({', '.join(quote_jql_value(status) for status in open_statuses)}) "
+                                    f"AND timespent > 0 AND key in ({{items}})")
+        for project, keys in project_issue_mapping.items():
+            queries[f'open_tasks:{project}'] = open_template.build(keys)
+
+        counts = analyzer.count_queries(queries)
+        failed = [name for name, count in counts.items() if count is None]
+        if failed:
+            logger.error(f"Quick refresh failed, count queries without result: {failed}")
+            return None
+
+        open_tasks_data = {name.split(':', 1)[1]: count for name, count in counts.items()
+                           if name.startswith('open_tasks:') and count}
+
+        all_keys = [key for keys in project_issue_mapping.values() for key in keys]
+        candidates, _ = fetch_closed_task_candidates(analyzer, all_keys, closed_statuses,
+                                                     has_merge_request_mentions)
+        closed_tasks_data = {}
+        for issue in candidates:
+            project = issue.get('fields', {}).get('project', {}).get('key', '')
+            closed_tasks_data[project] = closed_tasks_data.get(project, 0) + 1
+
+        refresh = {
+            'refreshed_at': datetime.now().isoformat(timespec='seconds'),
+            'source_timestamp': timestamp,
+            'clm_issues_count': counts['clm_issues_count'],
+            'est_issues_count': counts['est_issues_count'],
+            'open_tasks_data': open_tasks_data,
+            'closed_tasks_data': closed_tasks_data
+        }
+
+        with open(KPI_REFRESH_PATH, 'w', encoding='utf-8') as f:
+            json.dump(refresh, f, indent=2, ensure_ascii=False)
+        logger.info(f"Saved quick KPI refresh to {KPI_REFRESH_PATH}")
+        return refresh
+
+    except Exception as e:
+        logger.error(f"Error refreshing dashboard KPI tiles: {e}", exc_info=True)
+        return None
+
+
+def load_kpi_refresh(timestamp):
+    """
+    Load the last quick KPI refresh if it belongs to the given full collection
+
+    Args:
+        timestamp (str): Timestamp (folder name) of the latest full collection
+
+    Returns:
+        dict: Quick refresh data or None
+    """
+    if not timestamp or not os.path.exists(KPI_REFRESH_PATH):
+        return None
+    try:
+        with open(KPI_REFRESH_PATH, 'r', encoding='utf-8') as f:
+            refresh = json.load(f)
+    except Exception as e:
+        logger.error(f"Error reading quick KPI refresh: {e}")
+        return None
+    return refresh if refresh.get('source_timestamp') == timestamp else None
+
+
 def save_daily_data(data):
     """
     Save the daily dashboard data to a file.
@@ -400,12 +507,25 @@ def save_daily_data(data):
         summary_path = os.path.join(folder_path, 'summary.json')
         with open(summary_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        record_daily_snapshot(folder_path, data)
+        update_time_series(folder_path, data)
 
         logger.info(f"Saved dashboard data to {summary_path}")
     except Exception as e:
         logger.error(f"Error saving dashboard data: {e}", exc_info=True)
 
 
+def get_dashboard_data_files():
+    """
+    Get the files get_dashboard_data() is built from, for HTTP validators of the dashboard API
+
+    Returns:
+        list: Paths of the dashboard directory (folders added or removed), the time-series index
+              and the quick KPI refresh
+    """
+    return [DASHBOARD_DIR, get_series_path(DASHBOARD_DIR), KPI_REFRESH_PATH]
+
+
 def get_dashboard_data():
     """
     Get all dashboard data for the NBSS Dashboard.
@@ -415,50 +535,14 @@ def get_dashboard_data():
         dict: Dashboard data with time series and latest data
     """
     try:
-        # Get all data folders in the DASHBOARD_DIR
-        all_data = []
-        processed_dates = set()  # To track processed dates and avoid duplicates
-
-        # First, scan the directory for date folders
-        for item in os.listdir(DASHBOARD_DIR):
-            item_path = os.path.join(DASHBOARD_DIR, item)
-
-            # Only process directories with the date format (8 digits)
-            if os.path.isdir(item_path) and item.isdigit() and len(item) == 8:
-                # Look for summary.json in the folder
-                summary_path = os.path.join(item_path, 'summary.json')
-                if os.path.exists(summary_path):
-                    try:
-                        with open(summary_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-
-                            # Make sure the data has required fields
-                            if 'date' not in data:
-                                date_obj = datetime.strptime(item, '%Y%m%d')
-                                data['date'] = date_obj.strftime('%Y-%m-%d')
-
-                            # Check if we already processed this date
-                            if data['date'] not in processed_dates:
-                                processed_dates.add(data['date'])
-
-                                # Make sure open_tasks_data exists
-                                if 'open_tasks_data' not in data:
-                                    data['open_tasks_data'] = {}
-
-                                # Make sure closed_tasks_data exists
-                                if 'closed_tasks_data' not in data:
-                                    data['closed_tasks_data'] = {}
-
-                                all_data.append(data)
-                                logger.info(f"Loaded dashboard data from folder: {item}")
-                    except Exception as e:
-                        logger.error(f"Error reading summary file {summary_path}: {e}")
-
-        # Sort data by date
-        all_data.sort(key=lambda x: x['date'])
+        # Per-day totals and the latest tiles come from the time-series index (one small file)
+        series = load_time_series(DASHBOARD_DIR)
+        days = series['days']
+        latest = series.get('latest')
+        logger.info(f"Loaded dashboard data of {len(days)} days")
 
         # Get latest data
-        latest_data = all_data[-1] if all_data else None
+        latest_data = latest['summary'] if latest else None
 
         # Get the raw data for the latest date if available
         latest_date = latest_data.get('timestamp') if latest_data else None
@@ -467,13 +551,13 @@ def get_dashboard_data():
 
         if latest_folder_path and os.path.exists(latest_folder_path):
             raw_issues_path = os.path.join(latest_folder_path, 'raw_issues.json')
-            has_raw_data = os.path.exists(raw_issues_path)
+            has_raw_data = find_raw_issues(raw_issues_path) is not None
 
         # Create time series data
         time_series = {
-            'dates': [data['date'] for data in all_data],
-            'actual_time_spent': [data.get('total_time_spent_days', 0) for data in all_data],
-            'projected_time_spent': [data.get('projected_time_spent_days', 0) for data in all_data]
+            'dates': [day['date'] for day in days],
+            'actual_time_spent': [day['total_time_spent_days'] for day in days],
+            'projected_time_spent': [day['projected_time_spent_days'] for day in days]
         }
 
         # Get latest open tasks data
@@ -481,29 +565,24 @@ def get_dashboard_data():
         if latest_data:
             open_tasks_data = latest_data.get('open_tasks_data', {})
 
-        # Get closed tasks data - improved logging and handling
+        # Closed tasks tiles, taken from the metrics file when the index was written if the summary has none
         closed_tasks_data = {}
         if latest_data:
-            closed_tasks_data = latest_data.get('closed_tasks_data', {})
-            # Более подробное логирование для отладки
+            closed_tasks_data = latest['closed_tasks_data']
             if not closed_tasks_data:
                 logger.warning(f"No closed_tasks_data found in latest data for timestamp {latest_date}")
-                # Пытаемся найти closed_tasks_data в метриках или других местах
-                if 'closed_tasks_no_links_count' in latest_data:
-                    logger.info(f"Found closed_tasks_no_links_count: {latest_data['closed_tasks_no_links_count']}")
-
-                # Проверяем файл метрик если не нашли closed_tasks_data в summary
-                metrics_path = os.path.join(latest_folder_path, 'metrics', 'closed_tasks_no_links.json')
-                if os.path.exists(metrics_path):
-                    try:
-                        with open(metrics_path, 'r', encoding='utf-8') as f:
-                            metrics_data = json.load(f)
-                            if 'by_project' in metrics_data:
-                                closed_tasks_data = metrics_data['by_project']
-                                logger.info(
-                                    f"Found closed tasks data in metrics file: {len(closed_tasks_data)} projects")
-                    except Exception as e:
-                        logger.error(f"Error reading closed tasks metrics: {e}")
+
+        # Counts of a quick refresh made after the latest full collection replace its KPI tiles
+        kpi_refresh = load_kpi_refresh(latest_date)
+        if kpi_refresh:
+            latest_data = dict(latest_data, clm_issues_count=kpi_refresh['clm_issues_count'],
+                               est_issues_count=kpi_refresh['est_issues_count'],
+                               open_tasks_data=kpi_refresh['open_tasks_data'],
+                               closed_tasks_data=kpi_refresh['closed_tasks_data'],
+                               kpi_refreshed_at=kpi_refresh['refreshed_at'])
+            open_tasks_data = kpi_refresh['open_tasks_data']
+            closed_tasks_data = kpi_refresh['closed_tasks_data']
+            logger.info(f"Using KPI tiles of the quick refresh at {kpi_refresh['refreshed_at']}")
 
         # Get refresh interval from latest data or use the default
         refresh_interval = latest_data.get('refresh_interval',
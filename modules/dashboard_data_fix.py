@@ -3,6 +3,9 @@ import json
 import logging
 import pandas as pd
 from datetime import datetime, timedelta, date
+from modules.raw_issue_storage import save_raw_issues
+from modules.catalog import record_daily_snapshot
+from modules.dashboard_series import update_time_series
 
 
 # Use this to generate initial data for an empty dashboard
@@ -47,8 +50,7 @@ def generate_initial_dashboard_data():
         }
 
         raw_issues_path = os.path.join(folder_path, 'raw_issues.json')
-        with open(raw_issues_path, 'w', encoding='utf-8') as f:
-            json.dump(raw_data, f, indent=2, ensure_ascii=False)
+        save_raw_issues(raw_issues_path, raw_data)
 
         # 2. Empty clm_issue_keys data
         keys_data = {
@@ -92,6 +94,8 @@ def generate_initial_dashboard_data():
         summary_path = os.path.join(folder_path, 'summary.json')
         with open(summary_path, 'w', encoding='utf-8') as f:
             json.dump(dashboard_data, f, indent=2, ensure_ascii=False)
+        record_daily_snapshot(folder_path, dashboard_data)
+        update_time_series(folder_path, dashboard_data)
 
         # Generate sample past data for time series (last 7 days)
         for i in range(1, 8):
@@ -115,6 +119,8 @@ def generate_initial_dashboard_data():
                 past_summary_path = os.path.join(past_folder, 'summary.json')
                 with open(past_summary_path, 'w', encoding='utf-8') as f:
                     json.dump(past_data, f, indent=2, ensure_ascii=False)
+                record_daily_snapshot(past_folder, past_data)
+                update_time_series(past_folder, past_data)
 
         logger.info(f"Generated initial dashboard data for {date_str} and 7 previous days")
         return True
@@ -0,0 +1,224 @@
+"""
+Rolling time-series index of the NBSS dashboard (nbss_data/time_series.json).
+
+The dashboard endpoint is polled by every open tab. Instead of reading the
+summary of every daily snapshot, it reads this small file:
+
+    {
+        "format_version": 1,
+        "folders": ["20250601", "20250602", ...],
+        "days": [{"folder": "20250601", "date": "2025-06-01",
+                  "total_time_spent_days": 100.0, "projected_time_spent_days": 110.0}, ...],
+        "latest": {"folder": "20250602", "summary": {...}, "closed_tasks_data": {...}}
+    }
+
+"days" holds one entry per date (the first folder of a date wins) sorted by
+date, "latest" the summary of the last day with its closed tasks tiles resolved
+(from metrics/closed_tasks_no_links.json if the summary has none), and
+"folders" every YYYYMMDD folder seen when the index was written.
+
+save_daily_data() updates the index after writing summary.json. If the
+folders on disk differ from the recorded ones (a folder created or removed
+outside the app) or the file is missing, the index is rebuilt from the
+summaries; python rebuild_catalog.py rebuilds it as well.
+"""
+import os
+import json
+import logging
+import threading
+from datetime import datetime
+
+from modules.catalog import (DEFAULT_DASHBOARD_DIR, list_daily_snapshots, read_daily_summary, scan_folders,
+                             is_daily_folder)
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+SERIES_FORMAT_VERSION = 1
+SERIES_FILE_NAME = 'time_series.json'
+
+# Updates of the index in this process are serialized
+_series_lock = threading.Lock()
+
+
+def get_series_path(dashboard_dir=DEFAULT_DASHBOARD_DIR):
+    """Path of the time-series index of a dashboard directory"""
+    return os.path.join(dashboard_dir, SERIES_FILE_NAME)
+
+
+def load_time_series(dashboard_dir=DEFAULT_DASHBOARD_DIR):
+    """
+    Load the time-series index, rebuilding it if it is missing or does not match the folders on disk
+
+    Args:
+        dashboard_dir (str): Directory with YYYYMMDD folders
+
+    Returns:
+        dict: Index with "days" and "latest" (see module docstring)
+    """
+    series = _read_series(dashboard_dir)
+    folders = scan_folders(dashboard_dir, is_daily_folder)
+    if series is not None and set(series.get('folders', [])) == folders:
+        return series
+
+    reason = 'missing' if series is None else 'out of date'
+    logger.info(f"Time-series index of {dashboard_dir} is {reason}, rebuilding")
+    return rebuild_time_series(dashboard_dir)
+
+
+def update_time_series(folder_path, summary=None):
+    """
+    Add or replace the day of a snapshot in the time-series index after its summary.json was written
+
+    Args:
+        folder_path (str): Path to nbss_data/<YYYYMMDD>
+        summary (dict): Summary just written (read from summary.json if None)
+    """
+    folder_path = os.path.normpath(folder_path)
+    dashboard_dir = os.path.dirname(folder_path) or '.'
+    folder = os.path.basename(folder_path)
+    try:
+        with _series_lock:
+            series = _read_series(dashboard_dir)
+            if series is None:
+                _rebuild(dashboard_dir)
+                return
+
+            if summary is None:
+                summary = read_daily_summary(folder_path)
+            snapshots = [(entry['folder'], entry) for entry in series['days'] if entry['folder'] != folder]
+            if summary is not None:
+                snapshots.append((folder, summary))
+            snapshots.sort(key=lambda item: item[0])
+
+            latest = series.get('latest')
+            folders = set(series.get('folders', [])) | {folder}
+            _write_series(dashboard_dir, _build_series(dashboard_dir, snapshots, folders, latest, folder, summary))
+    except Exception as e:
+        logger.error(f"Error updating time-series index for {folder_path}: {e}", exc_info=True)
+
+
+def rebuild_time_series(dashboard_dir=DEFAULT_DASHBOARD_DIR, snapshots=None):
+    """
+    Rebuild the time-series index from the daily summaries
+
+    Args:
+        dashboard_dir (str): Directory with YYYYMMDD folders
+        snapshots (list): (folder name, summary) tuples oldest first (listed with list_daily_snapshots if None)
+
+    Returns:
+        dict: Written index
+    """
+    with _series_lock:
+        return _rebuild(dashboard_dir, snapshots)
+
+
+def _rebuild(dashboard_dir, snapshots=None):
+    folders = scan_folders(dashboard_dir, is_daily_folder)
+    if snapshots is None:
+        snapshots = list_daily_snapshots(dashboard_dir)
+    snapshots = [(folder, summary) for folder, summary in snapshots if summary is not None and folder in folders]
+    series = _build_series(dashboard_dir, snapshots, folders)
+    try:
+        _write_series(dashboard_dir, series)
+        logger.info(f"Rebuilt time-series index of {dashboard_dir}: {len(series['days'])} days")
+    except Exception as e:
+        logger.error(f"Error writing time-series index of {dashboard_dir}: {e}", exc_info=True)
+    return series
+
+
+def _build_series(dashboard_dir, snapshots, folders, latest=None, folder=None, summary=None):
+    """
+    Build the index from (folder, summary or day entry) tuples sorted by folder.
+
+    The summary of the latest day is taken from the summary just written, the
+    previous index or the snapshots if they are summaries (latest is None), and
+    read from its folder otherwise.
+    """
+    days = []
+    seen_dates = set()
+    for name, data in snapshots:
+        day_date = data.get('date') or datetime.strptime(name, '%Y%m%d').strftime('%Y-%m-%d')
+        if day_date in seen_dates:
+            continue
+        seen_dates.add(day_date)
+        days.append({
+            'folder': name,
+            'date': day_date,
+            'total_time_spent_days': data.get('total_time_spent_days', 0),
+            'projected_time_spent_days': data.get('projected_time_spent_days', 0),
+            '_data': data
+        })
+    days.sort(key=lambda entry: entry['date'])
+
+    latest_entry = None
+    if days:
+        latest_folder = days[-1]['folder']
+        if latest_folder == folder and summary is not None:
+            latest_summary = summary
+        elif latest and latest.get('folder') == latest_folder:
+            latest_summary = latest['summary']
+        elif latest is None and folder is None:
+            latest_summary = days[-1]['_data']
+        else:
+            latest_summary = read_daily_summary(os.path.join(dashboard_dir, latest_folder)) or {}
+        latest_entry = _latest_entry(dashboard_dir, latest_folder, days[-1]['date'], latest_summary)
+
+    for entry in days:
+        del entry['_data']
+
+    return {
+        'format_version': SERIES_FORMAT_VERSION,
+        'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'folders': sorted(folders),
+        'days': days,
+        'latest': latest_entry
+    }
+
+
+def _latest_entry(dashboard_dir, folder, day_date, summary):
+    summary = dict(summary)
+    summary['date'] = day_date
+    summary.setdefault('open_tasks_data', {})
+    summary.setdefault('closed_tasks_data', {})
+
+    # Closed tasks tiles fall back to the metrics file of the collection
+    closed_tasks_data = summary['closed_tasks_data']
+    if not closed_tasks_data:
+        metrics_path = os.path.join(dashboard_dir, folder, 'metrics', 'closed_tasks_no_links.json')
+        if os.path.exists(metrics_path):
+            try:
+                with open(metrics_path, 'r', encoding='utf-8') as f:
+                    metrics_data = json.load(f)
+                if 'by_project' in metrics_data:
+                    closed_tasks_data = metrics_data['by_project']
+                    logger.info(f"Found closed tasks data in metrics file: {len(closed_tasks_data)} projects")
+            except Exception as e:
+                logger.error(f"Error reading closed tasks metrics: {e}")
+
+    return {'folder': folder, 'summary': summary, 'closed_tasks_data': closed_tasks_data}
+
+
+def _read_series(dashboard_dir):
+    path = get_series_path(dashboard_dir)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            series = json.load(f)
+    except Exception as e:
+        logger.error(f"Error reading time-series index {path}: {e}")
+        return None
+    if series.get('format_version') != SERIES_FORMAT_VERSION:
+        return None
+    return series
+
+
+def _write_series(dashboard_dir, series):
+    if not os.path.exists(dashboard_dir):
+        os.makedirs(dashboard_dir)
+    path = get_series_path(dashboard_dir)
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(series, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(temp_path, path)
@@ -1,4 +1,6 @@
 import pandas as pd
+import numpy as np
+import re
 import json
 import logging
 
@@ -6,107 +8,108 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# Columns of the DataFrame built by process_issues_data
+ISSUE_COLUMNS = ['issue_key', 'project', 'issue_type', 'original_estimate_hours', 'time_spent_hours', 'status',
+                 'status_id', 'status_category', 'has_comments', 'has_attachments', 'has_links', 'created_date',
+                 'no_transitions']
+
+# Jira date fields look like 2025-01-10T10:00:00.000+0300: local time, then the UTC offset
+JIRA_LOCAL_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+JIRA_LOCAL_DATE_LENGTH = 23
+UTC_OFFSET_RE = re.compile(r'^([+-])(\d{2}):?(\d{2})$')
+
+
 def process_issues_data(issues):
     """
     Process issue data into a structured DataFrame with improved status handling.
     Added transitions analysis to identify issues that never changed status.
     Added detection of issue links.
 
+    Fields are extracted column by column in one pass over the issues, without
+    building a dictionary per row. Issues are consumed one by one, so a generator
+    (e.g. JiraAnalyzer.iter_issues) can be passed without keeping the raw issues
+    in memory. project, issue_type, status and status_category are categorical,
+    has_* and no_transitions are boolean and created_date is a parsed (UTC) datetime.
+
     Args:
-        issues (list): List of issue dictionaries
+        issues (iterable): List or generator of issue dictionaries
 
     Returns:
         pandas.DataFrame: Processed data
     """
-    processed_data = []
-
-    # Output the first issue for debugging
-    if issues:
-        first_issue = issues[0]
-        status_raw = first_issue.get('fields', {}).get('status', {})
-        logger.info(f"Example status field structure: {json.dumps(status_raw, indent=2, ensure_ascii=False)}")
-
-        # Check changelog structure
-        if 'changelog' in first_issue:
-            changelog_sample = first_issue.get('changelog', {})
-            logger.info(f"Changelog structure: {json.dumps(changelog_sample, indent=2, ensure_ascii=False)[:500]}...")
+    keys = []
+    projects = []
+    issue_types = []
+    original_estimates = []
+    time_spent = []
+    statuses = []
+    status_ids = []
+    status_categories = []
+    has_comments = []
+    has_attachments = []
+    has_links = []
+    created_dates = []
+    no_transitions = []
 
     for issue in issues:
-        issue_key = issue.get('key')
-        fields = issue.get('fields', {})
+        # Output the first issue for debugging
+        if not keys:
+            status_raw = issue.get('fields', {}).get('status', {})
+            logger.info(f"Example status field structure: {json.dumps(status_raw, indent=2, ensure_ascii=False)}")
 
-        project = fields.get('project', {}).get('key', 'Unknown')
-        issue_type = fields.get('issuetype', {}).get('name', 'Unknown')
-        original_estimate = fields.get('timeoriginalestimate', 0) or 0  # Convert None to 0
-        time_spent = fields.get('timespent', 0) or 0  # Convert None to 0
-        created_date = fields.get('created', '')
+            # Check changelog structure
+            if 'changelog' in issue:
+                changelog_sample = issue.get('changelog', {})
+                logger.info(f"Changelog structure: {json.dumps(changelog_sample, indent=2, ensure_ascii=False)[:500]}...")
 
-        # Get issue status (with debugging info)
+        fields = issue.get('fields', {})
         status_obj = fields.get('status', {})
-        status = status_obj.get('name', 'Unknown')
-        status_id = status_obj.get('id', 'Unknown')
-        status_category = status_obj.get('statusCategory', {}).get('name', 'Unknown')
-
-        # Check for comments
-        comments = fields.get('comment', {}).get('comments', [])
-        has_comments = len(comments) > 0
-
-        # Check for attachments
-        attachments = fields.get('attachment', [])
-        has_attachments = len(attachments) > 0
-
-        # Check for issue links - NEW
-        links = fields.get('issuelinks', [])
-        has_links = len(links) > 0
 
+        keys.append(issue.get('key'))
+        projects.append(fields.get('project', {}).get('key', 'Unknown'))
+        issue_types.append(fields.get('issuetype', {}).get('name', 'Unknown'))
+        original_estimates.append(fields.get('timeoriginalestimate') or 0)  # Convert None to 0
+        time_spent.append(fields.get('timespent') or 0)
+        statuses.append(status_obj.get('name', 'Unknown'))
+        status_ids.append(status_obj.get('id', 'Unknown'))
+        status_categories.append(status_obj.get('statusCategory', {}).get('name', 'Unknown'))
+        has_comments.append(bool(fields.get('comment', {}).get('comments')))
+        has_attachments.append(bool(fields.get('attachment')))
+        has_links.append(bool(fields.get('issuelinks')))
+        created_dates.append(fields.get('created'))
+
+        no_transitions.append(not _has_status_transition(issue))
+
+    if not keys:
+        logger.info("No issues to process")
+        return pd.DataFrame(columns=ISSUE_COLUMNS)
+
+    df = pd.DataFrame({
+        'issue_key': keys,
+        'project': pd.Categorical(projects),
+        'issue_type': pd.Categorical(issue_types),
         # Convert seconds to hours
-        original_estimate_hours = original_estimate / 3600 if original_estimate else 0
-        time_spent_hours = time_spent / 3600 if time_spent else 0
-
-        # Analyze changelog for transitions
-        # Look for status changes in history
-        no_transitions = True  # Default assumption: no transitions
-
-        if 'changelog' in issue and 'histories' in issue['changelog']:
-            for history in issue['changelog']['histories']:
-                for item in history.get('items', []):
-                    if item.get('field') == 'status':
-                        # Found status transition
-                        no_transitions = False
-                        break
-                if not no_transitions:
-                    break
-
-        # Log info about issues without transitions
-        if no_transitions:
-            logger.info(f"Issue {issue_key} has no status transitions (possibly new), current status: {status}")
-
-        processed_data.append({
-            'issue_key': issue_key,
-            'project': project,
-            'issue_type': issue_type,
-            'original_estimate_hours': original_estimate_hours,
-            'time_spent_hours': time_spent_hours,
-            'status': status,
-            'status_id': status_id,
-            'status_category': status_category,
-            'has_comments': has_comments,
-            'has_attachments': has_attachments,
-            'has_links': has_links,  # NEW field
-            'created_date': created_date,
-            'no_transitions': no_transitions
-        })
-
-    # Create DataFrame
-    df = pd.DataFrame(processed_data)
+        'original_estimate_hours': np.array(original_estimates, dtype=float) / 3600,
+        'time_spent_hours': np.array(time_spent, dtype=float) / 3600,
+        'status': pd.Categorical(statuses),
+        'status_id': status_ids,
+        'status_category': pd.Categorical(status_categories),
+        'has_comments': np.array(has_comments, dtype=bool),
+        'has_attachments': np.array(has_attachments, dtype=bool),
+        'has_links': np.array(has_links, dtype=bool),
+        'created_date': parse_jira_dates(created_dates),
+        'no_transitions': np.array(no_transitions, dtype=bool)
+    })
 
     # Output unique statuses for debugging
     unique_statuses = df['status'].unique()
-    logger.info(f"Unique issue statuses: {unique_statuses}")
+    logger.info(f"Unique issue statuses: {unique_statuses.tolist()}")
 
     # Output count of issues without transitions
     no_transitions_count = df['no_transitions'].sum()
     logger.info(f"Found {no_transitions_count} issues without transitions")
+    if no_transitions_count:
+        logger.debug(f"Issues without transitions: {df.loc[df['no_transitions'], 'issue_key'].tolist()}")
 
     # Output info about issues with links
     has_links_count = df['has_links'].sum()
@@ -115,6 +118,69 @@ def process_issues_data(issues):
     return df
 
 
+def _has_status_transition(issue):
+    """Whether the changelog of an issue contains a status change"""
+    for history in issue.get('changelog', {}).get('histories', []):
+        for item in history.get('items', []):
+            if item.get('field') == 'status':
+                return True
+    return False
+
+
+def _parse_utc_offset(offset):
+    """UTC offset ('+0300', '-05:00', 'Z') in minutes, None if not an offset"""
+    if offset == 'Z':
+        return 0
+    match = UTC_OFFSET_RE.match(offset)
+    if not match:
+        return None
+    minutes = int(match.group(2)) * 60 + int(match.group(3))
+    return -minutes if match.group(1) == '-' else minutes
+
+
+def parse_jira_dates(values):
+    """
+    Parse Jira timestamps into UTC datetimes.
+
+    Parsing '%z' per element is slow, so the local part is parsed with a fixed
+    format and the (few distinct) UTC offsets are applied afterwards. Values in
+    other formats fall back to the generic parser, unparseable ones become NaT.
+
+    Args:
+        values (list): Timestamps like 2025-01-10T10:00:00.000+0300 (None allowed)
+
+    Returns:
+        pandas.Series: datetime64[ns, UTC] values
+    """
+    text = pd.Series(values, dtype=object).fillna('').astype(str)
+    local = pd.to_datetime(text.str.slice(0, JIRA_LOCAL_DATE_LENGTH), format=JIRA_LOCAL_DATE_FORMAT,
+                           errors='coerce')
+    offsets = text.str.slice(JIRA_LOCAL_DATE_LENGTH)
+    offset_minutes = offsets.map({offset: _parse_utc_offset(offset) for offset in offsets.unique()})
+    dates = (local - pd.to_timedelta(offset_minutes.astype(float), unit='m')).dt.tz_localize('UTC')
+
+    fallback = dates.isna() & (text != '')
+    if fallback.any():
+        dates = dates.copy()
+        dates[fallback] = pd.to_datetime(text[fallback], format='ISO8601', errors='coerce', utc=True)
+    return dates
+
+
+def count_values(series):
+    """
+    Count values of a column, like Series.value_counts(), without the zero counts
+    that categorical columns report for categories missing from a filtered frame
+
+    Args:
+        series (pandas.Series): Column of processed data
+
+    Returns:
+        pandas.Series: Counts by value, most frequent first
+    """
+    counts = series.value_counts()
+    return counts[counts > 0]
+
+
 def get_improved_open_statuses(df):
     """
     Improved detection of open statuses
@@ -154,16 +220,22 @@ def get_improved_open_statuses(df):
     return open_statuses
 
 
-def get_closed_tasks_without_links(df):
+def get_closed_tasks_without_links(df, analyzer=None):
     """
     Get closed tasks without comments, attachments, and links
 
     Args:
         df (pandas.DataFrame): Processed data
+        analyzer (JiraAnalyzer): Optional analyzer, enables the JQL pushdown of
+                                 config.CLOSED_TASKS_MODE (see modules/closed_tasks.py)
 
     Returns:
         pandas.DataFrame: Filtered data with closed tasks without comments, attachments, and links
     """
+    if analyzer is not None:
+        from modules.closed_tasks import get_closed_tasks_without_activity
+        return get_closed_tasks_without_activity(df, analyzer=analyzer)[0]
+
     logger.info("GETTING CLOSED TASKS WITHOUT COMMENTS, ATTACHMENTS, AND LINKS")
 
     # Get status categories
@@ -189,6 +261,41 @@ def get_closed_tasks_without_links(df):
 
     return closed_tasks
 
+
+def get_issue_mask(df, issues, predicate, description='check'):
+    """
+    Apply a check of raw issues to the rows of processed data
+
+    Only raw issues whose keys are present in df are checked. Rows without a raw
+    issue get False (they are kept by filters that drop matching rows).
+
+    Args:
+        df (pandas.DataFrame): Processed data with issue_key column
+        issues (list): Raw issues from Jira API
+        predicate (callable): Check of one raw issue, e.g. has_merge_request_mentions
+        description (str): Name of the check for logging
+
+    Returns:
+        pandas.Series: Boolean mask aligned to df.index
+    """
+    if df.empty:
+        return pd.Series(False, index=df.index, dtype=bool)
+
+    wanted_keys = set(df['issue_key'])
+    results = {}
+    for issue in issues or []:
+        key = issue.get('key')
+        if key in wanted_keys and key not in results:
+            results[key] = bool(predicate(issue))
+
+    missing = wanted_keys.difference(results)
+    if missing:
+        logger.warning(f"Could not find raw issues for {len(missing)} issues for {description}: "
+                       f"{sorted(missing)[:10]}")
+
+    return df['issue_key'].isin([key for key, matched in results.items() if matched])
+
+
 def get_status_categories(df):
     """
     Get status categories (open, closed, unknown)
@@ -203,6 +310,19 @@ def get_status_categories(df):
     all_statuses = df['status'].unique().tolist()
     logger.info(f"ALL STATUSES IN DATASET: {all_statuses}")
 
+    return categorize_statuses(all_statuses)
+
+
+def categorize_statuses(all_statuses):
+    """
+    Split status names into open, closed and unknown ones
+
+    Args:
+        all_statuses (list): Status names (of a data set or all statuses defined in Jira)
+
+    Returns:
+        dict: Dictionary with categorized statuses
+    """
     # Terms for detecting open and closed statuses - expanded list with Russian terms
     open_terms = [
         'OPEN', 'NEW'
@@ -281,38 +401,38 @@ def diagnose_issues_data(df, status_mapping=None):
     logger.info(f"Unique statuses in dataset: {unique_statuses}")
 
     # 2. Count issues by status
-    status_counts = df['status'].value_counts()
+    status_counts = count_values(df['status'])
     logger.info(f"Issue distribution by status:\n{status_counts}")
 
     # 3. Check issues with logged time
     tasks_with_time = df[df['time_spent_hours'] > 0]
-    status_with_time = tasks_with_time['status'].value_counts()
+    status_with_time = count_values(tasks_with_time['status'])
     logger.info(f"Statuses of issues with logged time:\n{status_with_time}")
 
     # 4. Check issues without comments and attachments
     tasks_no_comments_attachments = df[(~df['has_comments']) & (~df['has_attachments'])]
-    status_no_comments = tasks_no_comments_attachments['status'].value_counts()
+    status_no_comments = count_values(tasks_no_comments_attachments['status'])
     logger.info(f"Statuses of issues without comments and attachments:\n{status_no_comments}")
 
     # 5. Find open issues with logged time
     open_tasks = df[df['status'].isin(open_statuses) & (df['time_spent_hours'] > 0)]
     logger.info(f"Found {len(open_tasks)} open issues with logged time")
     if not open_tasks.empty:
-        open_by_project = open_tasks.groupby('project')['time_spent_hours'].sum()
+        open_by_project = open_tasks.groupby('project', observed=True)['time_spent_hours'].sum()
         logger.info(f"Distribution by project:\n{open_by_project}")
 
     # 6. Find closed issues without comments and attachments
     closed_tasks = df[df['status'].isin(closed_statuses) & (~df['has_comments']) & (~df['has_attachments'])]
     logger.info(f"Found {len(closed_tasks)} closed issues without comments and attachments")
     if not closed_tasks.empty:
-        closed_by_project = closed_tasks.groupby('project').size()
+        closed_by_project = closed_tasks.groupby('project', observed=True).size()
         logger.info(f"Distribution by project:\n{closed_by_project}")
 
     # 7. Diagnose issues without transitions
     no_transitions_tasks = df[df['no_transitions'] == True]
     logger.info(f"Found {len(no_transitions_tasks)} issues without transitions (likely new)")
     if not no_transitions_tasks.empty:
-        no_transitions_by_project = no_transitions_tasks.groupby('project').size()
+        no_transitions_by_project = no_transitions_tasks.groupby('project', observed=True).size()
         logger.info(f"Distribution of issues without transitions by project:\n{no_transitions_by_project}")
 
     return {
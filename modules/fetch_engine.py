@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from modules.jira_client import get_jira_client
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Default number of requests in flight per run (can be overridden in config.py)
+DEFAULT_FETCH_CONCURRENCY = 8
+
+try:
+    import config
+
+    FETCH_CONCURRENCY = getattr(config, 'JIRA_FETCH_CONCURRENCY', DEFAULT_FETCH_CONCURRENCY)
+except ImportError:
+    FETCH_CONCURRENCY = DEFAULT_FETCH_CONCURRENCY
+
+
+class FetchEngine:
+    """
+    Asyncio fetch engine on top of the shared Jira client.
+
+    Requests are scheduled as asyncio tasks and limited by a semaphore, so hundreds
+    of independent queries can be overlapped with a fixed number of requests in flight.
+    The blocking JiraClient (pooled session, retries, cache) does the I/O on a small
+    executor owned by the event loop, so no thread is started per request.
+
+    Async code awaits fetch()/call() directly; synchronous code uses the facade
+    methods run(), fetch_many() and map(), which start a private event loop.
+    """
+
+    def __init__(self, client=None, max_concurrency=None):
+        """
+        Initialize the engine
+
+        Args:
+            client (JiraClient): HTTP client, shared Jira client if None
+            max_concurrency (int): Maximum number of requests in flight
+        """
+        self.client = client or get_jira_client()
+        self.max_concurrency = max_concurrency or FETCH_CONCURRENCY
+        self._local = threading.local()
+
+    def _get_semaphore(self):
+        """Get the semaphore of the running event loop (created on first use in each loop)"""
+        loop = asyncio.get_running_loop()
+        state = getattr(self._local, 'state', None)
+        if state is None or state[0] is not loop:
+            state = (loop, asyncio.Semaphore(self.max_concurrency))
+            self._local.state = state
+        return state[1]
+
+    async def call(self, func, *args, **kwargs):
+        """
+        Run a blocking function (usually one that sends Jira requests) under the concurrency limit
+
+        Args:
+            func (callable): Function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Any: Result of func
+        """
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
+
+    async def fetch(self, method, url, **kwargs):
+        """
+        Send one request through the client under the concurrency limit
+
+        Args:
+            method (str): HTTP method
+            url (str): Full request URL
+            **kwargs: Arguments for JiraClient.request (headers, params, data, cache...)
+
+        Returns:
+            requests.Response: Server response
+        """
+        return await self.call(self.client.request, method, url, **kwargs)
+
+    async def fetch_all(self, requests, return_exceptions=True):
+        """
+        Send requests concurrently
+
+        Args:
+            requests (list): Request dictionaries with 'method', 'url' and JiraClient.request arguments
+            return_exceptions (bool): Put exceptions into the result instead of raising the first one
+
+        Returns:
+            list: Responses (or exceptions) in the order of requests
+        """
+        tasks = []
+        for spec in requests:
+            spec = dict(spec)
+            method = spec.pop('method', 'GET')
+            url = spec.pop('url')
+            tasks.append(self.fetch(method, url, **spec))
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+
+    def run(self, coro, max_concurrency=None):
+        """
+        Run a coroutine to completion from synchronous code
+
+        Args:
+            coro (coroutine): Coroutine using this engine
+            max_concurrency (int): Number of executor threads for the run, engine default if None
+
+        Returns:
+            Any: Result of the coroutine
+
+        Raises:
+            RuntimeError: If called from a running event loop (await the coroutine instead)
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            coro.close()
+            raise RuntimeError("FetchEngine.run() cannot be called from a running event loop")
+
+        return asyncio.run(self._run(coro, max_concurrency or self.max_concurrency))
+
+    async def _run(self, coro, workers):
+        """Run coroutine with a bounded default executor for blocking I/O"""
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=workers, thread_name_prefix='jira-fetch'))
+        return await coro
+
+    def fetch_many(self, requests, return_exceptions=True):
+        """
+        Send requests concurrently from synchronous code, see fetch_all()
+
+        Args:
+            requests (list): Request dictionaries with 'method', 'url' and JiraClient.request arguments
+            return_exceptions (bool): Put exceptions into the result instead of raising the first one
+
+        Returns:
+            list: Responses (or exceptions) in the order of requests
+        """
+        if not requests:
+            return []
+        return self.run(self.fetch_all(requests, return_exceptions))
+
+    def map(self, func, items, max_concurrency=None):
+        """
+        Call a blocking function for every item concurrently from synchronous code
+
+        Args:
+            func (callable): Function taking one item
+            items (list): Items
+            max_concurrency (int): Maximum number of calls in flight, engine default if None
+
+        Returns:
+            list: Results in the order of items
+        """
+        items = list(items)
+        if not items:
+            return []
+        if len(items) == 1:
+            return [func(items[0])]
+
+        limit = max_concurrency or self.max_concurrency
+        engine = self if limit == self.max_concurrency else FetchEngine(self.client, limit)
+
+        async def run_all():
+            return await asyncio.gather(*(engine.call(func, item) for item in items))
+
+        return engine.run(run_all(), limit)
@@ -0,0 +1,258 @@
+import os
+import json
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Default location of the local issue store
+DEFAULT_ISSUE_STORE_PATH = os.path.join('data', 'issue_store.db')
+
+try:
+    import config
+
+    ISSUE_STORE_ENABLED = getattr(config, 'ISSUE_STORE_ENABLED', True)
+    ISSUE_STORE_PATH = getattr(config, 'ISSUE_STORE_PATH', DEFAULT_ISSUE_STORE_PATH)
+except ImportError:
+    ISSUE_STORE_ENABLED = True
+    ISSUE_STORE_PATH = DEFAULT_ISSUE_STORE_PATH
+
+# Field profiles ordered by completeness: a stored body satisfies any profile with a lower or equal rank
+PROFILE_RANKS = {
+    'keys': 0,
+    'counts_only': 1,
+    'dashboard': 2,
+    'full': 3
+}
+
+SYNC_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class IssueStore:
+    """
+    Persistent local store of Jira issues keyed by issue key and 'updated' timestamp.
+
+    Issue bodies are kept as JSON together with the field profile they were fetched
+    with, so a body is reused only while the issue is unchanged in Jira and the
+    stored profile covers the requested one. Sync state remembers when each query
+    was last refreshed for delta queries.
+    """
+
+    def __init__(self, path=None):
+        """
+        Initialize the store and create tables if needed
+
+        Args:
+            path (str): Path to SQLite database file
+        """
+        self.path = path or ISSUE_STORE_PATH
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS issues (
+                    key TEXT PRIMARY KEY,
+                    project TEXT,
+                    updated TEXT,
+                    profile TEXT,
+                    profile_rank INTEGER,
+                    data TEXT,
+                    synced_at TEXT
+                )
+            """)
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_issues_project ON issues(project)')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    query TEXT,
+                    profile TEXT,
+                    last_sync TEXT,
+                    issue_count INTEGER,
+                    PRIMARY KEY (query, profile)
+                )
+            """)
+
+    def _connect(self):
+        """Open a new connection (one per call, so the store can be used from worker threads)"""
+        return sqlite3.connect(self.path, timeout=30)
+
+    def upsert_issues(self, issues, profile):
+        """
+        Insert or update issue bodies.
+        A body with an older 'updated' value (e.g. from a slow or cached response) does not replace
+        a newer one, and a body fetched with a poorer profile does not replace a richer one for the
+        same 'updated' value. Jira returns 'updated' in the server time zone, so the values compare as text.
+
+        Args:
+            issues (list): List of issue dictionaries
+            profile (str): Field profile the issues were fetched with
+
+        Returns:
+            int: Number of issues written
+        """
+        rank = PROFILE_RANKS.get(profile, 0)
+        now = datetime.now().strftime(SYNC_TIME_FORMAT)
+        rows = []
+        for issue in issues:
+            key = issue.get('key')
+            if not key:
+                continue
+            fields = issue.get('fields', {})
+            rows.append((
+                key,
+                (fields.get('project') or {}).get('key', ''),
+                fields.get('updated') or '',
+                profile,
+                rank,
+                json.dumps(issue, ensure_ascii=False),
+                now
+            ))
+
+        if not rows:
+            return 0
+
+        with self._connect() as conn:
+            conn.executemany("""
+                INSERT INTO issues (key, project, updated, profile, profile_rank, data, synced_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    project = excluded.project,
+                    updated = excluded.updated,
+                    profile = excluded.profile,
+                    profile_rank = excluded.profile_rank,
+                    data = excluded.data,
+                    synced_at = excluded.synced_at
+                WHERE excluded.updated > issues.updated
+                   OR (excluded.updated = issues.updated AND excluded.profile_rank >= issues.profile_rank)
+            """, rows)
+
+        logger.info(f"Stored {len(rows)} issues in issue store (profile '{profile}')")
+        return len(rows)
+
+    def get_issues(self, keys):
+        """
+        Get stored issues by keys
+
+        Args:
+            keys (list): Issue keys
+
+        Returns:
+            dict: Mapping from key to dict with 'updated', 'profile' and 'issue'
+        """
+        result = {}
+        keys = list(keys)
+        with self._connect() as conn:
+            # SQLite limits the number of bound parameters, query in batches
+            for i in range(0, len(keys), 500):
+                batch = keys[i:i + 500]
+                placeholders = ','.join('?' * len(batch))
+                rows = conn.execute(
+                    f'SELECT key, updated, profile, data FROM issues WHERE key IN ({placeholders})', batch)
+                for key, updated, profile, data in rows:
+                    result[key] = {
+                        'updated': updated,
+                        'profile': profile,
+                        'issue': json.loads(data)
+                    }
+        return result
+
+    def get_stale_keys(self, stubs, profile):
+        """
+        Find issues that must be (re)fetched: missing, changed since stored or stored with a poorer profile
+
+        Args:
+            stubs (list): Issue dictionaries with at least 'key' and 'fields.updated'
+            profile (str): Required field profile
+
+        Returns:
+            tuple: (stale keys list, stored issues dict from get_issues)
+        """
+        rank = PROFILE_RANKS.get(profile, 0)
+        keys = [stub.get('key') for stub in stubs if stub.get('key')]
+        stored = self.get_issues(keys)
+
+        stale = []
+        for stub in stubs:
+            key = stub.get('key')
+            if not key:
+                continue
+            entry = stored.get(key)
+            updated = stub.get('fields', {}).get('updated') or ''
+            if (entry is None or entry['updated'] != updated or
+                    PROFILE_RANKS.get(entry['profile'], 0) < rank):
+                stale.append(key)
+
+        return stale, stored
+
+    def get_sync_state(self, query, profile):
+        """
+        Get the last sync state of a query
+
+        Args:
+            query (str): JQL query
+            profile (str): Field profile
+
+        Returns:
+            dict: Dict with 'last_sync' (datetime) and 'issue_count' or None if never synced
+        """
+        with self._connect() as conn:
+            row = conn.execute('SELECT last_sync, issue_count FROM sync_state WHERE query = ? AND profile = ?',
+                               (query, profile)).fetchone()
+        if not row:
+            return None
+        try:
+            return {
+                'last_sync': datetime.strptime(row[0], SYNC_TIME_FORMAT),
+                'issue_count': row[1]
+            }
+        except (TypeError, ValueError):
+            return None
+
+    def set_sync_state(self, query, profile, last_sync, issue_count):
+        """
+        Save the sync state of a query
+
+        Args:
+            query (str): JQL query
+            profile (str): Field profile
+            last_sync (datetime): Time when the sync started
+            issue_count (int): Number of issues matching the query
+        """
+        with self._connect() as conn:
+            conn.execute("""
+                INSERT INTO sync_state (query, profile, last_sync, issue_count) VALUES (?, ?, ?, ?)
+                ON CONFLICT(query, profile) DO UPDATE SET
+                    last_sync = excluded.last_sync,
+                    issue_count = excluded.issue_count
+            """, (query, profile, last_sync.strftime(SYNC_TIME_FORMAT), issue_count))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_issue_store():
+    """
+    Get the shared issue store if it is enabled in config
+
+    Returns:
+        IssueStore: Shared store instance or None if disabled or unavailable
+    """
+    global _store
+    if not ISSUE_STORE_ENABLED:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                try:
+                    _store = IssueStore()
+                    logger.info(f"Opened issue store: {_store.path}")
+                except Exception as e:
+                    logger.error(f"Error opening issue store: {e}", exc_info=True)
+                    return None
+    return _store
@@ -3,6 +3,7 @@ import pandas as pd
 import json
 import logging
 import sys
+from datetime import datetime, timedelta
 
 # Try to import the config with API token
 try:
@@ -16,10 +17,67 @@ except ImportError:
     logging.error("Example: api_token = 'your_token_here'")
     sys.exit(1)
 
+# Page fetching settings
+PARALLEL_PAGING = getattr(config, 'JIRA_PARALLEL_PAGING', True)
+SEARCH_WORKERS = getattr(config, 'JIRA_SEARCH_WORKERS', 4)
+
+# Overlap for delta queries, covers clock and time zone differences between us and Jira
+SYNC_OVERLAP_MINUTES = getattr(config, 'ISSUE_STORE_SYNC_OVERLAP_MINUTES', 60)
+# Number of issues hydrated from the store (and fetched when stale) per chunk
+HYDRATE_CHUNK_SIZE = 1000
+
+# CLM graph traversal settings
+GRAPH_WORKERS = getattr(config, 'JIRA_GRAPH_WORKERS', 4)
+MAX_SUBTASK_ROUNDS = 3  # Ограничим количество итераций, чтобы избежать бесконечного цикла
+
+# Field projection profiles for issue searches.
+# Each stage requests only the fields it actually reads:
+#   keys        - key and last update time only (membership checks for the local issue store)
+#   counts_only - keys, types, status, time tracking and links (graph traversal, KPI totals)
+#   dashboard   - counts_only + comments, attachments and changelog (process_issues_data, merge request detection)
+#   closed_check - fields of the merge request and remote mention checks of closed task candidates (modules/closed_tasks.py),
+#                  the same ones the local check gets from dashboard/full, so both modes see the same data
+#   full        - dashboard + worklog (everything, kept for backward compatibility)
+FIELD_PROFILES = {
+    'keys': {
+        'fields': ['updated'],
+        'expand': []
+    },
+    'counts_only': {
+        'fields': ['project', 'summary', 'issuetype', 'timeoriginalestimate', 'timespent', 'status',
+                   'created', 'updated', 'components', 'issuelinks'],
+        'expand': []
+    },
+    'dashboard': {
+        'fields': ['project', 'summary', 'issuetype', 'timeoriginalestimate', 'timespent', 'status',
+                   'comment', 'attachment', 'created', 'updated', 'components', 'issuelinks'],
+        'expand': ['changelog']
+    },
+    'closed_check': {
+        'fields': ['project', 'summary', 'status', 'comment', 'issuelinks'],
+        'expand': []
+    },
+    'full': {
+        'fields': ['project', 'summary', 'issuetype', 'timeoriginalestimate', 'timespent', 'status',
+                   'worklog', 'comment', 'attachment', 'created', 'updated', 'components', 'issuelinks'],
+        'expand': ['changelog']
+    }
+}
+DEFAULT_FIELD_PROFILE = 'full'
+
 # Import visualization and data processing
+from modules.jira_client import get_jira_client
+from modules.fetch_engine import FetchEngine
+from modules.jql_builder import JqlTemplate, JqlTooComplexError, is_too_complex_response, split_pack
 from modules.data_processor import process_issues_data, get_status_categories
 from modules.visualization import create_visualizations
 
+# JQL templates for the CLM graph (keys are packed up to config.JIRA_MAX_JQL_LENGTH)
+EST_TEMPLATE = JqlTemplate('project = "Оценки CLM" AND issueFunction in linkedIssuesOf("key in ({items})", "relates to")')
+SUBTASKS_TEMPLATE = JqlTemplate('{items}', item_template='parent = "{item}"', separator=' OR ')
+EPICS_TEMPLATE = JqlTemplate('{items}', item_template='"Epic Link" = "{item}"', separator=' OR ')
+KEYS_TEMPLATE = JqlTemplate('key in ({items})')
+
 
 class JiraAnalyzer:
     def __init__(self, jira_url=None, status_mapping=None):
@@ -27,11 +85,11 @@ class JiraAnalyzer:
         Initialize Jira analyzer with token from config.py
 
         Args:
-            jira_url (str): Base URL for your Jira instance
+            jira_url (str): Base URL for your Jira instance (config.jira_url if None)
             status_mapping (dict): Optional mapping of statuses to categories ('open' or 'closed')
                                   Example: {'Custom Status': 'open', 'Another Status': 'closed'}
         """
-        self.jira_url = jira_url or 'https://jira.nexign.com'
+        self.jira_url = jira_url or getattr(config, 'jira_url', None) or 'https://jira.nexign.com'
         self.logger = logging.getLogger(__name__)
         self.status_mapping = status_mapping or {}
 
@@ -42,6 +100,11 @@ class JiraAnalyzer:
             "Content-Type": "application/json"
         }
 
+        # Shared pooled HTTP client (keep-alive, retries with backoff)
+        self.client = get_jira_client()
+        # Asyncio engine overlapping independent requests with bounded concurrency
+        self.engine = FetchEngine(self.client)
+
         # Check connection but continue even if it fails
         if not self._check_connection():
             self.logger.warning("Connection check failed, but will try to continue.")
@@ -56,8 +119,7 @@ class JiraAnalyzer:
             self.logger.info("Checking Jira server availability...")
 
             try:
-                session = requests.Session()
-                resp = session.get(self.jira_url, timeout=10, allow_redirects=False)
+                resp = self.client.get(self.jira_url, timeout=10, allow_redirects=False, retries=0)
                 if resp.status_code >= 300 and resp.status_code < 400:
                     self.logger.error(f"Server redirecting to: {resp.headers.get('Location', 'unknown')}")
                     self.logger.error("VPN connection or NetScaler authentication may be required")
@@ -69,7 +131,7 @@ class JiraAnalyzer:
             self.logger.info("Server available, checking token authentication...")
 
             # Now check authentication using API v2
-            response = requests.get(
+            response = self.client.get(
                 f"{self.jira_url}/rest/api/2/myself",
                 headers=self.headers,
                 timeout=10
@@ -94,11 +156,16 @@ class JiraAnalyzer:
             self.logger.error(f"Error checking connection: {e}")
             return False
 
-    def get_issues_by_filter(self, jql_query=None, filter_id=None, max_results=10000, additional_fields=None):
+    def get_issues_by_filter(self, jql_query=None, filter_id=None, max_results=10000, additional_fields=None,
+                             parallel=None, max_workers=None, profile=DEFAULT_FIELD_PROFILE, raise_on_complex=False,
+                             use_cache=True):
         """
         Get issues from Jira using a JQL query or filter ID.
         No limit on the number of issues (default 10000 should be sufficient).
-        Includes changelog request for transitions analysis.
+        Includes changelog request for transitions analysis (except for the counts_only profile).
+
+        Collects all pages from iter_issue_pages(). Use iter_issue_pages() or iter_issues()
+        directly when the issues can be processed incrementally.
 
         FIXED: Properly handle filter_id parameter and correct error handling when data is not a JSON
 
@@ -107,10 +174,57 @@ class JiraAnalyzer:
             filter_id (str/int): Jira filter ID to use instead of JQL
             max_results (int): Maximum number of results to return
             additional_fields (list): Additional fields to request beyond the standard set
+            parallel (bool): Fetch remaining pages concurrently (default from config.JIRA_PARALLEL_PAGING)
+            max_workers (int): Number of concurrent page requests (default from config.JIRA_SEARCH_WORKERS)
+            profile (str): Field projection profile from FIELD_PROFILES ('counts_only', 'dashboard', 'full')
+            raise_on_complex (bool): Raise JqlTooComplexError instead of returning an empty list
+                                     when Jira rejects the query as too long or too complex
+            use_cache (bool): Allow search pages from the Jira response cache (False fetches fresh pages)
 
         Returns:
             list: List of issue dictionaries
         """
+        all_issues = []
+        try:
+            for page in self.iter_issue_pages(jql_query, filter_id, max_results, additional_fields,
+                                              parallel, max_workers, profile, use_cache):
+                all_issues.extend(page)
+        except JqlTooComplexError as e:
+            if raise_on_complex:
+                raise
+            self.logger.error(f"Query rejected by Jira: {e}")
+            return []
+
+        self.logger.info("Retrieved all issues matching the query or reached max_results.")
+
+        return all_issues
+
+    def iter_issue_pages(self, jql_query=None, filter_id=None, max_results=10000, additional_fields=None,
+                         parallel=None, max_workers=None, profile=DEFAULT_FIELD_PROFILE, use_cache=True):
+        """
+        Generator of search result pages, in startAt order.
+
+        The first page is fetched to learn the total. In parallel mode the next
+        max_workers pages are fetched concurrently and yielded before the following
+        ones are requested, so at most max_workers pages are held in memory at once.
+        A page that cannot be fetched ends the stream.
+
+        Args:
+            jql_query (str): JQL query string
+            filter_id (str/int): Jira filter ID to use instead of JQL
+            max_results (int): Maximum number of issues to yield
+            additional_fields (list): Additional fields to request beyond the standard set
+            parallel (bool): Fetch pages concurrently (default from config.JIRA_PARALLEL_PAGING)
+            max_workers (int): Number of concurrent page requests (default from config.JIRA_SEARCH_WORKERS)
+            profile (str): Field projection profile from FIELD_PROFILES
+            use_cache (bool): Allow search pages from the Jira response cache
+
+        Yields:
+            list: Issue dictionaries of one page
+
+        Raises:
+            JqlTooComplexError: If Jira rejects the query as too long or too complex
+        """
         # Use API v2
         search_url = f"{self.jira_url}/rest/api/2/search"
 
@@ -129,88 +243,226 @@ class JiraAnalyzer:
 
         self.logger.info(f"Final query string: {query_string}")
 
-        start_at = 0
-        all_issues = []
+        if parallel is None:
+            parallel = PARALLEL_PAGING
+        if not max_workers:
+            max_workers = SEARCH_WORKERS
 
-        # Базовый набор полей
-        fields = [
-            'project',
-            'summary',
-            'issuetype',
-            'timeoriginalestimate',
-            'timespent',
-            'status',
-            'worklog',
-            'comment',
-            'attachment',
-            'created',  # Request creation date
-            'components',  # Request components for CLM/EST analysis
-            'issuelinks'  # Request issue links for relationship analysis
-        ]
+        # Набор полей и expand из выбранного профиля
+        if profile not in FIELD_PROFILES:
+            self.logger.warning(f"Unknown field profile '{profile}', using '{DEFAULT_FIELD_PROFILE}'")
+            profile = DEFAULT_FIELD_PROFILE
+        fields = list(FIELD_PROFILES[profile]['fields'])
+        expand = list(FIELD_PROFILES[profile]['expand'])
+        self.logger.info(f"Using field profile '{profile}'")
 
         # Добавляем дополнительные поля, если они указаны
         if additional_fields:
             fields.extend(additional_fields)
 
-        while True:
-            query = {
-                'jql': query_string,
-                'maxResults': 100,  # Get 100 issues per request (API limit)
-                'startAt': start_at,
-                'fields': fields,
-                'expand': ['changelog']  # Request changelog for transitions analysis
-            }
-
-            try:
-                response = requests.post(
-                    search_url,
-                    headers=self.headers,
-                    data=json.dumps(query),
-                    timeout=30
-                )
-
-                # Print request info for debugging
-                self.logger.info(f"Request to {search_url}, response code: {response.status_code}")
+        def fetch(offset):
+            return self._fetch_search_page(search_url, query_string, fields, offset, page_size, expand,
+                                           use_cache=use_cache)
 
-                # Check for errors
-                if response.status_code != 200:
-                    self.logger.error(f"Error getting data: {response.status_code}")
-                    self.logger.error(f"Server response: {response.text[:200]}...")
-                    break
+        # First page tells us the total number of issues and the page size used by the server
+        data = self._fetch_search_page(search_url, query_string, fields, 0, expand=expand, check_complex=True,
+                                       use_cache=use_cache)
+        if data is None:
+            return
 
-                # Check for valid JSON
-                try:
-                    data = response.json()
-                except json.JSONDecodeError as e:
-                    self.logger.error(f"Error parsing JSON: {e}")
-                    self.logger.error(f"Response content: {response.text[:200]}...")
-                    break
+        issues = data.get('issues', [])
+        if not issues:
+            self.logger.info("No more issues found.")
+            return
+
+        total = min(data.get('total', 0), max_results)
+        page_size = data.get('maxResults') or len(issues)
+        retrieved = len(issues)
+        self.logger.info(f"Retrieved {retrieved}/{data.get('total', 0)} issues...")
+        yield issues[:max_results]
+        del data, issues
+
+        start_at = retrieved
+        window = max_workers if parallel else 1
+        while start_at < total:
+            offsets = list(range(start_at, total, page_size))[:window]
+            if len(offsets) > 1:
+                # map() keeps the pages in startAt order
+                pages = self.engine.map(fetch, offsets, max_concurrency=window)
+            else:
+                pages = [fetch(offsets[0])]
 
-                issues = data.get('issues', [])
+            for offset, page in zip(offsets, pages):
+                if page is None:
+                    self.logger.error(f"Stopping at page startAt={offset}, returning issues fetched before it")
+                    return
 
+                issues = page.get('issues', [])
                 if not issues:
                     self.logger.info("No more issues found.")
-                    break
+                    return
 
-                all_issues.extend(issues)
-                start_at += len(issues)
+                start_at = offset + len(issues)
+                issues = issues[:max_results - retrieved]
+                retrieved += len(issues)
+                yield issues
 
-                # Progress indicator
-                self.logger.info(f"Retrieved {len(all_issues)}/{data.get('total', 0)} issues...")
+            # Progress indicator
+            self.logger.info(f"Retrieved {retrieved}/{total} issues...")
+            del pages
 
-                # Exit if all issues received or max_results reached
-                if start_at >= data.get('total', 0) or len(all_issues) >= max_results:
-                    self.logger.info("Retrieved all issues matching the query or reached max_results.")
-                    break
+    def iter_issues(self, jql_query=None, filter_id=None, max_results=10000, additional_fields=None,
+                    profile=DEFAULT_FIELD_PROFILE, use_cache=True):
+        """
+        Generator of issues matching a JQL query or filter, fetched page by page
 
-            except Exception as e:
-                self.logger.error(f"Exception occurred: {str(e)}")
-                self.logger.error("Traceback:", exc_info=True)
-                break
+        Args:
+            jql_query (str): JQL query string
+            filter_id (str/int): Jira filter ID to use instead of JQL
+            max_results (int): Maximum number of issues to yield
+            additional_fields (list): Additional fields to request beyond the standard set
+            profile (str): Field projection profile from FIELD_PROFILES
+            use_cache (bool): Allow search pages from the Jira response cache
 
-        return all_issues
+        Yields:
+            dict: Issue dictionary
+        """
+        for page in self.iter_issue_pages(jql_query, filter_id, max_results, additional_fields,
+                                          profile=profile, use_cache=use_cache):
+            yield from page
 
-    def get_linked_issues(self, issues, link_type=None, max_depth=1):
+    def _fetch_search_page(self, search_url, query_string, fields, start_at, page_size=100, expand=None,
+                           check_complex=False, use_cache=True):
+        """
+        Fetch one page of search results
+
+        Args:
+            search_url (str): Search endpoint URL
+            query_string (str): JQL query string
+            fields (list): Fields to request
+            start_at (int): Index of the first issue in the page
+            page_size (int): Number of issues per page
+            expand (list): Entities to expand (e.g. changelog)
+            check_complex (bool): Raise JqlTooComplexError if Jira rejects the query as too complex
+            use_cache (bool): Allow the page from the Jira response cache
+
+        Returns:
+            dict: Search response data or None if error
+        """
+        query = {
+            'jql': query_string,
+            'maxResults': page_size,  # Get 100 issues per request (API limit)
+            'startAt': start_at,
+            'fields': fields,
+            'expand': expand or []  # Changelog is needed for transitions analysis
+        }
+
+        try:
+            # Search is read-only, so it is safe to retry on server errors
+            response = self.client.post(
+                search_url,
+                headers=self.headers,
+                data=json.dumps(query),
+                timeout=30,
+                idempotent=True,
+                cache=use_cache
+            )
+
+            # Print request info for debugging
+            self.logger.info(f"Request to {search_url} (startAt={start_at}), response code: {response.status_code}")
+
+            # Check for errors
+            if check_complex and response.status_code != 200 and is_too_complex_response(response):
+                raise JqlTooComplexError(f"{response.status_code}: {response.text[:200]}")
+
+            if response.status_code != 200:
+                self.logger.error(f"Error getting data: {response.status_code}")
+                self.logger.error(f"Server response: {response.text[:200]}...")
+                return None
+
+            # Check for valid JSON
+            try:
+                return response.json()
+            except json.JSONDecodeError as e:
+                self.logger.error(f"Error parsing JSON: {e}")
+                self.logger.error(f"Response content: {response.text[:200]}...")
+                return None
+
+        except JqlTooComplexError:
+            raise
+        except Exception as e:
+            self.logger.error(f"Exception occurred: {str(e)}")
+            self.logger.error("Traceback:", exc_info=True)
+            return None
+
+    def count_issues(self, jql_query=None, filter_id=None, use_cache=False):
+        """
+        Count issues matching a JQL query or filter without downloading them
+        (search with maxResults=0, only the total is read)
+
+        Args:
+            jql_query (str): JQL query string
+            filter_id (str/int): Jira filter ID to use instead of JQL
+            use_cache (bool): Allow the count from the Jira response cache
+
+        Returns:
+            int: Number of matching issues or None if the search failed
+        """
+        query_string = f'filter={filter_id}' if filter_id else (jql_query or '')
+        data = self._fetch_search_page(f"{self.jira_url}/rest/api/2/search", query_string, [], 0, page_size=0,
+                                       use_cache=use_cache)
+        if data is None or 'total' not in data:
+            return None
+        return data['total']
+
+    def count_queries(self, queries, max_workers=None, use_cache=False):
+        """
+        Run count-only searches concurrently
+
+        Args:
+            queries (dict): Name -> JQL query, or list of JQL queries whose totals are summed
+                            (e.g. a key list packed into several queries)
+            max_workers (int): Number of concurrent searches (default from config.JIRA_GRAPH_WORKERS)
+            use_cache (bool): Allow counts from the Jira response cache
+
+        Returns:
+            dict: Name -> number of issues, None for names with a failed search
+        """
+        searches = []
+        for name, jql in queries.items():
+            for query in ([jql] if isinstance(jql, str) else jql):
+                searches.append((name, query))
+
+        totals = self.engine.map(lambda search: self.count_issues(search[1], use_cache=use_cache), searches,
+                                 max_concurrency=max_workers or GRAPH_WORKERS)
+
+        counts = {name: 0 for name in queries}
+        for (name, query), total in zip(searches, totals):
+            if total is None:
+                self.logger.error(f"Count query for {name} failed: {query[:200]}")
+                counts[name] = None
+            elif counts[name] is not None:
+                counts[name] += total
+        return counts
+
+    def get_statuses(self):
+        """
+        Get names of all statuses defined in Jira
+
+        Returns:
+            list: Status names (empty if the request failed)
+        """
+        try:
+            response = self.client.get(f"{self.jira_url}/rest/api/2/status", headers=self.headers, timeout=30)
+            if response.status_code != 200:
+                self.logger.error(f"Error getting statuses: {response.status_code}")
+                return []
+            return [status.get('name') for status in response.json() if status.get('name')]
+        except Exception as e:
+            self.logger.error(f"Exception getting statuses: {e}")
+            return []
+
+    def get_linked_issues(self, issues, link_type=None, max_depth=1, profile=DEFAULT_FIELD_PROFILE):
         """
         Get issues linked to the provided issues.
 
@@ -218,6 +470,7 @@ class JiraAnalyzer:
             issues (list): List of issue dictionaries or issue keys
             link_type (str): Optional link type to filter by (e.g., "relates to")
             max_depth (int): Maximum depth of link traversal
+            profile (str): Field projection profile for the linked issues
 
         Returns:
             list: List of linked issue dictionaries
@@ -238,45 +491,351 @@ class JiraAnalyzer:
         if not issue_keys:
             return []
 
-        # Split issue keys into much smaller chunks to avoid query length limitations
-        # Jira has a smaller limit than expected, use 10 keys per chunk
-        chunk_size = 10
+        searches = self._build_linked_searches(issue_keys, link_type, profile)
+        self.logger.info(f"Fetching linked issues for {len(issue_keys)} issues in {len(searches)} queries")
+
         all_linked_issues = []
+        for linked_issues in self._run_searches(searches):
+            all_linked_issues.extend(linked_issues)
 
-        for i in range(0, len(issue_keys), chunk_size):
-            chunk = issue_keys[i:i + chunk_size]
+        self.logger.info(f"Retrieved {len(all_linked_issues)} linked issues")
+        return all_linked_issues
 
-            # Create the JQL query with proper syntax - important to use OR for multiple issues
-            if link_type:
-                jql_parts = []
-                for key in chunk:
-                    jql_parts.append(f'issue in linkedIssues("{key}", "{link_type}")')
+    def search_pack(self, template, items, profile=DEFAULT_FIELD_PROFILE, additional_fields=None, use_cache=True):
+        """
+        Search issues for a packed group of items.
+        If Jira rejects the query as too complex, the template's item limit is halved
+        and the group is retried in smaller queries.
 
-                jql = " OR ".join(jql_parts)
-            else:
-                jql_parts = []
-                for key in chunk:
-                    jql_parts.append(f'issue in linkedIssues("{key}")')
+        Args:
+            template (JqlTemplate): Query template
+            items (list): Items (issue keys) to put into the query
+            profile (str): Field projection profile
+            additional_fields (list): Additional fields to request
+            use_cache (bool): Allow search pages from the Jira response cache
 
-                jql = " OR ".join(jql_parts)
+        Returns:
+            list: List of issue dictionaries
+        """
+        # Split up front if Jira has already rejected larger queries of this template
+        if template.max_items and len(items) > template.max_items:
+            issues = []
+            for part in split_pack(items, template.max_items):
+                issues.extend(self.search_pack(template, part, profile=profile, additional_fields=additional_fields,
+                                               use_cache=use_cache))
+            return issues
+
+        jql = template.render(items)
+        try:
+            self.logger.info(f"Fetching issues for {len(items)} items with query: {jql}")
+            return self.get_issues_by_filter(jql_query=jql, additional_fields=additional_fields,
+                                             profile=profile, raise_on_complex=True, use_cache=use_cache)
+        except JqlTooComplexError as e:
+            if len(items) <= 1:
+                self.logger.error(f"Query for a single item was rejected by Jira: {e}")
+                return []
+
+            max_items = template.reduce_max_items(len(items))
+            self.logger.warning(f"Query with {len(items)} items rejected as too complex, "
+                                f"retrying with at most {max_items} items per query")
+            return self.search_pack(template, items, profile=profile, additional_fields=additional_fields,
+                                    use_cache=use_cache)
+
+    def _build_key_searches(self, keys, template, profile=DEFAULT_FIELD_PROFILE, additional_fields=None,
+                            use_cache=True):
+        """
+        Build search definitions for a list of keys, packing as many keys per query as fit
 
-            # Get the linked issues
-            self.logger.info(f"Fetching linked issues with query: {jql}")
-            linked_issues = self.get_issues_by_filter(jql_query=jql)
-            all_linked_issues.extend(linked_issues)
+        Args:
+            keys (list): Issue keys
+            template (JqlTemplate): Query template
+            profile (str): Field projection profile
+            additional_fields (list): Additional fields to request
+            use_cache (bool): Allow search pages from the Jira response cache
 
-            self.logger.info(
-                f"Retrieved {len(linked_issues)} linked issues for chunk {i // chunk_size + 1}/{(len(issue_keys) + chunk_size - 1) // chunk_size}")
+        Returns:
+            list: List of search dictionaries for _run_searches
+        """
+        return [{'template': template, 'items': pack, 'profile': profile, 'additional_fields': additional_fields,
+                 'use_cache': use_cache}
+                for pack in template.pack(keys)]
 
-        return all_linked_issues
+    def search_keys(self, keys, template, profile=DEFAULT_FIELD_PROFILE, use_cache=True):
+        """
+        Search issues for a list of keys, packing the keys into as few queries as fit
+        and running the queries concurrently
+
+        Args:
+            keys (list): Issue keys
+            template (JqlTemplate): Query template with an {items} placeholder for the keys
+            profile (str): Field projection profile
+            use_cache (bool): Allow search pages from the Jira response cache
+
+        Returns:
+            list: List of issue dictionaries
+        """
+        issues = []
+        for found in self._run_searches(self._build_key_searches(keys, template, profile, use_cache=use_cache)):
+            issues.extend(found)
+        return issues
+
+    def _build_linked_searches(self, issue_keys, link_type=None, profile=DEFAULT_FIELD_PROFILE):
+        """
+        Build linkedIssues() searches for the given keys
+
+        Args:
+            issue_keys (list): Issue keys
+            link_type (str): Optional link type to filter by
+            profile (str): Field projection profile
+
+        Returns:
+            list: List of search dictionaries for _run_searches
+        """
+        # Important to use OR for multiple issues
+        if link_type:
+            template = JqlTemplate('{items}', item_template='issue in linkedIssues("{item}", "' + link_type + '")',
+                                   separator=' OR ')
+        else:
+            template = JqlTemplate('{items}', item_template='issue in linkedIssues("{item}")', separator=' OR ')
+        return self._build_key_searches(issue_keys, template, profile)
+
+    def _run_searches(self, searches, max_workers=None):
+        """
+        Run independent searches concurrently on the fetch engine with bounded concurrency
+
+        Args:
+            searches (list): Search dictionaries with 'template', 'items', 'profile', 'additional_fields'
+                             and optional 'use_cache'
+            max_workers (int): Number of concurrent searches (default from config.JIRA_GRAPH_WORKERS)
+
+        Returns:
+            list: One list of issues per search, in the same order as searches
+        """
+        if not searches:
+            return []
+
+        def run(search):
+            try:
+                return self.search_pack(search['template'], search['items'],
+                                        profile=search.get('profile', DEFAULT_FIELD_PROFILE),
+                                        additional_fields=search.get('additional_fields'),
+                                        use_cache=search.get('use_cache', True))
+            except Exception as e:
+                self.logger.error(f"Error fetching issues for {len(search['items'])} items: {e}")
+                return []
+
+        return self.engine.map(run, searches, max_concurrency=max_workers or GRAPH_WORKERS)
+
+    def hydrate_issues(self, stubs, profile, store):
+        """
+        Replace issue stubs (key + updated) with full bodies from the local issue store.
+        Only issues missing in the store, changed since they were stored or stored with
+        a poorer field profile are fetched from Jira.
+
+        Args:
+            stubs (list): Issue dictionaries with at least 'key' and 'fields.updated'
+            profile (str): Required field profile
+            store (IssueStore): Local issue store
+
+        Returns:
+            list: Full issue dictionaries in the order of stubs
+        """
+        return list(self.iter_hydrated_issues(stubs, profile, store))
+
+    def iter_hydrated_issues(self, stubs, profile, store, chunk_size=None):
+        """
+        Generator version of hydrate_issues(): stubs are hydrated in chunks, so only
+        one chunk of full issue bodies is held in memory at a time
+
+        Args:
+            stubs (list): Issue dictionaries with at least 'key' and 'fields.updated'
+            profile (str): Required field profile
+            store (IssueStore): Local issue store
+            chunk_size (int): Number of stubs per chunk (default HYDRATE_CHUNK_SIZE)
 
-    def get_clm_related_issues(self, clm_issues):
+        Yields:
+            dict: Full issue dictionaries in the order of stubs
+        """
+        chunk_size = chunk_size or HYDRATE_CHUNK_SIZE
+        fetched_count = 0
+
+        for start in range(0, len(stubs), chunk_size):
+            chunk = stubs[start:start + chunk_size]
+            stale_keys, stored = store.get_stale_keys(chunk, profile)
+            issues = {key: entry['issue'] for key, entry in stored.items()}
+
+            if stale_keys:
+                fetched = []
+                # Stale issues changed in Jira, so cached search pages cannot be trusted for them
+                searches = self._build_key_searches(stale_keys, KEYS_TEMPLATE, profile, use_cache=False)
+                for chunk_issues in self._run_searches(searches):
+                    fetched.extend(chunk_issues)
+                store.upsert_issues(fetched, profile)
+                for issue in fetched:
+                    issues[issue.get('key')] = issue
+                fetched_count += len(stale_keys)
+
+            for stub in chunk:
+                issue = issues.get(stub.get('key'))
+                if issue is not None:
+                    yield issue
+                else:
+                    self.logger.warning(f"Issue {stub.get('key')} could not be loaded from Jira or issue store")
+
+        self.logger.info(f"Issue store: {len(stubs) - fetched_count} of {len(stubs)} issues were up to date, "
+                         f"fetched {fetched_count} with profile '{profile}'")
+
+    def iter_issue_bodies(self, stubs, profile, store=None, chunk_size=None):
+        """
+        Load full bodies of issue stubs chunk by chunk: through the local issue store
+        (see iter_hydrated_issues()) or, without a store, with key searches
+
+        Args:
+            stubs (list): Issue dictionaries with at least 'key' (and 'fields.updated' for the store)
+            profile (str): Field projection profile
+            store (IssueStore): Optional local issue store
+            chunk_size (int): Number of stubs per chunk (default HYDRATE_CHUNK_SIZE)
+
+        Yields:
+            dict: Full issue dictionaries in the order of stubs
+        """
+        if store is not None:
+            yield from self.iter_hydrated_issues(stubs, profile, store, chunk_size)
+            return
+
+        chunk_size = chunk_size or HYDRATE_CHUNK_SIZE
+        for start in range(0, len(stubs), chunk_size):
+            keys = [stub.get('key') for stub in stubs[start:start + chunk_size] if stub.get('key')]
+            issues = {}
+            for chunk_issues in self._run_searches(self._build_key_searches(keys, KEYS_TEMPLATE, profile)):
+                for issue in chunk_issues:
+                    issues[issue.get('key')] = issue
+
+            for key in keys:
+                issue = issues.get(key)
+                if issue is not None:
+                    yield issue
+                else:
+                    self.logger.warning(f"Issue {key} could not be loaded from Jira")
+
+    def sync_query(self, jql_query, profile=DEFAULT_FIELD_PROFILE, store=None, full_refresh=False):
+        """
+        Get issues matching a query through the local issue store.
+
+        The first sync downloads all issues. Later syncs fetch only issues with
+        'updated >= <last sync>' (delta query), then check the current membership of
+        the query with a light keys-only search, so removed issues drop out and
+        anything the delta missed is fetched by key.
+
+        Args:
+            jql_query (str): JQL query
+            profile (str): Field projection profile
+            store (IssueStore): Local issue store, plain get_issues_by_filter if None
+            full_refresh (bool): Ignore previous sync state and download everything
+
+        Returns:
+            list: List of issue dictionaries
+        """
+        return list(self.iter_sync_query(jql_query, profile, store, full_refresh))
+
+    def iter_sync_query(self, jql_query, profile=DEFAULT_FIELD_PROFILE, store=None, full_refresh=False):
+        """
+        Generator version of sync_query(): issues are yielded page by page (full sync)
+        or chunk by chunk (delta sync) instead of being collected into a list.
+        The sync state is saved when the generator is exhausted.
+
+        Args:
+            jql_query (str): JQL query
+            profile (str): Field projection profile
+            store (IssueStore): Local issue store, plain iter_issue_pages if None
+            full_refresh (bool): Ignore previous sync state and download everything
+
+        Yields:
+            dict: Issue dictionary
+        """
+        try:
+            if store is None:
+                for page in self.iter_issue_pages(jql_query=jql_query, profile=profile):
+                    yield from page
+                return
+
+            started = datetime.now()
+            state = None if full_refresh else store.get_sync_state(jql_query, profile)
+            count = 0
+
+            if state is None:
+                self.logger.info(f"Issue store: full sync for query: {jql_query}")
+                for page in self.iter_issue_pages(jql_query=jql_query, profile=profile, use_cache=not full_refresh):
+                    store.upsert_issues(page, profile)
+                    count += len(page)
+                    yield from page
+            else:
+                since = state['last_sync'] - timedelta(minutes=SYNC_OVERLAP_MINUTES)
+                delta_jql = f'({jql_query}) AND updated >= "{since.strftime("%Y/%m/%d %H:%M")}"'
+                self.logger.info(f"Issue store: delta sync since {since} for query: {jql_query}")
+
+                changed = 0
+                for page in self.iter_issue_pages(jql_query=delta_jql, profile=profile, use_cache=False):
+                    store.upsert_issues(page, profile)
+                    changed += len(page)
+                self.logger.info(f"Issue store: {changed} issues changed since last sync")
+
+                stubs = self.get_issues_by_filter(jql_query=jql_query, profile='keys', use_cache=False)
+                for issue in self.iter_hydrated_issues(stubs, profile, store):
+                    count += 1
+                    yield issue
+
+            store.set_sync_state(jql_query, profile, started, count)
+        except JqlTooComplexError as e:
+            self.logger.error(f"Query rejected by Jira: {e}")
+
+    @staticmethod
+    def _collect_new(issues, visited, target):
+        """
+        Append issues whose keys were not seen before
+
+        Args:
+            issues (list): Fetched issues
+            visited (set): Keys already collected (updated in place)
+            target (list): List receiving new issues
+
+        Returns:
+            list: Keys of newly collected issues
+        """
+        new_keys = []
+        for issue in issues:
+            key = issue.get('key')
+            if key and key not in visited:
+                visited.add(key)
+                target.append(issue)
+                new_keys.append(key)
+        return new_keys
+
+    def get_clm_related_issues(self, clm_issues, profile=DEFAULT_FIELD_PROFILE, store=None, keys_only=False):
         """
         Get all issues related to CLM issues following the specific logic.
         Now includes both "Improvement from CLM" and "Analyzing from CLM" issue types.
 
+        The CLM graph is walked breadth-first: every frontier level is split into
+        batched queries that run concurrently, and one visited set keeps each issue
+        from being collected or expanded twice. Levels:
+            1. CLM -> EST ("relates to") and CLM -> Improvement/Analyzing ("links CLM to")
+            2. Improvement/Analyzing -> implementation ("is realized in") and their subtasks
+            3. implementation -> subtasks and epic children
+            4+. new issues -> subtasks (up to MAX_SUBTASK_ROUNDS rounds)
+
+        EST and Improvement/Analyzing issues are only traversed, so they are fetched
+        with the counts_only profile; implementation issues use the given profile.
+        With a local issue store the implementation levels are walked with the keys
+        profile and only new or changed issue bodies are downloaded afterwards.
+        With keys_only the walk always uses the keys profile and implementation issues
+        are returned as stubs, for callers streaming the bodies with iter_issue_bodies().
+
         Args:
             clm_issues (list): List of CLM issue dictionaries
+            profile (str): Field projection profile for implementation issues
+            store (IssueStore): Optional local issue store
+            keys_only (bool): Return implementation issue stubs (key and updated) instead of bodies
 
         Returns:
             tuple: (est_issues, improvement_issues, implementation_issues)
@@ -287,24 +846,20 @@ class JiraAnalyzer:
         # Extract CLM issue keys
         clm_keys = [issue.get('key') for issue in clm_issues if issue.get('key')]
 
-        # Get EST issues related to CLM with "relates to" link
+        # Level 1: EST issues and Improvement/Analyzing issues are independent, fetch them together
         # ВАЖНО: Явно указываем связь с конкретными CLM из изначального запроса
-        self.logger.info(f"Fetching EST issues related to {len(clm_keys)} CLM issues...")
-
-        # Разбиваем на части, чтобы избежать слишком длинного запроса
-        est_issues = []
-        batch_size = 20
+        self.logger.info(f"Fetching EST, Improvement and Analyzing issues related to {len(clm_keys)} CLM issues...")
+        est_searches = self._build_key_searches(
+            clm_keys, EST_TEMPLATE, 'counts_only', ['customfield_12307'])
+        link_searches = self._build_linked_searches(clm_keys, "links CLM to", 'counts_only')
 
-        for i in range(0, len(clm_keys), batch_size):
-            batch = clm_keys[i:i + batch_size]
-            # Создаем точный запрос для связанных EST тикетов
-            batch_jql = f'project = "Оценки CLM" AND issueFunction in linkedIssuesOf("key in ({",".join(batch)})", "relates to")'
+        results = self._run_searches(est_searches + link_searches)
+        est_results, link_results = results[:len(est_searches)], results[len(est_searches):]
 
-            self.logger.info(f"Fetching EST batch {i // batch_size + 1} with query: {batch_jql}")
-            batch_issues = self.get_issues_by_filter(jql_query=batch_jql, additional_fields=['customfield_12307'])
-            est_issues.extend(batch_issues)
-
-            self.logger.info(f"Retrieved {len(batch_issues)} EST issues from batch {i // batch_size + 1}")
+        est_issues = []
+        est_visited = set()
+        for batch_issues in est_results:
+            self._collect_new(batch_issues, est_visited, est_issues)
 
         # Проверяем что получили EST тикеты
         if not est_issues:
@@ -315,21 +870,23 @@ class JiraAnalyzer:
                       issue.get('fields', {}).get('project', {}).get('key') == 'EST' or
                       issue.get('fields', {}).get('project', {}).get('name') == 'Оценки CLM']
 
-        # Get issues linked to CLM with "links CLM to" link
-        # Now includes both "Improvement from CLM" and "Analyzing from CLM" issue types
-        self.logger.info(f"Fetching Improvement and Analyzing issues linked to CLM...")
-        linked_issues = self.get_linked_issues(clm_keys, link_type="links CLM to")
-
         # Filter for both "Improvement from CLM" and "Analyzing from CLM" types
         improvement_issues = []
         analyzing_issues = []
+        linked_visited = set()
 
-        for issue in linked_issues:
-            issue_type = issue.get('fields', {}).get('issuetype', {}).get('name')
-            if issue_type == 'Improvement from CLM':
-                improvement_issues.append(issue)
-            elif issue_type == 'Analyzing from CLM':
-                analyzing_issues.append(issue)
+        for linked_issues in link_results:
+            for issue in linked_issues:
+                key = issue.get('key')
+                if not key or key in linked_visited:
+                    continue
+                issue_type = issue.get('fields', {}).get('issuetype', {}).get('name')
+                if issue_type == 'Improvement from CLM':
+                    improvement_issues.append(issue)
+                    linked_visited.add(key)
+                elif issue_type == 'Analyzing from CLM':
+                    analyzing_issues.append(issue)
+                    linked_visited.add(key)
 
         # Log counts of each type
         self.logger.info(f"Found {len(improvement_issues)} 'Improvement from CLM' issues")
@@ -337,182 +894,85 @@ class JiraAnalyzer:
 
         # Combine for further processing, but keep the original improvement_issues separate
         # to maintain backward compatibility with the rest of the code
-        all_clm_linked_issues = improvement_issues + analyzing_issues
+        all_linked_keys = [issue.get('key') for issue in improvement_issues + analyzing_issues]
 
-        # Get implementation issues linked to both Improvements and Analyzing issues with "is realized in" link
-        implementation_keys = []
+        # One visited set for all implementation levels
+        visited = set()
         implementation_issues = []
 
-        all_linked_keys = [issue.get('key') for issue in all_clm_linked_issues if issue.get('key')]
+        # With the issue store only keys are needed for the walk, bodies are loaded afterwards
+        walk_profile = 'keys' if store is not None or keys_only else profile
 
+        # Level 2: implementation issues ("is realized in") and direct subtasks of Improvement/Analyzing issues
+        frontier = []
         if all_linked_keys:
             self.logger.info(
-                f"Fetching implementation issues linked to {len(all_linked_keys)} Improvement and Analyzing issues...")
-            implementation_issues = self.get_linked_issues(all_linked_keys, link_type="is realized in")
-            implementation_keys = [issue.get('key') for issue in implementation_issues if issue.get('key')]
-
-        # Get ALL implementation issue keys including existing ones from improvement links
-        all_implementation_keys = implementation_keys.copy()
+                f"Fetching implementation issues and subtasks of {len(all_linked_keys)} Improvement and Analyzing issues...")
+            realized_searches = self._build_linked_searches(all_linked_keys, "is realized in", walk_profile)
+            subtask_searches = self._build_key_searches(all_linked_keys, SUBTASKS_TEMPLATE, walk_profile)
 
-        # Also get subtasks for improvement and analyzing issues directly
-        linked_subtasks = []
-        if all_linked_keys:
-            for i in range(0, len(all_linked_keys), 10):
-                chunk = all_linked_keys[i:i + 10]
-                parents_clause = " OR ".join([f'parent = "{key}"' for key in chunk])
-                subtasks_query = parents_clause
+            results = self._run_searches(realized_searches + subtask_searches)
+            for level_issues in results:
+                frontier.extend(self._collect_new(level_issues, visited, implementation_issues))
 
-                self.logger.info(f"Fetching subtasks of improvement and analyzing issues with query: {subtasks_query}")
-                try:
-                    chunk_subtasks = self.get_issues_by_filter(jql_query=subtasks_query)
-                    linked_subtasks.extend(chunk_subtasks)
-
-                    # Add these subtask keys to the implementation keys for getting their subtasks too
-                    for subtask in chunk_subtasks:
-                        key = subtask.get('key')
-                        if key and key not in all_implementation_keys:
-                            all_implementation_keys.append(key)
-                except Exception as e:
-                    self.logger.error(f"Error fetching improvement subtasks: {e}")
-
-        # Use all_implementation_keys instead of implementation_keys for further subtask fetching
         self.logger.info(
-            f"Total implementation keys including improvement and analyzing subtasks: {len(all_implementation_keys)}")
-
-        # Get subtasks using direct parent query instead of subtasksOf
-        subtasks = []
-        if all_implementation_keys:
-            for i in range(0, len(all_implementation_keys), 10):
-                chunk = all_implementation_keys[i:i + 10]
-                parents_clause = " OR ".join([f'parent = "{key}"' for key in chunk])
-                subtasks_query = parents_clause
-
-                self.logger.info(f"Fetching subtasks with query: {subtasks_query}")
-                try:
-                    chunk_subtasks = self.get_issues_by_filter(jql_query=subtasks_query)
-                    subtasks.extend(chunk_subtasks)
-                except Exception as e:
-                    self.logger.error(f"Error fetching subtasks: {e}")
-
-        # Get epic issues using Epic Link field instead of issuesInEpics
-        epic_issues = []
-        if all_implementation_keys:  # Use all_implementation_keys here too
-            for i in range(0, len(all_implementation_keys), 10):
-                chunk = all_implementation_keys[i:i + 10]
-                epics_clause = " OR ".join([f'"Epic Link" = "{key}"' for key in chunk])
-                epics_query = epics_clause
-
-                self.logger.info(f"Fetching epic issues with query: {epics_query}")
-                try:
-                    chunk_epics = self.get_issues_by_filter(jql_query=epics_query)
-                    epic_issues.extend(chunk_epics)
-                except Exception as e:
-                    self.logger.error(f"Error fetching epic issues: {e}")
-
-        # Combine all implementation-related issues
-        implementation_issues.extend(linked_subtasks)  # Add improvement and analyzing subtasks
-        implementation_issues.extend(subtasks)
-        implementation_issues.extend(epic_issues)
+            f"Total implementation keys including improvement and analyzing subtasks: {len(frontier)}")
 
-        # ДОБАВЛЕНО: Рекурсивный поиск всех подзадач для всех типов тикетов
-        self.logger.info("Starting recursive search for subtasks of all issue types...")
+        # Level 3: subtasks and epic children of implementation issues
+        if frontier:
+            self.logger.info(f"Fetching subtasks and epic issues of {len(frontier)} implementation issues...")
+            subtask_searches = self._build_key_searches(frontier, SUBTASKS_TEMPLATE, walk_profile)
+            epic_searches = self._build_key_searches(frontier, EPICS_TEMPLATE, walk_profile)
 
-        # Создадим множество всех известных ключей, чтобы избежать повторного сбора
-        all_known_keys = set(all_implementation_keys)
+            results = self._run_searches(subtask_searches + epic_searches)
+            frontier = []
+            for level_issues in results:
+                frontier.extend(self._collect_new(level_issues, visited, implementation_issues))
 
         # Сначала соберем все задачи по типам, чтобы иметь представление о составе
-        issue_types_before = {}
-        for issue in implementation_issues:
-            issue_type = issue.get('fields', {}).get('issuetype', {}).get('name', 'Unknown')
-            if issue_type in issue_types_before:
-                issue_types_before[issue_type] += 1
-            else:
-                issue_types_before[issue_type] = 1
-
-        self.logger.info(f"Issue types before recursive subtask search: {issue_types_before}")
-
-        # Итеративный поиск подзадач для всех найденных задач
-        max_iterations = 3  # Ограничим количество итераций, чтобы избежать бесконечного цикла
-        for iteration in range(max_iterations):
-            # Получаем все текущие ключи задач
-            current_keys = [issue.get('key') for issue in implementation_issues if issue.get('key')]
-
-            # Отфильтруем только новые ключи, которые мы еще не обрабатывали
-            new_keys = [key for key in current_keys if key not in all_known_keys]
-
-            if not new_keys:
+        # (при работе через хранилище типы известны только после загрузки тел задач)
+        if walk_profile != 'keys':
+            issue_types_before = self._count_issue_types(implementation_issues)
+            self.logger.info(f"Issue types before recursive subtask search: {issue_types_before}")
+
+        # Level 4+: рекурсивный поиск подзадач для новых задач
+        for iteration in range(MAX_SUBTASK_ROUNDS):
+            if not frontier:
                 self.logger.info(f"No new keys found in iteration {iteration + 1}, stopping recursive search")
                 break
 
-            self.logger.info(f"Iteration {iteration + 1}: Found {len(new_keys)} new keys to check for subtasks")
-
-            # Добавим новые ключи в множество известных
-            all_known_keys.update(new_keys)
-
-            # Поиск подзадач для новых ключей
-            new_subtasks = []
-            for i in range(0, len(new_keys), 10):
-                chunk = new_keys[i:i + 10]
-                parents_clause = " OR ".join([f'parent = "{key}"' for key in chunk])
-                subtasks_query = parents_clause
-
-                self.logger.info(f"Fetching subtasks for new keys (batch {i // 10 + 1}) with query: {subtasks_query}")
-                try:
-                    chunk_subtasks = self.get_issues_by_filter(jql_query=subtasks_query)
-                    new_subtasks.extend(chunk_subtasks)
-                except Exception as e:
-                    self.logger.error(f"Error fetching subtasks for new keys: {e}")
-
-            if not new_subtasks:
-                self.logger.info(f"No new subtasks found in iteration {iteration + 1}")
-                break
-
-            self.logger.info(f"Found {len(new_subtasks)} new subtasks in iteration {iteration + 1}")
-
-            # Добавим новые подзадачи к общему списку
-            implementation_issues.extend(new_subtasks)
+            self.logger.info(f"Iteration {iteration + 1}: Found {len(frontier)} new keys to check for subtasks")
 
-        # Выведем итоговую статистику по типам задач после рекурсивного поиска
-        issue_types_after = {}
-        for issue in implementation_issues:
-            issue_type = issue.get('fields', {}).get('issuetype', {}).get('name', 'Unknown')
-            if issue_type in issue_types_after:
-                issue_types_after[issue_type] += 1
-            else:
-                issue_types_after[issue_type] = 1
+            subtask_searches = self._build_key_searches(frontier, SUBTASKS_TEMPLATE, walk_profile)
+            frontier = []
+            for level_issues in self._run_searches(subtask_searches):
+                frontier.extend(self._collect_new(level_issues, visited, implementation_issues))
 
-        self.logger.info(f"Issue types after recursive subtask search: {issue_types_after}")
-        subtask_count_after = issue_types_after.get('Sub-task', 0) + issue_types_after.get('Subtask', 0)
-        self.logger.info(f"Total subtasks after recursive search: {subtask_count_after}")
+            self.logger.info(f"Found {len(frontier)} new subtasks in iteration {iteration + 1}")
 
-        # Deduplicate implementation issues by key
-        implementation_keys_set = set()
-        unique_implementation_issues = []
+        if store is not None and not keys_only:
+            implementation_issues = self.hydrate_issues(implementation_issues, profile, store)
 
-        for issue in implementation_issues:
-            key = issue.get('key')
-            if key and key not in implementation_keys_set:
-                implementation_keys_set.add(key)
-                unique_implementation_issues.append(issue)
-
-        implementation_issues = unique_implementation_issues
+        # Выведем итоговую статистику по типам задач после рекурсивного поиска (у заглушек keys_only типов нет)
+        if not keys_only:
+            issue_types = self._count_issue_types(implementation_issues)
+            self.logger.info(f"Issue types after recursive subtask search: {issue_types}")
         self.logger.info(
             f"Total unique implementation issues after including all subtasks: {len(implementation_issues)}")
 
         # Выведем диагностическую информацию о связях CLM и EST
         self.logger.info(f"CLM to EST relationship check:")
-        clm_to_est_map = {}
+        clm_keys_set = set(clm_keys)
         for issue in est_issues:
             est_key = issue.get('key', '')
             linked_clm = []
 
             # Ищем связи с CLM
             for link in issue.get('fields', {}).get('issuelinks', []):
-                if 'inwardIssue' in link and link.get('inwardIssue', {}).get('key', '') in clm_keys:
+                if 'inwardIssue' in link and link.get('inwardIssue', {}).get('key', '') in clm_keys_set:
                     linked_clm.append(link.get('inwardIssue', {}).get('key', ''))
 
             if linked_clm:
-                clm_to_est_map[est_key] = linked_clm
                 self.logger.info(f"EST {est_key} is linked to CLM: {', '.join(linked_clm)}")
 
         # Выведем информацию о поле customfield_12307 в EST задачах
@@ -526,17 +986,10 @@ class JiraAnalyzer:
         self.logger.info(f"Found {estimation_count} EST issues with customfield_12307 values out of {len(est_issues)}")
 
         # Логируем типы задач для проверки наличия подзадач
-        issue_types = {}
-        for issue in implementation_issues:
-            issue_type = issue.get('fields', {}).get('issuetype', {}).get('name', 'Unknown')
-            if issue_type in issue_types:
-                issue_types[issue_type] += 1
-            else:
-                issue_types[issue_type] = 1
-
-        self.logger.info(f"Final implementation issues by type: {issue_types}")
-        subtask_count = issue_types.get('Sub-task', 0) + issue_types.get('Subtask', 0)
-        self.logger.info(f"Final subtasks in implementation issues: {subtask_count}")
+        if not keys_only:
+            self.logger.info(f"Final implementation issues by type: {issue_types}")
+            subtask_count = issue_types.get('Sub-task', 0) + issue_types.get('Subtask', 0)
+            self.logger.info(f"Final subtasks in implementation issues: {subtask_count}")
 
         # Add analyzing issues to improvement_issues for the return value
         # to ensure they're included in all downstream processing
@@ -546,6 +999,23 @@ class JiraAnalyzer:
             f"Found {len(est_issues)} EST issues, {len(improvement_issues)} Improvement/Analyzing issues, and {len(implementation_issues)} implementation issues")
         return est_issues, improvement_issues, implementation_issues
 
+    @staticmethod
+    def _count_issue_types(issues):
+        """
+        Count issues by issue type name
+
+        Args:
+            issues (list): List of issue dictionaries
+
+        Returns:
+            dict: Mapping from issue type to count
+        """
+        issue_types = {}
+        for issue in issues:
+            issue_type = issue.get('fields', {}).get('issuetype', {}).get('name', 'Unknown')
+            issue_types[issue_type] = issue_types.get(issue_type, 0) + 1
+        return issue_types
+
     def get_subtasks_by_rest_api(self, issue_keys):
         """
         Get subtasks for issues using direct REST API calls instead of JQL
@@ -563,7 +1033,7 @@ class JiraAnalyzer:
                 # Make a direct API call to get the issue with subtasks expanded
                 issue_url = f"{self.jira_url}/rest/api/2/issue/{key}?expand=subtasks"
 
-                response = requests.get(
+                response = self.client.get(
                     issue_url,
                     headers=self.headers,
                     timeout=30
@@ -578,10 +1048,8 @@ class JiraAnalyzer:
                         self.logger.info(f"Found {len(subtask_keys)} subtasks for issue {key}")
 
                         # Get full details for each subtask
-                        for i in range(0, len(subtask_keys), 10):
-                            subtask_chunk = subtask_keys[i:i + 10]
-                            subtask_jql = f"key in ({','.join(subtask_chunk)})"
-                            chunk_subtasks = self.get_issues_by_filter(jql_query=subtask_jql)
+                        for subtask_chunk in KEYS_TEMPLATE.pack(subtask_keys):
+                            chunk_subtasks = self.search_pack(KEYS_TEMPLATE, subtask_chunk)
                             all_subtasks.extend(chunk_subtasks)
                 else:
                     self.logger.error(f"Error getting subtasks for issue {key}: {response.status_code}")
@@ -601,6 +1069,6 @@ class JiraAnalyzer:
         """Get status categories from the DataFrame"""
         return get_status_categories(df)
 
-    def create_visualizations(self, df, output_dir='jira_charts'):
-        """Create visualizations based on processed data"""
-        return create_visualizations(df, output_dir, self.logger)
\ No newline at end of file
+    def create_visualizations(self, df, output_dir='jira_charts', implementation_issues=None):
+        """Create visualizations based on processed data (implementation_issues: raw issues of df, optional)"""
+        return create_visualizations(df, output_dir, self.logger, implementation_issues, analyzer=self)
\ No newline at end of file
@@ -0,0 +1,245 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Default cache settings (can be overridden in config.py)
+DEFAULT_CACHE_PATH = os.path.join('data', 'jira_cache.db')
+DEFAULT_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# Time to live in seconds per endpoint (first matching pattern wins).
+# Endpoints that are not listed (issue details, transitions, /myself, ...) are never cached.
+DEFAULT_CACHE_TTLS = [
+    (r'/rest/api/2/issue/createmeta', 24 * 3600),
+    (r'/rest/api/2/field/[^/]+/option', 24 * 3600),
+    (r'/rest/api/2/field$', 24 * 3600),
+    (r'/rest/api/2/issueLinkType$', 24 * 3600),
+    (r'/rest/api/2/filter/\d+$', 3600),
+    (r'/rest/api/2/search$', 600)
+]
+
+try:
+    import config
+
+    CACHE_ENABLED = getattr(config, 'JIRA_CACHE_ENABLED', True)
+    CACHE_PATH = getattr(config, 'JIRA_CACHE_PATH', DEFAULT_CACHE_PATH)
+    CACHE_MAX_BYTES = getattr(config, 'JIRA_CACHE_MAX_BYTES', DEFAULT_CACHE_MAX_BYTES)
+    CACHE_TTLS = getattr(config, 'JIRA_CACHE_TTLS', DEFAULT_CACHE_TTLS)
+except ImportError:
+    CACHE_ENABLED = True
+    CACHE_PATH = DEFAULT_CACHE_PATH
+    CACHE_MAX_BYTES = DEFAULT_CACHE_MAX_BYTES
+    CACHE_TTLS = DEFAULT_CACHE_TTLS
+
+
+class JiraResponseCache:
+    """
+    On-disk cache of successful Jira responses.
+
+    Entries are keyed by method, URL, query parameters, request body (JQL, fields,
+    paging) and the caller's credentials, expire after a per-endpoint TTL and are
+    evicted in least-recently-used order when the cache grows over max_bytes.
+    """
+
+    def __init__(self, path=None, max_bytes=None, ttls=None):
+        """
+        Initialize the cache
+
+        Args:
+            path (str): Path to SQLite cache file
+            max_bytes (int): Maximum total size of cached bodies
+            ttls (list): List of (url regex, ttl seconds) pairs
+        """
+        self.path = path or CACHE_PATH
+        self.max_bytes = max_bytes or CACHE_MAX_BYTES
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in (ttls or CACHE_TTLS)]
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT,
+                    status_code INTEGER,
+                    headers TEXT,
+                    body BLOB,
+                    size INTEGER,
+                    expires_at REAL,
+                    last_access REAL
+                )
+            """)
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)')
+
+    def _connect(self):
+        """Open a new connection (one per call, so the cache can be used from worker threads)"""
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get_ttl(self, url):
+        """
+        Get TTL for an endpoint
+
+        Args:
+            url (str): Request URL
+
+        Returns:
+            int: TTL in seconds, 0 if the endpoint must not be cached
+        """
+        path = url.split('?', 1)[0]
+        for pattern, ttl in self.ttls:
+            if pattern.search(path):
+                return ttl
+        return 0
+
+    @staticmethod
+    def make_key(method, url, headers=None, params=None, data=None, json_body=None):
+        """
+        Build cache key from the request
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            headers (dict): Request headers (only Authorization is used)
+            params (dict): Query parameters
+            data (str/bytes): Raw request body
+            json_body (dict): JSON request body
+
+        Returns:
+            str: Cache key
+        """
+        if isinstance(data, bytes):
+            data = data.decode('utf-8', errors='replace')
+        if isinstance(data, str):
+            # Normalize JSON bodies so that key order does not matter
+            try:
+                data = json.loads(data)
+            except ValueError:
+                pass
+
+        # Credentials are hashed into the key so that users never share cached data
+        auth = (headers or {}).get('Authorization', '')
+        parts = {
+            'method': method.upper(),
+            'url': url,
+            'params': params or {},
+            'body': json_body if json_body is not None else data,
+            'auth': hashlib.sha256(auth.encode('utf-8')).hexdigest()
+        }
+        raw = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Get cached response
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            requests.Response: Cached response or None if missing or expired
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute('SELECT url, status_code, headers, body, expires_at FROM responses WHERE key = ?',
+                               (key,)).fetchone()
+            if row is None or row[4] < now:
+                self.misses += 1
+                return None
+            conn.execute('UPDATE responses SET last_access = ? WHERE key = ?', (now, key))
+
+        self.hits += 1
+        url, status_code, headers, body, _ = row
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response._content = body
+        response.url = url
+        response.encoding = 'utf-8'
+        response.from_cache = True
+        return response
+
+    def put(self, key, response, ttl):
+        """
+        Store response in cache and evict least recently used entries if needed
+
+        Args:
+            key (str): Cache key
+            response (requests.Response): Response to store
+            ttl (int): Time to live in seconds
+        """
+        body = response.content
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() in ('content-type', 'etag', 'last-modified')}
+        now = time.time()
+
+        with self._connect() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO responses (key, url, status_code, headers, body, size, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, response.url, response.status_code, json.dumps(headers), body, len(body), now + ttl, now))
+            self._evict(conn)
+
+    def _evict(self, conn):
+        """Delete expired entries and the least recently used ones above max_bytes"""
+        conn.execute('DELETE FROM responses WHERE expires_at < ?', (time.time(),))
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        # Free some space below the limit so that eviction does not run on every put
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for key, size in conn.execute('SELECT key, size FROM responses ORDER BY last_access').fetchall():
+            if total <= target:
+                break
+            conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+            total -= size
+            removed += 1
+        logger.info(f"Jira cache: evicted {removed} least recently used entries")
+
+    def clear(self):
+        """Delete all cached responses"""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM responses')
+        logger.info("Jira cache cleared")
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """
+    Get the shared response cache if it is enabled in config
+
+    Returns:
+        JiraResponseCache: Shared cache instance or None if disabled or unavailable
+    """
+    global _cache
+    if not CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = JiraResponseCache()
+                    logger.info(f"Opened Jira response cache: {_cache.path}")
+                except Exception as e:
+                    logger.error(f"Error opening Jira response cache: {e}", exc_info=True)
+                    return None
+    return _cache
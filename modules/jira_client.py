@@ -0,0 +1,315 @@
+import time
+import random
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from modules.jira_cache import get_response_cache
+from modules.jira_recorder import get_jira_recorder
+from modules.jira_throttle import TokenBucket, AimdController, MAX_CONCURRENCY
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Default connection settings (can be overridden in config.py)
+DEFAULT_POOL_SIZE = 20
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BACKOFF_FACTOR = 1.0
+DEFAULT_BACKOFF_MAX = 60
+DEFAULT_TIMEOUT = 30
+
+# Status codes that are worth retrying
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# HTTP methods that can be safely repeated after a server error
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+try:
+    import config
+
+    POOL_SIZE = getattr(config, 'JIRA_HTTP_POOL_SIZE', DEFAULT_POOL_SIZE)
+    MAX_RETRIES = getattr(config, 'JIRA_HTTP_MAX_RETRIES', DEFAULT_MAX_RETRIES)
+    BACKOFF_FACTOR = getattr(config, 'JIRA_HTTP_BACKOFF_FACTOR', DEFAULT_BACKOFF_FACTOR)
+    TIMEOUT = getattr(config, 'JIRA_HTTP_TIMEOUT', DEFAULT_TIMEOUT)
+except ImportError:
+    POOL_SIZE = DEFAULT_POOL_SIZE
+    MAX_RETRIES = DEFAULT_MAX_RETRIES
+    BACKOFF_FACTOR = DEFAULT_BACKOFF_FACTOR
+    TIMEOUT = DEFAULT_TIMEOUT
+
+
+class JiraClient:
+    """
+    Shared HTTP client for Jira REST API.
+
+    Keeps connections alive in a pooled requests.Session and retries
+    throttled (429) and failed (5xx) requests with exponential backoff,
+    honouring the Retry-After header when the server sends one.
+    Successful responses of read-only endpoints are served from the shared
+    on-disk response cache while they are fresh.
+
+    Every request sent to the server takes a token from a rate limiter and a slot
+    from an adaptive (AIMD) concurrency controller, so all analyzers sharing the
+    client together stay within what Jira can serve.
+
+    With JIRA_RECORD_MODE set, responses are recorded to files or replayed from
+    them instead of contacting the server (see modules/jira_recorder.py).
+    """
+
+    def __init__(self, pool_size=None, max_retries=None, backoff_factor=None, timeout=None, cache=None,
+                 rate_limiter=None, concurrency=None, recorder=None):
+        """
+        Initialize the client
+
+        Args:
+            pool_size (int): Maximum number of kept-alive connections per host
+            max_retries (int): Number of retries after the first attempt
+            backoff_factor (float): Base delay in seconds for exponential backoff
+            timeout (int/float/tuple): Default timeout for every request
+            cache (JiraResponseCache): Response cache, shared cache from config if None
+            rate_limiter (TokenBucket): Request rate limiter, configured from config if None
+            concurrency (AimdController): Concurrency controller, configured from config if None
+            recorder (JiraRecorder): Response recorder, shared recorder from config if None
+        """
+        self.pool_size = pool_size or POOL_SIZE
+        self.max_retries = MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_factor = BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+        self.timeout = timeout or TIMEOUT
+        self.cache = cache if cache is not None else get_response_cache()
+        self.rate_limiter = rate_limiter or TokenBucket()
+        self.concurrency = concurrency or AimdController(maximum=min(MAX_CONCURRENCY, self.pool_size))
+        self.recorder = recorder if recorder is not None else get_jira_recorder()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method, url, headers=None, timeout=None, idempotent=None, retries=None, cache=True,
+                **kwargs):
+        """
+        Send a request with retries and backoff.
+
+        Non-idempotent requests (POST by default) are retried only when the server
+        explicitly throttled them (429) or the connection attempt timed out,
+        so that issue creation is never repeated after a server-side failure.
+
+        Args:
+            method (str): HTTP method
+            url (str): Full request URL
+            headers (dict): Request headers
+            timeout (int/float/tuple): Timeout for this call, default timeout if None
+            idempotent (bool): Whether the request may be repeated after a 5xx or read error.
+                               Defaults to True for GET/HEAD/OPTIONS/PUT/DELETE
+            retries (int): Number of retries for this call, client default if None
+            cache (bool): Whether a cached response may be returned. False bypasses the cache
+                          and replaces the cached entry with the fresh response.
+                          Only GET and idempotent POST requests to endpoints with a TTL are cached
+            **kwargs: Other arguments passed to requests.Session.request
+
+        Returns:
+            requests.Response: Last response received from the server
+
+        Raises:
+            requests.RequestException: If the request failed and retries are exhausted
+                                       or the request was not recorded in replay mode
+        """
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        if timeout is None:
+            timeout = self.timeout
+        max_retries = self.max_retries if retries is None else retries
+
+        record_key = None
+        if self.recorder is not None:
+            record_key = self.recorder.make_key(method, url, kwargs.get('params'),
+                                                kwargs.get('data'), kwargs.get('json'))
+            if self.recorder.replaying:
+                response = self.recorder.load(record_key)
+                if response is None:
+                    raise requests.ConnectionError(f"No recorded response for {method} {url}")
+                return response
+            # Cached responses are not recorded, so every request goes to the server while recording
+            cache = False
+
+        cache_key = None
+        cache_ttl = 0
+        if self.cache is not None and (method == 'GET' or (method == 'POST' and idempotent)):
+            cache_ttl = self.cache.get_ttl(url)
+        if cache_ttl > 0:
+            cache_key = self.cache.make_key(method, url, headers, kwargs.get('params'),
+                                            kwargs.get('data'), kwargs.get('json'))
+            if cache:
+                try:
+                    cached = self.cache.get(cache_key)
+                except Exception as e:
+                    logger.warning(f"Error reading Jira response cache: {e}")
+                    cached = None
+                if cached is not None:
+                    logger.debug(f"{method} {url} served from cache")
+                    return cached
+
+        response = self._send(method, url, headers, timeout, idempotent, max_retries, **kwargs)
+
+        if record_key:
+            try:
+                self.recorder.save(record_key, method, url, response)
+            except Exception as e:
+                logger.warning(f"Error recording Jira response: {e}")
+
+        if cache_key and response.status_code == 200:
+            try:
+                self.cache.put(cache_key, response, cache_ttl)
+            except Exception as e:
+                logger.warning(f"Error writing Jira response cache: {e}")
+
+        return response
+
+    def _send(self, method, url, headers, timeout, idempotent, max_retries, **kwargs):
+        """
+        Send a request to the server, retrying as described in request()
+
+        Returns:
+            requests.Response: Last response received from the server
+        """
+        attempt = 0
+        while True:
+            try:
+                response = self._throttled_request(method, url, headers=headers, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # Non-idempotent requests are repeated only if they surely did not reach the server
+                retryable = idempotent or isinstance(e, requests.ConnectTimeout)
+                if attempt >= max_retries or not retryable:
+                    raise
+                delay = self._get_backoff_delay(attempt)
+                logger.warning(f"{method} {url} failed: {e}. Retrying in {delay:.1f}s "
+                               f"(attempt {attempt + 1}/{max_retries})")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= max_retries:
+                return response
+            if response.status_code != 429 and not idempotent:
+                return response
+
+            delay = self._get_retry_after(response)
+            if delay is None:
+                delay = self._get_backoff_delay(attempt)
+            logger.warning(f"{method} {url} returned {response.status_code}. Retrying in {delay:.1f}s "
+                           f"(attempt {attempt + 1}/{max_retries})")
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _throttled_request(self, method, url, **kwargs):
+        """
+        Send one HTTP request through the rate limiter and the concurrency controller,
+        reporting its latency and throttling signals back to them
+
+        Returns:
+            requests.Response: Server response
+        """
+        self.rate_limiter.acquire()
+        self.concurrency.acquire()
+        started = time.monotonic()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.Timeout:
+            # A timed out request is the strongest overload signal we get
+            self.concurrency.release(throttled=True)
+            raise
+        except Exception:
+            self.concurrency.release(failed=True)
+            raise
+
+        latency = time.monotonic() - started
+        retry_after = self._get_retry_after(response) if response.status_code >= 400 else None
+        throttled = response.status_code in (429, 503) or retry_after is not None
+        if retry_after:
+            self.rate_limiter.pause(retry_after)
+        self.concurrency.release(latency, throttled=throttled, failed=response.status_code >= 500)
+        return response
+
+    def get(self, url, **kwargs):
+        """Send a GET request, see request()"""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        """Send a POST request, see request()"""
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        """Send a PUT request, see request()"""
+        return self.request('PUT', url, **kwargs)
+
+    def _get_backoff_delay(self, attempt):
+        """
+        Calculate exponential backoff delay with jitter
+
+        Args:
+            attempt (int): Zero-based retry attempt
+
+        Returns:
+            float: Delay in seconds
+        """
+        delay = self.backoff_factor * (2 ** attempt)
+        return min(delay + random.uniform(0, self.backoff_factor), DEFAULT_BACKOFF_MAX)
+
+    @staticmethod
+    def _get_retry_after(response):
+        """
+        Parse Retry-After header (seconds or HTTP date)
+
+        Args:
+            response (requests.Response): Server response
+
+        Returns:
+            float: Delay in seconds or None if header is missing or invalid
+        """
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+
+        try:
+            return min(max(float(value), 0), DEFAULT_BACKOFF_MAX)
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+            return min(max(delay, 0), DEFAULT_BACKOFF_MAX)
+        except (TypeError, ValueError):
+            logger.debug(f"Invalid Retry-After header: {value}")
+            return None
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_jira_client():
+    """
+    Get the shared Jira client (created on first use)
+
+    Returns:
+        JiraClient: Shared client instance
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = JiraClient()
+                logger.info(f"Created shared Jira HTTP client (pool size: {_client.pool_size}, "
+                            f"retries: {_client.max_retries}, timeout: {_client.timeout}, "
+                            f"rate limit: {_client.rate_limiter.rate}/s, "
+                            f"concurrency: {int(_client.concurrency.limit)}-{_client.concurrency.maximum})")
+    return _client
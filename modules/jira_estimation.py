@@ -6,6 +6,8 @@ import requests
 import json
 import re
 from collections import defaultdict
+from modules.jira_client import get_jira_client
+from modules.fetch_engine import FetchEngine
 
 # Get logger
 logger = logging.getLogger(__name__)
@@ -16,6 +18,7 @@ FIELDS_TO_FETCH = "summary,issuetype,created,timeoriginalestimate,subtasks,sprin
 HISTORY_EXPAND = "changelog"
 ISSUE_TYPE_NEW_FEATURE = "New Feature"
 TARGET_SPRINT_IDS = [14638, 14639, 14640, 14641]  # NBSS 25Q1, 25Q2, 25Q3, 25Q4
+ESTIMATION_DATA_DIR = os.path.join('jira_charts', 'estimation_data')
 
 
 class JiraEstimationAnalyzer:
@@ -58,13 +61,16 @@ class JiraEstimationAnalyzer:
             "Content-Type": "application/json"
         }
 
+        # Shared pooled HTTP client (keep-alive, retries with backoff)
+        self.client = get_jira_client()
+        self.engine = FetchEngine(self.client)
+
     def check_connection(self):
         """Check connection to Jira and API token validity"""
         try:
             logger.info("Checking Jira server availability...")
             try:
-                session = requests.Session()
-                resp = session.get(self.jira_url, timeout=10, allow_redirects=False)
+                resp = self.client.get(self.jira_url, timeout=10, allow_redirects=False, retries=0)
                 if resp.status_code >= 300 and resp.status_code < 400:
                     logger.error(f"Server redirecting to: {resp.headers.get('Location', 'unknown')}")
                     logger.error("VPN connection or NetScaler authentication may be required")
@@ -74,7 +80,7 @@ class JiraEstimationAnalyzer:
                 return False
 
             logger.info("Server available, checking token authentication...")
-            response = requests.get(
+            response = self.client.get(
                 f"{self.jira_url}/rest/api/2/myself",
                 headers=self.headers,
                 timeout=10
@@ -101,7 +107,7 @@ class JiraEstimationAnalyzer:
         filter_url = f"{self.jira_url}/rest/api/2/filter/{filter_id}"
         logger.info(f"Getting filter JQL from: {filter_url}")
         try:
-            response = requests.get(filter_url, headers=self.headers)
+            response = self.client.get(filter_url, headers=self.headers)
             response.raise_for_status()
             jql = response.json().get('jql', '')
             logger.info(f"Retrieved JQL: {jql[:50]}...")
@@ -111,34 +117,43 @@ class JiraEstimationAnalyzer:
             return None
 
     def search_issues(self, jql):
-        """Search for issues using JQL query"""
+        """Search for issues using JQL query (pages after the first one are fetched concurrently)"""
         search_url = f"{self.jira_url}/rest/api/2/search"
-        issues = []
-        start_at = 0
         max_results = 50
 
-        try:
-            while True:
-                params = {
+        def page_request(start_at):
+            return {
+                "method": "GET",
+                "url": search_url,
+                "headers": self.headers,
+                "params": {
                     "jql": jql,
                     "startAt": start_at,
                     "maxResults": max_results,
                     "fields": FIELDS_TO_FETCH,
                     "expand": HISTORY_EXPAND
                 }
+            }
 
-                logger.info(f"Searching issues: startAt={start_at}, maxResults={max_results}")
-                response = requests.get(search_url, headers=self.headers, params=params)
-                response.raise_for_status()
-
-                data = response.json()
-                issues.extend(data["issues"])
-                logger.info(f"Retrieved {len(data['issues'])} issues, total: {len(issues)}/{data['total']}")
-
-                if start_at + max_results >= data["total"]:
-                    break
+        try:
+            logger.info(f"Searching issues: startAt=0, maxResults={max_results}")
+            response = self.client.get(search_url, headers=self.headers, params=page_request(0)["params"])
+            response.raise_for_status()
 
-                start_at += max_results
+            data = response.json()
+            issues = list(data["issues"])
+            total = data["total"]
+            logger.info(f"Retrieved {len(data['issues'])} issues, total: {len(issues)}/{total}")
+
+            offsets = list(range(max_results, total, max_results))
+            if offsets:
+                logger.info(f"Fetching {len(offsets)} remaining pages concurrently")
+                responses = self.engine.fetch_many([page_request(start_at) for start_at in offsets],
+                                                   return_exceptions=False)
+                for response in responses:
+                    response.raise_for_status()
+                    issues.extend(response.json()["issues"])
+                logger.info(f"Retrieved {len(issues)}/{total} issues")
 
             return issues
         except Exception as e:
@@ -155,7 +170,7 @@ class JiraEstimationAnalyzer:
 
         try:
             logger.info(f"Getting subtasks for issue: {issue_key}")
-            response = requests.get(issue_url, headers=self.headers, params=params)
+            response = self.client.get(issue_url, headers=self.headers, params=params)
             response.raise_for_status()
 
             data = response.json()
@@ -164,11 +179,14 @@ class JiraEstimationAnalyzer:
 
             subtasks = []
             if subtask_ids:
-                for subtask_id in subtask_ids:
-                    subtask_url = f"{self.jira_url}/rest/api/2/issue/{subtask_id}"
-                    logger.debug(f"Fetching subtask data for ID: {subtask_id}")
-                    subtask_response = requests.get(subtask_url, headers=self.headers,
-                                                    params={"expand": HISTORY_EXPAND})
+                logger.debug(f"Fetching subtask data for IDs: {subtask_ids}")
+                responses = self.engine.fetch_many([{
+                    "method": "GET",
+                    "url": f"{self.jira_url}/rest/api/2/issue/{subtask_id}",
+                    "headers": self.headers,
+                    "params": {"expand": HISTORY_EXPAND}
+                } for subtask_id in subtask_ids], return_exceptions=False)
+                for subtask_response in responses:
                     subtask_response.raise_for_status()
                     subtasks.append(subtask_response.json())
 
@@ -177,6 +195,11 @@ class JiraEstimationAnalyzer:
             logger.error(f"Error getting subtasks for {issue_key}: {e}")
             return []
 
+    def get_subtasks_for_issues(self, issue_keys):
+        """Get subtasks for several issues concurrently, returns a dict from issue key to subtask list"""
+        subtask_lists = self.engine.map(self.get_subtasks, issue_keys)
+        return dict(zip(issue_keys, subtask_lists))
+
     def convert_seconds_to_days(self, seconds):
         """Convert seconds to days (8 hours per day)"""
         if seconds is None:
@@ -400,6 +423,8 @@ class JiraEstimationAnalyzer:
 
         issue_type_metrics = defaultdict(lambda: {"count": 0, "historical": 0, "current": 0, "difference": 0})
 
+        # Select issues first, so that subtasks of all included issues can be fetched concurrently
+        selected = []
         for issue in issues:
             issue_key = issue["key"]
             issue_type = issue["fields"]["issuetype"]["name"]
@@ -423,13 +448,20 @@ class JiraEstimationAnalyzer:
             else:
                 sprints = self.get_current_sprint_info(issue)
 
+            selected.append((issue, sprints))
+
+        subtasks_by_key = self.get_subtasks_for_issues([issue["key"] for issue, _ in selected])
+
+        for issue, sprints in selected:
+            issue_key = issue["key"]
+            issue_type = issue["fields"]["issuetype"]["name"]
             total_included += 1
             logger.info(f"Processing {issue_key}: {issue['fields']['summary']} (Type: {issue_type})")
 
             issue_current_estimate = issue["fields"].get("timeoriginalestimate", 0) or 0
             issue_historical_estimate = self.get_original_estimate_at_date(issue, cutoff_date) or 0
 
-            subtasks = self.get_subtasks(issue_key)
+            subtasks = subtasks_by_key.get(issue_key, [])
 
             current_subtask_estimates = 0
             historical_subtask_estimates = 0
@@ -597,7 +629,7 @@ def save_estimation_results(results, sprint_filter=False, all_tasks=False):
     """Save estimation results to a file"""
     try:
         # Create directory if it doesn't exist
-        data_dir = os.path.join('jira_charts', 'estimation_data')
+        data_dir = ESTIMATION_DATA_DIR
         if not os.path.exists(data_dir):
             os.makedirs(data_dir)
 
@@ -637,6 +669,19 @@ def save_estimation_results(results, sprint_filter=False, all_tasks=False):
         return False
 
 
+def get_estimation_result_files():
+    """
+    List the saved estimation result files
+
+    Returns:
+        list: Paths of the result files (rewritten in place when analysis runs again on the same day)
+    """
+    if not os.path.exists(ESTIMATION_DATA_DIR):
+        return []
+    return [os.path.join(ESTIMATION_DATA_DIR, f) for f in sorted(os.listdir(ESTIMATION_DATA_DIR))
+            if f.startswith('20') and f.endswith('.json')]
+
+
 def get_latest_estimation_results(sprint_filter=None, all_tasks=None):
     """
     Get the latest saved estimation results
@@ -651,7 +696,7 @@ def get_latest_estimation_results(sprint_filter=None, all_tasks=None):
         dict: Latest estimation results or None if not found
     """
     try:
-        data_dir = os.path.join('jira_charts', 'estimation_data')
+        data_dir = ESTIMATION_DATA_DIR
         if not os.path.exists(data_dir):
             logger.warning(f"Estimation data directory does not exist: {data_dir}")
             return None
@@ -0,0 +1,163 @@
+import os
+import json
+import time
+import logging
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from modules.jira_cache import JiraResponseCache
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Default recorder settings (can be overridden in config.py)
+DEFAULT_RECORDINGS_DIR = os.path.join('data', 'jira_recordings')
+
+RECORD_MODES = ('record', 'replay')
+
+try:
+    import config
+
+    RECORD_MODE = getattr(config, 'JIRA_RECORD_MODE', None)
+    RECORDINGS_DIR = getattr(config, 'JIRA_RECORDINGS_DIR', DEFAULT_RECORDINGS_DIR)
+except ImportError:
+    RECORD_MODE = None
+    RECORDINGS_DIR = DEFAULT_RECORDINGS_DIR
+
+
+class JiraRecorder:
+    """
+    Records Jira responses to files and replays them without a server.
+
+    In 'record' mode every response received by the client is saved; in 'replay'
+    mode requests are answered from the recordings only and a request that was
+    never recorded fails with requests.ConnectionError, as if Jira were down.
+
+    Recordings are keyed by method, URL path, query parameters and body. The host
+    and credentials are not part of the key, so a session recorded against the
+    real Jira can be replayed by anyone against any jira_url.
+    """
+
+    def __init__(self, mode, directory=None):
+        """
+        Initialize the recorder
+
+        Args:
+            mode (str): 'record' or 'replay'
+            directory (str): Directory with recordings
+        """
+        if mode not in RECORD_MODES:
+            raise ValueError(f"Unknown Jira record mode: {mode}")
+        self.mode = mode
+        self.directory = directory or RECORDINGS_DIR
+        self.recorded = 0
+        self.replayed = 0
+        self.lock = threading.Lock()
+
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+
+    @property
+    def replaying(self):
+        return self.mode == 'replay'
+
+    @property
+    def recording(self):
+        return self.mode == 'record'
+
+    @staticmethod
+    def make_key(method, url, params=None, data=None, json_body=None):
+        """
+        Build recording key from the request (host and credentials excluded)
+
+        Returns:
+            str: Recording key
+        """
+        parts = urlsplit(url)
+        path = parts.path + ('?' + parts.query if parts.query else '')
+        return JiraResponseCache.make_key(method, path, None, params, data, json_body)
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, key[:2], f'{key}.json')
+
+    def load(self, key):
+        """
+        Get recorded response
+
+        Args:
+            key (str): Recording key
+
+        Returns:
+            requests.Response: Recorded response or None if missing
+        """
+        path = self._get_path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            record = json.load(f)
+
+        response = requests.Response()
+        response.status_code = record['status_code']
+        response.headers = CaseInsensitiveDict(record['headers'])
+        response._content = record['body'].encode('utf-8')
+        response.url = record['url']
+        response.encoding = 'utf-8'
+        response.from_recording = True
+        with self.lock:
+            self.replayed += 1
+        return response
+
+    def save(self, key, method, url, response):
+        """
+        Save response
+
+        Args:
+            key (str): Recording key
+            method (str): HTTP method
+            url (str): Request URL
+            response (requests.Response): Response to save
+        """
+        record = {
+            'method': method,
+            'url': url,
+            'status_code': response.status_code,
+            'headers': {name: value for name, value in response.headers.items()
+                        if name.lower() in ('content-type', 'retry-after')},
+            'body': response.content.decode('utf-8', errors='replace'),
+            'recorded_at': time.time()
+        }
+        path = self._get_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file first, concurrent requests may record the same key
+        temp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+        with self.lock:
+            self.recorded += 1
+
+
+_recorder = None
+_recorder_lock = threading.Lock()
+
+
+def get_jira_recorder():
+    """
+    Get the shared recorder if record or replay mode is set in config
+
+    Returns:
+        JiraRecorder: Shared recorder instance or None if disabled
+    """
+    global _recorder
+    if not RECORD_MODE:
+        return None
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = JiraRecorder(RECORD_MODE)
+                logger.info(f"Jira {RECORD_MODE} mode, recordings: {_recorder.directory}")
+    return _recorder
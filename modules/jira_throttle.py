@@ -0,0 +1,205 @@
+import time
+import logging
+import threading
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Default throttling settings (can be overridden in config.py)
+DEFAULT_RATE_LIMIT = 10.0
+DEFAULT_RATE_BURST = 20
+DEFAULT_INITIAL_CONCURRENCY = 4
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_MAX_CONCURRENCY = 20
+DEFAULT_LATENCY_TOLERANCE = 2.0
+
+# Multiplicative decrease factors
+THROTTLED_DECREASE = 0.5
+SLOW_DECREASE = 0.75
+
+# Smoothing of the observed latency
+LATENCY_ALPHA = 0.2
+BASELINE_DRIFT = 0.01
+
+try:
+    import config
+
+    RATE_LIMIT = getattr(config, 'JIRA_RATE_LIMIT', DEFAULT_RATE_LIMIT)
+    RATE_BURST = getattr(config, 'JIRA_RATE_BURST', DEFAULT_RATE_BURST)
+    ADAPTIVE_CONCURRENCY = getattr(config, 'JIRA_ADAPTIVE_CONCURRENCY', True)
+    INITIAL_CONCURRENCY = getattr(config, 'JIRA_INITIAL_CONCURRENCY', DEFAULT_INITIAL_CONCURRENCY)
+    MIN_CONCURRENCY = getattr(config, 'JIRA_MIN_CONCURRENCY', DEFAULT_MIN_CONCURRENCY)
+    MAX_CONCURRENCY = getattr(config, 'JIRA_MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY)
+    LATENCY_TOLERANCE = getattr(config, 'JIRA_LATENCY_TOLERANCE', DEFAULT_LATENCY_TOLERANCE)
+except ImportError:
+    RATE_LIMIT = DEFAULT_RATE_LIMIT
+    RATE_BURST = DEFAULT_RATE_BURST
+    ADAPTIVE_CONCURRENCY = True
+    INITIAL_CONCURRENCY = DEFAULT_INITIAL_CONCURRENCY
+    MIN_CONCURRENCY = DEFAULT_MIN_CONCURRENCY
+    MAX_CONCURRENCY = DEFAULT_MAX_CONCURRENCY
+    LATENCY_TOLERANCE = DEFAULT_LATENCY_TOLERANCE
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting the request rate.
+
+    Tokens are refilled at `rate` per second up to `burst`. The bucket can be
+    paused (e.g. for a Retry-After interval), which blocks every caller.
+    """
+
+    def __init__(self, rate=None, burst=None):
+        """
+        Initialize the bucket
+
+        Args:
+            rate (float): Tokens per second, 0 disables the limit
+            burst (int): Maximum number of tokens
+        """
+        self.rate = RATE_LIMIT if rate is None else rate
+        self.burst = max(1, burst or RATE_BURST)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Take one token, waiting until it is available
+
+        Returns:
+            float: Time spent waiting in seconds
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                delay = self.paused_until - now
+                if delay <= 0:
+                    if not self.rate:
+                        return waited
+                    self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds):
+        """
+        Block all requests for the given time (server asked to slow down)
+
+        Args:
+            seconds (float): Pause duration
+        """
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+
+class AimdController:
+    """
+    Adaptive limit of concurrent requests (additive increase, multiplicative decrease).
+
+    Every healthy response grows the limit by 1/limit, i.e. by about one slot per
+    round of requests. A throttled response (429, 503 or Retry-After) halves it,
+    and a smoothed latency above LATENCY_TOLERANCE times the baseline reduces it
+    by a quarter. Decreases are applied at most once per cooldown window so that
+    a burst of failures of the same round counts as one congestion signal.
+    """
+
+    def __init__(self, initial=None, minimum=None, maximum=None, latency_tolerance=None, adaptive=None):
+        """
+        Initialize the controller
+
+        Args:
+            initial (int): Initial concurrency limit
+            minimum (int): Lowest concurrency limit
+            maximum (int): Highest concurrency limit
+            latency_tolerance (float): Allowed ratio of smoothed latency to baseline
+            adaptive (bool): Adjust the limit, fixed at maximum if False
+        """
+        self.minimum = max(1, minimum or MIN_CONCURRENCY)
+        self.maximum = max(self.minimum, maximum or MAX_CONCURRENCY)
+        self.adaptive = ADAPTIVE_CONCURRENCY if adaptive is None else adaptive
+        initial = initial or INITIAL_CONCURRENCY
+        self.limit = float(min(max(initial, self.minimum), self.maximum)) if self.adaptive else float(self.maximum)
+        self.latency_tolerance = latency_tolerance or LATENCY_TOLERANCE
+
+        self.in_flight = 0
+        self.latency = None
+        self.baseline = None
+        self.last_decrease = 0.0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        """Wait for a free request slot"""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self, latency=None, throttled=False, failed=False):
+        """
+        Free a request slot and adjust the limit
+
+        Args:
+            latency (float): Response time in seconds
+            throttled (bool): Server throttled the request (429, 503 or Retry-After)
+            failed (bool): Request failed without a usable latency (connection error, other 5xx)
+        """
+        with self.condition:
+            self.in_flight -= 1
+            if self.adaptive:
+                if throttled:
+                    self._decrease(THROTTLED_DECREASE, 'throttled by server')
+                elif not failed and latency is not None:
+                    self._observe(latency)
+            self.condition.notify_all()
+
+    def _observe(self, latency):
+        """Update smoothed latency and baseline, then grow or shrink the limit"""
+        if self.latency is None:
+            self.latency = latency
+            self.baseline = latency
+        else:
+            self.latency += LATENCY_ALPHA * (latency - self.latency)
+            if self.latency < self.baseline:
+                self.baseline = self.latency
+            else:
+                # Let the baseline follow slowly, so a permanently slower server does not pin the limit down
+                self.baseline += BASELINE_DRIFT * (self.latency - self.baseline)
+
+        if self.latency > self.baseline * self.latency_tolerance:
+            self._decrease(SLOW_DECREASE, f'latency {self.latency:.2f}s over baseline {self.baseline:.2f}s')
+        elif self.limit < self.maximum:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+
+    def _decrease(self, factor, reason):
+        """Reduce the limit once per cooldown window (about one smoothed response time)"""
+        now = time.monotonic()
+        cooldown = max(self.latency or 0, 1.0)
+        if now - self.last_decrease < cooldown:
+            return
+        self.last_decrease = now
+        old_limit = int(self.limit)
+        self.limit = max(float(self.minimum), self.limit * factor)
+        logger.info(f"Jira concurrency limit {old_limit} -> {int(self.limit)}: {reason}")
+
+    def get_stats(self):
+        """
+        Get current controller state
+
+        Returns:
+            dict: Limit, requests in flight and latencies
+        """
+        with self.condition:
+            return {
+                'limit': int(self.limit),
+                'in_flight': self.in_flight,
+                'latency': self.latency,
+                'baseline': self.baseline
+            }
@@ -0,0 +1,345 @@
+"""
+Background job queue for analyses, estimation runs and dashboard collection.
+
+Routes submit work to the queue instead of running it in the request thread:
+
+    job, created = get_job_queue().submit('estimation', run_estimation_job, {'filter_id': '114924'})
+    return jsonify({'success': True, 'job': job.to_dict()}), 202
+
+The target is called as target(job, **params) in a worker thread. Jobs are
+kept in memory with an ID, a status (queued, running, succeeded, failed,
+cancelled), a progress record and the target's return value; /api/jobs
+serves them. A pool of JOB_WORKERS threads runs the oldest queued job whose
+kind is not running already: jobs of one kind run one at a time (two
+analyses started in the same second would write into the same folder),
+jobs of different kinds in parallel.
+
+Submitting a job with the kind and parameters of a queued or running job
+returns that job instead of queueing a duplicate.
+
+A queued job is cancelled at once. A running job is asked to stop: the next
+write to its progress record raises JobCancelled, and its result is dropped
+if the target finishes anyway.
+"""
+import json
+import uuid
+import logging
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Default settings (can be overridden in config.py)
+DEFAULT_JOB_WORKERS = 2
+DEFAULT_JOB_HISTORY_LIMIT = 100
+
+try:
+    import config
+
+    JOB_WORKERS = getattr(config, 'JOB_WORKERS', DEFAULT_JOB_WORKERS)
+    JOB_HISTORY_LIMIT = getattr(config, 'JOB_HISTORY_LIMIT', DEFAULT_JOB_HISTORY_LIMIT)
+except ImportError:
+    JOB_WORKERS = DEFAULT_JOB_WORKERS
+    JOB_HISTORY_LIMIT = DEFAULT_JOB_HISTORY_LIMIT
+
+# Job statuses
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+
+ACTIVE_STATUSES = (JOB_QUEUED, JOB_RUNNING)
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job whose cancellation was requested"""
+
+
+class JobProgress(dict):
+    """Progress record of a job, writes raise JobCancelled once cancellation is requested"""
+
+    def __init__(self, cancel_event):
+        super().__init__(progress=0, status_message='')
+        self._cancel_event = cancel_event
+
+    def __setitem__(self, key, value):
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+        super().__setitem__(key, value)
+
+    def _write(self, key, value):
+        # Used by the queue itself, also after cancellation
+        super().__setitem__(key, value)
+
+
+class Job:
+    """A unit of work submitted to the job queue"""
+
+    def __init__(self, kind, target, params=None):
+        """
+        Initialize the job
+
+        Args:
+            kind (str): Job kind, e.g. 'analysis'
+            target (callable): Called as target(job, **params)
+            params (dict): Keyword arguments of the target (JSON-serializable)
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.target = target
+        self.params = dict(params or {})
+        self.key = _job_key(kind, self.params)
+        self.status = JOB_QUEUED
+        self.result = None
+        self.error = None
+        self.created_at = _now()
+        self.started_at = None
+        self.finished_at = None
+        self._cancel_event = threading.Event()
+        self._done_event = threading.Event()
+        self.progress = JobProgress(self._cancel_event)
+        self.progress._write('status_message', 'Queued')
+
+    @property
+    def cancel_requested(self):
+        """True once cancellation of the job was requested"""
+        return self._cancel_event.is_set()
+
+    def is_finished(self):
+        """True if the job succeeded, failed or was cancelled"""
+        return self.status not in ACTIVE_STATUSES
+
+    def wait(self, timeout=None):
+        """
+        Wait until the job is finished
+
+        Args:
+            timeout (float): Seconds to wait (forever if None)
+
+        Returns:
+            bool: True if the job is finished
+        """
+        return self._done_event.wait(timeout)
+
+    def to_dict(self, include_result=True):
+        """
+        Get the job record
+
+        Args:
+            include_result (bool): Include the return value of the target
+
+        Returns:
+            dict: JSON-serializable job record
+        """
+        record = {
+            'id': self.id,
+            'kind': self.kind,
+            'params': self.params,
+            'status': self.status,
+            'progress': dict(self.progress),
+            'error': self.error,
+            'cancel_requested': self.cancel_requested,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+        if include_result:
+            record['result'] = self.result
+        return record
+
+
+class JobQueue:
+    """Bounded pool of worker threads running submitted jobs"""
+
+    def __init__(self, workers=None, history_limit=None):
+        """
+        Initialize the queue, worker threads are started with the first job
+
+        Args:
+            workers (int): Number of worker threads (JOB_WORKERS if None)
+            history_limit (int): Finished jobs kept in memory (JOB_HISTORY_LIMIT if None)
+        """
+        self.workers = max(1, JOB_WORKERS if workers is None else workers)
+        self.history_limit = JOB_HISTORY_LIMIT if history_limit is None else history_limit
+        self._jobs = OrderedDict()
+        self._queue = deque()
+        self._running_kinds = set()
+        self._threads = []
+        self._condition = threading.Condition()
+
+    def submit(self, kind, target, params=None):
+        """
+        Queue a job unless the same job is queued or running already
+
+        Args:
+            kind (str): Job kind, jobs of one kind run one at a time
+            target (callable): Called as target(job, **params)
+            params (dict): Keyword arguments of the target (JSON-serializable)
+
+        Returns:
+            tuple: (job, created) - created is False if an identical active job was returned
+        """
+        key = _job_key(kind, params or {})
+        with self._condition:
+            for job in self._jobs.values():
+                if job.key == key and job.status in ACTIVE_STATUSES and not job.cancel_requested:
+                    logger.info(f"Job {job.id} ({kind}) with the same parameters is {job.status}, not queueing another")
+                    return job, False
+
+            job = Job(kind, target, params)
+            self._jobs[job.id] = job
+            self._queue.append(job)
+            self._start_workers()
+            self._condition.notify_all()
+
+        logger.info(f"Queued job {job.id} ({kind}) with parameters {job.params}")
+        return job, True
+
+    def get(self, job_id):
+        """
+        Get a job by ID
+
+        Args:
+            job_id (str): Job ID
+
+        Returns:
+            Job: The job or None if it is unknown
+        """
+        with self._condition:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, kind=None):
+        """
+        List known jobs, newest first
+
+        Args:
+            kind (str): Only jobs of this kind (all if None)
+
+        Returns:
+            list: Job objects
+        """
+        with self._condition:
+            jobs = [job for job in self._jobs.values() if kind is None or job.kind == kind]
+        return list(reversed(jobs))
+
+    def cancel(self, job_id):
+        """
+        Cancel a queued job or ask a running job to stop
+
+        Args:
+            job_id (str): Job ID
+
+        Returns:
+            Job: The job or None if it is unknown
+        """
+        with self._condition:
+            job = self._jobs.get(job_id)
+            if job is None or job.is_finished():
+                return job
+
+            if job.status == JOB_QUEUED:
+                self._queue.remove(job)
+                self._finish(job, JOB_CANCELLED)
+            job._cancel_event.set()
+
+        logger.info(f"Cancellation of job {job.id} ({job.kind}) requested, status: {job.status}")
+        return job
+
+    def _start_workers(self):
+        # Called with the condition held
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, name=f'job-worker-{len(self._threads) + 1}', daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_job(self):
+        # Called with the condition held: the oldest queued job whose kind is not running
+        for job in self._queue:
+            if job.kind not in self._running_kinds:
+                self._queue.remove(job)
+                return job
+        return None
+
+    def _work(self):
+        while True:
+            with self._condition:
+                job = self._next_job()
+                while job is None:
+                    self._condition.wait()
+                    job = self._next_job()
+                job.status = JOB_RUNNING
+                job.started_at = _now()
+                job.progress._write('status_message', 'Running')
+                self._running_kinds.add(job.kind)
+
+            self._run(job)
+
+            with self._condition:
+                self._running_kinds.discard(job.kind)
+                self._prune()
+                self._condition.notify_all()
+
+    def _run(self, job):
+        logger.info(f"Job {job.id} ({job.kind}) started")
+        status, result, error = JOB_SUCCEEDED, None, None
+        try:
+            result = job.target(job, **job.params)
+        except JobCancelled:
+            status = JOB_CANCELLED
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind}) failed: {e}", exc_info=True)
+            status, error = JOB_FAILED, str(e)
+
+        with self._condition:
+            if status == JOB_SUCCEEDED and job.cancel_requested:
+                status, result = JOB_CANCELLED, None
+            self._finish(job, status, result, error)
+        logger.info(f"Job {job.id} ({job.kind}) {job.status}")
+
+    def _finish(self, job, status, result=None, error=None):
+        # Called with the condition held
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = _now()
+        if status == JOB_CANCELLED:
+            job.progress._write('status_message', 'Cancelled')
+        elif status == JOB_FAILED:
+            job.progress._write('status_message', error)
+        job._done_event.set()
+
+    def _prune(self):
+        # Called with the condition held: forget the oldest finished jobs above the history limit
+        finished = [job_id for job_id, job in self._jobs.items() if job.is_finished()]
+        for job_id in finished[:max(0, len(finished) - self.history_limit)]:
+            del self._jobs[job_id]
+
+
+def _job_key(kind, params):
+    return json.dumps([kind, params], sort_keys=True, default=str)
+
+
+def _now():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue():
+    """
+    Get the shared job queue
+
+    Returns:
+        JobQueue: Queue shared by all routes of the process
+    """
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = JobQueue()
+    return _queue
@@ -0,0 +1,197 @@
+import logging
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Default maximum JQL length in characters (can be overridden in config.py)
+DEFAULT_MAX_JQL_LENGTH = 6000
+
+try:
+    import config
+
+    MAX_JQL_LENGTH = getattr(config, 'JIRA_MAX_JQL_LENGTH', DEFAULT_MAX_JQL_LENGTH)
+except ImportError:
+    MAX_JQL_LENGTH = DEFAULT_MAX_JQL_LENGTH
+
+# Fragments of Jira error messages meaning that the query should be split
+TOO_COMPLEX_MARKERS = (
+    'too complex',
+    'too many clauses',
+    'toomanyclauses',
+    'maxclausecount',
+    'too long',
+    'too large'
+)
+
+
+class JqlTooComplexError(Exception):
+    """Raised when Jira rejects a query because it is too long or too complex"""
+
+
+class JqlTemplate:
+    """
+    Template of a JQL query over a list of items (usually issue keys).
+
+    The items are rendered with item_template, joined with separator and
+    substituted into template at the {items} placeholder, e.g.
+        JqlTemplate('key in ({items})')
+        JqlTemplate('{items}', item_template='parent = "{item}"', separator=' OR ')
+    """
+
+    def __init__(self, template, item_template='{item}', separator=','):
+        """
+        Initialize the template
+
+        Args:
+            template (str): Query text with an {items} placeholder
+            item_template (str): Text for one item with an {item} placeholder
+            separator (str): Separator between rendered items
+        """
+        self.template = template
+        self.item_template = item_template
+        self.separator = separator
+        # Length of the query without any items
+        self.base_length = len(template.replace('{items}', ''))
+        # Item limit learned from queries rejected by Jira as too complex
+        self.max_items = None
+
+    def render_item(self, item):
+        """Render a single item"""
+        return self.item_template.replace('{item}', str(item))
+
+    def render(self, items):
+        """
+        Render the query for the given items
+
+        Args:
+            items (list): Items to put into the query
+
+        Returns:
+            str: JQL query
+        """
+        return self.template.replace('{items}', self.separator.join(self.render_item(item) for item in items))
+
+    def pack(self, items, max_length=None, max_items=None):
+        """
+        Split items into groups so that each rendered query fits under max_length
+
+        Args:
+            items (list): Items to pack
+            max_length (int): Maximum query length (default from config.JIRA_MAX_JQL_LENGTH)
+            max_items (int): Optional maximum number of items per query
+
+        Returns:
+            list: List of item lists, in the original order
+        """
+        max_length = max_length or MAX_JQL_LENGTH
+        if self.max_items:
+            max_items = min(max_items, self.max_items) if max_items else self.max_items
+        packs = []
+        current = []
+        current_length = self.base_length
+
+        for item in items:
+            item_length = len(self.render_item(item))
+            added_length = item_length + (len(self.separator) if current else 0)
+
+            if current and (current_length + added_length > max_length or
+                            (max_items and len(current) >= max_items)):
+                packs.append(current)
+                current = []
+                current_length = self.base_length
+                added_length = item_length
+
+            if not current and self.base_length + item_length > max_length:
+                logger.warning(f"Single item {item} does not fit into JQL length limit {max_length}")
+
+            current.append(item)
+            current_length += added_length
+
+        if current:
+            packs.append(current)
+
+        return packs
+
+    def reduce_max_items(self, rejected_count):
+        """
+        Remember that a query with rejected_count items was too complex for Jira,
+        so later packs of this template use at most half of it
+
+        Args:
+            rejected_count (int): Number of items in the rejected query
+
+        Returns:
+            int: New item limit
+        """
+        limit = max(1, rejected_count // 2)
+        if self.max_items is None or limit < self.max_items:
+            self.max_items = limit
+            logger.info(f"Limiting JQL template to {limit} items per query: {self.template[:60]}")
+        return self.max_items
+
+    def build(self, items, max_length=None, max_items=None):
+        """
+        Pack items and render one query per group
+
+        Args:
+            items (list): Items to pack
+            max_length (int): Maximum query length
+            max_items (int): Optional maximum number of items per query
+
+        Returns:
+            list: List of JQL queries
+        """
+        return [self.render(pack) for pack in self.pack(items, max_length, max_items)]
+
+
+def build_key_list_jql(keys, max_length=None, clause='issue in ({items})'):
+    """
+    Build a single JQL matching all keys, OR-ing packed "issue in (...)" clauses
+
+    Args:
+        keys (list): Issue keys
+        max_length (int): Maximum length of one clause
+        clause (str): Clause template with an {items} placeholder
+
+    Returns:
+        str: JQL query or empty string if no keys
+    """
+    template = JqlTemplate(clause, separator=', ')
+    parts = template.build(keys, max_length)
+    if len(parts) > 1:
+        logger.info(f"Packed {len(keys)} issue keys into {len(parts)} clauses")
+    return ' OR '.join(parts)
+
+
+def is_too_complex_response(response):
+    """
+    Check whether Jira rejected a query because it is too long or too complex
+
+    Args:
+        response (requests.Response): Search response
+
+    Returns:
+        bool: True if the query should be split into smaller ones
+    """
+    if response.status_code in (413, 414):
+        return True
+    if response.status_code not in (400, 500):
+        return False
+
+    text = (response.text or '').lower()
+    return any(marker in text for marker in TOO_COMPLEX_MARKERS)
+
+
+def split_pack(items, max_items):
+    """
+    Split a group of items into smaller groups of at most max_items
+
+    Args:
+        items (list): Items of the query
+        max_items (int): Maximum number of items per group
+
+    Returns:
+        list: List of item lists (a single group if it cannot be split)
+    """
+    max_items = max(1, max_items)
+    return [items[i:i + max_items] for i in range(0, len(items), max_items)]
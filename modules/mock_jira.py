@@ -0,0 +1,897 @@
+"""
+Local Jira stand-in server for offline development and benchmarks.
+
+Serves the REST endpoints the application uses (search, issue, field,
+createmeta, issueLink, issueLinkType, status, transitions, filter, myself) from a set
+of issues loaded from raw_issues.json-like files or generated in memory, with
+configurable latency and error injection.
+
+Usage:
+    python mock_jira_server.py --data jira_charts/<timestamp>/raw_issues.json --latency 0.2
+    python mock_jira_server.py --synthetic 50000
+    then set jira_url = "http://127.0.0.1:8089" in config.py
+"""
+import re
+import json
+import time
+import random
+import logging
+import argparse
+import threading
+from datetime import datetime
+from urllib.parse import urlparse, parse_qs, unquote
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from modules.mock_jql import parse_jql, JqlError
+from modules.raw_issue_storage import load_raw_issues
+from modules.synthetic_data import SyntheticIssueGenerator, DEFAULT_SEED
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8089
+DEFAULT_PAGE_LIMIT = 100
+DEFAULT_SEARCH_RESULTS = 50
+
+EPIC_LINK_FIELD = 'customfield_10008'
+
+# Field catalogue returned by /field and used for createmeta
+FIELDS = [
+    {'id': 'summary', 'name': 'Summary', 'custom': False, 'schema': {'type': 'string', 'system': 'summary'}},
+    {'id': 'description', 'name': 'Description', 'custom': False,
+     'schema': {'type': 'string', 'system': 'description'}},
+    {'id': 'project', 'name': 'Project', 'custom': False, 'schema': {'type': 'project', 'system': 'project'}},
+    {'id': 'issuetype', 'name': 'Issue Type', 'custom': False, 'schema': {'type': 'issuetype', 'system': 'issuetype'}},
+    {'id': 'status', 'name': 'Status', 'custom': False, 'schema': {'type': 'status', 'system': 'status'}},
+    {'id': 'components', 'name': 'Component/s', 'custom': False,
+     'schema': {'type': 'array', 'items': 'component', 'system': 'components'}},
+    {'id': 'timeoriginalestimate', 'name': 'Original Estimate', 'custom': False,
+     'schema': {'type': 'number', 'system': 'timeoriginalestimate'}},
+    {'id': 'timespent', 'name': 'Time Spent', 'custom': False, 'schema': {'type': 'number', 'system': 'timespent'}},
+    {'id': EPIC_LINK_FIELD, 'name': 'Epic Link', 'custom': True,
+     'schema': {'type': 'any', 'custom': 'com.pyxis.greenhopper.jira:gh-epic-link'}},
+    {'id': 'customfield_12307', 'name': 'Estimation', 'custom': True,
+     'schema': {'type': 'number', 'custom': 'com.atlassian.jira.plugin.system.customfieldtypes:float'}},
+    {'id': 'customfield_10509', 'name': 'Product Group', 'custom': True,
+     'schema': {'type': 'option', 'custom': 'com.atlassian.jira.plugin.system.customfieldtypes:select'},
+     'allowedValues': [{'id': '10001', 'value': 'DIGITAL_BSS'}]},
+    {'id': 'customfield_14900', 'name': 'Subsystem', 'custom': True,
+     'schema': {'type': 'option', 'custom': 'com.atlassian.jira.plugin.system.customfieldtypes:select'},
+     'allowedValues': [{'id': str(11000 + i), 'value': name} for i, name in enumerate(
+         ['NBSS_CORE', 'UDB', 'CHM', 'NUS', 'ATS', 'SSO', 'DMS', 'NBSSPORTAL', 'TUDS', 'LIS'])]},
+    {'id': 'customfield_13004', 'name': 'Urgency', 'custom': True,
+     'schema': {'type': 'option', 'custom': 'com.atlassian.jira.plugin.system.customfieldtypes:select'},
+     'allowedValues': [{'id': '12001', 'value': 'A - Critical'}, {'id': '12002', 'value': 'B - High'},
+                       {'id': '12003', 'value': 'C - Medium'}, {'id': '12004', 'value': 'D - Low'}]},
+    {'id': 'customfield_16300', 'name': 'Company', 'custom': True,
+     'schema': {'type': 'array', 'custom': 'com.atlassian.jira.plugin.system.customfieldtypes:multiselect'},
+     'allowedValues': [{'id': '825', 'value': 'Nexign'}]},
+    {'id': 'customfield_17200', 'name': 'Production/Test', 'custom': True,
+     'schema': {'type': 'option', 'custom': 'com.atlassian.jira.plugin.system.customfieldtypes:select'},
+     'allowedValues': [{'id': '14001', 'value': 'PRODUCTION'}, {'id': '14002', 'value': 'TEST'},
+                       {'id': '14003', 'value': 'DEVELOPMENT'}]},
+    {'id': 'customfield_12408', 'name': 'Subsystem version', 'custom': True,
+     'schema': {'type': 'option', 'custom': 'com.atlassian.jira.plugin.system.customfieldtypes:select'},
+     'allowedValues': [{'id': '22550', 'value': '1.0.0'}, {'id': '22551', 'value': '1.1.0'}]},
+    {'id': 'customfield_17813', 'name': 'Investment', 'custom': True,
+     'schema': {'type': 'array', 'custom': 'com.atlassian.jira.plugin.system.customfieldtypes:multiselect'},
+     'allowedValues': [{'id': '169086', 'value': 'NBSS 2025'}]},
+    {'id': 'customfield_17812', 'name': 'Investment item', 'custom': True,
+     'schema': {'type': 'option', 'custom': 'com.atlassian.jira.plugin.system.customfieldtypes:select'},
+     'allowedValues': [{'id': '170958', 'value': 'NBSS'}]},
+    {'id': 'customfield_17814', 'name': 'Milestone', 'custom': True,
+     'schema': {'type': 'string', 'custom': 'com.atlassian.jira.plugin.system.customfieldtypes:textfield'}},
+    {'id': 'customfield_17819', 'name': 'Requirement/Backlog', 'custom': True,
+     'schema': {'type': 'string', 'custom': 'com.atlassian.jira.plugin.system.customfieldtypes:textfield'}}
+]
+
+# Required fields of CLM Error in createmeta
+CREATE_META_REQUIRED = ('summary', 'project', 'issuetype', 'customfield_10509', 'customfield_14900')
+
+# Workflow of CLM Error issues: transition name -> target status
+TRANSITIONS = [
+    {'id': '11', 'name': 'Studying', 'to': {'name': 'Studying', 'statusCategory': {'name': 'In Progress'}}},
+    {'id': '21', 'name': 'Received', 'to': {'name': 'Received', 'statusCategory': {'name': 'In Progress'}}},
+    {'id': '31', 'name': 'Done', 'to': {'name': 'Done', 'statusCategory': {'name': 'Done'}}}
+]
+
+DEFAULT_LINK_TYPES = [
+    {'id': '10000', 'name': 'Relates', 'inward': 'relates to', 'outward': 'relates to'},
+    {'id': '10001', 'name': 'Realization', 'inward': 'realizes', 'outward': 'is realized in'},
+    {'id': '10002', 'name': 'CLM', 'inward': 'is linked from CLM', 'outward': 'links CLM to'},
+    {'id': '10003', 'name': 'Blocks', 'inward': 'is blocked by', 'outward': 'blocks'}
+]
+
+# Field names resolved by get_field_values (lowercase JQL name -> extractor)
+DATE_FIELDS = {'created': 'created', 'updated': 'updated', 'resolved': 'resolutiondate',
+               'resolutiondate': 'resolutiondate', 'duedate': 'duedate'}
+NUMBER_FIELDS = {'timespent': 'timespent', 'timeoriginalestimate': 'timeoriginalestimate',
+                 'originalestimate': 'timeoriginalestimate', 'remainingestimate': 'timeestimate',
+                 'timeestimate': 'timeestimate'}
+
+
+def load_issues(paths):
+    """
+    Load issues from JSON files.
+    Accepts a list of issues, a search response ({'issues': [...]}) or raw_issues.json
+    ({'filtered_issues': [...], 'all_implementation_issues': [...], 'additional_data': {...}});
+    duplicates are dropped.
+
+    Args:
+        paths (list): JSON file paths
+
+    Returns:
+        list: Issue dictionaries
+    """
+    issues = []
+    seen = set()
+    for path in paths:
+        content = load_raw_issues(path)
+
+        # Lists can be nested (raw_issues.json keeps CLM, EST and Improvement issues in additional_data)
+        groups = [content]
+        while groups:
+            group = groups.pop(0)
+            if isinstance(group, dict):
+                groups.extend(value for value in group.values() if isinstance(value, (list, dict)))
+                continue
+            for issue in group:
+                if isinstance(issue, dict) and issue.get('key') and issue['key'] not in seen:
+                    seen.add(issue['key'])
+                    issues.append(issue)
+        logger.info(f"Loaded issues from {path}, {len(issues)} in total")
+    return issues
+
+
+class MockJiraData:
+    """
+    In-memory issue database of the stand-in server with link, subtask and epic indexes
+    """
+
+    def __init__(self, issues=None, filters=None, link_types=None, current_user='mock.user'):
+        """
+        Initialize the data set
+
+        Args:
+            issues (list): Issue dictionaries in Jira REST format
+            filters (dict): Saved filters, filter ID -> JQL
+            link_types (list): Issue link types, defaults to the ones used by the application
+            current_user (str): Name returned by currentUser() and /myself
+        """
+        self.issues = []
+        self.by_key = {}
+        self.by_id = {}
+        self.position = {}
+        self.links = {}
+        self.subtasks = {}
+        self.epic_children = {}
+        self.filters = {str(key): value for key, value in (filters or {}).items()}
+        self.link_types = link_types or list(DEFAULT_LINK_TYPES)
+        self.current_user = current_user
+        self.lock = threading.RLock()
+        self.field_names = {field['name'].lower(): field['id'] for field in FIELDS}
+        self.counters = {}
+
+        for issue in issues or []:
+            self.add_issue(issue)
+
+    def add_issue(self, issue):
+        """
+        Add an issue and index its links, parent and epic
+
+        Args:
+            issue (dict): Issue dictionary
+        """
+        with self.lock:
+            key = issue['key']
+            issue.setdefault('id', str(10000 + len(self.issues)))
+            fields = issue.setdefault('fields', {})
+            self.position[key] = len(self.issues)
+            self.issues.append(issue)
+            self.by_key[key] = issue
+            self.by_id[str(issue['id'])] = issue
+
+            project, _, number = key.rpartition('-')
+            if number.isdigit():
+                self.counters[project] = max(self.counters.get(project, 0), int(number))
+
+            for link in fields.get('issuelinks', []) or []:
+                link_type = link.get('type', {})
+                if 'outwardIssue' in link:
+                    self._index_link(key, link['outwardIssue'].get('key'), link_type, outward=True)
+                elif 'inwardIssue' in link:
+                    self._index_link(key, link['inwardIssue'].get('key'), link_type, outward=False)
+
+            parent = (fields.get('parent') or {}).get('key')
+            if parent:
+                self.subtasks.setdefault(parent, []).append(key)
+            epic = fields.get(EPIC_LINK_FIELD)
+            if epic:
+                self.epic_children.setdefault(epic, []).append(key)
+
+    def _index_link(self, key, other_key, link_type, outward):
+        """Index a link from both ends (raw data often stores it only on one side)"""
+        if not other_key:
+            return
+        name = link_type.get('name', '')
+        description = link_type.get('outward' if outward else 'inward', name)
+        reverse = link_type.get('inward' if outward else 'outward', name)
+        for source, target, text in ((key, other_key, description), (other_key, key, reverse)):
+            entries = self.links.setdefault(source, {})
+            entries.setdefault(target, set()).update({text.lower(), name.lower()})
+
+    def resolve_key(self, value):
+        """Map an issue ID to its key, keys are returned unchanged"""
+        issue = self.by_id.get(value)
+        return issue['key'] if issue is not None and value not in self.by_key else value.upper()
+
+    def get_issue(self, key_or_id):
+        """Get issue by key or ID"""
+        return self.by_key.get(key_or_id) or self.by_key.get(key_or_id.upper()) or self.by_id.get(key_or_id)
+
+    def get_linked_keys(self, key, link_type=None):
+        """
+        Keys of issues linked to an issue
+
+        Args:
+            key (str): Issue key
+            link_type (str): Link description seen from the issue ('is realized in') or link type name
+
+        Returns:
+            set: Linked issue keys
+        """
+        entries = self.links.get(self.resolve_key(str(key)), {})
+        if not link_type:
+            return set(entries)
+        link_type = link_type.lower()
+        return {other for other, types in entries.items() if link_type in types}
+
+    def get_subtask_keys(self, key):
+        """Keys of subtasks of an issue"""
+        return set(self.subtasks.get(self.resolve_key(str(key)), []))
+
+    def get_epic_children_keys(self, key):
+        """Keys of issues in an epic"""
+        return set(self.epic_children.get(self.resolve_key(str(key)), []))
+
+    def get_field_values(self, issue, field):
+        """
+        Values of a field for JQL comparison
+
+        Args:
+            issue (dict): Issue dictionary
+            field (str): Lowercase JQL field name
+
+        Returns:
+            list: Field values or None if the field is unknown
+        """
+        fields = issue.get('fields', {})
+        if field == 'project':
+            project = fields.get('project') or {}
+            return [project.get('key'), project.get('name')]
+        if field in ('issuetype', 'type'):
+            return [(fields.get('issuetype') or {}).get('name')]
+        if field == 'status':
+            return [(fields.get('status') or {}).get('name')]
+        if field == 'statuscategory':
+            return [((fields.get('status') or {}).get('statusCategory') or {}).get('name')]
+        if field in ('summary', 'text'):
+            return [fields.get('summary'), fields.get('description')] if field == 'text' else [fields.get('summary')]
+        if field == 'description':
+            return [fields.get('description')]
+        if field == 'parent':
+            return [(fields.get('parent') or {}).get('key')]
+        if field in ('component', 'components'):
+            return [component.get('name') for component in fields.get('components') or []]
+        if field == 'labels':
+            return list(fields.get('labels') or [])
+        if field in ('assignee', 'reporter'):
+            user = fields.get(field) or {}
+            return [user.get('name'), user.get('displayName')]
+        if field == 'resolution':
+            return [(fields.get('resolution') or {}).get('name')]
+        if field in DATE_FIELDS:
+            return [fields.get(DATE_FIELDS[field])]
+        if field in NUMBER_FIELDS:
+            return [fields.get(NUMBER_FIELDS[field]) or 0]
+        if field == 'worklogdate':
+            return [worklog.get('started') for worklog in (fields.get('worklog') or {}).get('worklogs', [])]
+        if field == 'worklogauthor':
+            return [(worklog.get('author') or {}).get('name')
+                    for worklog in (fields.get('worklog') or {}).get('worklogs', [])]
+        if field == 'comment':
+            return [comment.get('body') for comment in (fields.get('comment') or {}).get('comments', [])]
+        if field == 'issuelinktype':
+            names = []
+            for link in fields.get('issuelinks') or []:
+                link_type = link.get('type') or {}
+                names.extend([link_type.get('name'), link_type.get('inward'), link_type.get('outward')])
+            return names
+        if field in ('attachments', 'attachment'):
+            return [attachment.get('filename') for attachment in fields.get('attachment') or []]
+        if field == 'sprint':
+            return [sprint.get('name') if isinstance(sprint, dict) else sprint
+                    for sprint in fields.get('sprint') or []]
+
+        match = re.match(r'^cf\[(\d+)\]$', field)
+        field_id = f'customfield_{match.group(1)}' if match else self.field_names.get(field, field)
+        if field_id in fields or field_id.startswith('customfield_'):
+            value = fields.get(field_id)
+            values = value if isinstance(value, list) else [value]
+            return [item.get('value', item.get('name')) if isinstance(item, dict) else item for item in values]
+        return None
+
+    def create_issue(self, fields):
+        """
+        Create an issue (POST /issue)
+
+        Args:
+            fields (dict): Issue fields from the request
+
+        Returns:
+            dict: Created issue
+        """
+        with self.lock:
+            project = (fields.get('project') or {}).get('key', 'MOCK')
+            number = self.counters.get(project, 0) + 1
+            now = datetime.now().strftime('%Y-%m-%dT%H:%M:%S.000+0000')
+            issue_fields = dict(fields)
+            issue_fields.setdefault('status', {'name': 'Open', 'statusCategory': {'name': 'To Do'}})
+            issue_fields['created'] = now
+            issue_fields['updated'] = now
+            issue_fields['project'] = {'key': project, 'name': project}
+            issue = {'key': f'{project}-{number}', 'fields': issue_fields, 'changelog': {'histories': []}}
+            self.add_issue(issue)
+            return issue
+
+    def create_link(self, link_type_name, inward_key, outward_key):
+        """
+        Create a link (POST /issueLink)
+
+        Returns:
+            bool: False if an issue or link type does not exist
+        """
+        with self.lock:
+            link_type = next((lt for lt in self.link_types if lt['name'] == link_type_name), None)
+            inward = self.get_issue(inward_key or '')
+            outward = self.get_issue(outward_key or '')
+            if link_type is None or inward is None or outward is None:
+                return False
+            outward['fields'].setdefault('issuelinks', []).append({'type': link_type,
+                                                                    'inwardIssue': {'key': inward['key']}})
+            inward['fields'].setdefault('issuelinks', []).append({'type': link_type,
+                                                                   'outwardIssue': {'key': outward['key']}})
+            self._index_link(inward['key'], outward['key'], link_type, outward=True)
+            return True
+
+    def transition_issue(self, issue, transition_id):
+        """
+        Move an issue to the target status of a transition
+
+        Returns:
+            bool: False if the transition does not exist
+        """
+        transition = next((t for t in TRANSITIONS if t['id'] == str(transition_id)), None)
+        if transition is None:
+            return False
+        with self.lock:
+            fields = issue['fields']
+            old_status = (fields.get('status') or {}).get('name')
+            now = datetime.now().strftime('%Y-%m-%dT%H:%M:%S.000+0000')
+            fields['status'] = dict(transition['to'])
+            fields['updated'] = now
+            issue.setdefault('changelog', {}).setdefault('histories', []).append({
+                'created': now,
+                'items': [{'field': 'status', 'fromString': old_status, 'toString': transition['to']['name']}]
+            })
+        return True
+
+
+class SearchContext:
+    """State of one search: data set, compiled query cache and per-search memo"""
+
+    def __init__(self, data, compiled):
+        self.data = data
+        self.compiled = compiled
+        self.memo = {}
+
+    def compile(self, jql):
+        """Parse a query, using the server's cache of parsed queries"""
+        node = self.compiled.get(jql)
+        if node is None:
+            node = parse_jql(jql)
+            self.compiled[jql] = node
+        return node
+
+    def search(self, jql):
+        """
+        Find issues matching a query
+
+        Returns:
+            list: Matching issues in data order
+        """
+        node = self.compile(jql)
+        candidates = node.candidates(self)
+        if candidates is None:
+            pool = self.data.issues
+        else:
+            pool = [self.data.by_key[key] for key in candidates if key in self.data.by_key]
+            pool.sort(key=lambda issue: self.data.position[issue['key']])
+        return [issue for issue in pool if node.matches(issue, self)]
+
+    def search_keys(self, jql):
+        """Keys of issues matching a subquery"""
+        return {issue['key'] for issue in self.search(jql)}
+
+
+class FaultInjector:
+    """
+    Latency and error injection for the stand-in server.
+
+    Every request waits latency (+ random jitter, + latency_per_issue for each
+    returned issue), then fails with 5xx with probability error_rate or is
+    throttled with 429 + Retry-After with probability throttle_rate or when more
+    than max_concurrent requests are in flight.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, latency_per_issue=0.0, error_rate=0.0, throttle_rate=0.0,
+                 retry_after=1, max_concurrent=0, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.latency_per_issue = latency_per_issue
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.max_concurrent = max_concurrent
+        self.random = random.Random(seed)
+        self.in_flight = 0
+        self.lock = threading.Lock()
+
+    def enter(self):
+        """
+        Register a request and decide whether it fails
+
+        Returns:
+            tuple: (status code, headers) of an injected failure or None
+        """
+        with self.lock:
+            self.in_flight += 1
+            overloaded = self.max_concurrent and self.in_flight > self.max_concurrent
+            roll = self.random.random()
+            error = self.random.choice((500, 502, 503))
+
+        if overloaded or roll < self.throttle_rate:
+            return 429, {'Retry-After': str(self.retry_after)}
+        if roll < self.throttle_rate + self.error_rate:
+            return error, {}
+        return None
+
+    def leave(self):
+        """Unregister a request"""
+        with self.lock:
+            self.in_flight -= 1
+
+    def delay(self, issue_count=0):
+        """Sleep for the configured latency"""
+        delay = self.latency + issue_count * self.latency_per_issue
+        if self.jitter:
+            delay += self.random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+
+def project_issue(issue, fields=None, expand=None):
+    """
+    Return a copy of an issue limited to the requested fields
+
+    Args:
+        issue (dict): Issue dictionary
+        fields (list): Requested field IDs, all fields if empty or '*all'
+        expand (list): Requested expansions (changelog is returned only when expanded)
+
+    Returns:
+        dict: Issue for the response
+    """
+    result = {'id': issue['id'], 'key': issue['key'], 'self': f"/rest/api/2/issue/{issue['id']}"}
+    all_fields = issue.get('fields', {})
+    if not fields or '*all' in fields or '*navigable' in fields:
+        result['fields'] = all_fields
+    else:
+        result['fields'] = {name: all_fields.get(name) for name in fields if name in all_fields}
+
+    expand = expand or []
+    if 'changelog' in expand:
+        result['changelog'] = issue.get('changelog', {'histories': []})
+    if 'subtasks' in expand and 'subtasks' not in result['fields']:
+        result['fields']['subtasks'] = all_fields.get('subtasks', [])
+    return result
+
+
+def split_param(value):
+    """Split list parameters sent as lists or comma separated strings"""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(',') if item.strip()]
+    return list(value)
+
+
+class MockJiraHandler(BaseHTTPRequestHandler):
+    """Request handler, the server instance carries data, faults and statistics"""
+
+    protocol_version = 'HTTP/1.1'
+
+    ROUTES = [
+        ('GET', r'^/rest/api/2/myself$', 'handle_myself'),
+        ('GET', r'^/rest/api/2/search$', 'handle_search'),
+        ('POST', r'^/rest/api/2/search$', 'handle_search'),
+        ('GET', r'^/rest/api/2/field$', 'handle_fields'),
+        ('GET', r'^/rest/api/2/field/(?P<field_id>[^/]+)/option$', 'handle_field_options'),
+        ('GET', r'^/rest/api/2/issue/createmeta$', 'handle_create_meta'),
+        ('GET', r'^/rest/api/2/issueLinkType$', 'handle_link_types'),
+        ('GET', r'^/rest/api/2/status$', 'handle_statuses'),
+        ('POST', r'^/rest/api/2/issueLink$', 'handle_create_link'),
+        ('GET', r'^/rest/api/2/filter/(?P<filter_id>\d+)$', 'handle_filter'),
+        ('POST', r'^/rest/api/2/issue$', 'handle_create_issue'),
+        ('GET', r'^/rest/api/2/issue/(?P<key>[^/]+)/transitions$', 'handle_get_transitions'),
+        ('POST', r'^/rest/api/2/issue/(?P<key>[^/]+)/transitions$', 'handle_do_transition'),
+        ('GET', r'^/rest/api/2/issue/(?P<key>[^/]+)$', 'handle_issue'),
+        ('GET', r'^/mock/stats$', 'handle_stats'),
+        ('GET', r'^/$', 'handle_root')
+    ]
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def do_GET(self):
+        self.dispatch('GET')
+
+    def do_POST(self):
+        self.dispatch('POST')
+
+    def do_PUT(self):
+        self.dispatch('PUT')
+
+    def dispatch(self, method):
+        parsed = urlparse(self.path)
+        path = parsed.path.rstrip('/') or '/'
+        self.query = {name: values[-1] for name, values in parse_qs(parsed.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        raw_body = self.rfile.read(length) if length else b''
+        try:
+            self.body = json.loads(raw_body) if raw_body else {}
+        except ValueError:
+            self.body = {}
+
+        for route_method, pattern, handler_name in self.ROUTES:
+            match = re.match(pattern, path)
+            if match and route_method == method:
+                break
+        else:
+            self.send_json({'errorMessages': [f'No mock endpoint for {method} {path}']}, 404)
+            return
+
+        server = self.server
+        server.count(handler_name)
+        failure = None if handler_name in ('handle_stats', 'handle_root') else server.faults.enter()
+        try:
+            if failure is not None:
+                status, headers = failure
+                server.count('throttled' if status == 429 else 'errors')
+                server.faults.delay()
+                self.send_json({'errorMessages': [f'Injected failure {status}']}, status, headers)
+                return
+            getattr(self, handler_name)(**{name: unquote(value) for name, value in match.groupdict().items()})
+        except JqlError as e:
+            self.send_json({'errorMessages': [f"Error in the JQL Query: {e}"]}, 400)
+        except Exception as e:
+            logger.error(f"Mock Jira error on {method} {self.path}: {e}", exc_info=True)
+            self.send_json({'errorMessages': [str(e)]}, 500)
+        finally:
+            if failure is not None or handler_name not in ('handle_stats', 'handle_root'):
+                server.faults.leave()
+
+    def send_json(self, data, status=200, headers=None):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json;charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_empty(self, status=204):
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def handle_root(self):
+        self.server.faults.delay()
+        self.send_json({'mock': True})
+
+    def handle_stats(self):
+        self.send_json(self.server.get_stats())
+
+    def handle_myself(self):
+        self.server.faults.delay()
+        user = self.server.data.current_user
+        self.send_json({'name': user, 'displayName': user, 'active': True})
+
+    def handle_search(self):
+        params = self.body if self.command == 'POST' else self.query
+        jql = params.get('jql', '') or ''
+        start_at = int(params.get('startAt', 0) or 0)
+        max_results = int(params.get('maxResults', DEFAULT_SEARCH_RESULTS))
+        max_results = max(0, min(max_results, self.server.page_limit))
+        fields = split_param(params.get('fields'))
+        expand = split_param(params.get('expand'))
+
+        if self.server.max_jql_length and len(jql) > self.server.max_jql_length:
+            self.server.faults.delay()
+            self.send_json({'errorMessages': ['The JQL query is too complex to be processed']}, 400)
+            return
+
+        ctx = SearchContext(self.server.data, self.server.compiled)
+        with self.server.data.lock:
+            matched = ctx.search(jql)
+            page = [project_issue(issue, fields, expand) for issue in matched[start_at:start_at + max_results]]
+
+        self.server.faults.delay(len(page))
+        self.send_json({
+            'expand': 'schema,names',
+            'startAt': start_at,
+            'maxResults': max_results,
+            'total': len(matched),
+            'issues': page
+        })
+
+    def handle_issue(self, key):
+        issue = self.server.data.get_issue(key)
+        self.server.faults.delay(1)
+        if issue is None:
+            self.send_json({'errorMessages': ['Issue Does Not Exist'], 'errors': {}}, 404)
+            return
+        expand = split_param(self.query.get('expand'))
+        self.send_json(project_issue(issue, split_param(self.query.get('fields')), expand))
+
+    def handle_fields(self):
+        self.server.faults.delay()
+        self.send_json([{key: value for key, value in field.items() if key != 'allowedValues'} for field in FIELDS])
+
+    def handle_field_options(self, field_id):
+        self.server.faults.delay()
+        field = next((f for f in FIELDS if f['id'] == field_id), None)
+        if field is None:
+            self.send_json({'errorMessages': [f'Field {field_id} not found']}, 404)
+            return
+        values = field.get('allowedValues', [])
+        self.send_json({'maxResults': len(values), 'startAt': 0, 'total': len(values), 'isLast': True,
+                        'values': values})
+
+    def handle_create_meta(self):
+        self.server.faults.delay()
+        fields = {}
+        for field in FIELDS:
+            info = {'name': field['name'], 'schema': field['schema'],
+                    'required': field['id'] in CREATE_META_REQUIRED}
+            if 'allowedValues' in field:
+                info['allowedValues'] = field['allowedValues']
+            fields[field['id']] = info
+        project_key = (self.query.get('projectKeys') or 'CLM').split(',')[0]
+        issuetype = (self.query.get('issuetypeNames') or 'Error').split(',')[0]
+        self.send_json({'projects': [{'key': project_key, 'name': project_key,
+                                      'issuetypes': [{'id': '1', 'name': issuetype, 'fields': fields}]}]})
+
+    def handle_link_types(self):
+        self.server.faults.delay()
+        self.send_json({'issueLinkTypes': self.server.data.link_types})
+
+    def handle_statuses(self):
+        self.server.faults.delay()
+        with self.server.data.lock:
+            statuses = {}
+            for issue in self.server.data.issues:
+                status = issue.get('fields', {}).get('status') or {}
+                if status.get('name'):
+                    statuses.setdefault(status['name'], status)
+        self.send_json([{'id': status.get('id', str(index)), 'name': name,
+                         'statusCategory': status.get('statusCategory', {})}
+                        for index, (name, status) in enumerate(sorted(statuses.items()), 1)])
+
+    def handle_create_link(self):
+        self.server.faults.delay()
+        body = self.body
+        created = self.server.data.create_link((body.get('type') or {}).get('name'),
+                                               (body.get('inwardIssue') or {}).get('key'),
+                                               (body.get('outwardIssue') or {}).get('key'))
+        if not created:
+            self.send_json({'errorMessages': ['No issue link type or issue found']}, 404)
+            return
+        self.send_empty(201)
+
+    def handle_filter(self, filter_id):
+        self.server.faults.delay()
+        jql = self.server.data.filters.get(filter_id)
+        if jql is None:
+            self.send_json({'errorMessages': [f'The selected filter is not available to you ({filter_id})']}, 400)
+            return
+        self.send_json({'id': filter_id, 'name': f'Mock filter {filter_id}', 'jql': jql})
+
+    def handle_create_issue(self):
+        self.server.faults.delay()
+        issue = self.server.data.create_issue(self.body.get('fields') or {})
+        self.send_json({'id': issue['id'], 'key': issue['key'], 'self': f"/rest/api/2/issue/{issue['id']}"}, 201)
+
+    def handle_get_transitions(self, key):
+        self.server.faults.delay()
+        if self.server.data.get_issue(key) is None:
+            self.send_json({'errorMessages': ['Issue Does Not Exist']}, 404)
+            return
+        self.send_json({'expand': 'transitions', 'transitions': TRANSITIONS})
+
+    def handle_do_transition(self, key):
+        self.server.faults.delay()
+        issue = self.server.data.get_issue(key)
+        transition_id = (self.body.get('transition') or {}).get('id')
+        if issue is None or not self.server.data.transition_issue(issue, transition_id):
+            self.send_json({'errorMessages': ['Issue or transition does not exist']}, 400)
+            return
+        self.send_empty(204)
+
+
+class MockJiraServer(ThreadingHTTPServer):
+    """
+    Jira stand-in HTTP server.
+
+    Can be used in-process (start() / stop() or as a context manager):
+        with MockJiraServer(MockJiraData(issues), faults=FaultInjector(latency=0.1)) as server:
+            analyzer = JiraAnalyzer(jira_url=server.url)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, data=None, host='127.0.0.1', port=0, faults=None, page_limit=DEFAULT_PAGE_LIMIT,
+                 max_jql_length=None):
+        """
+        Initialize the server
+
+        Args:
+            data (MockJiraData): Issue data set
+            host (str): Address to bind
+            port (int): Port to bind, 0 for a free port
+            faults (FaultInjector): Latency and error injection, none by default
+            page_limit (int): Maximum number of issues per search page
+            max_jql_length (int): Reject longer queries as too complex (None - no limit)
+        """
+        super().__init__((host, port), MockJiraHandler)
+        self.data = data or MockJiraData()
+        self.faults = faults or FaultInjector()
+        self.page_limit = page_limit
+        self.max_jql_length = max_jql_length
+        self.compiled = {}
+        self.stats = {}
+        self.stats_lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def url(self):
+        """Base URL of the server"""
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def count(self, name):
+        """Increment a statistics counter"""
+        with self.stats_lock:
+            self.stats[name] = self.stats.get(name, 0) + 1
+
+    def get_stats(self):
+        """
+        Get request counters
+
+        Returns:
+            dict: Counter name -> value
+        """
+        with self.stats_lock:
+            return dict(self.stats)
+
+    def reset_stats(self):
+        """Reset request counters"""
+        with self.stats_lock:
+            self.stats = {}
+
+    def start(self):
+        """Serve requests in a background thread"""
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info(f"Mock Jira server started at {self.url} with {len(self.data.issues)} issues")
+        return self
+
+    def stop(self):
+        """Stop the background thread and close the socket"""
+        self.shutdown()
+        self.server_close()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def default_filters():
+    """Saved filters matching the default filter IDs from config.py"""
+    filters = {}
+    try:
+        import config
+        clm_filter = getattr(config, 'DEFAULT_CLM_FILTER_ID', None)
+        jira_filter = getattr(config, 'DEFAULT_JIRA_FILTER_ID', None)
+        if clm_filter:
+            filters[str(clm_filter)] = 'project = CLM'
+        if jira_filter:
+            filters[str(jira_filter)] = 'project != CLM'
+    except ImportError:
+        pass
+    return filters
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Local Jira stand-in server")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to bind")
+    parser.add_argument("--data", nargs='*', default=[],
+                        help="JSON files with issues (raw_issues.json, search responses or issue lists)")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="Also serve this many generated issues (see generate_synthetic_issues.py)")
+    parser.add_argument("--synthetic-seed", type=int, default=DEFAULT_SEED, help="Random seed of generated issues")
+    parser.add_argument("--filter", action='append', default=[], metavar='ID=JQL',
+                        help="Saved filter, can be repeated")
+    parser.add_argument("--latency", type=float, default=0.0, help="Base response latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency in seconds")
+    parser.add_argument("--latency-per-issue", type=float, default=0.0,
+                        help="Extra latency per returned issue in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failing with 5xx")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of requests throttled with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After value for 429 responses")
+    parser.add_argument("--max-concurrent", type=int, default=0,
+                        help="Throttle requests above this number in flight (0 - no limit)")
+    parser.add_argument("--page-limit", type=int, default=DEFAULT_PAGE_LIMIT, help="Maximum issues per search page")
+    parser.add_argument("--max-jql-length", type=int, default=None, help="Reject longer queries as too complex")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for fault injection")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the stand-in server from the command line"""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    filters = default_filters()
+    for item in args.filter:
+        filter_id, _, jql = item.partition('=')
+        filters[filter_id.strip()] = jql.strip()
+
+    issues = load_issues(args.data)
+    if args.synthetic:
+        issues.extend(SyntheticIssueGenerator(args.synthetic, args.synthetic_seed).iter_issues())
+    data = MockJiraData(issues, filters=filters)
+    faults = FaultInjector(latency=args.latency, jitter=args.jitter, latency_per_issue=args.latency_per_issue,
+                           error_rate=args.error_rate, throttle_rate=args.throttle_rate,
+                           retry_after=args.retry_after, max_concurrent=args.max_concurrent, seed=args.seed)
+    server = MockJiraServer(data, args.host, args.port, faults, args.page_limit, args.max_jql_length)
+    logger.info(f"Mock Jira server listening at {server.url} with {len(data.issues)} issues")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopping mock Jira server")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
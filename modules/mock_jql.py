@@ -0,0 +1,460 @@
+"""
+Small JQL evaluator for the local Jira stand-in server (modules/mock_jira.py).
+
+Supports the subset of JQL the application generates: AND / OR / NOT and
+parentheses, =, !=, >, >=, <, <=, ~, IN / NOT IN, IS [NOT] EMPTY, ORDER BY
+(ignored), filter=ID and the functions linkedIssues(), issueFunction
+linkedIssuesOf() / linkedIssuesOfRemote() and currentUser().
+Clauses on unknown fields match every issue.
+"""
+import re
+import logging
+from datetime import datetime, timedelta
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+KEYWORDS = ('AND', 'OR', 'NOT', 'IN', 'IS', 'EMPTY', 'NULL', 'ORDER', 'BY')
+
+TOKEN_RE = re.compile(r'''
+    \s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*') |
+        (?P<op>!=|>=|<=|!~|=|>|<|~) |
+        (?P<punct>[(),]) |
+        (?P<word>[^\s"'(),=!<>~]+)
+    )''', re.VERBOSE)
+
+DATE_FORMATS = ('%Y/%m/%d %H:%M', '%Y-%m-%d %H:%M', '%Y/%m/%d', '%Y-%m-%d')
+RELATIVE_DATE_RE = re.compile(r'^([+-]?\d+)([mhdw])$')
+
+
+class JqlError(Exception):
+    """Raised when a query cannot be parsed"""
+
+
+def tokenize(jql):
+    """
+    Split JQL into tokens
+
+    Args:
+        jql (str): Query text
+
+    Returns:
+        list: (kind, value) tuples, kind is 'string', 'op', 'punct', 'word' or 'keyword'
+    """
+    tokens = []
+    position = 0
+    jql = jql.strip()
+    while position < len(jql):
+        match = TOKEN_RE.match(jql, position)
+        if not match or match.end() == position:
+            raise JqlError(f"Unexpected character at position {position}: {jql[position:position + 20]}")
+        position = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'string':
+            value = re.sub(r'\\(.)', r'\1', value[1:-1])
+        elif kind == 'word' and value.upper() in KEYWORDS:
+            kind = 'keyword'
+            value = value.upper()
+        tokens.append((kind, value))
+    return tokens
+
+
+def parse_date(value):
+    """
+    Parse a JQL date value (absolute or relative like -7d)
+
+    Args:
+        value (str): Date value
+
+    Returns:
+        datetime: Parsed date or None
+    """
+    value = str(value).strip()
+    match = RELATIVE_DATE_RE.match(value)
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        delta = {'m': timedelta(minutes=amount), 'h': timedelta(hours=amount),
+                 'd': timedelta(days=amount), 'w': timedelta(weeks=amount)}[unit]
+        return datetime.now() + delta
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return parse_issue_date(value)
+
+
+def parse_issue_date(value):
+    """
+    Parse a Jira timestamp ('2025-01-10T12:30:00.000+0300'), time zone is ignored
+
+    Args:
+        value (str): Timestamp
+
+    Returns:
+        datetime: Parsed date or None
+    """
+    if not value:
+        return None
+    try:
+        return datetime.strptime(str(value)[:19], '%Y-%m-%dT%H:%M:%S')
+    except ValueError:
+        try:
+            return datetime.strptime(str(value)[:10], '%Y-%m-%d')
+        except ValueError:
+            return None
+
+
+class Node:
+    """Base class of query nodes"""
+
+    def matches(self, issue, ctx):
+        raise NotImplementedError
+
+    def candidates(self, ctx):
+        """Keys that can match (used to avoid scanning all issues) or None if unknown"""
+        return None
+
+
+class AndNode(Node):
+    def __init__(self, parts):
+        self.parts = parts
+
+    def matches(self, issue, ctx):
+        return all(part.matches(issue, ctx) for part in self.parts)
+
+    def candidates(self, ctx):
+        result = None
+        for part in self.parts:
+            keys = part.candidates(ctx)
+            if keys is not None:
+                result = set(keys) if result is None else result & keys
+        return result
+
+
+class OrNode(Node):
+    def __init__(self, parts):
+        self.parts = parts
+
+    def matches(self, issue, ctx):
+        return any(part.matches(issue, ctx) for part in self.parts)
+
+    def candidates(self, ctx):
+        result = set()
+        for part in self.parts:
+            keys = part.candidates(ctx)
+            if keys is None:
+                return None
+            result |= keys
+        return result
+
+
+class NotNode(Node):
+    def __init__(self, part):
+        self.part = part
+
+    def matches(self, issue, ctx):
+        return not self.part.matches(issue, ctx)
+
+
+class MatchAllNode(Node):
+    def matches(self, issue, ctx):
+        return True
+
+
+class FilterNode(Node):
+    """filter = ID, resolved to the saved filter query"""
+
+    def __init__(self, filter_id, negate=False):
+        self.filter_id = str(filter_id)
+        self.negate = negate
+
+    def _resolve(self, ctx):
+        jql = ctx.data.filters.get(self.filter_id)
+        if jql is None:
+            raise JqlError(f"The value '{self.filter_id}' does not exist for the field 'filter'.")
+        return ctx.compile(jql)
+
+    def matches(self, issue, ctx):
+        return self._resolve(ctx).matches(issue, ctx) != self.negate
+
+    def candidates(self, ctx):
+        return None if self.negate else self._resolve(ctx).candidates(ctx)
+
+
+class FunctionValue:
+    """Function call used as a value, e.g. linkedIssues("CLM-1", "relates to")"""
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def keys(self, ctx):
+        """Evaluate a key-set function"""
+        name = self.name.lower()
+        if name == 'linkedissues':
+            if not self.args:
+                return set()
+            return ctx.data.get_linked_keys(self.args[0], self.args[1] if len(self.args) > 1 else None)
+        if name == 'linkedissuesof':
+            if not self.args:
+                return set()
+            subquery = ctx.search_keys(self.args[0])
+            link_type = self.args[1] if len(self.args) > 1 else None
+            result = set()
+            for key in subquery:
+                result |= ctx.data.get_linked_keys(key, link_type)
+            return result
+        if name == 'subtasksof':
+            return {key for parent in ctx.search_keys(self.args[0]) for key in ctx.data.get_subtask_keys(parent)}
+        if name in ('linkedissuesofremote', 'issuesfromremotelinks'):
+            return {issue['key'] for issue in ctx.data.issues if issue.get('remotelinks')}
+        logger.warning(f"Mock JQL: unsupported function {self.name}(), treated as empty")
+        return set()
+
+    def scalar(self, ctx):
+        """Evaluate a scalar function"""
+        name = self.name.lower()
+        if name == 'currentuser':
+            return ctx.data.current_user
+        if name in ('now', 'startofday', 'endofday'):
+            now = datetime.now()
+            if name == 'startofday':
+                return now.replace(hour=0, minute=0, second=0, microsecond=0)
+            if name == 'endofday':
+                return now.replace(hour=23, minute=59, second=59, microsecond=0)
+            return now
+        logger.warning(f"Mock JQL: unsupported function {self.name}()")
+        return None
+
+
+class ClauseNode(Node):
+    """field <op> value(s)"""
+
+    def __init__(self, field, op, values):
+        self.field = field
+        self.op = op
+        self.values = values
+
+    def _value_keys(self, ctx):
+        """Keys of 'key/issue in (...)' and function values (evaluated once per search)"""
+        keys = ctx.memo.get(id(self))
+        if keys is None:
+            keys = set()
+            for value in self.values:
+                if isinstance(value, FunctionValue):
+                    keys |= value.keys(ctx)
+                else:
+                    keys.add(ctx.data.resolve_key(str(value)))
+            ctx.memo[id(self)] = keys
+        return keys
+
+    def candidates(self, ctx):
+        field = self.field.lower()
+        if self.op in ('=', 'in') and field in ('key', 'issue', 'issuekey', 'id', 'issuefunction'):
+            return self._value_keys(ctx)
+        if self.op in ('=', 'in') and field == 'parent':
+            return {key for value in self.values for key in ctx.data.get_subtask_keys(str(value))}
+        if self.op in ('=', 'in') and field == 'epic link':
+            return {key for value in self.values for key in ctx.data.get_epic_children_keys(str(value))}
+        return None
+
+    def matches(self, issue, ctx):
+        field = self.field.lower()
+        op = self.op
+
+        if field in ('key', 'issue', 'issuekey', 'id', 'issuefunction'):
+            if op in ('=', 'in', '!=', 'not in'):
+                found = issue['key'] in self._value_keys(ctx)
+                return found if op in ('=', 'in') else not found
+            if op in ('is', 'is not'):
+                return op == 'is not'
+
+        actual = ctx.data.get_field_values(issue, field)
+        if actual is None:
+            return True  # Unknown field
+
+        if op in ('is', 'is not'):
+            empty = not [value for value in actual if value not in (None, '', 0)]
+            return empty if op == 'is' else not empty
+
+        if op in ('>', '>=', '<', '<='):
+            return any(self._compare(value, op, ctx) for value in actual)
+
+        if op in ('~', '!~'):
+            needle = str(self.values[0]).lower().strip('*')
+            found = any(needle in str(value).lower() for value in actual)
+            return found if op == '~' else not found
+
+        expected = ctx.memo.get(id(self))
+        if expected is None:
+            expected = set()
+            for value in self.values:
+                if isinstance(value, FunctionValue):
+                    expected.add(str(value.scalar(ctx)).lower())
+                else:
+                    expected.add(str(value).lower())
+            ctx.memo[id(self)] = expected
+        found = any(str(value).lower() in expected for value in actual)
+        return found if op in ('=', 'in') else not found
+
+    def _compare(self, actual, op, ctx):
+        """Compare a date or number value"""
+        value = self.values[0]
+        if isinstance(value, FunctionValue):
+            value = value.scalar(ctx)
+
+        if isinstance(actual, (int, float)):
+            try:
+                expected = float(value)
+            except (TypeError, ValueError):
+                return False
+        else:
+            actual = parse_issue_date(actual)
+            expected = value if isinstance(value, datetime) else parse_date(value)
+            if actual is None or expected is None:
+                return False
+
+        if op == '>':
+            return actual > expected
+        if op == '>=':
+            return actual >= expected
+        if op == '<':
+            return actual < expected
+        return actual <= expected
+
+
+class Parser:
+    """Recursive descent parser producing a Node tree"""
+
+    def __init__(self, jql):
+        self.tokens = tokenize(jql)
+        self.position = 0
+
+    def peek(self, offset=0):
+        index = self.position + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def next(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def accept(self, kind, value=None):
+        token = self.peek()
+        if token[0] == kind and (value is None or token[1] == value):
+            self.position += 1
+            return True
+        return False
+
+    def expect(self, kind, value=None):
+        if not self.accept(kind, value):
+            raise JqlError(f"Expected {value or kind}, got {self.peek()[1]!r}")
+
+    def parse(self):
+        if not self.tokens or self.peek() == ('keyword', 'ORDER'):
+            return MatchAllNode()
+        node = self.parse_or()
+        if self.peek() == ('keyword', 'ORDER'):
+            # Ordering is ignored, results keep data order
+            self.position = len(self.tokens)
+        if self.position < len(self.tokens):
+            raise JqlError(f"Unexpected token {self.peek()[1]!r}")
+        return node
+
+    def parse_or(self):
+        parts = [self.parse_and()]
+        while self.accept('keyword', 'OR'):
+            parts.append(self.parse_and())
+        return parts[0] if len(parts) == 1 else OrNode(parts)
+
+    def parse_and(self):
+        parts = [self.parse_not()]
+        while self.accept('keyword', 'AND'):
+            parts.append(self.parse_not())
+        return parts[0] if len(parts) == 1 else AndNode(parts)
+
+    def parse_not(self):
+        if self.accept('keyword', 'NOT'):
+            return NotNode(self.parse_not())
+        if self.accept('punct', '('):
+            node = self.parse_or()
+            self.expect('punct', ')')
+            return node
+        return self.parse_clause()
+
+    def parse_clause(self):
+        kind, field = self.next()
+        if kind not in ('word', 'string'):
+            raise JqlError(f"Expected field name, got {field!r}")
+
+        kind, op = self.peek()
+        if kind == 'op':
+            self.position += 1
+        elif (kind, op) == ('keyword', 'IN'):
+            self.position += 1
+            op = 'in'
+        elif (kind, op) == ('keyword', 'NOT') and self.peek(1) == ('keyword', 'IN'):
+            self.position += 2
+            op = 'not in'
+        elif (kind, op) == ('keyword', 'IS'):
+            self.position += 1
+            op = 'is not' if self.accept('keyword', 'NOT') else 'is'
+            if not (self.accept('keyword', 'EMPTY') or self.accept('keyword', 'NULL')):
+                raise JqlError("Expected EMPTY after IS")
+            return ClauseNode(field, op, [])
+        else:
+            raise JqlError(f"Expected operator after {field!r}, got {op!r}")
+
+        if op in ('in', 'not in') and self.peek() == ('punct', '('):
+            values = self.parse_list()
+        else:
+            values = [self.parse_value()]
+
+        if field.lower() == 'filter':
+            if op not in ('=', '!=', 'in'):
+                raise JqlError(f"Unsupported operator for filter: {op}")
+            filters = [FilterNode(value) for value in values]
+            node = filters[0] if len(filters) == 1 else OrNode(filters)
+            return NotNode(node) if op == '!=' else node
+
+        return ClauseNode(field, op, values)
+
+    def parse_list(self):
+        self.expect('punct', '(')
+        values = []
+        if self.accept('punct', ')'):
+            return values
+        values.append(self.parse_value())
+        while self.accept('punct', ','):
+            values.append(self.parse_value())
+        self.expect('punct', ')')
+        return values
+
+    def parse_value(self):
+        kind, value = self.next()
+        if kind == 'word' and self.peek() == ('punct', '('):
+            return FunctionValue(value, self.parse_list())
+        if kind in ('word', 'string'):
+            return value
+        if kind == 'keyword' and value in ('EMPTY', 'NULL'):
+            return ''
+        raise JqlError(f"Expected value, got {value!r}")
+
+
+def parse_jql(jql):
+    """
+    Parse a query
+
+    Args:
+        jql (str): Query text
+
+    Returns:
+        Node: Query tree
+
+    Raises:
+        JqlError: If the query cannot be parsed
+    """
+    return Parser(jql or '').parse()
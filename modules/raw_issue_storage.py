@@ -0,0 +1,349 @@
+"""
+Storage of raw issue snapshots (raw_issues.json) with every issue body stored once.
+
+Snapshots hold several named issue lists (filtered_issues, all_implementation_issues,
+additional_data.clm_issues, ...) that overlap heavily - without a date filter the
+first two are the same list. The format stores a table of issue bodies keyed by
+issue key and the lists as key references:
+
+    {
+        "format": "issue_refs",
+        "format_version": 2,
+        "issues": {"PRJ-1": {...}, "PRJ-2": {...}},
+        "lists": {"filtered_issues": {"$refs": ["PRJ-1"]},
+                  "all_implementation_issues": {"$refs": ["PRJ-1", "PRJ-2"]}, ...}
+    }
+
+If the same key occurs with different bodies (e.g. fetched with other fields or
+at another time), the second body gets its own reference "<key>@<updated>".
+
+A reference file has "source" instead of "issues" and resolves its keys against
+the issue table of another snapshot in the same folder.
+
+save_raw_issues() writes lists that are already in memory. RawIssueWriter writes
+a snapshot while its lists are streamed: every body goes to the file when it is
+added and only the references (and a digest per body) are kept.
+
+Snapshots are written compressed (raw_issues.json.gz or .zst, see
+modules/snapshot_storage.py). load_raw_issues() takes the plain path, finds the
+file actually present and returns the original structure for both this format
+and the old plain JSON (a dictionary of lists or a single list), so readers do
+not need to know which one a folder contains.
+"""
+import os
+import json
+import hashlib
+import logging
+
+from modules.snapshot_storage import write_json_snapshot, read_json_snapshot, find_snapshot, JsonSnapshotWriter
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+RAW_ISSUES_FORMAT = 'issue_refs'
+RAW_ISSUES_FORMAT_VERSION = 2
+
+# Marker of a list of references in the "lists" structure
+REFS_KEY = '$refs'
+
+
+class IssueTable:
+    """Issue bodies keyed by reference, filled while lists are converted to references"""
+
+    def __init__(self):
+        self.issues = {}
+        # id() of an added body -> reference, the same object is not compared again
+        self._refs_by_id = {}
+
+    def add(self, issue):
+        """
+        Add an issue body
+
+        Args:
+            issue (dict): Issue dictionary
+
+        Returns:
+            str: Reference of the body
+        """
+        ref = self._refs_by_id.get(id(issue))
+        if ref is not None:
+            return ref
+
+        ref = new_reference(issue, len(self.issues),
+                            lambda candidate: candidate in self.issues and self.issues[candidate] != issue)
+        self.issues.setdefault(ref, issue)
+        self._refs_by_id[id(issue)] = ref
+        return ref
+
+
+class RawIssueWriter:
+    """
+    Raw issues snapshot written while its lists are streamed.
+
+    Bodies are written to the file as they are added, so memory holds only the
+    references and a digest of every stored body (to tell a second body of the
+    same key from a repeated one):
+
+        writer = RawIssueWriter(path, ['filtered_issues', 'all_implementation_issues'])
+        for issue in issues:
+            writer.add(issue, 'filtered_issues', 'all_implementation_issues')
+        writer.close()
+
+    List names with dots are nested ('additional_data.clm_issues'). Used as a
+    context manager the snapshot is closed at the end of the block, or dropped
+    if the block raises.
+    """
+
+    def __init__(self, path, list_names):
+        """
+        Start the snapshot
+
+        Args:
+            path (str): Output file path
+            list_names (list): Names of the lists of the snapshot, in output order
+        """
+        self.path = path
+        self.stats = None
+        self._refs = {name: [] for name in list_names}
+        self._digests = {}
+        self._snapshot = JsonSnapshotWriter(path)
+        self._snapshot.write(f'{{"format":"{RAW_ISSUES_FORMAT}","format_version":{RAW_ISSUES_FORMAT_VERSION},"issues":{{')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._snapshot.abort()
+        return False
+
+    def add(self, issue, *list_names):
+        """
+        Add an issue to lists of the snapshot
+
+        Args:
+            issue (dict): Issue dictionary
+            *list_names: Lists the issue belongs to
+
+        Returns:
+            str: Reference of the body
+        """
+        body = json.dumps(issue, ensure_ascii=False, separators=(',', ':'))
+        digest = hashlib.sha1(body.encode('utf-8')).digest()
+        ref = new_reference(issue, len(self._digests),
+                            lambda candidate: self._digests.get(candidate, digest) != digest)
+
+        if ref not in self._digests:
+            separator = ',' if self._digests else ''
+            self._digests[ref] = digest
+            self._snapshot.write(f'{separator}{json.dumps(ref, ensure_ascii=False)}:{body}')
+
+        for name in list_names:
+            self._refs[name].append(ref)
+        return ref
+
+    def extend(self, issues, *list_names):
+        """Add issues to lists of the snapshot"""
+        for issue in issues:
+            self.add(issue, *list_names)
+
+    def close(self):
+        """
+        Finish the snapshot
+
+        Returns:
+            dict: Statistics - written file path, number of stored bodies and of list entries
+        """
+        lists = self._nested_lists(self._refs)
+        self._snapshot.write('},"lists":' + json.dumps(lists, ensure_ascii=False, separators=(',', ':')) + '}')
+        path = self._snapshot.close()
+
+        entries = _count_references(lists)
+        logger.info(f"Saved {len(self._digests)} issue bodies for {entries} list entries to {path}")
+        self.stats = {'path': path, 'issues': len(self._digests), 'entries': entries}
+        return self.stats
+
+    def save_refs(self, path, list_name):
+        """
+        Save one list of the snapshot as a reference file (bodies stay in this snapshot)
+
+        Args:
+            path (str): Output file path
+            list_name (str): Name of the list
+        """
+        _write_reference_snapshot(path, self.path, {REFS_KEY: list(self._refs[list_name])})
+
+    @staticmethod
+    def _nested_lists(refs):
+        lists = {}
+        for name, list_refs in refs.items():
+            *parents, leaf = name.split('.')
+            target = lists
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[leaf] = {REFS_KEY: list_refs}
+        return lists
+
+
+def new_reference(issue, index, is_taken):
+    """
+    Choose the reference of an issue body in an issue table
+
+    Args:
+        issue (dict): Issue dictionary
+        index (int): Number of bodies in the table (for issues without key and ID)
+        is_taken (callable): True if a reference holds another body than this one
+
+    Returns:
+        str: The issue key, or "<key>@<updated>" (with a "#<n>" suffix if needed) when
+             the key already holds another body
+    """
+    key = issue.get('key') or issue.get('id') or f'#{index}'
+    ref = key
+    if is_taken(ref):
+        updated = issue.get('fields', {}).get('updated')
+        ref = f'{key}@{updated}' if updated else f'{key}@'
+        suffix = 1
+        base_ref = ref
+        while is_taken(ref):
+            suffix += 1
+            ref = f'{base_ref}#{suffix}'
+    return ref
+
+
+def is_issue_list(value):
+    """Whether a value is a list of issue dictionaries"""
+    return isinstance(value, list) and all(isinstance(item, dict) and 'key' in item for item in value)
+
+
+def to_references(data, table):
+    """
+    Replace issue lists in a snapshot structure with lists of references
+
+    Args:
+        data: Snapshot structure (dictionary of lists, possibly nested, or a list of issues)
+        table (IssueTable): Table receiving the bodies
+
+    Returns:
+        Structure of the same shape with reference lists
+    """
+    if is_issue_list(data):
+        return {REFS_KEY: [table.add(issue) for issue in data]}
+    if isinstance(data, dict):
+        return {name: to_references(value, table) for name, value in data.items()}
+    return data
+
+
+def from_references(lists, issues):
+    """
+    Materialize reference lists back into issue lists
+
+    Args:
+        lists: Structure with reference lists
+        issues (dict): Issue bodies by reference
+
+    Returns:
+        Structure with issue lists
+    """
+    if isinstance(lists, dict) and REFS_KEY in lists:
+        materialized = []
+        for ref in lists[REFS_KEY]:
+            issue = issues.get(ref)
+            if issue is None:
+                logger.warning(f"Issue {ref} referenced in raw issues snapshot is missing")
+                continue
+            materialized.append(issue)
+        return materialized
+    if isinstance(lists, dict):
+        return {name: from_references(value, issues) for name, value in lists.items()}
+    return lists
+
+
+def save_raw_issues(path, data):
+    """
+    Save a raw issues snapshot with every issue body stored once
+
+    Args:
+        path (str): Output file path
+        data: Dictionary of (possibly nested) issue lists or a list of issues
+
+    Returns:
+        dict: Statistics - written file path, number of stored bodies and of list entries
+    """
+    table = IssueTable()
+    lists = to_references(data, table)
+    snapshot = {
+        'format': RAW_ISSUES_FORMAT,
+        'format_version': RAW_ISSUES_FORMAT_VERSION,
+        'issues': table.issues,
+        'lists': lists
+    }
+    path = write_json_snapshot(path, snapshot)
+
+    entries = _count_references(lists)
+    logger.info(f"Saved {len(table.issues)} issue bodies for {entries} list entries to {path}")
+    return {'path': path, 'issues': len(table.issues), 'entries': entries}
+
+
+def load_raw_issues(path):
+    """
+    Load a raw issues snapshot in any supported format
+
+    Args:
+        path (str): Snapshot file path, with or without the compression suffix
+
+    Returns:
+        Original structure: dictionary of issue lists or a list of issues
+    """
+    data = read_json_snapshot(find_raw_issues(path) or path)
+
+    if not is_reference_snapshot(data):
+        return data
+
+    issues = data.get('issues')
+    if issues is None and data.get('source'):
+        source_path = os.path.join(os.path.dirname(path), data['source'])
+        issues = read_json_snapshot(find_raw_issues(source_path) or source_path).get('issues', {})
+    return from_references(data.get('lists'), issues or {})
+
+
+def find_raw_issues(path):
+    """
+    Find the file of a raw issues snapshot
+
+    Args:
+        path (str): Plain snapshot path, e.g. '<folder>/raw_issues.json'
+
+    Returns:
+        str: Path of the compressed or plain file present, or None
+    """
+    if os.path.exists(path) and not path.endswith('.json'):
+        return path
+    return find_snapshot(path)
+
+
+def is_reference_snapshot(data):
+    """Whether loaded JSON is a snapshot in the issue_refs format"""
+    return isinstance(data, dict) and data.get('format') == RAW_ISSUES_FORMAT
+
+
+def _write_reference_snapshot(path, source_path, lists):
+    snapshot = {
+        'format': RAW_ISSUES_FORMAT,
+        'format_version': RAW_ISSUES_FORMAT_VERSION,
+        'source': os.path.basename(source_path),
+        'lists': lists
+    }
+    path = write_json_snapshot(path, snapshot)
+    logger.info(f"Saved {_count_references(lists)} issue references to {path} (bodies in {source_path})")
+
+
+def _count_references(lists):
+    if isinstance(lists, dict) and REFS_KEY in lists:
+        return len(lists[REFS_KEY])
+    if isinstance(lists, dict):
+        return sum(_count_references(value) for value in lists.values())
+    return 0
+
@@ -0,0 +1,221 @@
+"""
+In-process LRU cache of parsed snapshot files of analyses and dashboard days.
+
+Views and drill-down endpoints read the same files again and again
+(clm_issue_keys.json, chart_data.json, metrics, raw issues, DataFrame
+snapshots). The cache keeps the parsed objects keyed by file path, checked
+against the file's modification time and size on every access, so a rewritten
+file is parsed again. Least recently used entries are evicted when the
+estimated memory use of all entries exceeds SNAPSHOT_CACHE_MAX_BYTES:
+
+    parsed JSON       - sys.getsizeof of the dicts, lists, strings and numbers
+                        of the object (a parsed file takes several times the
+                        size of its JSON text; long lists are sampled)
+    DataFrames        - deep memory usage of the frame
+
+Returned objects are shared between requests and must not be modified;
+callers that change them work on a copy.
+"""
+import os
+import sys
+import json
+import logging
+import threading
+from collections import OrderedDict
+
+from modules.raw_issue_storage import load_raw_issues, find_raw_issues
+from modules.snapshot_storage import load_frame, find_snapshot
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+# Default settings (can be overridden in config.py)
+DEFAULT_SNAPSHOT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+try:
+    import config
+
+    SNAPSHOT_CACHE_MAX_BYTES = getattr(config, 'SNAPSHOT_CACHE_MAX_BYTES', DEFAULT_SNAPSHOT_CACHE_MAX_BYTES)
+except ImportError:
+    SNAPSHOT_CACHE_MAX_BYTES = DEFAULT_SNAPSHOT_CACHE_MAX_BYTES
+
+# Items of a long list weighed to estimate the memory of the whole list
+WEIGHT_SAMPLE_SIZE = 64
+
+
+class SnapshotCache:
+    """LRU of parsed files keyed by path and variant, valid while the file's mtime and size are unchanged"""
+
+    def __init__(self, max_bytes=None):
+        """
+        Initialize the cache
+
+        Args:
+            max_bytes (int): Size budget of all entries (SNAPSHOT_CACHE_MAX_BYTES if None, 0 disables caching)
+        """
+        self.max_bytes = SNAPSHOT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path, loader, weigher=None, variant=None):
+        """
+        Get the parsed content of a file, loading it on a miss
+
+        Args:
+            path (str): File the content is parsed from
+            loader (callable): Parses the file, called without arguments
+            weigher (callable): Estimated memory use of a loaded value (_object_weight if None)
+            variant: Part of the key for different views of one file (e.g. a column list)
+
+        Returns:
+            Loaded value
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Missing files are not cached, the loader reports them as usual
+            return loader()
+
+        key = (os.path.abspath(path), variant)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = loader()
+        weight = (weigher or _object_weight)(value)
+        if weight > self.max_bytes:
+            return value
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[2]
+            self._entries[key] = (version, value, weight)
+            self._size += weight
+            while self._size > self.max_bytes and self._entries:
+                evicted_key, evicted = self._entries.popitem(last=False)
+                self._size -= evicted[2]
+                logger.debug(f"Evicted {evicted_key[0]} from snapshot cache")
+        return value
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get_stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Entries, size in bytes, budget, hits and misses
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+def _object_weight(value):
+    # Memory of a parsed JSON object: every container and value is counted, keys are not
+    # (the JSON decoder shares one string per distinct key). Long lists (e.g. of issues)
+    # are weighed by an evenly spaced sample of their items
+    if value is None or value is True or value is False:
+        return 0
+    size = sys.getsizeof(value)
+    if type(value) is dict:
+        return size + sum(_object_weight(item) for item in value.values())
+    if type(value) is list:
+        count = len(value)
+        if count > WEIGHT_SAMPLE_SIZE:
+            sample = [value[i * count // WEIGHT_SAMPLE_SIZE] for i in range(WEIGHT_SAMPLE_SIZE)]
+            return size + sum(_object_weight(item) for item in sample) * count // WEIGHT_SAMPLE_SIZE
+        return size + sum(_object_weight(item) for item in value)
+    return size
+
+
+def _frame_weight(df):
+    if df is None:
+        return 0
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_snapshot_cache():
+    """
+    Get the shared snapshot cache
+
+    Returns:
+        SnapshotCache: Cache shared by all routes of the process
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SnapshotCache()
+    return _cache
+
+
+def load_json_cached(path):
+    """
+    Load a JSON file through the snapshot cache
+
+    Args:
+        path (str): JSON file path
+
+    Returns:
+        Parsed JSON (shared, do not modify)
+    """
+    def load():
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    return get_snapshot_cache().get(path, load)
+
+
+def load_raw_issues_cached(path):
+    """
+    Load a raw issues snapshot through the snapshot cache
+
+    Args:
+        path (str): Snapshot path, with or without the compression suffix
+
+    Returns:
+        Original structure: dictionary of issue lists or a list of issues (shared, do not modify)
+    """
+    file_path = find_raw_issues(path) or path
+    return get_snapshot_cache().get(file_path, lambda: load_raw_issues(path))
+
+
+def load_frame_cached(base_path, columns=None):
+    """
+    Load a DataFrame snapshot through the snapshot cache
+
+    Args:
+        base_path (str): Path without suffix, e.g. '<analysis>/data/raw_data'
+        columns (list): Columns to load (all if None)
+
+    Returns:
+        pandas.DataFrame: Loaded data (shared, do not modify) or None if there is no snapshot
+    """
+    file_path = find_snapshot(base_path)
+    if file_path is None:
+        return None
+    variant = tuple(columns) if columns is not None else None
+    return get_snapshot_cache().get(file_path, lambda: load_frame(base_path, columns), _frame_weight, variant)
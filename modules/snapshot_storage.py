@@ -0,0 +1,381 @@
+"""
+Compressed snapshot files of analysis data: processed DataFrames and raw issue JSON.
+
+Processed DataFrames (data/raw_data) are stored in a columnar format so readers
+can load only the columns they need:
+    parquet  - Parquet via pyarrow, if installed
+    columns  - compressed JSON Lines: a header line with the row count and
+               column dtypes, then one JSON array of values per column.
+               A reader decodes only the lines of the requested columns.
+
+JSON documents (raw issue snapshots) are compressed with zstd if the
+zstandard package is installed, otherwise with gzip.
+
+Old analyses keep plain JSON files (data/raw_data.json written by df.to_json,
+raw_issues.json); find_snapshot() and the loaders accept both, and index.json
+records the snapshot format version of an analysis.
+"""
+import os
+import io
+import gzip
+import json
+import logging
+
+import pandas as pd
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow  # noqa: F401
+    import pyarrow.parquet as pq
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# Version of the snapshot layout of an analysis folder, recorded in index.json
+SNAPSHOT_FORMAT_VERSION = 3
+
+# Default settings (can be overridden in config.py)
+# 'auto' - Parquet if pyarrow is installed, otherwise compressed column lines
+DEFAULT_SNAPSHOT_FRAME_FORMAT = 'auto'
+# 'auto' - zstd if zstandard is installed, otherwise gzip; 'none' - plain files
+DEFAULT_SNAPSHOT_COMPRESSION = 'auto'
+DEFAULT_SNAPSHOT_GZIP_LEVEL = 3
+
+try:
+    import config
+
+    SNAPSHOT_FRAME_FORMAT = getattr(config, 'SNAPSHOT_FRAME_FORMAT', DEFAULT_SNAPSHOT_FRAME_FORMAT)
+    SNAPSHOT_COMPRESSION = getattr(config, 'SNAPSHOT_COMPRESSION', DEFAULT_SNAPSHOT_COMPRESSION)
+    SNAPSHOT_GZIP_LEVEL = getattr(config, 'SNAPSHOT_GZIP_LEVEL', DEFAULT_SNAPSHOT_GZIP_LEVEL)
+except ImportError:
+    SNAPSHOT_FRAME_FORMAT = DEFAULT_SNAPSHOT_FRAME_FORMAT
+    SNAPSHOT_COMPRESSION = DEFAULT_SNAPSHOT_COMPRESSION
+    SNAPSHOT_GZIP_LEVEL = DEFAULT_SNAPSHOT_GZIP_LEVEL
+
+COLUMNS_FORMAT = 'columns'
+
+# File suffixes by compression
+COMPRESSION_SUFFIXES = {'zstd': '.zst', 'gzip': '.gz', 'none': ''}
+
+
+def get_compression():
+    """
+    Get the compression used for new snapshot files
+
+    Returns:
+        str: 'zstd', 'gzip' or 'none'
+    """
+    compression = SNAPSHOT_COMPRESSION
+    if compression == 'auto':
+        return 'zstd' if HAS_ZSTD else 'gzip'
+    if compression == 'zstd' and not HAS_ZSTD:
+        logger.warning("zstandard is not installed, snapshots are compressed with gzip")
+        return 'gzip'
+    if compression not in COMPRESSION_SUFFIXES:
+        logger.warning(f"Unknown snapshot compression '{compression}', using gzip")
+        return 'gzip'
+    return compression
+
+
+def get_frame_format():
+    """
+    Get the file format used for new DataFrame snapshots
+
+    Returns:
+        str: 'parquet' or 'columns'
+    """
+    frame_format = SNAPSHOT_FRAME_FORMAT
+    if frame_format == 'auto':
+        return 'parquet' if HAS_PYARROW else COLUMNS_FORMAT
+    if frame_format == 'parquet' and not HAS_PYARROW:
+        logger.warning("pyarrow is not installed, DataFrame snapshots are saved as compressed column lines")
+        return COLUMNS_FORMAT
+    return frame_format if frame_format in ('parquet', COLUMNS_FORMAT) else COLUMNS_FORMAT
+
+
+def open_snapshot(path, binary=False):
+    """
+    Open a snapshot file for reading, decompressed according to its suffix
+
+    Args:
+        path (str): File path ending with .zst, .gz or a plain suffix
+        binary (bool): Return a binary instead of a text file object
+
+    Returns:
+        File object
+    """
+    if path.endswith('.gz'):
+        f = gzip.open(path, 'rb')
+    elif path.endswith('.zst'):
+        if not HAS_ZSTD:
+            raise RuntimeError(f"zstandard is required to read {path}")
+        f = zstandard.open(path, 'rb')
+    else:
+        f = open(path, 'rb')
+    return f if binary else io.TextIOWrapper(f, encoding='utf-8')
+
+
+def find_snapshot(base_path):
+    """
+    Find an existing snapshot file by its path without format suffixes
+
+    Args:
+        base_path (str): Path such as '<folder>/raw_issues.json' or '<folder>/data/raw_data'
+
+    Returns:
+        str: Path of the existing file or None
+    """
+    stem = base_path[:-len('.json')] if base_path.endswith('.json') else base_path
+    candidates = [f'{stem}.parquet']
+    for suffix in ('.zst', '.gz'):
+        candidates.append(f'{stem}.jsonl{suffix}')
+        candidates.append(f'{stem}.json{suffix}')
+    candidates.append(f'{stem}.json')
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def write_json_snapshot(path, data):
+    """
+    Write a compressed compact JSON document
+
+    Args:
+        path (str): Path without compression suffix, e.g. '<folder>/raw_issues.json'
+        data: JSON-serializable data
+
+    Returns:
+        str: Path of the written file
+    """
+    base_path = path
+    path = base_path + COMPRESSION_SUFFIXES[get_compression()]
+    temp_path = f'{path}.tmp'
+    # One buffer: json.dump() to a file writes many small chunks, which is slow through a compressor
+    content = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    with _open_temp(path, temp_path, binary=True) as f:
+        f.write(content)
+    os.replace(temp_path, path)
+    _remove_stale_snapshots(base_path, path)
+    return path
+
+
+class JsonSnapshotWriter:
+    """
+    Compressed JSON document written in parts, for documents too large to be built in memory.
+    The text is buffered and the file replaces an older snapshot on close().
+    """
+
+    BUFFER_SIZE = 1 << 20
+
+    def __init__(self, path):
+        """
+        Open the temporary file of the snapshot
+
+        Args:
+            path (str): Path without compression suffix, e.g. '<folder>/raw_issues.json'
+        """
+        self.base_path = path
+        self.path = path + COMPRESSION_SUFFIXES[get_compression()]
+        self._temp_path = f'{self.path}.tmp'
+        self._file = _open_temp(self.path, self._temp_path, binary=True)
+        self._buffer = []
+        self._buffered = 0
+
+    def write(self, text):
+        """Append JSON text to the document"""
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.BUFFER_SIZE:
+            self._flush()
+
+    def close(self):
+        """
+        Finish the document and move it into place
+
+        Returns:
+            str: Path of the written file
+        """
+        self._flush()
+        self._file.close()
+        os.replace(self._temp_path, self.path)
+        _remove_stale_snapshots(self.base_path, self.path)
+        return self.path
+
+    def abort(self):
+        """Drop the unfinished document, an older snapshot stays in place"""
+        self._file.close()
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+
+    def _flush(self):
+        # Compressors are slow with many small writes, so the buffer goes out in one piece
+        if self._buffer:
+            self._file.write(''.join(self._buffer).encode('utf-8'))
+            self._buffer = []
+            self._buffered = 0
+
+
+def read_json_snapshot(path):
+    """
+    Read a JSON document written by write_json_snapshot() or plain JSON
+
+    Args:
+        path (str): File path
+
+    Returns:
+        Loaded data
+    """
+    with open_snapshot(path, binary=True) as f:
+        return json.loads(f.read())
+
+
+def save_frame(base_path, df):
+    """
+    Save a processed DataFrame as a columnar snapshot
+
+    Args:
+        base_path (str): Path without suffix, e.g. '<analysis>/data/raw_data'
+        df (pandas.DataFrame): Data to save
+
+    Returns:
+        str: Path of the written file
+    """
+    frame_format = get_frame_format()
+    if frame_format == 'parquet':
+        path = f'{base_path}.parquet'
+        temp_path = f'{path}.tmp'
+        df.to_parquet(temp_path, index=False)
+    else:
+        path = f'{base_path}.jsonl' + COMPRESSION_SUFFIXES[get_compression()]
+        temp_path = f'{path}.tmp'
+        with _open_temp(path, temp_path) as f:
+            _write_columns(f, df)
+    os.replace(temp_path, path)
+    logger.info(f"Saved {len(df)} rows with {len(df.columns)} columns to {path}")
+    return path
+
+
+def load_frame(base_path, columns=None):
+    """
+    Load a DataFrame snapshot, reading only the requested columns if possible
+
+    Args:
+        base_path (str): Path without suffix, e.g. '<analysis>/data/raw_data'
+        columns (list): Columns to load (all if None); missing columns are skipped
+
+    Returns:
+        pandas.DataFrame: Loaded data or None if there is no snapshot
+    """
+    path = find_snapshot(base_path)
+    if path is None:
+        return None
+
+    if path.endswith('.parquet'):
+        if not HAS_PYARROW:
+            raise RuntimeError(f"pyarrow is required to read {path}")
+        if columns is not None:
+            available = pq.read_schema(path).names
+            columns = [column for column in columns if column in available]
+        return pd.read_parquet(path, columns=columns)
+
+    if '.jsonl' in os.path.basename(path):
+        with open_snapshot(path) as f:
+            return _read_columns(f, columns)
+
+    # Old analyses: row records written by df.to_json(orient='records')
+    df = pd.read_json(path, orient='records', convert_dates=False)
+    if columns is not None:
+        df = df[[column for column in columns if column in df.columns]]
+    if 'created_date' in df.columns:
+        df['created_date'] = pd.to_datetime(df['created_date'], utc=True, errors='coerce')
+    return df
+
+
+def _remove_stale_snapshots(base_path, path):
+    # A snapshot rewritten with other settings must not be shadowed by its old file
+    for suffix in COMPRESSION_SUFFIXES.values():
+        stale_path = base_path + suffix
+        if stale_path != path and os.path.exists(stale_path):
+            os.remove(stale_path)
+
+
+def _open_temp(path, temp_path, binary=False):
+    # Compression follows the final suffix, the temp file only adds '.tmp'
+    if path.endswith('.gz'):
+        f = gzip.open(temp_path, 'wb', compresslevel=SNAPSHOT_GZIP_LEVEL)
+    elif path.endswith('.zst'):
+        f = zstandard.open(temp_path, 'wb')
+    else:
+        f = open(temp_path, 'wb')
+    return f if binary else io.TextIOWrapper(f, encoding='utf-8')
+
+
+def _write_columns(f, df):
+    header = {
+        'format': COLUMNS_FORMAT,
+        'format_version': SNAPSHOT_FORMAT_VERSION,
+        'rows': len(df),
+        'columns': [{'name': str(name), 'dtype': str(df[name].dtype)} for name in df.columns]
+    }
+    f.write(json.dumps(header, ensure_ascii=False) + '\n')
+    for name in df.columns:
+        f.write(json.dumps(_column_values(df[name]), ensure_ascii=False) + '\n')
+
+
+def _column_values(series):
+    if isinstance(series.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_any_dtype(series):
+        # Epoch nanoseconds: much cheaper to write and parse than ISO strings
+        values = series.astype('int64').astype(object)
+        return values.where(series.notna(), None).tolist()
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+    if series.dtype == object or pd.api.types.is_float_dtype(series):
+        # NaN is not valid JSON
+        return series.astype(object).where(series.notna(), None).tolist()
+    return series.tolist()
+
+
+def _read_columns(f, columns=None):
+    header = json.loads(f.readline())
+    wanted = set(columns) if columns is not None else None
+
+    data = {}
+    for column in header['columns']:
+        line = f.readline()
+        name = column['name']
+        if wanted is not None and name not in wanted:
+            # Skipped columns are not decoded
+            continue
+        data[name] = _restore_column(json.loads(line), column['dtype'])
+
+    df = pd.DataFrame(data, index=pd.RangeIndex(header.get('rows', 0)))
+    if columns is not None:
+        df = df[[column for column in columns if column in df.columns]]
+    return df
+
+
+def _restore_column(values, dtype):
+    if dtype.startswith('datetime64'):
+        series = pd.to_datetime(pd.Series(values, dtype='Int64'), unit='ns', utc=', ' in dtype)
+        timezone = dtype[dtype.find(', ') + 2:-1] if ', ' in dtype else None
+        return series.dt.tz_convert(timezone) if timezone and timezone != 'UTC' else series
+    if dtype == 'category':
+        return pd.Series(values, dtype='category')
+    if dtype == 'bool':
+        return pd.Series(values, dtype=object).fillna(False).astype(bool)
+    if dtype.startswith('float'):
+        return pd.Series(values, dtype=dtype)
+    if dtype.startswith('int') and None not in values:
+        return pd.Series(values, dtype=dtype)
+    return pd.Series(values, dtype=object)
@@ -12,7 +12,8 @@ import logging
 from datetime import datetime, timedelta
 
 import pandas as pd
-import requests
+
+from .jira_client import get_jira_client
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +37,8 @@ class ClmStatusTransitioner:
         self.time_delay = time_delay
         self.running = False
         self.transition_thread = None
-        self.jira_url = 'https://jira.nexign.com'
-        logger.info(f"Initializing ClmErrorCreator with Jira URL: {self.jira_url}")
+        self.jira_url = clm_creator.jira_url
+        logger.info(f"Initializing ClmStatusTransitioner with Jira URL: {self.jira_url}")
 
         # Use token from config
         try:
@@ -60,6 +61,9 @@ class ClmStatusTransitioner:
             self.api_token = None
             self.headers = {}
 
+        # Shared pooled HTTP client (keep-alive, retries with backoff)
+        self.client = get_jira_client()
+
         # Initialize cache for field options to avoid repeated API calls
         self.field_options_cache = {}
         # Load subsystem mapping from Excel file
@@ -287,7 +291,7 @@ class ClmStatusTransitioner:
                     return field_mappings
 
                 url = f"{self.jira_url}/rest/api/2/field"
-                response = requests.get(
+                response = self.client.get(
                     url,
                     headers=self.headers,
                     timeout=30
@@ -371,7 +375,7 @@ class ClmStatusTransitioner:
                 url = f"{self.jira_url}/rest/api/2/field/{field_id}/option"
                 logger.info(f"Fetching options for field {field_id} from {url}")
 
-                response = requests.get(
+                response = self.client.get(
                     url,
                     headers=self.headers,
                     timeout=30
@@ -420,11 +424,8 @@ class ClmStatusTransitioner:
 
         while self.running:
             try:
-                # Get creation results
-                results = self.clm_creator.get_creation_results()
-
-                # Process each successful CLM Error creation
-                successful_results = [r for r in results if r.get('status') == 'success' and r.get('clm_error_key')]
+                # Get successful creations of the last 3 hours from the results index
+                successful_results = self.clm_creator.results_journal.get_recent_successes(max_hours=3)
                 logger.info(f"Found {len(successful_results)} successful CLM Error creations to check")
 
                 for result in successful_results:
@@ -543,7 +544,6 @@ class ClmStatusTransitioner:
             dict: Результат запроса в виде JSON или None в случае ошибки
         """
         try:
-            import requests
             import json
             import re
 
@@ -561,13 +561,13 @@ class ClmStatusTransitioner:
 
             # Выполняем запрос
             if method.upper() == 'GET':
-                response = requests.get(
+                response = self.client.get(
                     url,
                     headers=self.clm_creator.headers,
                     timeout=30
                 )
             elif method.upper() == 'POST':
-                response = requests.post(
+                response = self.client.post(
                     url,
                     headers=self.clm_creator.headers,
                     json=data,
@@ -668,7 +668,7 @@ class ClmStatusTransitioner:
             # Запрашиваем доступные опции для поля customfield_12408
             url = f"{self.clm_creator.jira_url}/rest/api/2/field/customfield_12408/option"
 
-            response = requests.get(
+            response = self.client.get(
                 url,
                 headers=self.clm_creator.headers,
                 timeout=30
@@ -807,17 +807,10 @@ class ClmStatusTransitioner:
                     source_issue_key = issue_key
                     logger.info(f"Issue {issue_key} is already a source issue (RMBSS)")
                 else:
-                    # Look for related RMBSS ticket in results_file
-                    results_file = os.path.join('data', 'clm_results', 'creation_results.json')
-                    if os.path.exists(results_file):
-                        with open(results_file, 'r', encoding='utf-8') as f:
-                            creation_results = json.load(f)
-                            # Find entry where clm_error_key matches our issue_key
-                            for result in creation_results:
-                                if result.get('clm_error_key') == issue_key:
-                                    source_issue_key = result.get('source_key')
-                                    logger.info(f"Found source issue {source_issue_key} for CLM Error {issue_key}")
-                                    break
+                    # Look for related RMBSS ticket in the creation results index
+                    source_issue_key = self.clm_creator.find_source_key(issue_key)
+                    if source_issue_key:
+                        logger.info(f"Found source issue {source_issue_key} for CLM Error {issue_key}")
 
                 # If we found the source ticket, try to get its component
                 if source_issue_key:
@@ -1039,7 +1032,7 @@ class ClmStatusTransitioner:
             url = f"{self.jira_url}/rest/api/2/issue/createmeta?projectKeys=CLM&issuetypeNames=Error&expand=projects.issuetypes.fields"
             logger.info(f"Fetching create metadata from {url}")
 
-            response = requests.get(
+            response = self.client.get(
                 url,
                 headers=self.headers,
                 timeout=30
@@ -1152,7 +1145,7 @@ class ClmStatusTransitioner:
                     return field_mappings
 
                 url = f"{self.jira_url}/rest/api/2/field"
-                response = requests.get(
+                response = self.client.get(
                     url,
                     headers=self.headers,
                     timeout=30
@@ -1277,14 +1270,7 @@ class ClmStatusTransitioner:
                 if issue_key.startswith('RMBSS-'):
                     source_issue_key = issue_key
                 else:
-                    results_file = os.path.join('data', 'clm_results', 'creation_results.json')
-                    if os.path.exists(results_file):
-                        with open(results_file, 'r', encoding='utf-8') as f:
-                            creation_results = json.load(f)
-                            for result in creation_results:
-                                if result.get('clm_error_key') == issue_key:
-                                    source_issue_key = result.get('source_key')
-                                    break
+                    source_issue_key = self.clm_creator.find_source_key(issue_key)
 
                 if source_issue_key:
                     # Get component from source issue
@@ -1385,14 +1371,7 @@ class ClmStatusTransitioner:
                 if issue_key.startswith('RMBSS-'):
                     source_issue_key = issue_key
                 else:
-                    results_file = os.path.join('data', 'clm_results', 'creation_results.json')
-                    if os.path.exists(results_file):
-                        with open(results_file, 'r', encoding='utf-8') as f:
-                            creation_results = json.load(f)
-                            for result in creation_results:
-                                if result.get('clm_error_key') == issue_key:
-                                    source_issue_key = result.get('source_key')
-                                    break
+                    source_issue_key = self.clm_creator.find_source_key(issue_key)
 
                 if source_issue_key:
                     # Get component from source issue
@@ -0,0 +1,526 @@
+"""
+Synthetic Jira issues at production scale and beyond.
+
+Builds CLM trees with the same topology the analyzers walk:
+    CLM --relates to--> EST
+    CLM --links CLM to--> Improvement/Analyzing from CLM --is realized in--> epics and stories
+    epic <--Epic Link-- stories <--parent-- subtasks
+Issues carry changelogs (status, estimate and sprint changes), worklogs,
+comments (some mentioning merge requests), attachments, remote links and sprints.
+
+The output has the shape of raw_issues.json written by the analysis, so it can be
+fed to the processing code, the benchmarks and the mock Jira server:
+    python generate_synthetic_issues.py --issues 100000 --output data/synthetic/raw_issues.json
+"""
+import os
+import json
+import zlib
+import shutil
+import random
+import logging
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_ISSUE_COUNT = 1000
+DEFAULT_SEED = 42
+DEFAULT_DAYS = 365
+DEFAULT_FILTERED_DAYS = 30
+
+EPIC_LINK_FIELD = 'customfield_10008'
+ESTIMATION_FIELD = 'customfield_12307'
+
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.000+0300'
+
+# Implementation projects and the EST components that map to them
+PROJECTS = [
+    "NBSSPORTAL", "NUS", "UDB", "CHM", "ATS", "SSO", "TUDBRES", "BFAM",
+    "SAM", "EPM", "MBUS", "TOMCAT", "TLRDAPIMF", "MCCA", "UFMNX", "LCM",
+    "DMS", "FIM", "COMMON", "TLRKCELL", "UZTK", "IOTCMPRTK", "IOTCMP"
+]
+
+# Status workflow: name -> (id, category key, category name)
+STATUSES = {
+    'New': ('10000', 'new', 'To Do'),
+    'Open': ('1', 'new', 'To Do'),
+    'In Progress': ('3', 'indeterminate', 'In Progress'),
+    'Reopened': ('4', 'indeterminate', 'In Progress'),
+    'Resolved': ('5', 'done', 'Done'),
+    'Closed': ('6', 'done', 'Done')
+}
+WORKFLOW = ['Open', 'In Progress', 'Resolved', 'Closed']
+
+# Share of issues that never left their initial status
+NO_TRANSITION_RATE = 0.15
+
+SPRINTS = [
+    {'id': 14638, 'name': 'NBSS 25Q1', 'state': 'closed'},
+    {'id': 14639, 'name': 'NBSS 25Q2', 'state': 'closed'},
+    {'id': 14640, 'name': 'NBSS 25Q3', 'state': 'active'},
+    {'id': 14641, 'name': 'NBSS 25Q4', 'state': 'future'}
+]
+
+USERS = [f'user{i:03d}' for i in range(1, 201)]
+
+LINK_TYPES = {
+    'Relates': {'id': '10000', 'name': 'Relates', 'inward': 'relates to', 'outward': 'relates to'},
+    'Realization': {'id': '10001', 'name': 'Realization', 'inward': 'realizes', 'outward': 'is realized in'},
+    'CLM': {'id': '10002', 'name': 'CLM', 'inward': 'is linked from CLM', 'outward': 'links CLM to'},
+    'Mentioned': {'id': '10004', 'name': 'Mentioned on', 'inward': 'mentioned on', 'outward': 'mentions'}
+}
+
+COMMENT_TEXTS = [
+    'Looks good to me',
+    'Please check the attached logs',
+    'Waiting for the customer answer',
+    'Estimate updated after analysis',
+    'Deployed to the test environment',
+    'Reproduced on the latest build',
+    'Can we discuss this at the daily meeting?',
+    'Done, please verify',
+    'Merge request created: !{n}',
+    'Fixed in SSO-{n}'
+]
+
+
+class SyntheticIssueGenerator:
+    """
+    Deterministic generator of synthetic Jira issues.
+
+    Every CLM tree is generated from its own seeded random generator, so the same
+    seed and size always produce the same issues and trees can be streamed
+    without keeping the whole data set in memory.
+    """
+
+    def __init__(self, issue_count=DEFAULT_ISSUE_COUNT, seed=DEFAULT_SEED, end_date=None, days=DEFAULT_DAYS,
+                 filtered_days=DEFAULT_FILTERED_DAYS, projects=None):
+        """
+        Initialize the generator
+
+        Args:
+            issue_count (int): Total number of issues (CLM, EST, Improvement and implementation)
+            seed (int): Random seed
+            end_date (datetime): Latest date of generated activity, now if None
+            days (int): Length of the generated history in days
+            filtered_days (int): Issues with worklogs in the last filtered_days days are 'filtered_issues'
+            projects (list): Implementation project keys
+        """
+        self.issue_count = issue_count
+        self.seed = seed
+        self.end_date = (end_date or datetime.now()).replace(microsecond=0)
+        self.start_date = self.end_date - timedelta(days=days)
+        self.filtered_since = self.end_date - timedelta(days=filtered_days)
+        self.projects = projects or PROJECTS
+        self.counters = {}
+        self.next_id = 100000
+
+    def _format_date(self, value):
+        return value.strftime(DATE_FORMAT)
+
+    def _new_key(self, project):
+        number = self.counters.get(project, 0) + 1
+        self.counters[project] = number
+        self.next_id += 1
+        return f'{project}-{number}', str(self.next_id)
+
+    def _random_date(self, rnd, start, end=None):
+        end = end or self.end_date
+        if end <= start:
+            return start
+        return start + timedelta(seconds=rnd.randint(0, int((end - start).total_seconds())))
+
+    def _user(self, rnd):
+        name = rnd.choice(USERS)
+        return {'name': name, 'key': name, 'displayName': name.capitalize()}
+
+    def _status(self, name):
+        status_id, category_key, category_name = STATUSES[name]
+        return {'id': status_id, 'name': name, 'statusCategory': {'key': category_key, 'name': category_name}}
+
+    def _make_issue(self, rnd, project, project_name, issue_type, summary, created, subtask=False):
+        """
+        Build an issue with status history, estimates, comments and attachments
+
+        Returns:
+            dict: Issue in Jira REST format (with changelog)
+        """
+        key, issue_id = self._new_key(project)
+        histories = []
+        history_date = created
+
+        # Status history along the workflow, some issues never moved
+        if rnd.random() < NO_TRANSITION_RATE:
+            status = rnd.choice(['New', 'Open'])
+        else:
+            steps = rnd.randint(1, len(WORKFLOW) - 1)
+            for step in range(steps):
+                history_date = self._random_date(rnd, history_date, min(self.end_date,
+                                                                       history_date + timedelta(days=30)))
+                histories.append({
+                    'id': str(rnd.randint(1, 10 ** 9)),
+                    'author': self._user(rnd),
+                    'created': self._format_date(history_date),
+                    'items': [{'field': 'status', 'fieldtype': 'jira',
+                               'from': STATUSES[WORKFLOW[step]][0], 'fromString': WORKFLOW[step],
+                               'to': STATUSES[WORKFLOW[step + 1]][0], 'toString': WORKFLOW[step + 1]}]
+                })
+            status = WORKFLOW[steps]
+            if status == 'In Progress' and rnd.random() < 0.05:
+                status = 'Reopened'
+
+        # Original estimate, sometimes changed after creation
+        estimate = rnd.choice([None, 3600 * 4, 3600 * 8, 3600 * 16, 3600 * 40, 3600 * 80])
+        if estimate and rnd.random() < 0.3:
+            old_estimate = max(3600, estimate - rnd.choice([3600 * 4, 3600 * 8]))
+            histories.append({
+                'id': str(rnd.randint(1, 10 ** 9)),
+                'author': self._user(rnd),
+                'created': self._format_date(self._random_date(rnd, created)),
+                'items': [{'field': 'timeoriginalestimate', 'fieldtype': 'jira',
+                           'from': str(old_estimate), 'fromString': str(old_estimate),
+                           'to': str(estimate), 'toString': str(estimate)}]
+            })
+
+        # Sprint membership and its history
+        sprints = []
+        if not subtask and rnd.random() < 0.6:
+            sprints = [rnd.choice(SPRINTS)]
+            if rnd.random() < 0.3:
+                histories.append({
+                    'id': str(rnd.randint(1, 10 ** 9)),
+                    'author': self._user(rnd),
+                    'created': self._format_date(self._random_date(rnd, created)),
+                    'items': [{'field': 'Sprint', 'fieldtype': 'custom', 'from': None, 'fromString': None,
+                               'to': str(sprints[0]['id']), 'toString': sprints[0]['name']}]
+                })
+        histories.sort(key=lambda history: history['created'])
+
+        comments = []
+        for _ in range(rnd.choice([0, 0, 1, 2, 3, 5])):
+            comments.append({
+                'id': str(rnd.randint(1, 10 ** 9)),
+                'author': self._user(rnd),
+                'body': rnd.choice(COMMENT_TEXTS).format(n=rnd.randint(1, 99999)),
+                'created': self._format_date(self._random_date(rnd, created))
+            })
+
+        attachments = []
+        for index in range(rnd.choice([0, 0, 0, 1, 2])):
+            attachments.append({
+                'id': str(rnd.randint(1, 10 ** 9)),
+                'filename': f'{key.lower()}_{index}.log',
+                'size': rnd.randint(100, 10 ** 6),
+                'created': self._format_date(self._random_date(rnd, created))
+            })
+
+        updated = max([created] + [datetime.strptime(h['created'][:19], '%Y-%m-%dT%H:%M:%S') for h in histories])
+        fields = {
+            'summary': summary,
+            'description': f'{summary}. Generated issue.' if rnd.random() < 0.9 else None,
+            'project': {'id': str(zlib.crc32(project.encode('utf-8')) % 100000), 'key': project, 'name': project_name},
+            'issuetype': {'name': issue_type, 'subtask': subtask},
+            'status': self._status(status),
+            'created': self._format_date(created),
+            'updated': self._format_date(updated),
+            'resolutiondate': self._format_date(updated) if STATUSES[status][2] == 'Done' else None,
+            'timeoriginalestimate': estimate,
+            'timespent': None,
+            'components': [],
+            'labels': [],
+            'assignee': self._user(rnd),
+            'reporter': self._user(rnd),
+            'comment': {'comments': comments, 'total': len(comments), 'maxResults': len(comments), 'startAt': 0},
+            'attachment': attachments,
+            'issuelinks': [],
+            'subtasks': [],
+            'sprint': sprints,
+            'worklog': {'worklogs': [], 'total': 0, 'maxResults': 20, 'startAt': 0}
+        }
+        return {'id': issue_id, 'key': key, 'self': f'/rest/api/2/issue/{issue_id}',
+                'fields': fields, 'changelog': {'startAt': 0, 'total': len(histories), 'histories': histories}}
+
+    def _add_worklogs(self, rnd, issue, created):
+        """Log work on an issue and set its time spent"""
+        worklogs = []
+        # Work is logged within a few months after creation
+        last_day = min(self.end_date, created + timedelta(days=90))
+        for _ in range(rnd.choice([0, 1, 2, 3, 5, 8])):
+            seconds = rnd.choice([1800, 3600, 7200, 14400, 28800])
+            worklogs.append({
+                'id': str(rnd.randint(1, 10 ** 9)),
+                'author': self._user(rnd),
+                'started': self._format_date(self._random_date(rnd, created, last_day)),
+                'timeSpentSeconds': seconds
+            })
+        worklogs.sort(key=lambda worklog: worklog['started'])
+        fields = issue['fields']
+        fields['worklog'] = {'worklogs': worklogs, 'total': len(worklogs), 'maxResults': 20, 'startAt': 0}
+        fields['timespent'] = sum(worklog['timeSpentSeconds'] for worklog in worklogs) or None
+        if worklogs:
+            fields['updated'] = max(fields['updated'], worklogs[-1]['started'])
+
+    def _link(self, source, target, link_type):
+        """Link source (outward) to target (inward) on both issues"""
+        link = LINK_TYPES[link_type]
+        source['fields']['issuelinks'].append({'id': str(self.next_id), 'type': link,
+                                               'outwardIssue': self._ref(target)})
+        target['fields']['issuelinks'].append({'id': str(self.next_id), 'type': link,
+                                               'inwardIssue': self._ref(source)})
+
+    def _ref(self, issue):
+        fields = issue['fields']
+        return {'id': issue['id'], 'key': issue['key'],
+                'fields': {'summary': fields['summary'], 'status': fields['status'],
+                           'issuetype': fields['issuetype']}}
+
+    def make_tree(self, index, budget):
+        """
+        Generate one CLM tree
+
+        Args:
+            index (int): Tree number (selects the random generator)
+            budget (int): Maximum number of issues in the tree
+
+        Returns:
+            dict: Lists of issues by role: clm, est, improvement, implementation
+        """
+        rnd = random.Random(self.seed * 1000003 + index)
+        tree = {'clm': [], 'est': [], 'improvement': [], 'implementation': []}
+        created = self._random_date(rnd, self.start_date)
+        project = rnd.choice(self.projects)
+
+        clm = self._make_issue(rnd, 'CLM', 'CLM', 'Change Request', f'Customer request {index}', created)
+        tree['clm'].append(clm)
+        budget -= 1
+
+        if budget > 0:
+            est = self._make_issue(rnd, 'EST', 'Оценки CLM', 'Estimation', f'Estimation of CLM request {index}',
+                                   self._random_date(rnd, created, created + timedelta(days=7)))
+            est['fields']['components'] = [{'name': f'{project} Core'}]
+            est['fields'][ESTIMATION_FIELD] = rnd.choice([5, 10, 20, 40, 80])
+            self._link(clm, est, 'Relates')
+            tree['est'].append(est)
+            budget -= 1
+
+        if budget <= 0:
+            return tree
+
+        issue_type = 'Improvement from CLM' if rnd.random() < 0.8 else 'Analyzing from CLM'
+        improvement = self._make_issue(rnd, 'NBSS', 'NBSS', issue_type, f'Implementation of CLM request {index}',
+                                       self._random_date(rnd, created, created + timedelta(days=14)))
+        self._link(clm, improvement, 'CLM')
+        tree['improvement'].append(improvement)
+        budget -= 1
+
+        # Epic with stories, stories with subtasks
+        stories_count = rnd.randint(1, 8)
+        implementation = []
+        epic = None
+        if budget > 0:
+            epic_created = self._random_date(rnd, created, created + timedelta(days=30))
+            epic = self._make_issue(rnd, project, project, 'Epic', f'{project} changes for CLM request {index}',
+                                    epic_created)
+            self._link(improvement, epic, 'Realization')
+            implementation.append(epic)
+            budget -= 1
+
+        for story_index in range(stories_count):
+            if budget <= 0:
+                break
+            story_type = rnd.choice(['Story', 'Task', 'New Feature', 'Bug'])
+            story_created = self._random_date(rnd, created, created + timedelta(days=60))
+            story = self._make_issue(rnd, project, project, story_type,
+                                     f'{story_type} {story_index + 1} of CLM request {index}', story_created)
+            story['fields'][EPIC_LINK_FIELD] = epic['key']
+            if rnd.random() < 0.2:
+                self._link(improvement, story, 'Realization')
+            if rnd.random() < 0.05:
+                story['fields']['remotelinks'] = [{'relationship': 'mentioned in',
+                                                   'object': {'title': f'Merge request !{rnd.randint(1, 9999)}'}}]
+            if rnd.random() < 0.05:
+                self._link(story, {'id': '0', 'key': f'SSO-{rnd.randint(1, 99999)}',
+                                   'fields': {'summary': 'Merge request', 'status': self._status('Open'),
+                                              'issuetype': {'name': 'Task', 'subtask': False},
+                                              'issuelinks': []}}, 'Mentioned')
+            self._add_worklogs(rnd, story, story_created)
+            implementation.append(story)
+            budget -= 1
+
+            for subtask_index in range(rnd.choice([0, 1, 2, 3, 4])):
+                if budget <= 0:
+                    break
+                subtask_created = self._random_date(rnd, story_created, story_created + timedelta(days=30))
+                subtask = self._make_issue(rnd, project, project, 'Sub-task',
+                                           f'Sub-task {subtask_index + 1}: {story["fields"]["summary"]}', subtask_created,
+                                           subtask=True)
+                subtask['fields']['parent'] = self._ref(story)
+                story['fields']['subtasks'].append(self._ref(subtask))
+                self._add_worklogs(rnd, subtask, subtask_created)
+                implementation.append(subtask)
+                budget -= 1
+
+        tree['implementation'] = implementation
+        return tree
+
+    def iter_trees(self):
+        """
+        Generate CLM trees until issue_count issues are produced
+
+        Yields:
+            dict: Lists of issues by role: clm, est, improvement, implementation
+        """
+        self.counters = {}
+        self.next_id = 100000
+        remaining = self.issue_count
+        index = 0
+        while remaining > 0:
+            index += 1
+            tree = self.make_tree(index, remaining)
+            remaining -= sum(len(issues) for issues in tree.values())
+            yield tree
+
+    def iter_issues(self):
+        """
+        Generate all issues as one stream
+
+        Yields:
+            dict: Issue
+        """
+        for tree in self.iter_trees():
+            for role in ('clm', 'est', 'improvement', 'implementation'):
+                yield from tree[role]
+
+    def is_filtered(self, issue):
+        """Whether an implementation issue has worklogs in the filtered period (as 'filtered_issues')"""
+        since = self._format_date(self.filtered_since)
+        return any(worklog['started'] >= since
+                   for worklog in issue['fields'].get('worklog', {}).get('worklogs', []))
+
+    def generate(self):
+        """
+        Generate the data set in memory
+
+        Returns:
+            dict: Data in raw_issues.json format
+        """
+        result = {
+            'filtered_issues': [],
+            'all_implementation_issues': [],
+            'additional_data': {'clm_issues': [], 'est_issues': [], 'improvement_issues': []}
+        }
+        for tree in self.iter_trees():
+            self._collect_tree(tree, result)
+        return result
+
+    def _collect_tree(self, tree, result):
+        additional = result['additional_data']
+        additional['clm_issues'].extend(tree['clm'])
+        additional['est_issues'].extend(tree['est'])
+        additional['improvement_issues'].extend(tree['improvement'])
+        result['all_implementation_issues'].extend(tree['implementation'])
+        result['filtered_issues'].extend(issue for issue in tree['implementation'] if self.is_filtered(issue))
+
+    def write(self, path, indent=None):
+        """
+        Write the data set in raw_issues.json format.
+        Issues are streamed into one temporary file per list, so memory use does not grow with issue_count.
+
+        Args:
+            path (str): Output file path
+            indent (int): JSON indent of every issue (None - compact)
+
+        Returns:
+            dict: Number of issues per list
+        """
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        sections = ['filtered_issues', 'all_implementation_issues', 'clm_issues', 'est_issues', 'improvement_issues']
+        counts = dict.fromkeys(sections, 0)
+        temp_dir = tempfile.mkdtemp(dir=directory or None)
+        try:
+            files = {name: open(os.path.join(temp_dir, name), 'w', encoding='utf-8') for name in sections}
+            try:
+                for tree in self.iter_trees():
+                    section_issues = {
+                        'filtered_issues': [issue for issue in tree['implementation'] if self.is_filtered(issue)],
+                        'all_implementation_issues': tree['implementation'],
+                        'clm_issues': tree['clm'],
+                        'est_issues': tree['est'],
+                        'improvement_issues': tree['improvement']
+                    }
+                    for name, issues in section_issues.items():
+                        for issue in issues:
+                            if counts[name]:
+                                files[name].write(',\n')
+                            files[name].write(json.dumps(issue, ensure_ascii=False, indent=indent))
+                            counts[name] += 1
+            finally:
+                for f in files.values():
+                    f.close()
+
+            with open(path, 'w', encoding='utf-8') as out:
+                for position, name in enumerate(sections):
+                    if name == 'clm_issues':
+                        out.write(',\n"additional_data": {\n')
+                    elif position:
+                        out.write(',\n')
+                    out.write(f'"{name}": [\n' if position else f'{{\n"{name}": [\n')
+                    with open(os.path.join(temp_dir, name), 'r', encoding='utf-8') as f:
+                        shutil.copyfileobj(f, out)
+                    out.write('\n]')
+                out.write('\n}\n}\n')
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        logger.info(f"Wrote {sum(counts.values()) - counts['filtered_issues']} synthetic issues to {path}: {counts}")
+        return counts
+
+
+def generate_issues(issue_count, seed=DEFAULT_SEED, **kwargs):
+    """
+    Generate a synthetic data set in raw_issues.json format
+
+    Args:
+        issue_count (int): Total number of issues
+        seed (int): Random seed
+        **kwargs: Other SyntheticIssueGenerator arguments
+
+    Returns:
+        dict: Data in raw_issues.json format
+    """
+    return SyntheticIssueGenerator(issue_count, seed, **kwargs).generate()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic Jira issues in raw_issues.json format")
+    parser.add_argument("--issues", type=int, default=DEFAULT_ISSUE_COUNT,
+                        help=f"Total number of issues (default: {DEFAULT_ISSUE_COUNT})")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help="Length of the generated history in days")
+    parser.add_argument("--filtered-days", type=int, default=DEFAULT_FILTERED_DAYS,
+                        help="Issues with worklogs in this many last days go to filtered_issues")
+    parser.add_argument("--end-date", help="Latest activity date (YYYY-MM-DD), today if omitted")
+    parser.add_argument("--indent", type=int, default=None, help="JSON indent (compact if omitted)")
+    parser.add_argument("--output", default=os.path.join('data', 'synthetic', 'raw_issues.json'),
+                        help="Output file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Generate a data set from the command line"""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    end_date = datetime.strptime(args.end_date, '%Y-%m-%d') if args.end_date else None
+    generator = SyntheticIssueGenerator(args.issues, args.seed, end_date=end_date, days=args.days,
+                                        filtered_days=args.filtered_days)
+    generator.write(args.output, indent=args.indent)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,14 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
-from modules.data_processor import get_improved_open_statuses, get_status_categories, logger
+from modules.data_processor import get_improved_open_statuses, get_status_categories, count_values, logger
+from modules.closed_tasks import get_closed_tasks_without_activity
+from modules.raw_issue_storage import save_raw_issues
+from modules.snapshot_storage import save_frame, SNAPSHOT_FORMAT_VERSION
+from modules.catalog import record_analysis
 
 
-def create_visualizations(df, output_dir='jira_charts', logger=None, implementation_issues=None):
+def create_visualizations(df, output_dir='jira_charts', logger=None, implementation_issues=None, analyzer=None):
     """
     Create visualizations from processed data.
     Added chart for closed tasks without comments, attachments, links and merge request mentions.
@@ -21,6 +25,7 @@ def create_visualizations(df, output_dir='jira_charts', logger=None, implementat
         output_dir (str): Directory to save visualizations
         logger (logging.Logger): Logger instance
         implementation_issues (list): Raw issue data for detecting merge request mentions
+        analyzer (JiraAnalyzer): Analyzer for the JQL pushdown mode of the closed tasks chart
     """
     # Set default logger if none provided
     if logger is None:
@@ -50,7 +55,8 @@ def create_visualizations(df, output_dir='jira_charts', logger=None, implementat
     chart_paths.update(create_open_tasks_chart(df, output_dir, logger))
     chart_paths.update(create_closed_tasks_chart(df, output_dir, logger))
     # Add the new chart with implementation_issues parameter
-    chart_paths.update(create_closed_tasks_without_links_chart(df, output_dir, logger, implementation_issues))
+    chart_paths.update(create_closed_tasks_without_links_chart(df, output_dir, logger, implementation_issues,
+                                                               analyzer))
 
     # Generate summary statistics
     summary = {
@@ -118,7 +124,7 @@ def configure_axis(ax, rotation=45):
 def create_project_distribution_chart(df, output_dir):
     """Create project distribution chart"""
     plt.figure(figsize=(10, 6))
-    project_counts = df['project'].value_counts()
+    project_counts = count_values(df['project'])
     ax = sns.barplot(x=project_counts.index, y=project_counts.values)
     configure_axis(ax)
     plt.title('Распределение задач по проектам')
@@ -134,8 +140,8 @@ def create_project_distribution_chart(df, output_dir):
 def create_comparison_chart(df, output_dir):
     """Create comparison chart between estimate and time spent"""
     # Get data for projects
-    project_estimates = df.groupby('project')['original_estimate_hours'].sum().sort_values(ascending=False)
-    project_time_spent = df.groupby('project')['time_spent_hours'].sum().sort_values(ascending=False)
+    project_estimates = df.groupby('project', observed=True)['original_estimate_hours'].sum().sort_values(ascending=False)
+    project_time_spent = df.groupby('project', observed=True)['time_spent_hours'].sum().sort_values(ascending=False)
 
     plt.figure(figsize=(14, 8))
 
@@ -174,7 +180,7 @@ def create_comparison_chart(df, output_dir):
 
 def create_pie_chart(df, output_dir):
     """Create pie chart of project distribution"""
-    project_counts = df['project'].value_counts()
+    project_counts = count_values(df['project'])
 
     if len(project_counts) > 0:
         plt.figure(figsize=(10, 10))
@@ -205,8 +211,8 @@ def create_pie_chart(df, output_dir):
 def create_efficiency_chart(df, output_dir):
     """Create efficiency ratio chart"""
     # Get data for projects
-    project_estimates = df.groupby('project')['original_estimate_hours'].sum()
-    project_time_spent = df.groupby('project')['time_spent_hours'].sum()
+    project_estimates = df.groupby('project', observed=True)['original_estimate_hours'].sum()
+    project_time_spent = df.groupby('project', observed=True)['time_spent_hours'].sum()
 
     plt.figure(figsize=(12, 7))
     efficiency_df = pd.DataFrame({
@@ -255,7 +261,7 @@ def create_no_transitions_chart(df, output_dir, logger):
 
         if not no_transitions_tasks.empty:
             # Group by project
-            no_transitions_by_project = no_transitions_tasks.groupby('project').size().sort_values(ascending=False)
+            no_transitions_by_project = no_transitions_tasks.groupby('project', observed=True).size().sort_values(ascending=False)
             logger.info(f"NO TRANSITIONS TASKS BY PROJECT: {no_transitions_by_project.to_dict()}")
 
             if not no_transitions_by_project.empty:
@@ -297,7 +303,7 @@ def create_no_transitions_chart(df, output_dir, logger):
         no_transitions_data = {
             'count': len(no_transitions_tasks),
             'by_project': no_transitions_tasks.groupby(
-                'project').size().to_dict() if not no_transitions_tasks.empty else {}
+                'project', observed=True).size().to_dict() if not no_transitions_tasks.empty else {}
         }
 
         no_transitions_metrics_path = os.path.join(metrics_dir, 'no_transitions_tasks.json')
@@ -338,7 +344,7 @@ def create_open_tasks_chart(df, output_dir, logger):
         plt.figure(figsize=(12, 7))
 
         if not open_tasks_improved.empty:
-            open_tasks_by_project = open_tasks_improved.groupby('project')['time_spent_hours'].sum().sort_values(
+            open_tasks_by_project = open_tasks_improved.groupby('project', observed=True)['time_spent_hours'].sum().sort_values(
                 ascending=False)
             logger.info(f"OPEN TASKS BY PROJECT: {open_tasks_by_project.to_dict()}")
 
@@ -370,10 +376,10 @@ def create_open_tasks_chart(df, output_dir, logger):
             'count': int(len(open_tasks_improved)),
             'total_time_spent': float(
                 open_tasks_improved['time_spent_hours'].sum()) if not open_tasks_improved.empty else 0.0,
-            'by_project': open_tasks_improved.groupby('project')[
+            'by_project': open_tasks_improved.groupby('project', observed=True)[
                 'time_spent_hours'].sum().to_dict() if not open_tasks_improved.empty else {},
-            'task_statuses': open_tasks_improved[
-                'status'].value_counts().to_dict() if not open_tasks_improved.empty else {},
+            'task_statuses': count_values(
+                open_tasks_improved['status']).to_dict() if not open_tasks_improved.empty else {},
             'sample_tasks': open_tasks_improved['issue_key'].head(
                 10).tolist() if not open_tasks_improved.empty else []
         }
@@ -414,7 +420,7 @@ def create_closed_tasks_chart(df, output_dir, logger):
         plt.figure(figsize=(12, 7))
 
         if not closed_tasks.empty:
-            closed_tasks_by_project = closed_tasks.groupby('project').size().sort_values(ascending=False)
+            closed_tasks_by_project = closed_tasks.groupby('project', observed=True).size().sort_values(ascending=False)
             logger.info(f"CLOSED TASKS BY PROJECT: {closed_tasks_by_project.to_dict()}")
 
             if not closed_tasks_by_project.empty:
@@ -447,7 +453,7 @@ def create_closed_tasks_chart(df, output_dir, logger):
 
         closed_tasks_data = {
             'count': len(closed_tasks),
-            'by_project': closed_tasks.groupby('project').size().to_dict() if not closed_tasks.empty else {}
+            'by_project': closed_tasks.groupby('project', observed=True).size().to_dict() if not closed_tasks.empty else {}
         }
 
         closed_tasks_metrics_path = os.path.join(metrics_dir, 'closed_tasks.json')
@@ -464,7 +470,7 @@ def create_closed_tasks_chart(df, output_dir, logger):
     return chart_paths
 
 
-def create_closed_tasks_without_links_chart(df, output_dir, logger, implementation_issues=None):
+def create_closed_tasks_without_links_chart(df, output_dir, logger, implementation_issues=None, analyzer=None):
     """
     Create chart for closed tasks without comments, attachments, links, and merge request mentions
 
@@ -473,6 +479,7 @@ def create_closed_tasks_without_links_chart(df, output_dir, logger, implementati
         output_dir (str): Output directory for charts
         logger (logging.Logger): Logger instance
         implementation_issues (list): Raw issue data for detecting merge request mentions
+        analyzer (JiraAnalyzer): Analyzer for the JQL pushdown mode of modules/closed_tasks.py
 
     Returns:
         dict: Chart paths and metrics
@@ -482,58 +489,15 @@ def create_closed_tasks_without_links_chart(df, output_dir, logger, implementati
     remote_mentions_count = 0
 
     try:
-        # Get status categories
-        status_categories = get_status_categories(df)
-        closed_statuses = status_categories['closed_statuses']
-
-        # First, filter closed tasks without comments and attachments
-        pre_filtered_tasks = df[
-            df['status'].isin(closed_statuses) &
-            (~df['has_comments']) &
-            (~df['has_attachments']) &
-            (~df['has_links'])
-        ]
-
-        logger.info(f"Pre-filtered {len(pre_filtered_tasks)} closed tasks without comments, attachments, and links")
-
         # Always create a chart, even if empty
         plt.figure(figsize=(12, 7))
 
-        # Prepare closed tasks
-        closed_tasks = pre_filtered_tasks
-
-        # If implementation_issues are provided, check for remote mentions
-        if implementation_issues:
-            from modules.dashboard import has_remote_mentions
-
-            # Create mapping of issue keys to raw issues
-            issue_mapping = {issue.get('key'): issue for issue in implementation_issues if issue.get('key')}
-
-            # Filter tasks without remote mentions
-            filtered_indices = []
-            remote_mentions_count = 0
-
-            for idx, row in pre_filtered_tasks.iterrows():
-                issue_key = row['issue_key']
-                raw_issue = issue_mapping.get(issue_key)
-
-                if raw_issue:
-                    if not has_remote_mentions(raw_issue):
-                        filtered_indices.append(idx)
-                    else:
-                        remote_mentions_count += 1
-                else:
-                    # If we can't find the raw issue, include it
-                    filtered_indices.append(idx)
-                    logger.warning(f"Could not find raw issue for {issue_key} for remote mentions check")
-
-            logger.info(f"Filtered out {remote_mentions_count} issues with remote mentions")
-
-            # Apply the filter
-            if filtered_indices:
-                closed_tasks = pre_filtered_tasks.loc[filtered_indices]
-            else:
-                closed_tasks = pd.DataFrame(columns=pre_filtered_tasks.columns)
+        # Closed tasks without comments, attachments and links, then without remote mentions
+        # (checked on implementation_issues locally or on the candidates returned by Jira in pushdown mode)
+        from modules.dashboard import has_remote_mentions
+        closed_tasks, remote_mentions_count = get_closed_tasks_without_activity(
+            df, implementation_issues, has_remote_mentions, analyzer)
+        logger.info(f"Filtered out {remote_mentions_count} issues with remote mentions")
 
         logger.info(
             f"FOUND {len(closed_tasks)} CLOSED TASKS WITHOUT COMMENTS, ATTACHMENTS, LINKS, AND REMOTE MENTIONS")
@@ -544,11 +508,11 @@ def create_closed_tasks_without_links_chart(df, output_dir, logger, implementati
             logger.info(f"SAMPLE CLOSED TASKS: {sample_keys}")
 
             # Подробная информация о статусах
-            status_counts = closed_tasks['status'].value_counts()
+            status_counts = count_values(closed_tasks['status'])
             logger.info(f"Status distribution: {status_counts.to_dict()}")
 
         if not closed_tasks.empty:
-            closed_tasks_by_project = closed_tasks.groupby('project').size().sort_values(ascending=False)
+            closed_tasks_by_project = closed_tasks.groupby('project', observed=True).size().sort_values(ascending=False)
             logger.info(f"CLOSED TASKS BY PROJECT: {closed_tasks_by_project.to_dict()}")
 
             if not closed_tasks_by_project.empty:
@@ -594,7 +558,7 @@ def create_closed_tasks_without_links_chart(df, output_dir, logger, implementati
         closed_tasks_data = {
             'count': len(closed_tasks),
             'remote_mentions_count': remote_mentions_count,
-            'by_project': closed_tasks.groupby('project').size().to_dict() if not closed_tasks.empty else {},
+            'by_project': closed_tasks.groupby('project', observed=True).size().to_dict() if not closed_tasks.empty else {},
             'issue_keys': all_issue_keys,
             'by_project_issue_keys': project_issue_keys
         }
@@ -700,9 +664,8 @@ def run_analysis(use_filter=True, filter_id=114476, jql_query=None, date_from=No
         analysis_state['progress'] = 50
         df = analyzer.process_issues_data(issues)
 
-        # Save raw data for interactive charts
-        raw_data_path = os.path.join(data_dir, 'raw_data.json')
-        df.to_json(raw_data_path, orient='records')
+        # Save processed data as a columnar snapshot for interactive charts
+        save_frame(os.path.join(data_dir, 'raw_data'), df)
 
         # Create visualizations
         analysis_state['status_message'] = 'Creating visualizations...'
@@ -714,29 +677,29 @@ def run_analysis(use_filter=True, filter_id=114476, jql_query=None, date_from=No
         analysis_state['progress'] = 80
 
         # Project data
-        project_counts = df['project'].value_counts().to_dict()
-        project_estimates = df.groupby('project')['original_estimate_hours'].sum().to_dict()
-        project_time_spent = df.groupby('project')['time_spent_hours'].sum().to_dict()
+        project_counts = count_values(df['project']).to_dict()
+        project_estimates = df.groupby('project', observed=True)['original_estimate_hours'].sum().to_dict()
+        project_time_spent = df.groupby('project', observed=True)['time_spent_hours'].sum().to_dict()
 
         # Special chart data
 
         # 1. No transitions tasks data
         no_transitions_tasks = df[df['no_transitions'] == True]
         no_transitions_by_project = no_transitions_tasks.groupby(
-            'project').size().to_dict() if not no_transitions_tasks.empty else {}
+            'project', observed=True).size().to_dict() if not no_transitions_tasks.empty else {}
 
         # 2. Open tasks data
         # Get improved open statuses detection
         improved_open_statuses = get_improved_open_statuses(df)
         open_tasks = df[df['status'].isin(improved_open_statuses) & (df['time_spent_hours'] > 0)]
-        open_tasks_by_project = open_tasks.groupby('project')[
+        open_tasks_by_project = open_tasks.groupby('project', observed=True)[
             'time_spent_hours'].sum().to_dict() if not open_tasks.empty else {}
 
         # 3. Closed tasks without comments data
         status_categories = get_status_categories(df)
         closed_statuses = status_categories['closed_statuses']
         closed_tasks = df[df['status'].isin(closed_statuses) & (~df['has_comments']) & (~df['has_attachments'])]
-        closed_tasks_by_project = closed_tasks.groupby('project').size().to_dict() if not closed_tasks.empty else {}
+        closed_tasks_by_project = closed_tasks.groupby('project', observed=True).size().to_dict() if not closed_tasks.empty else {}
 
         # Save data for interactive charts
         chart_data = {
@@ -785,7 +748,8 @@ def run_analysis(use_filter=True, filter_id=114476, jql_query=None, date_from=No
             'date_from': date_from,
             'date_to': date_to,
             'filter_id': filter_id if use_filter else None,
-            'jql_query': jql_query if not use_filter else None
+            'jql_query': jql_query if not use_filter else None,
+            'format_version': SNAPSHOT_FORMAT_VERSION
         }
 
         # Load summary data if available
@@ -802,6 +766,7 @@ def run_analysis(use_filter=True, filter_id=114476, jql_query=None, date_from=No
         index_path = os.path.join(output_dir, 'index.json')
         with open(index_path, 'w', encoding='utf-8') as f:
             json.dump(index_data, f, indent=4, ensure_ascii=False)
+        record_analysis(output_dir)
 
         analysis_state['status_message'] = f'Analysis complete. Charts saved to {output_dir}.'
         analysis_state['progress'] = 100
@@ -809,8 +774,7 @@ def run_analysis(use_filter=True, filter_id=114476, jql_query=None, date_from=No
 
         # Save raw issues for diagnostics
         raw_issues_path = os.path.join(output_dir, 'raw_issues.json')
-        with open(raw_issues_path, 'w', encoding='utf-8') as f:
-            json.dump(issues, f, indent=2, ensure_ascii=False)
+        save_raw_issues(raw_issues_path, issues)
         logger.info(f"Raw issue data saved to {raw_issues_path}")
 
     except Exception as e:
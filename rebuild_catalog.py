@@ -0,0 +1,10 @@
+#!/usr/bin/env python
+"""
+Rebuild the catalog of analyses and daily dashboard snapshots from existing folders:
+
+    python rebuild_catalog.py --charts-dir jira_charts --dashboard-dir nbss_data
+"""
+from modules.catalog import main
+
+if __name__ == "__main__":
+    main()
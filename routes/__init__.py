@@ -3,6 +3,7 @@ from .analysis_routes import register_analysis_routes
 from .api_routes import register_api_routes
 from .clm_error_routes import register_clm_error_routes
 from .estimation_routes import register_estimation_routes
+from .job_routes import register_job_routes
 
 def register_routes(app):
     """Register all routes with the Flask application"""
@@ -11,3 +12,4 @@ def register_routes(app):
     register_api_routes(app)
     register_clm_error_routes(app)
     register_estimation_routes(app)  # Добавлено
+    register_job_routes(app)
@@ -2,10 +2,13 @@ import os
 import json
 import logging
 import shutil
-import threading
 from flask import render_template, request, redirect, url_for, send_from_directory
-from modules.analysis import run_analysis
-from routes.main_routes import analysis_state
+from modules.analysis import run_analysis_job
+from modules.job_queue import get_job_queue
+from modules.raw_issue_storage import find_raw_issues
+from modules.snapshot_cache import load_json_cached, load_raw_issues_cached
+from modules.catalog import record_daily_snapshot, remove_analysis
+from modules.dashboard_series import update_time_series
 from modules.utils import format_timestamp_for_display
 
 # Get logger
@@ -32,10 +35,7 @@ def register_analysis_routes(app):
 
     @app.route('/start_analysis', methods=['POST'])
     def start_analysis():
-        """Handle starting a new analysis with improved error handling"""
-        if analysis_state['is_running']:
-            return redirect(url_for('index'))
-
+        """Queue a new analysis job"""
         # Get data source (jira or clm)
         data_source = request.form.get('data_source', 'jira')
 
@@ -91,15 +91,19 @@ def register_analysis_routes(app):
             else:
                 logger.info(f"Using CLM JQL query: {clm_jql_query}")
 
-        # Start analysis in a separate thread
-        analysis_thread = threading.Thread(
-            target=run_analysis,
-            args=(data_source, use_filter, filter_id, jql_query, date_from, date_to, clm_filter_id, clm_jql_query)
-        )
-        analysis_thread.daemon = True
-        analysis_thread.start()
+        # Queue the analysis, the same analysis queued twice runs once
+        job, _ = get_job_queue().submit('analysis', run_analysis_job, {
+            'data_source': data_source,
+            'use_filter': use_filter,
+            'filter_id': filter_id,
+            'jql_query': jql_query,
+            'date_from': date_from,
+            'date_to': date_to,
+            'clm_filter_id': clm_filter_id,
+            'clm_jql_query': clm_jql_query
+        })
 
-        logger.info(f"Analysis thread started successfully")
+        logger.info(f"Analysis job {job.id} is {job.status}")
 
         return redirect(url_for('index'))
 
@@ -118,8 +122,7 @@ def register_analysis_routes(app):
 
         if os.path.exists(chart_data_path):
             try:
-                with open(chart_data_path, 'r', encoding='utf-8') as f:
-                    chart_data = json.load(f)
+                chart_data = load_json_cached(chart_data_path)
             except Exception as e:
                 logger.error(f"Error reading chart data: {e}")
                 chart_data = {}  # Ensure it's initialized even on error
@@ -195,8 +198,7 @@ def register_analysis_routes(app):
         summary_file = os.path.join(folder_path, 'summary.json')
         if os.path.exists(summary_file):
             try:
-                with open(summary_file, 'r', encoding='utf-8') as f:
-                    summary_data = json.load(f)
+                summary_data = dict(load_json_cached(summary_file))
             except Exception as e:
                 logger.error(f"Error reading summary file: {e}")
 
@@ -207,12 +209,11 @@ def register_analysis_routes(app):
             open_tasks_metrics = os.path.join(metrics_dir, 'open_tasks.json')
             if os.path.exists(open_tasks_metrics):
                 try:
-                    with open(open_tasks_metrics, 'r', encoding='utf-8') as f:
-                        open_tasks_data = json.load(f)
-                        if 'count' in open_tasks_data:
-                            summary_data['open_tasks_count'] = open_tasks_data['count']
-                        if 'total_time_spent' in open_tasks_data:
-                            summary_data['open_tasks_time_spent_hours'] = open_tasks_data['total_time_spent']
+                    open_tasks_data = load_json_cached(open_tasks_metrics)
+                    if 'count' in open_tasks_data:
+                        summary_data['open_tasks_count'] = open_tasks_data['count']
+                    if 'total_time_spent' in open_tasks_data:
+                        summary_data['open_tasks_time_spent_hours'] = open_tasks_data['total_time_spent']
                 except Exception as e:
                     logger.error(f"Error loading open tasks metrics: {e}")
 
@@ -220,10 +221,9 @@ def register_analysis_routes(app):
             closed_tasks_metrics = os.path.join(metrics_dir, 'closed_tasks.json')
             if os.path.exists(closed_tasks_metrics):
                 try:
-                    with open(closed_tasks_metrics, 'r', encoding='utf-8') as f:
-                        closed_tasks_data = json.load(f)
-                        if 'count' in closed_tasks_data:
-                            summary_data['completed_tasks_no_comments_count'] = closed_tasks_data['count']
+                    closed_tasks_data = load_json_cached(closed_tasks_metrics)
+                    if 'count' in closed_tasks_data:
+                        summary_data['completed_tasks_no_comments_count'] = closed_tasks_data['count']
                 except Exception as e:
                     logger.error(f"Error loading closed tasks metrics: {e}")
 
@@ -231,10 +231,9 @@ def register_analysis_routes(app):
             no_transitions_metrics = os.path.join(metrics_dir, 'no_transitions_tasks.json')
             if os.path.exists(no_transitions_metrics):
                 try:
-                    with open(no_transitions_metrics, 'r', encoding='utf-8') as f:
-                        no_transitions_data = json.load(f)
-                        if 'count' in no_transitions_data:
-                            summary_data['no_transitions_tasks_count'] = no_transitions_data['count']
+                    no_transitions_data = load_json_cached(no_transitions_metrics)
+                    if 'count' in no_transitions_data:
+                        summary_data['no_transitions_tasks_count'] = no_transitions_data['count']
                 except Exception as e:
                     logger.error(f"Error loading no transitions tasks metrics: {e}")
 
@@ -242,10 +241,9 @@ def register_analysis_routes(app):
             clm_metrics = os.path.join(metrics_dir, 'clm_metrics.json')
             if os.path.exists(clm_metrics):
                 try:
-                    with open(clm_metrics, 'r', encoding='utf-8') as f:
-                        clm_data = json.load(f)
-                        for key, value in clm_data.items():
-                            summary_data[key] = value
+                    clm_data = load_json_cached(clm_metrics)
+                    for key, value in clm_data.items():
+                        summary_data[key] = value
                 except Exception as e:
                     logger.error(f"Error loading CLM metrics: {e}")
 
@@ -254,8 +252,7 @@ def register_analysis_routes(app):
         index_file = os.path.join(folder_path, 'index.json')
         if os.path.exists(index_file):
             try:
-                with open(index_file, 'r', encoding='utf-8') as f:
-                    index_data = json.load(f)
+                index_data = load_json_cached(index_file)
             except Exception as e:
                 logger.error(f"Error reading index file: {e}")
 
@@ -327,6 +324,7 @@ def register_analysis_routes(app):
                 try:
                     # Recursively delete the report directory
                     shutil.rmtree(report_path)
+                    remove_analysis(report_path)
                     logger.info(f"Deleted report: {report_id}")
                 except Exception as e:
                     logger.error(f"Error deleting report {report_id}: {str(e)}")
@@ -351,7 +349,7 @@ def register_analysis_routes(app):
 
         # Check for raw_issues.json (this is the critical file)
         raw_issues_path = os.path.join(folder_path, 'raw_issues.json')
-        if not os.path.exists(raw_issues_path):
+        if find_raw_issues(raw_issues_path) is None:
             logger.error(f"Raw issues file not found: {raw_issues_path}")
             return f"Raw issues file not found for date {date_str}", 404
 
@@ -364,74 +362,73 @@ def register_analysis_routes(app):
 
             # Generate basic dashboard data from raw issues
             try:
-                with open(raw_issues_path, 'r', encoding='utf-8') as f:
-                    raw_issues = json.load(f)
-
-                    # Extract issues based on the standardized format
-                    if isinstance(raw_issues, dict):
-                        filtered_issues = raw_issues.get('filtered_issues', [])
-                        implementation_issues = raw_issues.get('all_implementation_issues', filtered_issues)
-
-                        # Check for extra data in the new standardized format
-                        additional_data = raw_issues.get('additional_data', {})
-                        clm_issues = additional_data.get('clm_issues', [])
-                        est_issues = additional_data.get('est_issues', [])
-                        improvement_issues = additional_data.get('improvement_issues', [])
-                    else:
-                        # Fallback if raw_issues is a list
-                        filtered_issues = raw_issues
-                        implementation_issues = raw_issues
-                        clm_issues = []
-                        est_issues = []
-                        improvement_issues = []
-
-                    # Calculate time spent
-                    total_time_spent_hours = 0
-                    for issue in filtered_issues:
-                        time_spent = issue.get('fields', {}).get('timespent', 0) or 0
-                        total_time_spent_hours += time_spent / 3600
-
-                    total_time_spent_days = total_time_spent_hours / 8
-                    projected_time_spent_days = total_time_spent_days * 1.2  # Simple estimate
-
-                    # Create basic dashboard data
-                    dashboard_data = {
-                        'date': f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}",
-                        'timestamp': date_str,
-                        'total_time_spent_hours': float(total_time_spent_hours),
-                        'total_time_spent_days': float(total_time_spent_days),
-                        'projected_time_spent_days': float(projected_time_spent_days),
-                        'clm_issues_count': len(clm_issues),
-                        'est_issues_count': len(est_issues),
-                        'improvement_issues_count': len(improvement_issues),
-                        'implementation_issues_count': len(implementation_issues),
-                        'filtered_issues_count': len(filtered_issues)
-                    }
+                raw_issues = load_raw_issues_cached(raw_issues_path)
+
+                # Extract issues based on the standardized format
+                if isinstance(raw_issues, dict):
+                    filtered_issues = raw_issues.get('filtered_issues', [])
+                    implementation_issues = raw_issues.get('all_implementation_issues', filtered_issues)
 
-                    # Save for future use
-                    try:
-                        with open(summary_path, 'w', encoding='utf-8') as f:
-                            json.dump(dashboard_data, f, indent=2, ensure_ascii=False)
-                        logger.info(f"Created dashboard summary file: {summary_path}")
-                    except Exception as e:
-                        logger.error(f"Error saving dashboard data: {e}", exc_info=True)
+                    # Check for extra data in the new standardized format
+                    additional_data = raw_issues.get('additional_data', {})
+                    clm_issues = additional_data.get('clm_issues', [])
+                    est_issues = additional_data.get('est_issues', [])
+                    improvement_issues = additional_data.get('improvement_issues', [])
+                else:
+                    # Fallback if raw_issues is a list
+                    filtered_issues = raw_issues
+                    implementation_issues = raw_issues
+                    clm_issues = []
+                    est_issues = []
+                    improvement_issues = []
+
+                # Calculate time spent
+                total_time_spent_hours = 0
+                for issue in filtered_issues:
+                    time_spent = issue.get('fields', {}).get('timespent', 0) or 0
+                    total_time_spent_hours += time_spent / 3600
+
+                total_time_spent_days = total_time_spent_hours / 8
+                projected_time_spent_days = total_time_spent_days * 1.2  # Simple estimate
+
+                # Create basic dashboard data
+                dashboard_data = {
+                    'date': f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}",
+                    'timestamp': date_str,
+                    'total_time_spent_hours': float(total_time_spent_hours),
+                    'total_time_spent_days': float(total_time_spent_days),
+                    'projected_time_spent_days': float(projected_time_spent_days),
+                    'clm_issues_count': len(clm_issues),
+                    'est_issues_count': len(est_issues),
+                    'improvement_issues_count': len(improvement_issues),
+                    'implementation_issues_count': len(implementation_issues),
+                    'filtered_issues_count': len(filtered_issues)
+                }
+
+                # Save for future use
+                try:
+                    with open(summary_path, 'w', encoding='utf-8') as f:
+                        json.dump(dashboard_data, f, indent=2, ensure_ascii=False)
+                    record_daily_snapshot(folder_path, dashboard_data)
+                    update_time_series(folder_path, dashboard_data)
+                    logger.info(f"Created dashboard summary file: {summary_path}")
+                except Exception as e:
+                    logger.error(f"Error saving dashboard data: {e}", exc_info=True)
             except Exception as e:
                 logger.error(f"Error generating dashboard data: {e}", exc_info=True)
                 return f"Error generating dashboard data: {e}", 500
         else:
             # Load the existing summary file
             try:
-                with open(summary_path, 'r', encoding='utf-8') as f:
-                    dashboard_data = json.load(f)
-                    logger.info(f"Successfully loaded dashboard data from {summary_path}")
+                dashboard_data = load_json_cached(summary_path)
+                logger.info(f"Successfully loaded dashboard data from {summary_path}")
             except Exception as e:
                 logger.error(f"Error reading dashboard data: {e}", exc_info=True)
                 return f"Error reading dashboard data: {e}", 500
 
         # Process the raw issues
         try:
-            with open(raw_issues_path, 'r', encoding='utf-8') as f:
-                raw_issues = json.load(f)
+            raw_issues = load_raw_issues_cached(raw_issues_path)
 
             # Extract issues based on the standardized format
             if isinstance(raw_issues, dict):
@@ -461,6 +458,7 @@ def register_analysis_routes(app):
 
             # Use the Jira analyzer to process the data
             from modules.jira_analyzer import JiraAnalyzer
+            from modules.data_processor import count_values
             analyzer = JiraAnalyzer()
 
             # Process implementation issues to get a dataframe
@@ -472,7 +470,8 @@ def register_analysis_routes(app):
                 os.makedirs(temp_dir)
 
             # Create visualizations
-            chart_paths = analyzer.create_visualizations(df, temp_dir)
+            # The raw issues tell the closed tasks chart whether comments and attachments were downloaded
+            chart_paths = analyzer.create_visualizations(df, temp_dir, all_implementation_issues)
 
             # Prepare chart data for the view
             chart_files = {}
@@ -488,9 +487,9 @@ def register_analysis_routes(app):
                 os.makedirs(data_dir)
 
             # Calculate project counts, estimates and time spent
-            project_counts = df['project'].value_counts().to_dict()
-            project_estimates = df.groupby('project')['original_estimate_hours'].sum().to_dict()
-            project_time_spent = df.groupby('project')['time_spent_hours'].sum().to_dict()
+            project_counts = count_values(df['project']).to_dict()
+            project_estimates = df.groupby('project', observed=True)['original_estimate_hours'].sum().to_dict()
+            project_time_spent = df.groupby('project', observed=True)['time_spent_hours'].sum().to_dict()
 
             # Calculate open tasks
             from modules.data_processor import get_improved_open_statuses
@@ -499,7 +498,7 @@ def register_analysis_routes(app):
             no_transitions_by_project = {}
 
             if not open_tasks.empty:
-                no_transitions_by_project = open_tasks.groupby('project').size().to_dict()
+                no_transitions_by_project = open_tasks.groupby('project', observed=True).size().to_dict()
 
             # Extract issue keys from raw issues using standardized format
             clm_issue_keys = []
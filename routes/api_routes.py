@@ -1,13 +1,18 @@
 import os
-import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from flask import request, jsonify, render_template
 from modules.log_buffer import get_logs
 from modules.data_processor import get_improved_open_statuses
+from modules.jql_builder import build_key_list_jql
+from modules.raw_issue_storage import find_raw_issues
+from modules.snapshot_storage import find_snapshot
+from modules.snapshot_cache import load_json_cached, load_raw_issues_cached, load_frame_cached
+from modules.job_queue import get_job_queue
 import pandas as pd
 
 from routes.analysis_routes import metrics_tooltips
+from routes.http_cache import make_validators, is_not_modified, not_modified_response, set_validators
 
 # Get logger
 logger = logging.getLogger(__name__)
@@ -25,19 +30,16 @@ def register_api_routes(app):
     @app.route('/api/dashboard/collect', methods=['POST'])
     def trigger_dashboard_collection():
         """
-        Manually trigger dashboard data collection
+        Manually trigger dashboard data collection (poll /api/jobs/<id> for the result)
         """
         try:
-            from scheduler import trigger_data_collection
-
-            # Trigger the data collection
-            result = trigger_data_collection()
+            job = submit_dashboard_collection(quick=False)
 
             return jsonify({
                 'success': True,
-                'message': 'Dashboard data collection has been triggered',
-                'status': result
-            })
+                'message': 'Dashboard data collection has been queued',
+                'job': job.to_dict(include_result=False)
+            }), 202
         except Exception as e:
             logger.error(f"Error triggering dashboard data collection: {e}", exc_info=True)
             return jsonify({
@@ -129,12 +131,32 @@ def register_api_routes(app):
         if request.path == '/logs':
             return None
 
+    def dashboard_data_validators(files):
+        """
+        Compute the validators of /api/dashboard/data
+
+        The date is part of the ETag because the fallback data is dated today. If-Modified-Since
+        only sees the files, so the handlers ignore it and answer 304 for a matching ETag only.
+
+        Args:
+            files (list): Dashboard data files
+
+        Returns:
+            tuple: (etag, last_modified datetime or None)
+        """
+        return make_validators(files, [datetime.now().strftime('%Y-%m-%d')])
+
     @app.route('/api/dashboard/data')
     def api_dashboard_data():
         """
         Get dashboard data for the NBSS Dashboard
         """
-        from modules.dashboard import get_dashboard_data
+        from modules.dashboard import get_dashboard_data, get_dashboard_data_files
+
+        # The data changes with the daily collection: polls with a current ETag get 304 without building it
+        etag, last_modified = dashboard_data_validators(get_dashboard_data_files())
+        if is_not_modified(etag, last_modified, use_modified_since=False):
+            return not_modified_response(etag, last_modified)
 
         try:
             # Get dashboard data
@@ -149,8 +171,6 @@ def register_api_routes(app):
                 logger.warning("Time series data is empty, generating fallback data")
 
                 # Generate fallback time series data
-                from datetime import datetime, timedelta
-
                 today = datetime.now()
                 dates = []
                 actual_values = []
@@ -182,8 +202,6 @@ def register_api_routes(app):
                 logger.warning("Latest data is empty, generating fallback data")
 
                 # Generate fallback latest data
-                from datetime import datetime
-
                 # Use the last values from time series if available
                 actual_value = 0
                 projected_value = 0
@@ -229,7 +247,7 @@ def register_api_routes(app):
                 'data': data
             }
 
-            return jsonify(response_data)
+            return set_validators(jsonify(response_data), etag, last_modified)
         except Exception as e:
             logger.error(f"Error getting dashboard data: {e}", exc_info=True)
 
@@ -329,30 +347,29 @@ def register_api_routes(app):
             if chart_type == 'closed_tasks' and os.path.exists(closed_tasks_metrics_path):
                 logger.info(f"Found closed tasks metrics file: {closed_tasks_metrics_path}")
                 try:
-                    with open(closed_tasks_metrics_path, 'r', encoding='utf-8') as f:
-                        closed_tasks_data = json.load(f)
-
-                        # Подробное логирование для отладки
-                        if 'by_project_issue_keys' in closed_tasks_data:
-                            logger.info(
-                                f"Available projects in closed tasks: {list(closed_tasks_data.get('by_project_issue_keys', {}).keys())}")
-
-                        # Если указан конкретный проект и есть данные по проектам
-                        if project != 'all' and 'by_project_issue_keys' in closed_tasks_data:
-                            # Проверяем существование проекта в данных
-                            if project in closed_tasks_data.get('by_project_issue_keys', {}):
-                                issue_keys = closed_tasks_data.get('by_project_issue_keys', {}).get(project, [])
-                                logger.info(f"Found {len(issue_keys)} closed task keys for project {project}")
-                            else:
-                                # Проект не найден в данных
-                                logger.warning(f"Project {project} not found in closed tasks data")
-                                issue_keys = []
+                    closed_tasks_data = load_json_cached(closed_tasks_metrics_path)
+
+                    # Подробное логирование для отладки
+                    if 'by_project_issue_keys' in closed_tasks_data:
+                        logger.info(
+                            f"Available projects in closed tasks: {list(closed_tasks_data.get('by_project_issue_keys', {}).keys())}")
+
+                    # Если указан конкретный проект и есть данные по проектам
+                    if project != 'all' and 'by_project_issue_keys' in closed_tasks_data:
+                        # Проверяем существование проекта в данных
+                        if project in closed_tasks_data.get('by_project_issue_keys', {}):
+                            issue_keys = closed_tasks_data.get('by_project_issue_keys', {}).get(project, [])
+                            logger.info(f"Found {len(issue_keys)} closed task keys for project {project}")
                         else:
-                            # Возвращаем все ключи
-                            issue_keys = closed_tasks_data.get('issue_keys', [])
-                            logger.info(f"Found {len(issue_keys)} total closed task keys")
+                            # Проект не найден в данных
+                            logger.warning(f"Project {project} not found in closed tasks data")
+                            issue_keys = []
+                    else:
+                        # Возвращаем все ключи
+                        issue_keys = closed_tasks_data.get('issue_keys', [])
+                        logger.info(f"Found {len(issue_keys)} total closed task keys")
 
-                        return issue_keys
+                    return issue_keys
                 except Exception as e:
                     logger.error(f"Error reading closed tasks metrics: {e}", exc_info=True)
                     # Если ошибка, продолжаем стандартный путь
@@ -361,23 +378,22 @@ def register_api_routes(app):
             if chart_type == 'closed_tasks' and os.path.exists(clm_keys_path):
                 logger.info("Looking for closed tasks in clm_issue_keys.json")
                 try:
-                    with open(clm_keys_path, 'r', encoding='utf-8') as f:
-                        clm_data = json.load(f)
-
-                        # Сначала проверяем наличие closed_tasks_issue_keys
-                        if 'closed_tasks_issue_keys' in clm_data:
-                            all_keys = clm_data.get('closed_tasks_issue_keys', [])
-                            logger.info(f"Found {len(all_keys)} closed task keys")
-
-                            # Если запрошены задачи для конкретного проекта
-                            if project != 'all' and 'closed_tasks_by_project' in clm_data:
-                                # Получаем только ключи для указанного проекта
-                                project_keys = clm_data.get('closed_tasks_by_project', {}).get(project, [])
-                                logger.info(f"Filtered to {len(project_keys)} closed task keys for project {project}")
-                                return project_keys
-
-                            # Иначе возвращаем все ключи
-                            return all_keys
+                    clm_data = load_json_cached(clm_keys_path)
+
+                    # Сначала проверяем наличие closed_tasks_issue_keys
+                    if 'closed_tasks_issue_keys' in clm_data:
+                        all_keys = clm_data.get('closed_tasks_issue_keys', [])
+                        logger.info(f"Found {len(all_keys)} closed task keys")
+
+                        # Если запрошены задачи для конкретного проекта
+                        if project != 'all' and 'closed_tasks_by_project' in clm_data:
+                            # Получаем только ключи для указанного проекта
+                            project_keys = clm_data.get('closed_tasks_by_project', {}).get(project, [])
+                            logger.info(f"Filtered to {len(project_keys)} closed task keys for project {project}")
+                            return project_keys
+
+                        # Иначе возвращаем все ключи
+                        return all_keys
                 except Exception as e:
                     logger.error(f"Error reading closed tasks from clm_keys: {e}", exc_info=True)
                     # Продолжаем обычный путь при ошибке
@@ -387,50 +403,49 @@ def register_api_routes(app):
                 logger.error(f"CLM issue keys file not found: {clm_keys_path}")
                 return []
 
-            with open(clm_keys_path, 'r', encoding='utf-8') as f:
-                clm_data = json.load(f)
-
-                logger.info(f"Available key types in CLM data: {list(clm_data.keys())}")
-
-                # Проверим, есть ли специальный ключ для закрытых задач
-                if chart_type == 'closed_tasks' and 'closed_tasks_issue_keys' in clm_data:
-                    keys = clm_data.get('closed_tasks_issue_keys', [])
-                    logger.info(f"Found {len(keys)} closed tasks issue keys in CLM data")
-                # Get keys based on chart type
-                elif chart_type == 'clm_issues':
-                    keys = clm_data.get('clm_issue_keys', [])
-                elif chart_type == 'est_issues':
-                    keys = clm_data.get('est_issue_keys', [])
-                elif chart_type == 'improvement_issues':
-                    keys = clm_data.get('improvement_issue_keys', [])
-                elif chart_type == 'linked_issues':
-                    keys = clm_data.get('implementation_issue_keys', [])
-                elif chart_type == 'filtered_issues':
-                    keys = clm_data.get('filtered_issue_keys', [])
-                elif chart_type == 'open_tasks':
-                    # Use pre-computed open task keys if available
-                    keys = clm_data.get('open_tasks_issue_keys', [])
-                elif chart_type == 'project_issues':
-                    # IMPROVED: Use the project_issue_mapping directly
-                    if project != 'all' and 'project_issue_mapping' in clm_data:
-                        keys = clm_data.get('project_issue_mapping', {}).get(project, [])
-                    else:
-                        keys = clm_data.get('filtered_issue_keys', [])
+            clm_data = load_json_cached(clm_keys_path)
+
+            logger.info(f"Available key types in CLM data: {list(clm_data.keys())}")
+
+            # Проверим, есть ли специальный ключ для закрытых задач
+            if chart_type == 'closed_tasks' and 'closed_tasks_issue_keys' in clm_data:
+                keys = clm_data.get('closed_tasks_issue_keys', [])
+                logger.info(f"Found {len(keys)} closed tasks issue keys in CLM data")
+            # Get keys based on chart type
+            elif chart_type == 'clm_issues':
+                keys = clm_data.get('clm_issue_keys', [])
+            elif chart_type == 'est_issues':
+                keys = clm_data.get('est_issue_keys', [])
+            elif chart_type == 'improvement_issues':
+                keys = clm_data.get('improvement_issue_keys', [])
+            elif chart_type == 'linked_issues':
+                keys = clm_data.get('implementation_issue_keys', [])
+            elif chart_type == 'filtered_issues':
+                keys = clm_data.get('filtered_issue_keys', [])
+            elif chart_type == 'open_tasks':
+                # Use pre-computed open task keys if available
+                keys = clm_data.get('open_tasks_issue_keys', [])
+            elif chart_type == 'project_issues':
+                # IMPROVED: Use the project_issue_mapping directly
+                if project != 'all' and 'project_issue_mapping' in clm_data:
+                    keys = clm_data.get('project_issue_mapping', {}).get(project, [])
                 else:
-                    # Default to filtered issues
                     keys = clm_data.get('filtered_issue_keys', [])
+            else:
+                # Default to filtered issues
+                keys = clm_data.get('filtered_issue_keys', [])
 
-                # If we need to filter by project and we're not already using project mapping
-                if project != 'all' and chart_type != 'project_issues' and chart_type != 'closed_tasks' and 'project_issue_mapping' in clm_data:
-                    # Get all issues for this project
-                    project_issues = clm_data.get('project_issue_mapping', {}).get(project, [])
-                    # Filter the keys to only those in this project
-                    filtered_keys = [key for key in keys if key in project_issues]
-                    logger.info(f"Filtered from {len(keys)} to {len(filtered_keys)} keys for project {project}")
-                    keys = filtered_keys
+            # If we need to filter by project and we're not already using project mapping
+            if project != 'all' and chart_type != 'project_issues' and chart_type != 'closed_tasks' and 'project_issue_mapping' in clm_data:
+                # Get all issues for this project
+                project_issues = clm_data.get('project_issue_mapping', {}).get(project, [])
+                # Filter the keys to only those in this project
+                filtered_keys = [key for key in keys if key in project_issues]
+                logger.info(f"Filtered from {len(keys)} to {len(filtered_keys)} keys for project {project}")
+                keys = filtered_keys
 
-                logger.info(f"Found {len(keys)} issue keys for chart type {chart_type}, project {project}")
-                return keys
+            logger.info(f"Found {len(keys)} issue keys for chart type {chart_type}, project {project}")
+            return keys
 
         except Exception as e:
             logger.error(f"Error getting issue keys for CLM chart: {e}", exc_info=True)
@@ -457,24 +472,8 @@ def register_api_routes(app):
             logger.info(f"CLM mode: Found {len(issue_keys)} issue keys for project {project}")
 
             if issue_keys:
-                # ENHANCED: Always use issue in (...) format with chunking for large sets
-                chunk_size = 100  # Jira typically has limits on JQL length
-
-                if len(issue_keys) > chunk_size:
-                    # For many issues, split into chunks and join with OR
-                    logger.info(f"Chunking {len(issue_keys)} issue keys into groups of {chunk_size}")
-                    chunks = [issue_keys[i:i + chunk_size] for i in range(0, len(issue_keys), chunk_size)]
-
-                    # Create a JQL with multiple "issue in (...)" clauses
-                    jql_parts = [f'issue in ({", ".join(chunk)})' for chunk in chunks]
-                    jql = ' OR '.join(jql_parts)
-
-                    logger.info(f"Created chunked JQL with {len(chunks)} chunks")
-                else:
-                    # For a reasonable number of issues, use a single clause
-                    jql = f'issue in ({", ".join(issue_keys)})'
-
-                    logger.info(f"Created single-chunk JQL with {len(issue_keys)} issues")
+                # Always use issue in (...) format, packing keys into clauses that fit the JQL length limit
+                jql = build_key_list_jql(issue_keys)
 
                 # Add date filters if specified
                 if date_from or date_to:
@@ -587,23 +586,8 @@ def register_api_routes(app):
                     sample_keys = issue_keys[:5] if len(issue_keys) > 5 else issue_keys
                     logger.info(f"Sample keys: {sample_keys}")
 
-                    # ENHANCED: Always use issue in (...) format with chunking for large sets
-                    chunk_size = 100  # Jira typically has limits on JQL length
-
-                    if len(issue_keys) > chunk_size:
-                        # For many issues, split into chunks and join with OR
-                        logger.info(f"Chunking {len(issue_keys)} issue keys into groups of {chunk_size}")
-                        chunks = [issue_keys[i:i + chunk_size] for i in range(0, len(issue_keys), chunk_size)]
-
-                        # Create a JQL with multiple "issue in (...)" clauses
-                        jql_parts = [f'issue in ({", ".join(chunk)})' for chunk in chunks]
-                        jql = ' OR '.join(jql_parts)
-
-                        logger.info(f"Created chunked JQL with {len(chunks)} chunks")
-                    else:
-                        # For a reasonable number of issues, use a single clause
-                        jql = f'issue in ({", ".join(issue_keys)})' if issue_keys else ''
-                        logger.info(f"Created single-chunk JQL with {len(issue_keys)} issues")
+                    # Always use issue in (...) format, packing keys into clauses that fit the JQL length limit
+                    jql = build_key_list_jql(issue_keys)
                 else:
                     # Если у нас closed_tasks и ключи не нашлись (пустой список)
                     logger.warning(f"No filtered issue keys found for project {project}, using direct fallback query")
@@ -641,24 +625,8 @@ def register_api_routes(app):
             issue_keys = get_issue_keys_for_clm_chart(timestamp, project, chart_type)
 
             if issue_keys and len(issue_keys) > 0:
-                # ENHANCED: Always use issue in (...) format with chunking for large sets
-                chunk_size = 100  # Jira typically has limits on JQL length
-
-                if len(issue_keys) > chunk_size:
-                    # For many issues, split into chunks and join with OR
-                    logger.info(f"Chunking {len(issue_keys)} issue keys into groups of {chunk_size}")
-                    chunks = [issue_keys[i:i + chunk_size] for i in range(0, len(issue_keys), chunk_size)]
-
-                    # Create a JQL with multiple "issue in (...)" clauses
-                    jql_parts = [f'issue in ({", ".join(chunk)})' for chunk in chunks]
-                    jql = ' OR '.join(jql_parts)
-
-                    logger.info(f"Created chunked JQL with {len(chunks)} chunks")
-                else:
-                    # For a reasonable number of issues, use a single clause
-                    jql = f'issue in ({", ".join(issue_keys)})'
-
-                    logger.info(f"Created single-chunk JQL with {len(issue_keys)} issues")
+                # Always use issue in (...) format, packing keys into clauses that fit the JQL length limit
+                jql = build_key_list_jql(issue_keys)
 
                 # If not ignoring period and not a CLM summary chart type, add date filters
                 if (date_from or date_to) and not ignore_period and chart_type not in clm_summary_chart_types:
@@ -838,7 +806,7 @@ def register_api_routes(app):
 
             # Путь к файлу raw_issues.json
             raw_issues_path = os.path.join(folder_path, 'raw_issues.json')
-            if not os.path.exists(raw_issues_path):
+            if find_raw_issues(raw_issues_path) is None:
                 return jsonify({
                     'error': 'Raw issues data not found',
                     'success': False
@@ -852,9 +820,20 @@ def register_api_routes(app):
                     'success': False
                 }), 404
 
+            # Snapshots of an analysis do not change after it is saved: a current ETag gets 304 without loading them
+            data_path = os.path.join(folder_path, 'data')
+            etag, last_modified = make_validators([
+                find_raw_issues(raw_issues_path),
+                clm_keys_path,
+                find_snapshot(os.path.join(data_path, 'raw_data')),
+                find_snapshot(os.path.join(data_path, 'implementation_data')),
+                os.path.join(data_path, 'chart_data.json')
+            ])
+            if is_not_modified(etag, last_modified):
+                return not_modified_response(etag, last_modified)
+
             # Загрузка данных о CLM задачах
-            with open(clm_keys_path, 'r', encoding='utf-8') as f:
-                clm_keys_data = json.load(f)
+            clm_keys_data = load_json_cached(clm_keys_path)
 
             # Получаем ключи implementation issues и filtered issues
             implementation_issue_keys = clm_keys_data.get('implementation_issue_keys', [])
@@ -863,40 +842,55 @@ def register_api_routes(app):
             logger.info(f"Found {len(implementation_issue_keys)} implementation issue keys")
             logger.info(f"Found {len(filtered_issue_keys)} filtered issue keys")
 
-            # Load raw issues with the new format (contains both filtered and all implementation issues)
-            with open(raw_issues_path, 'r', encoding='utf-8') as f:
-                raw_issues_data = json.load(f)
+            from modules.data_processor import process_issues_data, count_values
 
-            # Check if we have the new format
-            if isinstance(raw_issues_data,
-                          dict) and 'filtered_issues' in raw_issues_data and 'all_implementation_issues' in raw_issues_data:
-                # New format
-                logger.info("Found new raw_issues.json format with both filtered and implementation issues")
-                all_implementation_issues = raw_issues_data.get('all_implementation_issues', [])
-                filtered_issues = raw_issues_data.get('filtered_issues', [])
+            # Processed snapshots of the analysis hold the per-issue values, only the chart columns are read
+            chart_columns = ['project', 'original_estimate_hours', 'time_spent_hours']
+            df_filtered = load_frame_cached(os.path.join(folder_path, 'data', 'raw_data'), chart_columns)
+            df_all = load_frame_cached(os.path.join(folder_path, 'data', 'implementation_data'), chart_columns)
+            if df_all is None and df_filtered is not None and len(filtered_issue_keys) == len(implementation_issue_keys):
+                # Without a date filter all implementation issues are the filtered ones
+                df_all = df_filtered
 
-                logger.info(
-                    f"Loaded {len(all_implementation_issues)} implementation issues and {len(filtered_issues)} filtered issues")
+            if df_all is not None and df_filtered is not None:
+                logger.info(f"Loaded {len(df_all)} implementation and {len(df_filtered)} filtered rows from snapshots")
+                implementation_count = len(df_all)
+                filtered_count = len(df_filtered)
             else:
-                # Old format (just an array of filtered issues)
-                logger.info("Found old raw_issues.json format, treating as filtered issues only")
-                filtered_issues = raw_issues_data if isinstance(raw_issues_data, list) else []
+                # Load raw issues with the new format (contains both filtered and all implementation issues)
+                raw_issues_data = load_raw_issues_cached(raw_issues_path)
+
+                # Check if we have the new format
+                if isinstance(raw_issues_data,
+                              dict) and 'filtered_issues' in raw_issues_data and 'all_implementation_issues' in raw_issues_data:
+                    # New format
+                    logger.info("Found new raw_issues.json format with both filtered and implementation issues")
+                    all_implementation_issues = raw_issues_data.get('all_implementation_issues', [])
+                    filtered_issues = raw_issues_data.get('filtered_issues', [])
+
+                    logger.info(
+                        f"Loaded {len(all_implementation_issues)} implementation issues and {len(filtered_issues)} filtered issues")
+                else:
+                    # Old format (just an array of filtered issues)
+                    logger.info("Found old raw_issues.json format, treating as filtered issues only")
+                    filtered_issues = raw_issues_data if isinstance(raw_issues_data, list) else []
 
-                # Fall back to a copy of filtered issues for implementation issues
-                all_implementation_issues = filtered_issues.copy()
+                    # Fall back to a copy of filtered issues for implementation issues
+                    all_implementation_issues = filtered_issues.copy()
 
-                logger.info(f"Loaded {len(filtered_issues)} filtered issues, no separate implementation issues")
+                    logger.info(f"Loaded {len(filtered_issues)} filtered issues, no separate implementation issues")
 
-            # Process implementation issues to get all data
-            from modules.data_processor import process_issues_data
+                df_all = process_issues_data(all_implementation_issues) if all_implementation_issues else None
+                df_filtered = process_issues_data(filtered_issues) if filtered_issues else None
+                implementation_count = len(all_implementation_issues)
+                filtered_count = len(filtered_issues)
 
-            if all_implementation_issues:
-                df_all = process_issues_data(all_implementation_issues)
-                all_project_estimates = df_all.groupby('project')['original_estimate_hours'].sum().to_dict()
-                all_project_time_spent = df_all.groupby('project')['time_spent_hours'].sum().to_dict()
+            if df_all is not None and not df_all.empty:
+                all_project_estimates = df_all.groupby('project', observed=True)['original_estimate_hours'].sum().to_dict()
+                all_project_time_spent = df_all.groupby('project', observed=True)['time_spent_hours'].sum().to_dict()
 
                 # IMPORTANT: Calculate the project counts based on the actual implementation issues
-                all_project_counts = df_all['project'].value_counts().to_dict()
+                all_project_counts = count_values(df_all['project']).to_dict()
 
                 logger.info(f"Processed implementation issues dataframe with {len(df_all)} rows")
                 logger.info(
@@ -918,13 +912,12 @@ def register_api_routes(app):
                 logger.warning("No implementation issues found")
 
             # Process filtered issues
-            if filtered_issues:
-                df_filtered = process_issues_data(filtered_issues)
-                filtered_project_estimates = df_filtered.groupby('project')['original_estimate_hours'].sum().to_dict()
-                filtered_project_time_spent = df_filtered.groupby('project')['time_spent_hours'].sum().to_dict()
+            if df_filtered is not None and not df_filtered.empty:
+                filtered_project_estimates = df_filtered.groupby('project', observed=True)['original_estimate_hours'].sum().to_dict()
+                filtered_project_time_spent = df_filtered.groupby('project', observed=True)['time_spent_hours'].sum().to_dict()
 
                 # Also calculate project counts for filtered data
-                filtered_project_counts = df_filtered['project'].value_counts().to_dict()
+                filtered_project_counts = count_values(df_filtered['project']).to_dict()
 
                 logger.info(f"Processed filtered issues dataframe with {len(df_filtered)} rows")
                 logger.info(
@@ -970,16 +963,15 @@ def register_api_routes(app):
 
             if os.path.exists(chart_data_path):
                 try:
-                    with open(chart_data_path, 'r', encoding='utf-8') as f:
-                        chart_data = json.load(f)
+                    chart_data = load_json_cached(chart_data_path)
 
-                        # Get CLM estimates
-                        if 'project_clm_estimates' in chart_data:
-                            project_clm_estimates = chart_data['project_clm_estimates']
+                    # Get CLM estimates
+                    if 'project_clm_estimates' in chart_data:
+                        project_clm_estimates = chart_data['project_clm_estimates']
 
-                        # Get original project order
-                        if 'projects' in chart_data:
-                            existing_projects = chart_data['projects']
+                    # Get original project order
+                    if 'projects' in chart_data:
+                        existing_projects = chart_data['projects']
                 except Exception as e:
                     logger.error(f"Error reading chart data: {e}")
 
@@ -1015,11 +1007,11 @@ def register_api_routes(app):
                 'project_clm_estimates': project_clm_estimates,
                 'projects': ordered_projects,
                 'data_source': 'clm',
-                'implementation_count': len(all_implementation_issues),
-                'filtered_count': len(filtered_issues)
+                'implementation_count': implementation_count,
+                'filtered_count': filtered_count
             }
 
-            return jsonify(result)
+            return set_validators(jsonify(result), etag, last_modified)
 
         except Exception as e:
             logger.error(f"Error fetching CLM chart data: {str(e)}", exc_info=True)
@@ -1033,7 +1025,12 @@ def register_api_routes(app):
         """
         Get dashboard data for the NBSS Dashboard
         """
-        from modules.dashboard import get_dashboard_data
+        from modules.dashboard import get_dashboard_data, get_dashboard_data_files
+
+        # The data changes with the daily collection: polls with a current ETag get 304 without building it
+        etag, last_modified = dashboard_data_validators(get_dashboard_data_files())
+        if is_not_modified(etag, last_modified, use_modified_since=False):
+            return not_modified_response(etag, last_modified)
 
         try:
             # Get dashboard data
@@ -1055,10 +1052,10 @@ def register_api_routes(app):
             # Log the timestamp being sent to the frontend
             logger.info(f"Sending dashboard data with latest_timestamp: {data.get('latest_timestamp')}")
 
-            return jsonify({
+            return set_validators(jsonify({
                 'success': True,
                 'data': data
-            })
+            }), etag, last_modified)
         except Exception as e:
             logger.error(f"Error getting dashboard data: {e}", exc_info=True)
             return jsonify({
@@ -1069,18 +1066,17 @@ def register_api_routes(app):
     @app.route('/api/dashboard/collect')
     def collect_dashboard_data():
         """
-        Manually trigger data collection for the NBSS Dashboard
+        Queue data collection for the NBSS Dashboard (poll /api/jobs/<id> for the collected data).
+        With ?quick=1 only the KPI tiles are refreshed with count-only queries.
         """
-        from modules.dashboard import collect_daily_data
-
         try:
-            # Collect dashboard data
-            data = collect_daily_data()
+            quick = request.args.get('quick', '').lower() in ('1', 'true', 'yes')
+            job = submit_dashboard_collection(quick=quick)
 
             return jsonify({
                 'success': True,
-                'data': data
-            })
+                'job': job.to_dict(include_result=False)
+            }), 202
         except Exception as e:
             logger.error(f"Error collecting dashboard data: {e}", exc_info=True)
             return jsonify({
@@ -1088,3 +1084,20 @@ def register_api_routes(app):
                 'error': str(e)
             }), 500
 
+    def submit_dashboard_collection(quick):
+        """Queue a dashboard data collection job, an identical queued or running one is reused"""
+        job, _ = get_job_queue().submit('dashboard_collect', run_dashboard_collection_job, {'quick': quick})
+        return job
+
+    def run_dashboard_collection_job(job, quick):
+        """Job target of a dashboard data collection"""
+        from modules.dashboard import collect_daily_data
+
+        job.progress['status_message'] = 'Refreshing KPI tiles...' if quick else 'Collecting dashboard data...'
+        data = collect_daily_data(quick=quick)
+        if data is None:
+            raise RuntimeError('Dashboard data collection failed, see the logs')
+
+        job.progress['progress'] = 100
+        job.progress['status_message'] = 'Dashboard data collected'
+        return data
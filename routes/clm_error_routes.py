@@ -1,8 +1,9 @@
 import os
 import logging
 from flask import render_template, request, jsonify, redirect, url_for
-from modules.clm_error_creator import ClmErrorCreator
+from modules.clm_error_creator import ClmErrorCreator, RESULTS_FILE, LEGACY_RESULTS_FILE
 from modules.excel_reader import save_subsystem_mapping, get_subsystems_for_product
+from routes.http_cache import conditional_response
 
 # Get logger
 logger = logging.getLogger(__name__)
@@ -66,13 +67,14 @@ def register_clm_error_routes(app):
     def get_clm_error_results():
         """Get all CLM Error creation results"""
         try:
-            creator = ClmErrorCreator()
-            results = creator.get_creation_results()
-
-            return jsonify({
-                'success': True,
-                'results': results
-            })
+            # Results change only when one is appended to the journal: a current ETag gets 304 without loading them
+            return conditional_response(
+                lambda: jsonify({
+                    'success': True,
+                    'results': ClmErrorCreator().get_creation_results()
+                }),
+                files=[RESULTS_FILE, LEGACY_RESULTS_FILE]
+            )
         except Exception as e:
             logger.error(f"Error getting CLM Error results: {e}", exc_info=True)
             return jsonify({
@@ -1,6 +1,8 @@
 import logging
 from flask import render_template, request, jsonify
-from modules.jira_estimation import get_latest_estimation_results, collect_estimation_data
+from modules.jira_estimation import get_latest_estimation_results, collect_estimation_data, get_estimation_result_files
+from modules.job_queue import get_job_queue
+from routes.http_cache import conditional_response
 
 # Get logger
 logger = logging.getLogger(__name__)
@@ -61,10 +63,11 @@ def register_estimation_routes(app):
                     all_tasks=all_tasks
                 )
             else:
-                logger.info("API: Loading latest Jira estimation data")
-                results = get_latest_estimation_results(
-                    sprint_filter=sprint_filter,
-                    all_tasks=all_tasks
+                # Saved results change only when the analysis runs: a current ETag gets 304 without reading them
+                return conditional_response(
+                    lambda: latest_estimation_results_response(sprint_filter, all_tasks),
+                    files=get_estimation_result_files(),
+                    extra=[sprint_filter, all_tasks]
                 )
 
             if not results:
@@ -84,9 +87,28 @@ def register_estimation_routes(app):
                 'error': str(e)
             }), 500
 
+    def latest_estimation_results_response(sprint_filter, all_tasks):
+        """Build the API response with the latest saved estimation results"""
+        logger.info("API: Loading latest Jira estimation data")
+        results = get_latest_estimation_results(
+            sprint_filter=sprint_filter,
+            all_tasks=all_tasks
+        )
+
+        if not results:
+            return jsonify({
+                'success': False,
+                'error': 'No estimation results available'
+            }), 404
+
+        return jsonify({
+            'success': True,
+            'data': results
+        })
+
     @app.route('/api/run-estimation')
     def api_run_estimation():
-        """API endpoint to run Jira estimation analysis"""
+        """API endpoint to queue a Jira estimation analysis job (poll /api/jobs/<id> for the result)"""
         try:
             # Get query parameters
             filter_id = request.args.get('filter_id', '114924')
@@ -94,29 +116,38 @@ def register_estimation_routes(app):
             all_tasks = request.args.get('all_tasks', 'true').lower() == 'false'
 
             logger.info(
-                f"Running estimation analysis with filter_id={filter_id}, sprint_filter={sprint_filter}, all_tasks={all_tasks}")
+                f"Queueing estimation analysis with filter_id={filter_id}, sprint_filter={sprint_filter}, all_tasks={all_tasks}")
 
-            # Run analysis
-            results = collect_estimation_data(
-                filter_id=filter_id,
-                sprint_filter=sprint_filter,
-                all_tasks=all_tasks
-            )
-
-            if not results:
-                return jsonify({
-                    'success': False,
-                    'error': 'Failed to run estimation analysis'
-                }), 500
+            job, created = get_job_queue().submit('estimation', run_estimation_job, {
+                'filter_id': filter_id,
+                'sprint_filter': sprint_filter,
+                'all_tasks': all_tasks
+            })
 
             return jsonify({
                 'success': True,
-                'message': 'Estimation analysis completed successfully',
-                'data': results
-            })
+                'message': 'Estimation analysis has been queued' if created else 'Estimation analysis is already queued',
+                'job': job.to_dict(include_result=False)
+            }), 202
         except Exception as e:
-            logger.error(f"Error running estimation analysis: {e}", exc_info=True)
+            logger.error(f"Error queueing estimation analysis: {e}", exc_info=True)
             return jsonify({
                 'success': False,
                 'error': str(e)
-            }), 500
\ No newline at end of file
+            }), 500
+
+    def run_estimation_job(job, filter_id, sprint_filter, all_tasks):
+        """Job target of an estimation analysis"""
+        job.progress['status_message'] = f'Collecting estimation data for filter {filter_id}...'
+        results = collect_estimation_data(
+            filter_id=filter_id,
+            sprint_filter=sprint_filter,
+            all_tasks=all_tasks
+        )
+
+        if not results:
+            raise RuntimeError('Failed to run estimation analysis')
+
+        job.progress['progress'] = 100
+        job.progress['status_message'] = 'Estimation analysis completed successfully'
+        return results
@@ -0,0 +1,144 @@
+"""
+Conditional GET support for JSON endpoints polled by the front-end.
+
+The validator of a response is derived from the modification times and sizes
+of the files it is built from (plus any other values it depends on), so it can
+be checked before the payload is built:
+
+    return conditional_response(
+        lambda: jsonify(build_payload()),
+        files=[summary_path, index_path],
+        extra=[request.query_string]
+    )
+
+A request whose If-None-Match matches the ETag (or, without If-None-Match,
+whose If-Modified-Since is not older than the newest file) gets an empty
+304 Not Modified. If-Modified-Since only sees the files, so it is ignored
+when the validator has extra values: a client holding the response for
+another selection (e.g. another date) must not get a 304 for it. Responses carry ETag, Last-Modified and "Cache-Control:
+no-cache", so browsers revalidate every time instead of guessing freshness.
+"""
+import os
+import hashlib
+import logging
+from datetime import datetime, timezone
+
+from flask import request, make_response
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+
+def file_state(path):
+    """
+    Get the state of a file or directory used in a validator
+
+    Args:
+        path (str): File or directory path (may be None or missing)
+
+    Returns:
+        tuple: (path, mtime in ns, size) or (path, None, None) if it does not exist
+    """
+    if not path:
+        return (path, None, None)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path, None, None)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def make_validators(files=None, extra=None):
+    """
+    Compute the ETag and Last-Modified time of a response
+
+    Args:
+        files (list): Files and directories the response is built from
+        extra (list): Other values the response depends on
+
+    Returns:
+        tuple: (etag, last_modified datetime or None)
+    """
+    states = [file_state(path) for path in files or []]
+    digest = hashlib.sha1(repr((states, list(extra or []))).encode('utf-8')).hexdigest()[:24]
+
+    mtimes = [mtime for _, mtime, _ in states if mtime is not None]
+    last_modified = None
+    if mtimes:
+        last_modified = datetime.fromtimestamp(max(mtimes) // 1_000_000_000, tz=timezone.utc)
+    return digest, last_modified
+
+
+def is_not_modified(etag, last_modified=None, use_modified_since=True):
+    """
+    Check the conditional headers of the current request
+
+    Args:
+        etag (str): Current ETag of the resource
+        last_modified (datetime): Current modification time of the resource
+        use_modified_since (bool): Honour If-Modified-Since (False if the ETag covers more than the files)
+
+    Returns:
+        bool: True if the client copy is up to date
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if use_modified_since and last_modified is not None and request.if_modified_since is not None:
+        return last_modified <= request.if_modified_since
+    return False
+
+
+def set_validators(response, etag, last_modified=None):
+    """
+    Add the validators of a resource to a response
+
+    Args:
+        response (flask.Response): Response to send
+        etag (str): ETag of the resource
+        last_modified (datetime): Modification time of the resource
+
+    Returns:
+        flask.Response: The same response
+    """
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def not_modified_response(etag, last_modified=None):
+    """
+    Build an empty 304 Not Modified response
+
+    Args:
+        etag (str): ETag of the resource
+        last_modified (datetime): Modification time of the resource
+
+    Returns:
+        flask.Response: 304 response with validators
+    """
+    return set_validators(make_response('', 304), etag, last_modified)
+
+
+def conditional_response(build, files=None, extra=None):
+    """
+    Build a response unless the client copy is still valid
+
+    Args:
+        build (callable): Returns the response (anything Flask accepts) when it has to be sent
+        files (list): Files and directories the response is built from
+        extra (list): Other values the response depends on
+
+    Returns:
+        flask.Response: 304 Not Modified or the built response with validators
+    """
+    etag, last_modified = make_validators(files, extra)
+    if is_not_modified(etag, last_modified, use_modified_since=not extra):
+        return not_modified_response(etag, last_modified)
+
+    response = make_response(build())
+    if response.status_code != 200:
+        # Errors are not cached, the next poll tries again
+        return response
+    return set_validators(response, etag, last_modified)
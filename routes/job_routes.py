@@ -0,0 +1,56 @@
+import logging
+from flask import request, jsonify
+from modules.job_queue import get_job_queue
+
+# Get logger
+logger = logging.getLogger(__name__)
+
+
+def register_job_routes(app):
+    """Register routes for background jobs (analyses, estimation runs, dashboard collection)"""
+
+    @app.route('/api/jobs')
+    def api_jobs():
+        """
+        List background jobs, newest first
+
+        Query params:
+        - kind: Only jobs of this kind (analysis, estimation, dashboard_collect)
+        """
+        kind = request.args.get('kind')
+        jobs = get_job_queue().list_jobs(kind)
+
+        return jsonify({
+            'success': True,
+            'jobs': [job.to_dict(include_result=False) for job in jobs]
+        })
+
+    @app.route('/api/jobs/<job_id>')
+    def api_job(job_id):
+        """Get a background job with its progress and result"""
+        job = get_job_queue().get(job_id)
+        if job is None:
+            return jsonify({
+                'success': False,
+                'error': f'Job {job_id} not found'
+            }), 404
+
+        return jsonify({
+            'success': True,
+            'job': job.to_dict()
+        })
+
+    @app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+    def api_cancel_job(job_id):
+        """Cancel a queued job or ask a running job to stop"""
+        job = get_job_queue().cancel(job_id)
+        if job is None:
+            return jsonify({
+                'success': False,
+                'error': f'Job {job_id} not found'
+            }), 404
+
+        return jsonify({
+            'success': True,
+            'job': job.to_dict(include_result=False)
+        })
@@ -1,8 +1,9 @@
-import os
 import logging
 from datetime import datetime, timedelta
 from flask import render_template, jsonify, redirect, url_for
 from modules.utils import format_timestamp_for_display
+from modules.catalog import list_analyses, list_daily_snapshots
+from modules.job_queue import get_job_queue, JOB_QUEUED, JOB_RUNNING
 
 # Get logger
 logger = logging.getLogger(__name__)
@@ -18,6 +19,33 @@ analysis_state = {
 }
 
 
+def get_analysis_status():
+    """
+    Get the state of analysis jobs for the analyzer page and /status
+
+    Returns:
+        dict: Progress of the running (or next queued) analysis, the number of queued
+              analyses and the job ID to cancel
+    """
+    jobs = [job for job in get_job_queue().list_jobs('analysis') if not job.is_finished()]
+    if not jobs:
+        # Analyses run outside the job queue report to analysis_state
+        return dict(analysis_state, queued=0, job_id=None)
+
+    running = [job for job in jobs if job.status == JOB_RUNNING]
+    current = running[0] if running else jobs[-1]
+    return {
+        'is_running': True,
+        'last_run': analysis_state['last_run'],
+        'progress': current.progress.get('progress', 0),
+        'total_issues': current.progress.get('total_issues', 0),
+        'status_message': current.progress.get('status_message', ''),
+        'current_folder': current.progress.get('current_folder'),
+        'queued': sum(1 for job in jobs if job.status == JOB_QUEUED),
+        'job_id': current.id
+    }
+
+
 def register_main_routes(app):
     """Register the main page routes"""
 
@@ -29,46 +57,28 @@ def register_main_routes(app):
     @app.route('/jira-analyzer')
     def jira_analyzer():
         """Render the JIRA analyzer page"""
-        # Get list of all analysis folders (sorted by date in reverse order)
+        # Get list of all analysis folders (sorted by date in reverse order) from the catalog
         CHARTS_DIR = 'jira_charts'
         analysis_folders = []
 
-        for folder in sorted(os.listdir(CHARTS_DIR), reverse=True):
-            folder_path = os.path.join(CHARTS_DIR, folder)
-            if os.path.isdir(folder_path) and folder != 'data':
-                index_file = os.path.join(folder_path, 'index.json')
-                info = {
-                    'timestamp': folder,
-                    'display_timestamp': format_timestamp_for_display(folder),
-                    'charts_count': 0,
-                    'total_issues': 0,
-                    'date_from': None,
-                    'date_to': None,
-                    'analysis_type': 'jira'  # Default to 'jira' if not specified
-                }
-
-                if os.path.exists(index_file):
-                    try:
-                        import json
-                        with open(index_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            info['charts_count'] = len(data.get('charts', {}))
-                            info['total_issues'] = data.get('total_issues', 0)
-                            info['date_from'] = data.get('date_from')
-                            info['date_to'] = data.get('date_to')
-                            # Include the data source type (jira or clm)
-                            info['analysis_type'] = data.get('data_source', 'jira')
-                    except Exception as e:
-                        logger.error(f"Error reading index file {index_file}: {e}")
-
-                analysis_folders.append(info)
+        for analysis in list_analyses(CHARTS_DIR):
+            analysis_folders.append({
+                'timestamp': analysis['timestamp'],
+                'display_timestamp': format_timestamp_for_display(analysis['timestamp']),
+                'charts_count': len(analysis['charts']),
+                'total_issues': analysis['total_issues'],
+                'date_from': analysis['date_from'],
+                'date_to': analysis['date_to'],
+                # Include the data source type (jira or clm)
+                'analysis_type': analysis['data_source']
+            })
 
         # Default date values (month ago - today)
         today = datetime.now().strftime('%Y-%m-%d')
         month_ago = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
 
         return render_template('index.html',
-                               analysis_state=analysis_state,
+                               analysis_state=get_analysis_status(),
                                analysis_folders=analysis_folders,
                                default_from=month_ago,
                                default_to=today,
@@ -77,11 +87,14 @@ def register_main_routes(app):
     @app.route('/status')
     def status():
         """Return the current analysis status"""
+        state = get_analysis_status()
         return {
-            'is_running': analysis_state['is_running'],
-            'progress': analysis_state['progress'],
-            'status_message': analysis_state['status_message'],
-            'total_issues': analysis_state['total_issues']
+            'is_running': state['is_running'],
+            'progress': state['progress'],
+            'status_message': state['status_message'],
+            'total_issues': state['total_issues'],
+            'queued': state['queued'],
+            'job_id': state['job_id']
         }
 
     @app.errorhandler(404)
@@ -111,24 +124,12 @@ def register_main_routes(app):
         DASHBOARD_DIR = 'nbss_data'
         latest_timestamp = None
 
-        if os.path.exists(DASHBOARD_DIR):
-            folders = [f for f in os.listdir(DASHBOARD_DIR) if os.path.isdir(os.path.join(DASHBOARD_DIR, f))]
-            if folders:
-                # Sort folders (timestamps) in descending order to get the latest
-                folders.sort(reverse=True)
-                latest_timestamp = folders[0]
-
-                # Try to get the actual date from summary.json if it exists
-                summary_path = os.path.join(DASHBOARD_DIR, latest_timestamp, 'summary.json')
-                if os.path.exists(summary_path):
-                    try:
-                        import json
-                        with open(summary_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            if 'date' in data:
-                                latest_timestamp = data['date']  # Use actual date instead of folder name
-                    except Exception as e:
-                        logger.error(f"Error reading dashboard summary: {e}")
+        snapshots = list_daily_snapshots(DASHBOARD_DIR)
+        if snapshots:
+            # Snapshots are sorted by folder (timestamp), the last one is the latest
+            latest_timestamp, summary = snapshots[-1]
+            if summary and 'date' in summary:
+                latest_timestamp = summary['date']  # Use actual date instead of folder name
 
         return render_template('dashboard.html',
                                active_tab='dashboard',
@@ -280,7 +280,7 @@ document.addEventListener('DOMContentLoaded', function() {
     // Fetch updated results periodically (can be enabled if needed)
     /*
     function fetchUpdatedResults() {
-        fetch('/api/clm-error-results')
+        fetchWithValidators('/api/clm-error-results')
             .then(response => response.json())
             .then(data => {
                 if (data.success && data.results && data.results.length > 0) {
@@ -0,0 +1,59 @@
+// conditional-fetch.js - Conditional GET for polled JSON endpoints
+
+// Last validators and body per URL (kept for the lifetime of the page)
+const conditionalFetchCache = new Map();
+
+/**
+ * Fetch a URL sending the validators of the previous response (If-None-Match / If-Modified-Since).
+ * A 304 Not Modified is turned into a 200 response with the previous body, so callers
+ * handle both cases the same way as a plain fetch().
+ * @param {string} url - URL to fetch with GET
+ * @param {Object} options - Additional fetch options
+ * @returns {Promise<Response>} Promise that resolves with the fresh or the reused response
+ */
+function fetchWithValidators(url, options = {}) {
+    const cached = conditionalFetchCache.get(url);
+    const headers = new Headers(options.headers || {});
+
+    if (cached) {
+        if (cached.etag) {
+            headers.set('If-None-Match', cached.etag);
+        }
+        if (cached.lastModified) {
+            headers.set('If-Modified-Since', cached.lastModified);
+        }
+    }
+
+    // The browser cache is bypassed, the validators above are handled here
+    return fetch(url, { ...options, headers: headers, cache: 'no-store' })
+        .then(response => {
+            if (response.status === 304 && cached) {
+                return new Response(cached.body, {
+                    status: 200,
+                    headers: { 'Content-Type': cached.contentType }
+                });
+            }
+
+            const etag = response.headers.get('ETag');
+            const lastModified = response.headers.get('Last-Modified');
+            if (!response.ok || (!etag && !lastModified)) {
+                conditionalFetchCache.delete(url);
+                return response;
+            }
+
+            return response.text().then(body => {
+                conditionalFetchCache.set(url, {
+                    etag: etag,
+                    lastModified: lastModified,
+                    contentType: response.headers.get('Content-Type') || 'application/json',
+                    body: body
+                });
+                return new Response(body, {
+                    status: response.status,
+                    headers: response.headers
+                });
+            });
+        });
+}
+
+window.fetchWithValidators = fetchWithValidators;
@@ -65,7 +65,7 @@ function fetchDashboardData() {
         refreshBtn.disabled = true;
     }
 
-    fetch('/api/dashboard/data')
+    fetchWithValidators('/api/dashboard/data')
         .then(response => {
             console.log("API response received, status:", response.status);
             return response.json();
@@ -15,7 +15,7 @@ function fetchDashboardData() {
     showLoadingState();
 
     // Fetch data from API
-    return fetch('/api/dashboard/data')
+    return window.fetchWithValidators('/api/dashboard/data')
         .then(response => {
             console.log("API response status:", response.status);
             if (!response.ok) {
@@ -160,9 +160,19 @@ function triggerDataCollection() {
     .then(response => response.json())
     .then(data => {
         console.log("Data collection response:", data);
+        if (!data.success) {
+            throw new Error(data.error);
+        }
 
-        // Refresh after 30 seconds
-        setTimeout(fetchDashboardData, 30000);
+        // Refresh when the collection job is finished
+        return window.waitForJob(data.job.id);
+    })
+    .then(job => {
+        if (job.status !== 'succeeded') {
+            alert('Сбор данных не выполнен: ' + (job.error || job.status));
+            return;
+        }
+        fetchDashboardData();
     })
     .catch(error => {
         console.error("Error triggering data collection:", error);
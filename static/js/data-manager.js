@@ -344,7 +344,7 @@ export function loadFullClmData(chartData, timestamp, callbacks) {
         originalSummaryData = captureSummaryData();
     }
 
-    fetch(`/api/clm-chart-data/${timestamp}`)
+    window.fetchWithValidators(`/api/clm-chart-data/${timestamp}`)
         .then(response => {
             if (!response.ok) {
                 throw new Error(`Server returned ${response.status}: ${response.statusText}`);
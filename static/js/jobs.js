@@ -0,0 +1,50 @@
+// jobs.js - Waiting for background jobs (analyses, estimation runs, dashboard collection)
+
+/**
+ * Poll a background job until it is finished.
+ * @param {string} jobId - Job ID returned when the job was queued
+ * @param {number} interval - Polling interval in milliseconds
+ * @returns {Promise<Object>} Promise that resolves with the finished job record
+ *     (status 'succeeded', 'failed' or 'cancelled', result of a succeeded job in job.result)
+ */
+function waitForJob(jobId, interval = 2000) {
+    return new Promise((resolve, reject) => {
+        const poll = () => {
+            fetch(`/api/jobs/${encodeURIComponent(jobId)}`, { cache: 'no-store' })
+                .then(response => response.json())
+                .then(data => {
+                    if (!data.success) {
+                        reject(new Error(data.error || 'Job not found'));
+                        return;
+                    }
+                    const job = data.job;
+                    if (job.status === 'queued' || job.status === 'running') {
+                        setTimeout(poll, interval);
+                    } else {
+                        resolve(job);
+                    }
+                })
+                .catch(reject);
+        };
+        poll();
+    });
+}
+
+/**
+ * Cancel a queued job or ask a running job to stop.
+ * @param {string} jobId - Job ID
+ * @returns {Promise<Object>} Promise that resolves with the job record
+ */
+function cancelJob(jobId) {
+    return fetch(`/api/jobs/${encodeURIComponent(jobId)}/cancel`, { method: 'POST' })
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) {
+                throw new Error(data.error || 'Job not found');
+            }
+            return data.job;
+        });
+}
+
+window.waitForJob = waitForJob;
+window.cancelJob = cancelJob;
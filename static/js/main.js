@@ -156,6 +156,18 @@ document.addEventListener('DOMContentLoaded', function() {
                         progressBar.textContent = data.progress + '%';
                     }
 
+                    const queueMessage = document.getElementById('queue-message');
+                    if (queueMessage) {
+                        queueMessage.textContent = data.queued ? 'Анализов в очереди: ' + data.queued : '';
+                    }
+
+                    // The cancel button follows the running (or next queued) analysis
+                    const cancelButton = document.getElementById('cancel-analysis');
+                    if (cancelButton && data.job_id && cancelButton.dataset.jobId !== data.job_id) {
+                        cancelButton.dataset.jobId = data.job_id;
+                        cancelButton.disabled = false;
+                    }
+
                     // Schedule next update in 1 second
                     setTimeout(refreshStatus, 1000);
                 } else {
@@ -176,4 +188,18 @@ document.addEventListener('DOMContentLoaded', function() {
     if (document.querySelector('[data-analysis-running="true"]')) {
         setTimeout(refreshStatus, 1000);
     }
+
+    // Cancel the running (or next queued) analysis
+    const cancelAnalysisButton = document.getElementById('cancel-analysis');
+    if (cancelAnalysisButton) {
+        cancelAnalysisButton.addEventListener('click', function() {
+            cancelAnalysisButton.disabled = true;
+            cancelJob(cancelAnalysisButton.dataset.jobId)
+                .catch(error => {
+                    console.error('Error cancelling analysis:', error);
+                    alert('Не удалось отменить анализ: ' + error.message);
+                    cancelAnalysisButton.disabled = false;
+                });
+        });
+    }
 });
\ No newline at end of file
@@ -179,7 +179,7 @@ function fetchDashboardData() {
     document.getElementById('last-refresh-time').classList.add('text-muted');
 
     // Fetch data from API
-    fetch('/api/dashboard/data')
+    fetchWithValidators('/api/dashboard/data')
         .then(response => {
             console.log("API response status:", response.status);
             if (!response.ok) {
@@ -1019,9 +1019,19 @@ function triggerDataCollection() {
     .then(response => response.json())
     .then(data => {
         console.log("Data collection response:", data);
+        if (!data.success) {
+            throw new Error(data.error);
+        }
 
-        // Refresh after 30 seconds
-        setTimeout(fetchDashboardData, 30000);
+        // Refresh when the collection job is finished
+        return window.waitForJob(data.job.id);
+    })
+    .then(job => {
+        if (job.status !== 'succeeded') {
+            alert('Сбор данных не выполнен: ' + (job.error || job.status));
+            return;
+        }
+        fetchDashboardData();
     })
     .catch(error => {
         console.error("Error triggering data collection:", error);